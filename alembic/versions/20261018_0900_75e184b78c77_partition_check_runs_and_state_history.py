@@ -0,0 +1,292 @@
+"""partition_check_runs_and_state_history
+
+Revision ID: 75e184b78c77
+Revises: b6a2d6a86874
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+Converts check_runs and pr_state_history into tables range-partitioned by
+month on created_at so retention can drop whole partitions instead of
+deleting rows. PostgreSQL requires the partition key in every unique
+constraint, so primary keys become (id, created_at), the external_id unique
+constraint becomes (external_id, created_at), and the foreign key from
+analysis_results to check_runs is dropped.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "75e184b78c77"
+down_revision: Union[str, None] = "b6a2d6a86874"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CHECK_RUN_COLUMNS = (
+    "id, pr_id, external_id, check_name, check_suite_id, status, conclusion, "
+    "logs_url, details_url, metadata, started_at, completed_at, created_at, updated_at"
+)
+STATE_HISTORY_COLUMNS = (
+    "id, pr_id, old_state, new_state, trigger_event, metadata, created_at"
+)
+
+CHECK_RUN_INDEXES = [
+    ('idx_check_runs_pr_id', ['pr_id']),
+    ('idx_check_runs_status', ['status']),
+    ('idx_check_runs_conclusion', ['conclusion']),
+    ('idx_check_runs_check_name', ['check_name']),
+    ('idx_check_runs_created_at', ['created_at']),
+    ('idx_check_runs_pr_status', ['pr_id', 'status']),
+    ('idx_check_runs_pr_conclusion', ['pr_id', 'conclusion']),
+]
+STATE_HISTORY_INDEXES = [
+    ('idx_pr_state_history_pr_id', ['pr_id']),
+    ('idx_pr_state_history_created_at', ['created_at']),
+    ('idx_pr_state_history_trigger_event', ['trigger_event']),
+    ('idx_pr_state_history_pr_created', ['pr_id', 'created_at']),
+]
+
+
+def _check_run_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', postgresql.UUID(), nullable=False),
+        sa.Column('pr_id', postgresql.UUID(), nullable=False),
+        sa.Column('external_id', sa.String(100), nullable=False),
+        sa.Column('check_name', sa.String(200), nullable=False),
+        sa.Column('check_suite_id', sa.String(100), nullable=True),
+        sa.Column('status', postgresql.ENUM(name='check_status', create_type=False), nullable=False),
+        sa.Column('conclusion', postgresql.ENUM(name='check_conclusion', create_type=False), nullable=True),
+        sa.Column('logs_url', sa.String(500), nullable=True),
+        sa.Column('details_url', sa.String(500), nullable=True),
+        sa.Column('metadata', sa.JSON(), nullable=True),
+        sa.Column('started_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('completed_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['pr_id'], ['pull_requests.id'], ondelete='CASCADE'),
+    ]
+
+
+def _state_history_columns() -> list[sa.Column]:
+    return [
+        sa.Column('id', postgresql.UUID(), nullable=False),
+        sa.Column('pr_id', postgresql.UUID(), nullable=False),
+        sa.Column('old_state', postgresql.ENUM(name='pr_state', create_type=False), nullable=True),
+        sa.Column('new_state', postgresql.ENUM(name='pr_state', create_type=False), nullable=False),
+        sa.Column('trigger_event', postgresql.ENUM(name='trigger_event', create_type=False), nullable=False),
+        sa.Column('metadata', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.TIMESTAMP(timezone=True), nullable=False, server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.ForeignKeyConstraint(['pr_id'], ['pull_requests.id'], ondelete='CASCADE'),
+    ]
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    # Function creating monthly partitions from a given month up to N months
+    # ahead of the current one. Safe to call repeatedly (PartitionMaintainer
+    # calls it at startup and periodically); returns the number of partitions
+    # created. Rows that reached the default partition before their month's
+    # partition existed are moved into it, since PostgreSQL refuses to attach
+    # a partition while the default partition holds rows in its range.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+            parent_table text,
+            from_month timestamptz,
+            months_ahead integer
+        )
+        RETURNS integer AS $$
+        DECLARE
+            default_table text := parent_table || '_default';
+            first_month timestamptz := from_month;
+            month_start date;
+            last_month date := (
+                date_trunc('month', CURRENT_TIMESTAMP AT TIME ZONE 'UTC')
+                + make_interval(months => months_ahead)
+            )::date;
+            partition_name text;
+            range_start text;
+            range_end text;
+            created integer := 0;
+        BEGIN
+            IF to_regclass(default_table) IS NOT NULL THEN
+                EXECUTE format(
+                    'SELECT least(%L::timestamptz, min(created_at)) FROM %I',
+                    from_month,
+                    default_table
+                ) INTO first_month;
+            END IF;
+            month_start := date_trunc('month', first_month AT TIME ZONE 'UTC')::date;
+
+            WHILE month_start <= last_month LOOP
+                partition_name := format(
+                    '%s_p%s', parent_table, to_char(month_start, 'YYYY_MM')
+                );
+                IF to_regclass(partition_name) IS NULL THEN
+                    range_start := to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+00';
+                    range_end := to_char(month_start + interval '1 month', 'YYYY-MM-DD')
+                        || ' 00:00:00+00';
+                    EXECUTE format(
+                        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                        partition_name,
+                        parent_table
+                    );
+                    IF to_regclass(default_table) IS NOT NULL THEN
+                        EXECUTE format(
+                            'WITH moved AS (DELETE FROM %I WHERE created_at >= %L '
+                            'AND created_at < %L RETURNING *) '
+                            'INSERT INTO %I SELECT * FROM moved',
+                            default_table,
+                            range_start,
+                            range_end,
+                            partition_name
+                        );
+                    END IF;
+                    EXECUTE format(
+                        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        parent_table,
+                        partition_name,
+                        range_start,
+                        range_end
+                    );
+                    created := created + 1;
+                END IF;
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+            RETURN created;
+        END;
+        $$ language 'plpgsql';
+    """)
+
+    # check_runs
+    op.drop_constraint('analysis_results_check_run_id_fkey', 'analysis_results', type_='foreignkey')
+    op.execute("DROP TRIGGER IF EXISTS update_check_runs_updated_at ON check_runs")
+    for index_name, _ in CHECK_RUN_INDEXES:
+        op.drop_index(index_name, table_name='check_runs')
+    op.rename_table('check_runs', 'check_runs_legacy')
+    op.execute("ALTER TABLE check_runs_legacy RENAME CONSTRAINT check_runs_pkey TO check_runs_legacy_pkey")
+    op.execute("ALTER TABLE check_runs_legacy RENAME CONSTRAINT uq_check_runs_external_id TO uq_check_runs_legacy_external_id")
+
+    op.create_table(
+        'check_runs',
+        *_check_run_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at', name='check_runs_pkey'),
+        sa.UniqueConstraint('external_id', 'created_at', name='uq_check_runs_external_id'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute("CREATE TABLE check_runs_default PARTITION OF check_runs DEFAULT")
+    op.execute("""
+        SELECT ensure_monthly_partitions(
+            'check_runs',
+            COALESCE((SELECT min(created_at) FROM check_runs_legacy), CURRENT_TIMESTAMP),
+            3
+        )
+    """)
+    op.execute(
+        f"INSERT INTO check_runs ({CHECK_RUN_COLUMNS}) "
+        f"SELECT {CHECK_RUN_COLUMNS} FROM check_runs_legacy"
+    )
+    op.drop_table('check_runs_legacy')
+
+    for index_name, columns in CHECK_RUN_INDEXES:
+        op.create_index(index_name, 'check_runs', columns)
+    op.execute("""
+        CREATE TRIGGER update_check_runs_updated_at
+            BEFORE UPDATE ON check_runs
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    """)
+
+    # pr_state_history
+    for index_name, _ in STATE_HISTORY_INDEXES:
+        op.drop_index(index_name, table_name='pr_state_history')
+    op.rename_table('pr_state_history', 'pr_state_history_legacy')
+    op.execute("ALTER TABLE pr_state_history_legacy RENAME CONSTRAINT pr_state_history_pkey TO pr_state_history_legacy_pkey")
+
+    op.create_table(
+        'pr_state_history',
+        *_state_history_columns(),
+        sa.PrimaryKeyConstraint('id', 'created_at', name='pr_state_history_pkey'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.execute("CREATE TABLE pr_state_history_default PARTITION OF pr_state_history DEFAULT")
+    op.execute("""
+        SELECT ensure_monthly_partitions(
+            'pr_state_history',
+            COALESCE((SELECT min(created_at) FROM pr_state_history_legacy), CURRENT_TIMESTAMP),
+            3
+        )
+    """)
+    op.execute(
+        f"INSERT INTO pr_state_history ({STATE_HISTORY_COLUMNS}) "
+        f"SELECT {STATE_HISTORY_COLUMNS} FROM pr_state_history_legacy"
+    )
+    op.drop_table('pr_state_history_legacy')
+
+    for index_name, columns in STATE_HISTORY_INDEXES:
+        op.create_index(index_name, 'pr_state_history', columns)
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    # pr_state_history
+    for index_name, _ in STATE_HISTORY_INDEXES:
+        op.drop_index(index_name, table_name='pr_state_history')
+    op.rename_table('pr_state_history', 'pr_state_history_partitioned')
+    op.execute("ALTER TABLE pr_state_history_partitioned RENAME CONSTRAINT pr_state_history_pkey TO pr_state_history_partitioned_pkey")
+
+    op.create_table(
+        'pr_state_history',
+        *_state_history_columns(),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.execute(
+        f"INSERT INTO pr_state_history ({STATE_HISTORY_COLUMNS}) "
+        f"SELECT {STATE_HISTORY_COLUMNS} FROM pr_state_history_partitioned"
+    )
+    op.execute("DROP TABLE pr_state_history_partitioned CASCADE")
+
+    for index_name, columns in STATE_HISTORY_INDEXES:
+        op.create_index(index_name, 'pr_state_history', columns)
+
+    # check_runs
+    op.execute("DROP TRIGGER IF EXISTS update_check_runs_updated_at ON check_runs")
+    for index_name, _ in CHECK_RUN_INDEXES:
+        op.drop_index(index_name, table_name='check_runs')
+    op.rename_table('check_runs', 'check_runs_partitioned')
+    op.execute("ALTER TABLE check_runs_partitioned RENAME CONSTRAINT check_runs_pkey TO check_runs_partitioned_pkey")
+    op.execute("ALTER TABLE check_runs_partitioned RENAME CONSTRAINT uq_check_runs_external_id TO uq_check_runs_partitioned_external_id")
+
+    op.create_table(
+        'check_runs',
+        *_check_run_columns(),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('external_id', name='uq_check_runs_external_id'),
+    )
+    op.execute(
+        f"INSERT INTO check_runs ({CHECK_RUN_COLUMNS}) "
+        f"SELECT {CHECK_RUN_COLUMNS} FROM check_runs_partitioned"
+    )
+    op.execute("DROP TABLE check_runs_partitioned CASCADE")
+
+    for index_name, columns in CHECK_RUN_INDEXES:
+        op.create_index(index_name, 'check_runs', columns)
+    op.execute("""
+        CREATE TRIGGER update_check_runs_updated_at
+            BEFORE UPDATE ON check_runs
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    """)
+    op.create_foreign_key(
+        'analysis_results_check_run_id_fkey',
+        'analysis_results',
+        'check_runs',
+        ['check_run_id'],
+        ['id'],
+        ondelete='CASCADE',
+    )
+
+    op.execute("DROP FUNCTION IF EXISTS ensure_monthly_partitions(text, timestamptz, integer)")
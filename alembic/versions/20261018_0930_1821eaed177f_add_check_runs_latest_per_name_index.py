@@ -0,0 +1,35 @@
+"""add_check_runs_latest_per_name_index
+
+Revision ID: 1821eaed177f
+Revises: 75e184b78c77
+Create Date: 2026-10-18 09:30:00.000000+00:00
+
+Composite index serving the DISTINCT ON (pr_id, check_name) queries that
+pick the latest check run per check name for one or many PRs.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1821eaed177f"
+down_revision: Union[str, None] = "75e184b78c77"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.create_index(
+        'idx_check_runs_pr_name_created',
+        'check_runs',
+        ['pr_id', 'check_name', sa.text('created_at DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.drop_index('idx_check_runs_pr_name_created', table_name='check_runs')
@@ -0,0 +1,107 @@
+"""add_full_text_search_indexes
+
+Revision ID: 30a122c3ed9b
+Revises: 1821eaed177f
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+Replaces leading-wildcard ILIKE scans in PR and repository search:
+- pull_requests.search_vector, a stored tsvector generated from title (weight
+  A) and body (weight B), indexed with GIN for ranked full-text search
+- pg_trgm GIN indexes on pull_requests.author and on repositories.name,
+  full_name, url and description, so every column of the substring ILIKE
+  filters and similarity ordering can use an index
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "30a122c3ed9b"
+down_revision: Union[str, None] = "1821eaed177f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # The models have always declared these columns but the core schema never
+    # created them
+    op.execute('ALTER TABLE pull_requests ADD COLUMN IF NOT EXISTS body TEXT')
+    op.execute('ALTER TABLE repositories ADD COLUMN IF NOT EXISTS full_name VARCHAR(300)')
+    op.execute('ALTER TABLE repositories ADD COLUMN IF NOT EXISTS description VARCHAR(1000)')
+
+    op.add_column(
+        'pull_requests',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(body, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'idx_pull_requests_search_vector',
+        'pull_requests',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+
+    op.create_index(
+        'idx_pull_requests_author_trgm',
+        'pull_requests',
+        ['author'],
+        postgresql_using='gin',
+        postgresql_ops={'author': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_repositories_name_trgm',
+        'repositories',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_repositories_full_name_trgm',
+        'repositories',
+        ['full_name'],
+        postgresql_using='gin',
+        postgresql_ops={'full_name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_repositories_url_trgm',
+        'repositories',
+        ['url'],
+        postgresql_using='gin',
+        postgresql_ops={'url': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'idx_repositories_description_trgm',
+        'repositories',
+        ['description'],
+        postgresql_using='gin',
+        postgresql_ops={'description': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.drop_index('idx_repositories_description_trgm', table_name='repositories')
+    op.drop_index('idx_repositories_url_trgm', table_name='repositories')
+    op.drop_index('idx_repositories_full_name_trgm', table_name='repositories')
+    op.drop_index('idx_repositories_name_trgm', table_name='repositories')
+    op.drop_index('idx_pull_requests_author_trgm', table_name='pull_requests')
+    op.drop_index('idx_pull_requests_search_vector', table_name='pull_requests')
+    op.drop_column('pull_requests', 'search_vector')
+    op.execute('ALTER TABLE repositories DROP COLUMN IF EXISTS description')
+    op.execute('ALTER TABLE repositories DROP COLUMN IF EXISTS full_name')
+    op.execute('ALTER TABLE pull_requests DROP COLUMN IF EXISTS body')
@@ -0,0 +1,83 @@
+"""add_repositories_next_poll_at
+
+Revision ID: dd4eae59bb8d
+Revises: 30a122c3ed9b
+Create Date: 2026-10-18 10:30:00.000000+00:00
+
+Stores each repository's next due poll time so the poll scheduler can use an
+index range scan (next_poll_at <= now()) instead of computing the elapsed
+interval per row, and so workers can lease due rows with
+FOR UPDATE SKIP LOCKED. A trigger keeps next_poll_at in step with
+last_polled_at and polling_interval_minutes for writes that bypass the ORM.
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "dd4eae59bb8d"
+down_revision: Union[str, None] = "30a122c3ed9b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+    op.add_column(
+        'repositories',
+        sa.Column(
+            'next_poll_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+            nullable=False,
+        ),
+    )
+
+    # Backfill from the existing schedule; never-polled rows stay due now
+    op.execute("""
+        UPDATE repositories
+        SET next_poll_at = last_polled_at
+            + make_interval(mins => polling_interval_minutes)
+        WHERE last_polled_at IS NOT NULL
+    """)
+
+    op.create_index(
+        'idx_repositories_next_poll_at',
+        'repositories',
+        ['next_poll_at'],
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_repositories_next_poll_at()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.next_poll_at = COALESCE(NEW.last_polled_at, CURRENT_TIMESTAMP)
+                + make_interval(mins => NEW.polling_interval_minutes);
+            RETURN NEW;
+        END;
+        $$ language 'plpgsql';
+    """)
+
+    op.execute("DROP TRIGGER IF EXISTS update_repositories_next_poll_at ON repositories")
+    op.execute("""
+        CREATE TRIGGER update_repositories_next_poll_at
+            BEFORE UPDATE OF last_polled_at, polling_interval_minutes ON repositories
+            FOR EACH ROW
+            WHEN (
+                OLD.last_polled_at IS DISTINCT FROM NEW.last_polled_at
+                OR OLD.polling_interval_minutes IS DISTINCT FROM NEW.polling_interval_minutes
+            )
+            EXECUTE FUNCTION update_repositories_next_poll_at();
+    """)
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+    op.execute("DROP TRIGGER IF EXISTS update_repositories_next_poll_at ON repositories")
+    op.execute("DROP FUNCTION IF EXISTS update_repositories_next_poll_at()")
+    op.drop_index('idx_repositories_next_poll_at', table_name='repositories')
+    op.drop_column('repositories', 'next_poll_at')
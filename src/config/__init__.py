@@ -4,7 +4,7 @@ This module provides type-safe configuration management with support for:
 - YAML configuration files with environment variable substitution
 - Hierarchical configuration loading (defaults -> file -> env -> runtime)
 - Pydantic-based validation and type safety
-- Hot reload capabilities for configuration changes
+- Hot reload of the configuration file with per-section change subscribers
 
 Example usage:
     from src.config import get_config
@@ -22,6 +22,7 @@ from .cache import (
     set_config_cache,
     warm_config_cache,
 )
+from .environment import EnvironmentSubstitutor, SubstitutionResult
 from .exceptions import (
     ConfigurationError,
     ConfigurationFileError,
@@ -29,6 +30,7 @@ from .exceptions import (
     ConfigurationValidationError,
     EnvironmentVariableError,
 )
+from .lazy import ConfigDocumentCache, LazyConfig
 from .loader import (
     ConfigurationLoader,
     get_config,
@@ -64,6 +66,13 @@ from .models import (
     RepositoryConfig,
     SystemConfig,
 )
+from .resolver import (
+    RepositoryConfigResolver,
+    RepositorySettings,
+    get_repository_config_resolver,
+)
+from .skip_patterns import SkipFilter, compile_skip_patterns
+from .snapshot import ConfigAccessor, ConfigSnapshot
 from .utils import (
     create_minimal_config,
     generate_example_config,
@@ -77,10 +86,20 @@ from .validation import (
     ConfigurationValidator,
     validate_config,
 )
+from .watcher import ConfigChange, ConfigWatcher
+from .worker_snapshot import read_config_snapshot, write_config_snapshot
 
 __all__ = [
     # Core configuration models and types
     "Config",
+    # Snapshots and accessors
+    "ConfigAccessor",
+    # Hot reload
+    "ConfigChange",
+    # Lazy loading
+    "ConfigDocumentCache",
+    "ConfigSnapshot",
+    "ConfigWatcher",
     # Caching
     "ConfigurationCache",
     # Exceptions
@@ -97,10 +116,13 @@ __all__ = [
     # Validation
     "ConfigurationValidator",
     "DatabaseConfig",
+    # Environment variable substitution
+    "EnvironmentSubstitutor",
     "EnvironmentVariableError",
     "FixCategory",
     "LLMProvider",
     "LLMProviderConfig",
+    "LazyConfig",
     "LogLevel",
     "NotificationChannelConfig",
     "NotificationConfig",
@@ -108,7 +130,14 @@ __all__ = [
     "NotificationProvider",
     "QueueConfig",
     "RepositoryConfig",
+    # Per-repository resolution
+    "RepositoryConfigResolver",
+    "RepositorySettings",
+    # Skip patterns
+    "SkipFilter",
+    "SubstitutionResult",
     "SystemConfig",
+    "compile_skip_patterns",
     # Utilities
     "create_minimal_config",
     "generate_example_config",
@@ -120,12 +149,15 @@ __all__ = [
     "get_config_metrics",
     "get_config_summary",
     "get_loader",
+    "get_repository_config_resolver",
     "initialize_config_manager",
     "invalidate_config_cache",
     "is_config_loaded",
     "load_config",
     "mask_sensitive_values",
     "merge_configs",
+    # Worker snapshots
+    "read_config_snapshot",
     "record_config_event",
     "reload_config",
     "set_config_cache",
@@ -133,4 +165,5 @@ __all__ = [
     "validate_config",
     "validate_environment_variables",
     "warm_config_cache",
+    "write_config_snapshot",
 ]
@@ -15,6 +15,7 @@ The caching system is designed to:
 import threading
 import time
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 from weakref import WeakValueDictionary
 
@@ -177,6 +178,35 @@ class ConfigurationCache:
                 self._cache_hits = saved_hits
                 self._cache_misses = saved_misses
 
+    def update_config(self, config: Config, changed_paths: Iterable[str]) -> int:
+        """Swap in a new configuration, invalidating only affected entries.
+
+        Unlike set_config, entries unrelated to the changed paths stay valid.
+
+        Args:
+            config: New configuration to cache
+            changed_paths: Dotted paths that differ from the previous config
+
+        Returns:
+            Number of invalidated cache entries
+        """
+        paths = list(changed_paths)
+
+        with self._lock:
+            self._config = config
+            self._cache_version += 1
+
+            stale = [
+                key
+                for key in self._cache
+                if any(_key_affected(key, path) for path in paths)
+            ]
+            for key in stale:
+                self._cache.pop(key, None)
+                self._dirty_keys.discard(key)
+
+            return len(stale)
+
     def invalidate(self, pattern: str | None = None) -> None:
         """Invalidate cached configuration entries.
 
@@ -410,6 +440,21 @@ class ConfigurationCache:
             return key == pattern
 
 
+def _key_affected(key: str, path: str) -> bool:
+    """Check if a cache key holds data at, above or below a changed path."""
+    if key.startswith("section:"):
+        key = key.removeprefix("section:")
+    return _is_within(path, key) or _is_within(key, path)
+
+
+def _is_within(path: str, ancestor: str) -> bool:
+    """Check if path equals ancestor or lies below it."""
+    if not path.startswith(ancestor):
+        return False
+    rest = path[len(ancestor) :]
+    return not rest or rest[0] in ".["
+
+
 # Global cache instance
 _global_cache: ConfigurationCache | None = None
 _cache_lock = threading.Lock()
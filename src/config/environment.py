@@ -0,0 +1,219 @@
+"""Environment variable substitution for configuration documents.
+
+References have the form ${VAR_NAME} (required) or ${VAR_NAME:default}.
+Substitution is a single pass over the parsed document before validation:
+
+- Only strings containing "${" are matched, against one compiled pattern.
+- Each variable is read from the environment once per generation and
+  memoized, so a token referenced by thousands of repositories is looked up
+  once.
+- Every reference is recorded with the document path it appears at, so a
+  change of one variable maps to the configuration keys that depend on it.
+
+The loader validates substituted documents with SUBSTITUTED_CONTEXT, which
+tells the models' own substitution validator to leave values untouched.
+"""
+
+import os
+import re
+import threading
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .exceptions import EnvironmentVariableError
+
+# ${VAR_NAME} or ${VAR_NAME:default}
+ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
+
+# Validation context key marking a document as already substituted
+SUBSTITUTED_KEY = "env_substituted"
+SUBSTITUTED_CONTEXT: dict[str, Any] = {SUBSTITUTED_KEY: True}
+
+
+def _format_path(parts: list[str | int]) -> str:
+    """Format path segments as a dotted path with list indexes."""
+    path = ""
+    for part in parts:
+        if isinstance(part, int):
+            path += f"[{part}]"
+        else:
+            path = f"{path}.{part}" if path else part
+    return path
+
+
+@dataclass(frozen=True, slots=True)
+class SubstitutionResult:
+    """Substituted document and the variables it references.
+
+    Attributes:
+        value: Document with references replaced
+        dependencies: Document paths referencing each variable, e.g.
+            {"GITHUB_TOKEN": {"repositories[0].auth_token"}}
+        defaulted: Variables referenced with a default value
+        missing: Required variables that are not set; only non-empty when
+            substituting with strict=False
+    """
+
+    value: Any
+    dependencies: Mapping[str, frozenset[str]] = field(default_factory=dict)
+    defaulted: frozenset[str] = frozenset()
+    missing: frozenset[str] = frozenset()
+
+    def paths_for(self, variables: Iterable[str]) -> frozenset[str]:
+        """Get the document paths that depend on any of the variables.
+
+        Args:
+            variables: Variable names, e.g. the ones that changed
+
+        Returns:
+            Paths referencing at least one of the variables
+        """
+        paths: set[str] = set()
+        for name in variables:
+            paths.update(self.dependencies.get(name, ()))
+        return frozenset(paths)
+
+
+class EnvironmentSubstitutor:
+    """Substitute environment variable references with memoized lookups.
+
+    Looked-up values are memoized for the current generation. refresh()
+    compares them with the environment and starts a new generation when any
+    changed, so callers refresh before each load and never see stale values.
+    """
+
+    def __init__(self, environ: Mapping[str, str] | None = None) -> None:
+        """Initialize substitutor.
+
+        Args:
+            environ: Environment to read; defaults to os.environ
+        """
+        self._environ = os.environ if environ is None else environ
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._memo: dict[str, str | None] = {}
+
+    @property
+    def generation(self) -> int:
+        """Number of environment changes seen by refresh()."""
+        return self._generation
+
+    def lookup(self, name: str) -> str | None:
+        """Get a variable's value in the current generation.
+
+        Args:
+            name: Variable name
+
+        Returns:
+            Value, or None if the variable is not set
+        """
+        memo = self._memo
+        try:
+            return memo[name]
+        except KeyError:
+            value = memo[name] = self._environ.get(name)
+            return value
+
+    def refresh(self) -> frozenset[str]:
+        """Start a new generation if memoized variables changed.
+
+        Returns:
+            Memoized variables whose value changed, empty if none did
+        """
+        with self._lock:
+            environ = self._environ
+            changed = frozenset(
+                name for name, value in self._memo.items() if environ.get(name) != value
+            )
+            if changed:
+                self._generation += 1
+                self._memo = {}
+        return changed
+
+    def substitute(
+        self,
+        document: Any,
+        deferred: Collection[str] = (),
+        strict: bool = True,
+    ) -> SubstitutionResult:
+        """Substitute all references in a document in a single pass.
+
+        Args:
+            document: Parsed configuration document
+            deferred: Top-level keys to leave unsubstituted; their references
+                are still recorded as dependencies
+            strict: Whether a missing required variable raises; otherwise it
+                is replaced by an empty string and reported in missing
+
+        Returns:
+            Substituted document with its variable dependencies
+
+        Raises:
+            EnvironmentVariableError: If strict and a required variable is
+                not set
+        """
+        lookup = self.lookup
+        dependencies: dict[str, set[str]] = {}
+        defaulted: set[str] = set()
+        missing: set[str] = set()
+        parts: list[str | int] = []
+
+        def resolve(match: re.Match[str]) -> str:
+            name, default = match.group(1), match.group(2)
+            dependencies.setdefault(name, set()).add(_format_path(parts))
+            value = lookup(name)
+            if default is not None:
+                defaulted.add(name)
+                return default if value is None else value
+            if value is None:
+                if strict:
+                    raise EnvironmentVariableError(
+                        f"Required environment variable '{name}' not found",
+                        variable_name=name,
+                    )
+                missing.add(name)
+                return ""
+            return value
+
+        def walk(value: Any, substitute: bool) -> Any:
+            if isinstance(value, str):
+                if "${" not in value:
+                    return value
+                if substitute:
+                    return ENV_VAR_PATTERN.sub(resolve, value)
+                for match in ENV_VAR_PATTERN.finditer(value):
+                    name = match.group(1)
+                    dependencies.setdefault(name, set()).add(_format_path(parts))
+                    if match.group(2) is not None:
+                        defaulted.add(name)
+                    # Memoize so refresh() notices changes of deferred values
+                    lookup(name)
+                return value
+            if isinstance(value, dict):
+                result = {}
+                for key, item in value.items():
+                    parts.append(str(key))
+                    result[key] = walk(
+                        item, substitute and not (len(parts) == 1 and key in deferred)
+                    )
+                    parts.pop()
+                return result
+            if isinstance(value, list):
+                items = []
+                for index, item in enumerate(value):
+                    parts.append(index)
+                    items.append(walk(item, substitute))
+                    parts.pop()
+                return items
+            return value
+
+        substituted = walk(document, True)
+        return SubstitutionResult(
+            value=substituted,
+            dependencies={
+                name: frozenset(paths) for name, paths in dependencies.items()
+            },
+            defaulted=frozenset(defaulted),
+            missing=frozenset(missing),
+        )
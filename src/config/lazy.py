@@ -0,0 +1,281 @@
+"""Lazy, section-level configuration loading for fast startup.
+
+Large deployments configure thousands of repositories, and building and
+validating every RepositoryConfig at startup dominates the time CLI tools and
+short-lived workers need before their first configuration read. This module
+defers that work:
+
+- ConfigDocumentCache keeps the parsed YAML document in a compact binary file
+  keyed by the configuration file's SHA-256, so unchanged files skip YAML
+  parsing entirely.
+- LazyConfig validates the small sections eagerly and keeps deferred sections
+  (repositories) as raw data until they are first accessed, at which point
+  they are validated, checked and cached on the instance.
+
+The cache stores the document as written, before environment variable
+substitution, so secrets provided through ${VAR} references never reach disk.
+"""
+
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+import yaml
+from pydantic import PrivateAttr, TypeAdapter, ValidationError
+
+from .environment import SUBSTITUTED_CONTEXT, EnvironmentSubstitutor
+from .exceptions import ConfigurationValidationError, EnvironmentVariableError
+from .models import Config
+
+# Sections validated on first access instead of at load time
+DEFERRABLE_SECTIONS: tuple[str, ...] = ("repositories",)
+
+_YAML_LOADER: Any = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Materialization is rare, so one lock for all instances is enough
+_materialize_lock = threading.Lock()
+
+_section_adapters: dict[str, TypeAdapter[Any]] = {}
+
+
+def _section_adapter(section: str) -> TypeAdapter[Any]:
+    """Get a cached type adapter validating a Config section."""
+    adapter = _section_adapters.get(section)
+    if adapter is None:
+        adapter = TypeAdapter(Config.model_fields[section].annotation or Any)
+        _section_adapters[section] = adapter
+    return adapter
+
+
+def default_cache_dir() -> Path:
+    """Get the directory for cached configuration documents.
+
+    Uses AGENTIC_CONFIG_CACHE_DIR if set, else the user cache directory.
+    """
+    if configured := os.getenv("AGENTIC_CONFIG_CACHE_DIR"):
+        return Path(configured)
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "agentic" / "config"
+
+
+class ConfigDocumentCache:
+    """On-disk cache of parsed configuration documents keyed by file hash.
+
+    Entries are marshal-encoded, which is several times faster to load than
+    YAML and, unlike pickle, cannot execute code. There is one entry per
+    configuration path; an entry is only used when the file's current
+    SHA-256 matches the hash stored with it.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        """Initialize document cache.
+
+        Args:
+            cache_dir: Directory for cache entries; defaults to
+                default_cache_dir()
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Path) -> dict[str, Any]:
+        """Get the parsed document of a configuration file.
+
+        Args:
+            path: Configuration file to read
+
+        Returns:
+            Parsed YAML document
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        entry = self._entry_path(path)
+
+        cached = self._read(entry, digest)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        document = yaml.load(content, Loader=_YAML_LOADER) or {}
+        self._write(entry, digest, document)
+        return document
+
+    def _entry_path(self, path: Path) -> Path:
+        """Get the cache entry location for a configuration file."""
+        key = hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:32]
+        return self.cache_dir / f"{key}.bin"
+
+    def _header(self, digest: str) -> tuple[int, int, str]:
+        """Get the header an entry for a file with this hash must carry."""
+        return (self.FORMAT_VERSION, marshal.version, digest)
+
+    def _read(self, entry: Path, digest: str) -> dict[str, Any] | None:
+        """Read an entry if it exists and matches the file hash."""
+        try:
+            header, document = marshal.loads(entry.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if tuple(header) != self._header(digest) or not isinstance(document, dict):
+            return None
+        return document
+
+    def _write(self, entry: Path, digest: str, document: Any) -> None:
+        """Write an entry atomically; caching is best effort."""
+        try:
+            payload = marshal.dumps((self._header(digest), document))
+        except ValueError:
+            # Documents with YAML timestamps or other objects are not cached
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as tmp:
+                tmp.write(payload)
+            os.chmod(tmp.name, 0o600)
+            os.replace(tmp.name, entry)
+        except OSError:
+            return
+
+
+class LazyConfig(Config):
+    """Configuration whose deferred sections are validated on first access.
+
+    Behaves like Config: deferred sections materialize transparently on
+    attribute access, and serialization materializes everything first.
+    """
+
+    _deferred: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _environment: EnvironmentSubstitutor | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_document(
+        cls,
+        document: dict[str, Any],
+        deferred_sections: tuple[str, ...] = DEFERRABLE_SECTIONS,
+        environment: EnvironmentSubstitutor | None = None,
+    ) -> "LazyConfig":
+        """Validate a document, deferring the given sections.
+
+        Args:
+            document: Parsed configuration document
+            deferred_sections: Sections to validate on first access
+            environment: Substitutor that already substituted every section
+                except the deferred ones, which it substitutes on first
+                access; None lets the models substitute while validating
+
+        Returns:
+            Configuration with deferred sections pending
+
+        Raises:
+            pydantic.ValidationError: If an eagerly validated section is
+                invalid
+        """
+        context: dict[str, Any] = {"deferred_sections": deferred_sections}
+        if environment is not None:
+            context.update(SUBSTITUTED_CONTEXT)
+        config = cls.model_validate(document, context=context)
+        config._environment = environment
+        for section in deferred_sections:
+            if section in config.__dict__:
+                config._deferred[section] = config.__dict__.pop(section)
+        return config
+
+    @property
+    def deferred_sections(self) -> frozenset[str]:
+        """Sections not yet validated."""
+        return frozenset(self._deferred)
+
+    def __getattr__(self, name: str) -> Any:
+        """Materialize deferred sections on first access."""
+        if not name.startswith("_"):
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and name in private.get("_deferred", ()):
+                return self.materialize_section(name)
+        return super().__getattr__(name)  # type: ignore[misc]
+
+    def materialize_section(self, section: str) -> Any:
+        """Validate a deferred section and store it on the instance.
+
+        Args:
+            section: Section name
+
+        Returns:
+            Validated section value
+
+        Raises:
+            ConfigurationValidationError: If the section is invalid
+        """
+        with _materialize_lock:
+            if section not in self._deferred:
+                return self.__dict__[section]
+
+            raw = self._deferred[section]
+            try:
+                if self._environment is None:
+                    value = _section_adapter(section).validate_python(raw)
+                else:
+                    value = _section_adapter(section).validate_python(
+                        self._environment.substitute(raw).value,
+                        context=SUBSTITUTED_CONTEXT,
+                    )
+            except (ValidationError, EnvironmentVariableError) as e:
+                raise ConfigurationValidationError(
+                    f"Configuration validation failed for '{section}': {e}"
+                ) from e
+
+            self.__dict__[section] = value
+            del self._deferred[section]
+
+            # Imported here: validation imports the models this module extends
+            from .validation import ConfigurationValidator
+
+            errors, _ = ConfigurationValidator(self).validate_section(section)
+            if errors:
+                self._deferred[section] = self.__dict__.pop(section)
+                raise ConfigurationValidationError(
+                    f"Configuration validation failed for '{section}'",
+                    validation_errors=errors,
+                )
+            return value
+
+    def materialize(self) -> None:
+        """Validate all deferred sections."""
+        for section in list(self._deferred):
+            self.materialize_section(section)
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Dump the configuration, materializing deferred sections first."""
+        self.materialize()
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Dump the configuration as JSON, materializing it first."""
+        self.materialize()
+        return super().model_dump_json(**kwargs)
+
+    def model_copy(self, **kwargs: Any) -> "LazyConfig":
+        """Copy the configuration, materializing it first."""
+        self.materialize()
+        return super().model_copy(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare configurations, materializing both first."""
+        self.materialize()
+        if isinstance(other, LazyConfig):
+            other.materialize()
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
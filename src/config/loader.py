@@ -13,11 +13,13 @@ The loading hierarchy is:
 """
 
 import os
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
+from .environment import SUBSTITUTED_CONTEXT, EnvironmentSubstitutor
 from .exceptions import (
     ConfigurationError,
     ConfigurationFileError,
@@ -25,6 +27,9 @@ from .exceptions import (
 )
 from .models import Config
 
+if TYPE_CHECKING:
+    from .lazy import ConfigDocumentCache, LazyConfig
+
 
 class ConfigurationLoader:
     """Handles loading and validation of configuration from various sources."""
@@ -38,6 +43,11 @@ class ConfigurationLoader:
             "env": False,
             "defaults": True,
         }
+        # Unsubstituted document of the last load, for environment reloads
+        self._environment = EnvironmentSubstitutor()
+        self._document: dict[str, Any] | None = None
+        self._document_lazy = False
+        self._env_dependencies: Mapping[str, frozenset[str]] = {}
 
     def load_from_file(self, config_path: str | Path, validate: bool = True) -> Config:
         """Load configuration from a YAML file.
@@ -80,7 +90,7 @@ class ConfigurationLoader:
             ) from e
 
         try:
-            self._config = Config(**config_data)
+            self._config = self._build(config_data)
             self._config_file_path = config_path.resolve()
             self._loaded_from_sources["file"] = True
 
@@ -94,6 +104,57 @@ class ConfigurationLoader:
 
         return self._config
 
+    def load_lazy(
+        self,
+        config_path: str | Path,
+        cache: "ConfigDocumentCache | None" = None,
+    ) -> "LazyConfig":
+        """Load configuration from a YAML file, deferring heavy sections.
+
+        Repositories are validated on first access instead of at load time,
+        and the parsed document is cached by file hash so unchanged files
+        skip YAML parsing on the next start.
+
+        Args:
+            config_path: Path to the YAML configuration file
+            cache: Document cache to use; defaults to the user cache directory
+
+        Returns:
+            Configuration with deferred sections pending
+
+        Raises:
+            ConfigurationFileError: If file cannot be read or parsed
+            ConfigurationValidationError: If an eager section is invalid
+        """
+        from .lazy import ConfigDocumentCache
+
+        config_path = Path(config_path)
+
+        if not config_path.is_file():
+            raise ConfigurationFileError(f"Configuration file not found: {config_path}")
+
+        try:
+            document = (cache or ConfigDocumentCache()).load(config_path)
+        except yaml.YAMLError as e:
+            raise ConfigurationFileError(
+                f"Failed to parse YAML configuration: {e}"
+            ) from e
+        except OSError as e:
+            raise ConfigurationFileError(
+                f"Failed to read configuration file: {e}"
+            ) from e
+
+        try:
+            self._config = config = self._build_lazy(document)
+        except Exception as e:
+            raise ConfigurationValidationError(
+                f"Configuration validation failed: {e}"
+            ) from e
+
+        self._config_file_path = config_path.resolve()
+        self._loaded_from_sources["file"] = True
+        return config
+
     def load_from_dict(
         self, config_data: dict[str, Any], validate: bool = True
     ) -> Config:
@@ -110,7 +171,7 @@ class ConfigurationLoader:
             ConfigurationValidationError: If configuration validation fails
         """
         try:
-            self._config = Config(**config_data)
+            self._config = self._build(config_data)
             self._loaded_from_sources["dict"] = True
 
             if validate:
@@ -123,6 +184,84 @@ class ConfigurationLoader:
 
         return self._config
 
+    def environment_changes(self) -> frozenset[str]:
+        """Get referenced environment variables changed since the last load.
+
+        Returns:
+            Names of changed variables the loaded document references
+        """
+        changed = self._environment.refresh()
+        return frozenset(changed & self._env_dependencies.keys())
+
+    def reload_environment(self) -> Config:
+        """Substitute the last loaded document again and rebuild it.
+
+        The document is not read or parsed again, so this is the cheap path
+        when only environment variables changed.
+
+        Returns:
+            Configuration built from the current environment
+
+        Raises:
+            ConfigurationError: If no document was loaded
+            ConfigurationValidationError: If configuration validation fails
+        """
+        if self._document is None:
+            raise ConfigurationError("No configuration document loaded")
+
+        try:
+            self._config = self._build(self._document, lazy=self._document_lazy)
+        except Exception as e:
+            raise ConfigurationValidationError(
+                f"Configuration validation failed: {e}"
+            ) from e
+        return self._config
+
+    def _build(self, document: dict[str, Any], lazy: bool = False) -> Config:
+        """Substitute environment variables once and validate a document.
+
+        Args:
+            document: Parsed configuration document
+            lazy: Whether to defer validating heavy sections
+
+        Returns:
+            Validated configuration
+
+        Raises:
+            EnvironmentVariableError: If a required variable is not set
+            pydantic.ValidationError: If the document is invalid
+        """
+        if lazy:
+            return self._build_lazy(document)
+
+        values = self._substitute(document, lazy=False)
+        return Config.model_validate(values, context=SUBSTITUTED_CONTEXT)
+
+    def _build_lazy(self, document: dict[str, Any]) -> "LazyConfig":
+        """Substitute and validate a document, deferring heavy sections."""
+        from .lazy import LazyConfig
+
+        values = self._substitute(document, lazy=True)
+        return LazyConfig.from_document(values, environment=self._environment)
+
+    def _substitute(self, document: dict[str, Any], lazy: bool) -> Any:
+        """Substitute a document in one pass and remember it for reloads."""
+        from .lazy import DEFERRABLE_SECTIONS
+
+        self._environment.refresh()
+        result = self._environment.substitute(
+            document, deferred=DEFERRABLE_SECTIONS if lazy else ()
+        )
+        self._document = document
+        self._document_lazy = lazy
+        self._env_dependencies = result.dependencies
+        return result.value
+
+    @property
+    def env_dependencies(self) -> Mapping[str, frozenset[str]]:
+        """Configuration paths of the last load referencing each variable."""
+        return self._env_dependencies
+
     def load_default(self) -> Config:
         """Load configuration with default values only.
 
@@ -11,14 +11,23 @@ The manager provides:
 - Configuration validation and health monitoring
 - Batch operations for efficient startup
 - Hot reload capabilities with cache invalidation
+- File watching with diff-based invalidation and change subscribers
+- Binary snapshots letting worker processes start without validation
+
+Reads go through an immutable snapshot of the configuration that is swapped
+atomically on load, reload and override changes, so get() never takes a lock.
+Access patterns are sampled instead of recorded on every read.
 """
 
+import itertools
 import threading
 import time
+from collections.abc import Callable, Iterable
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Any, TypeVar
 
-from .cache import ConfigurationCache, set_config_cache
+from .cache import ConfigurationCache, get_config_cache, set_config_cache
 from .exceptions import ConfigurationError
 from .loader import ConfigurationLoader, reload_config
 from .metrics import (
@@ -27,10 +36,16 @@ from .metrics import (
     time_operation,
 )
 from .models import Config
+from .snapshot import _MISSING, ConfigAccessor, ConfigSnapshot, SnapshotSource
 from .validation import validate_config
+from .watcher import ConfigChange, ConfigWatcher, WatchBackend, diff_configs
+from .worker_snapshot import read_config_snapshot, write_config_snapshot
 
 T = TypeVar("T")
 
+# Change callback and the sections it subscribed to, None for all
+_Subscriber = tuple[Callable[[ConfigChange], None], frozenset[str] | None]
+
 
 class ConfigurationManager:
     """High-performance configuration manager with caching and monitoring.
@@ -45,6 +60,7 @@ class ConfigurationManager:
         config: Config | None = None,
         enable_caching: bool = True,
         enable_metrics: bool = True,
+        access_sample_rate: int = 100,
     ) -> None:
         """Initialize configuration manager.
 
@@ -52,7 +68,12 @@ class ConfigurationManager:
             config: Optional initial configuration
             enable_caching: Whether to enable configuration caching
             enable_metrics: Whether to enable metrics collection
+            access_sample_rate: Record one in this many reads in the access
+                pattern metrics, weighted to estimate the total
         """
+        if access_sample_rate < 1:
+            raise ValueError("access_sample_rate must be at least 1")
+
         self._config: Config | None = config
         self._loader = ConfigurationLoader()
         self._lock = threading.RLock()
@@ -80,12 +101,24 @@ class ConfigurationManager:
         self._overrides: dict[str, Any] = {}
         self._override_stack: list[dict[str, Any]] = []
 
+        # Lock-free read path
+        self._snapshots = SnapshotSource()
+        self._access_sample_rate = access_sample_rate
+        self._reads = itertools.count()
+        if config is not None:
+            self._publish()
+
+        # Hot reload
+        self._subscribers: list[_Subscriber] = []
+        self._watcher: ConfigWatcher | None = None
+
     @time_operation("load_config")
     def load_configuration(
         self,
         config_path: str | None = None,
         auto_discover: bool = True,
         validate: bool = True,
+        lazy: bool = False,
     ) -> Config:
         """Load configuration with performance tracking.
 
@@ -93,6 +126,8 @@ class ConfigurationManager:
             config_path: Optional explicit configuration file path
             auto_discover: Whether to auto-discover config file if path not provided
             validate: Whether to validate configuration after loading
+            lazy: Whether to defer validating repositories until first access
+                and reuse the cached parse of an unchanged file
 
         Returns:
             Loaded and validated configuration
@@ -106,7 +141,16 @@ class ConfigurationManager:
 
             try:
                 # Load configuration using existing loader
-                if config_path:
+                config: Config
+                lazy_path = None
+                if lazy:
+                    lazy_path = config_path or (
+                        self._loader.find_config_file() if auto_discover else None
+                    )
+
+                if lazy_path:
+                    config = self._loader.load_lazy(lazy_path)
+                elif config_path:
                     config = self._loader.load_from_file(config_path, validate=False)
                 elif auto_discover:
                     config = self._loader.auto_load()
@@ -125,22 +169,7 @@ class ConfigurationManager:
                             {"validation_time": validation_time},
                         )
 
-                # Store configuration
-                self._config = config
-                self._is_loaded = True
-                self._load_time = time.time() - start_time
-
-                # Update cache if enabled
-                if self._cache:
-                    self._cache.set_config(config)
-                    set_config_cache(config)  # Update global cache
-
-                # Record metrics
-                if self._metrics:
-                    self._metrics.record_event(
-                        ConfigurationEvent.CONFIG_LOADED, {"load_time": self._load_time}
-                    )
-
+                self._store_loaded(config, start_time)
                 return config
 
             except Exception as e:
@@ -151,6 +180,78 @@ class ConfigurationManager:
                     )
                 raise
 
+    @time_operation("load_snapshot")
+    def load_snapshot(
+        self,
+        snapshot_path: str | Path,
+        config_path: str | None = None,
+        auto_discover: bool = True,
+        validate: bool = True,
+    ) -> Config:
+        """Load configuration from a snapshot written by export_snapshot().
+
+        The snapshot was validated when it was exported, so it is neither
+        parsed nor validated again. If it is missing, was written for another
+        configuration schema, or its configuration file has changed since,
+        the configuration is loaded in full instead.
+
+        Args:
+            snapshot_path: Snapshot file
+            config_path: Configuration file path for the full-load fallback
+            auto_discover: Whether the fallback may auto-discover the file
+            validate: Whether the fallback validates the configuration
+
+        Returns:
+            Loaded configuration
+
+        Raises:
+            ConfigurationError: If the fallback cannot load configuration
+            ConfigurationValidationError: If fallback validation fails
+        """
+        start_time = time.time()
+        config = read_config_snapshot(snapshot_path)
+        if config is None:
+            if self._metrics:
+                self._metrics.record_event(
+                    ConfigurationEvent.CACHE_MISS, {"snapshot": str(snapshot_path)}
+                )
+            fallback: Config = self.load_configuration(
+                config_path, auto_discover, validate
+            )
+            return fallback
+
+        with self._lock:
+            self._store_loaded(config, start_time)
+        return config
+
+    def export_snapshot(self, path: str | Path) -> Path:
+        """Write the current configuration to a snapshot file for workers.
+
+        The snapshot is tied to the configuration file it was loaded from, if
+        any, and is rejected by load_snapshot() once that file changes.
+        Environment changes are not detected; export again after
+        refresh_environment() applied a change.
+
+        Args:
+            path: Snapshot file to write
+
+        Returns:
+            Path of the written snapshot
+
+        Raises:
+            ConfigurationError: If no configuration is loaded or it cannot be
+                written
+        """
+        config = self.config
+        try:
+            return write_config_snapshot(
+                config, path, source=self._loader.config_file_path
+            )
+        except (OSError, ValueError) as e:
+            raise ConfigurationError(
+                f"Failed to write configuration snapshot: {e}"
+            ) from e
+
     @time_operation("reload_config")
     def reload_configuration(self, validate: bool = True) -> Config:
         """Reload configuration with cache invalidation.
@@ -181,6 +282,7 @@ class ConfigurationManager:
                 # Update internal state
                 self._config = config
                 self._last_reload_time = time.time() - start_time
+                self._publish()
 
                 # Invalidate cache and update with new config
                 if self._cache:
@@ -202,8 +304,225 @@ class ConfigurationManager:
                     self._metrics.record_error("config_reload_error", str(e))
                 raise
 
+    def apply_configuration(self, config: Config) -> ConfigChange:
+        """Swap in an already validated configuration incrementally.
+
+        Only cache entries under changed paths are invalidated, and only
+        subscribers of changed sections are notified. Applying a configuration
+        equal to the current one is a no-op.
+
+        Args:
+            config: New configuration
+
+        Returns:
+            The applied change, with an empty diff list if nothing changed
+
+        Raises:
+            ConfigurationError: If no configuration is loaded
+        """
+        with self._lock:
+            change, subscribers = self._swap_configuration(config)
+        self._notify_subscribers(change, subscribers)
+        return change
+
+    def reload_file(
+        self, config_path: str | Path, validate: bool = True
+    ) -> ConfigChange:
+        """Load a changed configuration file and apply it incrementally.
+
+        The file is loaded by a new loader that replaces the manager's own
+        once the configuration is applied, so later environment refreshes
+        substitute the document that is live. A file that fails to load or
+        validate leaves the manager unchanged.
+
+        Args:
+            config_path: Configuration file to load
+            validate: Whether to validate the new configuration
+
+        Returns:
+            The applied change, with an empty diff list if nothing changed
+
+        Raises:
+            ConfigurationError: If no configuration is loaded or the file
+                cannot be loaded
+            ConfigurationValidationError: If the new configuration is invalid
+        """
+        with self._lock:
+            if not self._is_loaded:
+                raise ConfigurationError("No configuration loaded to update")
+
+            loader = ConfigurationLoader()
+            config = loader.load_from_file(config_path, validate=False)
+            if validate:
+                validate_config(config, raise_on_error=True)
+
+            self._loader = loader
+            change, subscribers = self._swap_configuration(config)
+        self._notify_subscribers(change, subscribers)
+        return change
+
+    def refresh_environment(self, validate: bool = True) -> ConfigChange | None:
+        """Apply changes of environment variables the configuration references.
+
+        Only the loaded document is substituted again; the file is not read.
+        Variables the configuration does not reference are ignored, and
+        subscribers are notified only for sections whose values changed.
+
+        Args:
+            validate: Whether to validate the new configuration
+
+        Returns:
+            The applied change, or None if no referenced variable changed
+
+        Raises:
+            ConfigurationError: If no configuration is loaded
+            ConfigurationValidationError: If the new configuration is invalid
+        """
+        with self._lock:
+            if not self._is_loaded:
+                raise ConfigurationError("No configuration loaded to update")
+
+            if not self._loader.environment_changes():
+                return None
+
+            config = self._loader.reload_environment()
+            if validate:
+                validate_config(config, raise_on_error=True)
+
+            change, subscribers = self._swap_configuration(config)
+        self._notify_subscribers(change, subscribers)
+        return change
+
+    def _swap_configuration(
+        self, config: Config
+    ) -> tuple[ConfigChange, list[_Subscriber]]:
+        """Publish a new configuration; the caller holds the lock.
+
+        Returns:
+            The change, and the subscribers to notify once the lock is released
+        """
+        if not self._is_loaded or self._config is None:
+            raise ConfigurationError("No configuration loaded to update")
+
+        start_time = time.time()
+        change = ConfigChange(
+            old=self._config, new=config, diffs=diff_configs(self._config, config)
+        )
+        if not change.diffs:
+            return change, []
+
+        self._config = config
+        self._publish()
+
+        if self._cache:
+            self._cache.update_config(config, change.paths)
+            get_config_cache().update_config(config, change.paths)
+
+        self._last_reload_time = time.time() - start_time
+        if self._metrics:
+            self._metrics.record_event(
+                ConfigurationEvent.CONFIG_RELOADED,
+                {
+                    "reload_time": self._last_reload_time,
+                    "changed_sections": sorted(change.sections),
+                    "changed_paths": len(change.paths),
+                },
+            )
+
+        return change, list(self._subscribers)
+
+    def _notify_subscribers(
+        self,
+        change: ConfigChange,
+        subscribers: list[_Subscriber],
+    ) -> None:
+        """Notify subscribers of changed sections, outside the lock."""
+        for callback, sections in subscribers:
+            if sections is not None and not sections & change.sections:
+                continue
+            try:
+                callback(change)
+            except Exception as e:
+                if self._metrics:
+                    self._metrics.record_error(
+                        "config_subscriber_error",
+                        str(e),
+                        {"subscriber": getattr(callback, "__qualname__", "")},
+                    )
+
+    def subscribe(
+        self,
+        callback: Callable[[ConfigChange], None],
+        sections: Iterable[str] | None = None,
+    ) -> Callable[[], None]:
+        """Subscribe to configuration changes.
+
+        Args:
+            callback: Called with the ConfigChange after it has been applied
+            sections: Top-level sections of interest, e.g. ["database"];
+                None subscribes to every change
+
+        Returns:
+            Function that removes the subscription
+        """
+        entry = (callback, frozenset(sections) if sections is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def start_watching(
+        self,
+        config_path: str | Path | None = None,
+        backend: WatchBackend = "auto",
+        poll_interval: float = 1.0,
+        debounce: float = 0.5,
+    ) -> ConfigWatcher:
+        """Hot reload the configuration file whenever it changes.
+
+        Args:
+            config_path: File to watch; defaults to the loaded file
+            backend: "inotify", "polling", or "auto"
+            poll_interval: Seconds between stat checks when polling
+            debounce: Seconds without further changes before reloading
+
+        Returns:
+            Running watcher
+
+        Raises:
+            ConfigurationError: If there is no file to watch
+        """
+        path = config_path or self._loader.config_file_path
+        if path is None:
+            raise ConfigurationError("No configuration file to watch")
+
+        # Stopped outside the lock, the old watcher may be applying a reload
+        self.stop_watching()
+        with self._lock:
+            self._watcher = ConfigWatcher(
+                self,
+                path,
+                backend=backend,
+                poll_interval=poll_interval,
+                debounce=debounce,
+            )
+            self._watcher.start()
+            return self._watcher
+
+    def stop_watching(self) -> None:
+        """Stop the configuration file watcher if one is running."""
+        with self._lock:
+            watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.stop()
+
     def get(self, key: str, default: Any = None) -> Any:
-        """Get configuration value with caching and metrics.
+        """Get configuration value from the current snapshot.
 
         Args:
             key: Configuration key in dot notation
@@ -212,30 +531,43 @@ class ConfigurationManager:
         Returns:
             Configuration value or default
         """
-        if not self._is_loaded:
+        snapshot = self._snapshots.snapshot
+        if snapshot is None:
             raise ConfigurationError("No configuration loaded")
 
-        # Record access pattern
-        if self._metrics:
-            self._metrics.record_access_pattern(key, "read")
+        self._sample_access(key)
+        return snapshot.get(key, default)
 
-        # Try cache first if enabled
-        if self._cache:
-            return self._cache.get(key, default)
+    def accessor(self, key: str, default: Any = _MISSING) -> ConfigAccessor[Any]:
+        """Resolve an accessor for a configuration key read on hot paths.
 
-        # Fallback to direct access
-        try:
-            value: Any = self._config
-            for part in key.split("."):
-                if hasattr(value, part):
-                    value = getattr(value, part)
-                elif isinstance(value, dict) and part in value:
-                    value = value[part]
-                else:
-                    return default
-            return value
-        except (AttributeError, KeyError, TypeError):
-            return default
+        The accessor keeps following reloads and overrides, and only looks the
+        key up again when a new snapshot has been published.
+
+        Args:
+            key: Configuration key in dot notation
+            default: Value for a missing key; if omitted, a missing key raises
+
+        Returns:
+            Accessor whose get() returns the key's current value
+
+        Raises:
+            ConfigurationError: If no configuration is loaded, or the key does
+                not exist and no default was given
+        """
+        return ConfigAccessor(self._snapshots, key, default)
+
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """Get the currently published configuration snapshot.
+
+        Raises:
+            ConfigurationError: If no configuration is loaded
+        """
+        snapshot = self._snapshots.snapshot
+        if snapshot is None:
+            raise ConfigurationError("No configuration loaded")
+        return snapshot
 
     def get_section(self, section: str) -> dict[str, Any]:
         """Get entire configuration section with caching.
@@ -256,13 +588,15 @@ class ConfigurationManager:
         if self._metrics:
             self._metrics.record_access_pattern(f"section:{section}", "read")
 
-        # Try cache first if enabled
-        if self._cache:
+        # The cache holds sections as loaded; overrides live in the snapshot
+        if self._cache and not self._overrides:
             return self._cache.get_section(section)
 
-        # Fallback to direct access
+        # Fallback to the snapshot, which has overrides applied
         try:
-            section_obj: Any = getattr(self._config, section)
+            section_obj: Any = self.snapshot.get(section, _MISSING)
+            if section_obj is _MISSING:
+                raise AttributeError(section)
 
             if hasattr(section_obj, "model_dump"):
                 model_result: dict[str, Any] = section_obj.model_dump()
@@ -292,16 +626,8 @@ class ConfigurationManager:
         if not self._is_loaded:
             raise ConfigurationError("No configuration loaded")
 
-        # Use cache batch operation if available
-        if self._cache:
-            return self._cache.batch_get(keys)
-
-        # Fallback to individual gets
-        result = {}
-        for key in keys:
-            result[key] = self.get(key)
-
-        return result
+        snapshot = self.snapshot
+        return {key: snapshot.get(key) for key in keys}
 
     def get_database_config(self) -> dict[str, Any]:
         """Get database configuration with type safety.
@@ -390,6 +716,7 @@ class ConfigurationManager:
             # Invalidate cache for this key
             if self._cache:
                 self._cache.invalidate(key)
+            self._publish()
 
     def remove_override(self, key: str) -> None:
         """Remove configuration override.
@@ -403,6 +730,7 @@ class ConfigurationManager:
             # Invalidate cache for this key
             if self._cache:
                 self._cache.invalidate(key)
+            self._publish()
 
     @contextmanager
     def override_context(self, overrides: dict[str, Any]) -> Any:
@@ -427,6 +755,7 @@ class ConfigurationManager:
             if self._cache:
                 for key in overrides:
                     self._cache.invalidate(key)
+            self._publish()
 
             yield
 
@@ -438,6 +767,7 @@ class ConfigurationManager:
             if self._cache:
                 for key in overrides:
                     self._cache.invalidate(key)
+            self._publish()
 
     def warm_cache(self, keys: list[str] | None = None) -> None:
         """Pre-load configuration values into cache.
@@ -474,6 +804,14 @@ class ConfigurationManager:
             "cache_enabled": self._enable_caching,
             "metrics_enabled": self._enable_metrics,
             "active_overrides": len(self._overrides),
+            "snapshot_version": (
+                snapshot.version
+                if (snapshot := self._snapshots.snapshot) is not None
+                else None
+            ),
+            "access_sample_rate": self._access_sample_rate,
+            "watching": self._watcher is not None and self._watcher.is_running,
+            "subscribers": len(self._subscribers),
         }
 
         return metrics
@@ -550,6 +888,40 @@ class ConfigurationManager:
             raise_on_error=raise_on_error,
         )
 
+    def _store_loaded(self, config: Config, start_time: float) -> None:
+        """Make a newly loaded configuration current."""
+        self._config = config
+        self._is_loaded = True
+        self._load_time = time.time() - start_time
+        self._publish()
+
+        # Update cache if enabled
+        if self._cache:
+            self._cache.set_config(config)
+            set_config_cache(config)  # Update global cache
+
+        # Record metrics
+        if self._metrics:
+            self._metrics.record_event(
+                ConfigurationEvent.CONFIG_LOADED, {"load_time": self._load_time}
+            )
+
+    def _publish(self) -> None:
+        """Publish a snapshot of the current configuration and overrides."""
+        with self._lock:
+            if self._config is not None:
+                self._snapshots.publish(self._config, self._overrides)
+
+    def _sample_access(self, key: str) -> None:
+        """Record one in access_sample_rate reads in the access metrics."""
+        if self._metrics is None:
+            return
+        # next() on itertools.count is atomic, so no lock is needed
+        if next(self._reads) % self._access_sample_rate == 0:
+            self._metrics.record_access_pattern(
+                key, "read", count=self._access_sample_rate
+            )
+
     @property
     def config(self) -> Config:
         """Get the underlying configuration object.
@@ -595,6 +967,7 @@ def initialize_config_manager(
     config_path: str | None = None,
     enable_caching: bool = True,
     enable_metrics: bool = True,
+    lazy: bool = False,
 ) -> ConfigurationManager:
     """Initialize the global configuration manager.
 
@@ -602,6 +975,7 @@ def initialize_config_manager(
         config_path: Optional configuration file path
         enable_caching: Whether to enable caching
         enable_metrics: Whether to enable metrics
+        lazy: Whether to defer validating repositories until first access
 
     Returns:
         Initialized configuration manager
@@ -614,7 +988,9 @@ def initialize_config_manager(
         )
 
         # Load configuration if path provided
-        if True:  # Always auto-discover by default
+        if lazy:
+            _global_manager.load_configuration(config_path, lazy=True)
+        else:  # Always auto-discover by default
             _global_manager.load_configuration(config_path)
 
     return _global_manager
@@ -0,0 +1,342 @@
+"""Low-overhead storage primitives for configuration metrics.
+
+Recording a metric must cost far less than the operation it measures, so the
+primitives here avoid locks on the write path:
+
+- ShardedCounter keeps one counter dict per thread. A thread only ever writes
+  its own shard, and readers add the shards up.
+- QuantileSketch is a streaming, mergeable quantile sketch with bounded
+  memory and bounded relative error, replacing unbounded lists of samples.
+- ShardedSketches keeps per-thread sketches and merges them on read.
+
+Shards of threads that have exited are folded into a retired shard on the
+next read, so short-lived threads do not accumulate shards.
+"""
+
+import math
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+
+class QuantileSketch:
+    """Streaming quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized buckets, so any quantile is
+    estimated within relative_accuracy of a value of the same rank. Sketches
+    of the same accuracy merge exactly, which is what lets every thread keep
+    its own. When more than max_buckets are in use, the lowest buckets are
+    collapsed, trading accuracy on the smallest values for bounded memory.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_gamma_log",
+        "_index_scale",
+        "_zero_count",
+        "count",
+        "max",
+        "max_buckets",
+        "min",
+        "relative_accuracy",
+        "total",
+    )
+
+    # Values at or below this are counted as zero
+    MIN_VALUE = 1e-9
+
+    def __init__(
+        self, relative_accuracy: float = 0.01, max_buckets: int = 2048
+    ) -> None:
+        """Initialize quantile sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+            max_buckets: Maximum number of buckets kept
+
+        Raises:
+            ValueError: If relative_accuracy is not between 0 and 1
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._gamma_log = math.log(gamma)
+        self._index_scale = 1 / self._gamma_log
+        self._buckets: dict[int, float] = {}
+        self._zero_count = 0.0
+        self.count = 0.0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, weight: float = 1.0) -> None:
+        """Add a value.
+
+        Args:
+            value: Observed value
+            weight: Number of observations the value stands for, for sampled
+                recording
+        """
+        if value > self.MIN_VALUE:
+            buckets = self._buckets
+            index = math.ceil(math.log(value) * self._index_scale)
+            buckets[index] = buckets.get(index, 0.0) + weight
+            if len(buckets) > self.max_buckets:
+                self._collapse()
+        else:
+            self._zero_count += weight
+
+        self.count += weight
+        self.total += value * weight
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the observations of another sketch of the same accuracy.
+
+        Raises:
+            ValueError: If the sketches have different accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy")
+
+        # Copy first: the owning thread may be adding to the other sketch
+        for index, weight in dict(other._buckets).items():
+            self._buckets[index] = self._buckets.get(index, 0.0) + weight
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the value at quantile q.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if self.count <= 0:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket in relative terms
+                estimate = (
+                    2
+                    * math.exp(index * self._gamma_log)
+                    / (1 + math.exp(self._gamma_log))
+                )
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def summary(
+        self, quantiles: tuple[float, ...] = (0.5, 0.9, 0.95, 0.99)
+    ) -> dict[str, Any]:
+        """Get count, sum, extremes and quantile estimates.
+
+        Returns:
+            Dictionary with count, sum, min, max, avg and a pNN entry per
+            quantile
+        """
+        if self.count <= 0:
+            return {"count": 0}
+
+        summary: dict[str, Any] = {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.total / self.count,
+        }
+        for q in quantiles:
+            summary[f"p{q * 100:g}"] = self.quantile(q)
+        return summary
+
+    def _collapse(self) -> None:
+        """Merge the lowest buckets until max_buckets remain."""
+        indexes = sorted(self._buckets)
+        excess = len(indexes) - self.max_buckets
+        target = indexes[excess]
+        for index in indexes[:excess]:
+            self._buckets[target] += self._buckets.pop(index)
+
+
+class _ThreadSharded[S](ABC):
+    """Base for values kept as one shard per writing thread.
+
+    Writers get their shard from a thread local without locking. Readers
+    take the registry lock, retire shards of exited threads and combine the
+    rest; the lock is never taken on the write path after a thread's first
+    write.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[tuple[weakref.ref[threading.Thread], S]] = []
+        self._retired: S = self._new_shard()
+
+    @abstractmethod
+    def _new_shard(self) -> S:
+        """Create an empty shard."""
+
+    @abstractmethod
+    def _merge_shard(self, into: S, shard: S) -> None:
+        """Add the contents of shard to into."""
+
+    @abstractmethod
+    def _clear_shard(self, shard: S) -> None:
+        """Remove all contents of a shard."""
+
+    def _shard(self) -> S:
+        """Get the calling thread's shard."""
+        try:
+            return self._local.shard  # type: ignore[no-any-return]
+        except AttributeError:
+            shard = self._new_shard()
+            with self._lock:
+                self._shards.append((weakref.ref(threading.current_thread()), shard))
+            self._local.shard = shard
+            return shard
+
+    def _combined(self) -> S:
+        """Combine all shards into a new shard."""
+        combined = self._new_shard()
+        with self._lock:
+            live = []
+            for ref, shard in self._shards:
+                thread = ref()
+                if thread is None or not thread.is_alive():
+                    self._merge_shard(self._retired, shard)
+                else:
+                    live.append((ref, shard))
+            self._shards = live
+
+            self._merge_shard(combined, self._retired)
+            for _, shard in live:
+                self._merge_shard(combined, shard)
+        return combined
+
+    def clear(self) -> None:
+        """Remove all recorded values."""
+        with self._lock:
+            self._clear_shard(self._retired)
+            for _, shard in self._shards:
+                self._clear_shard(shard)
+
+
+class ShardedCounter[K](_ThreadSharded[dict[K, int]], Mapping[K, int]):
+    """Counters incremented without locking, read as a mapping of totals."""
+
+    def increment(self, name: K, value: int = 1) -> None:
+        """Add value to a counter."""
+        shard = self._shard()
+        shard[name] = shard.get(name, 0) + value
+
+    def set(self, name: K, value: int) -> None:
+        """Set a counter to an absolute value.
+
+        Takes the registry lock; increments racing with set() may be lost.
+        """
+        with self._lock:
+            for _, shard in self._shards:
+                shard.pop(name, None)
+            self._retired[name] = value
+
+    def snapshot(self) -> dict[K, int]:
+        """Get the current total of every counter."""
+        return self._combined()
+
+    def __getitem__(self, name: K) -> int:
+        return self.snapshot()[name]
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+    def _new_shard(self) -> dict[K, int]:
+        return {}
+
+    def _merge_shard(self, into: dict[K, int], shard: dict[K, int]) -> None:
+        # dict() copies atomically while the owning thread keeps writing
+        for name, value in dict(shard).items():
+            into[name] = into.get(name, 0) + value
+
+    def _clear_shard(self, shard: dict[K, int]) -> None:
+        shard.clear()
+
+
+class ShardedSketches(
+    _ThreadSharded[dict[str, QuantileSketch]], Mapping[str, QuantileSketch]
+):
+    """Named quantile sketches recorded without locking, merged on read."""
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """Initialize sharded sketches.
+
+        Args:
+            relative_accuracy: Relative accuracy of every sketch
+        """
+        self.relative_accuracy = relative_accuracy
+        super().__init__()
+
+    def observe(self, name: str, value: float, weight: float = 1.0) -> None:
+        """Add a value to the named sketch."""
+        shard = self._shard()
+        sketch = shard.get(name)
+        if sketch is None:
+            sketch = shard[name] = QuantileSketch(self.relative_accuracy)
+        sketch.add(value, weight)
+
+    def snapshot(self) -> dict[str, QuantileSketch]:
+        """Get a merged copy of every sketch."""
+        return self._combined()
+
+    def __getitem__(self, name: str) -> QuantileSketch:
+        return self.snapshot()[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+    def _new_shard(self) -> dict[str, QuantileSketch]:
+        return {}
+
+    def _merge_shard(
+        self, into: dict[str, QuantileSketch], shard: dict[str, QuantileSketch]
+    ) -> None:
+        for name, sketch in dict(shard).items():
+            target = into.get(name)
+            if target is None:
+                target = into[name] = QuantileSketch(self.relative_accuracy)
+            target.merge(sketch)
+
+    def _clear_shard(self, shard: dict[str, QuantileSketch]) -> None:
+        shard.clear()
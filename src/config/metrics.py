@@ -11,16 +11,36 @@ The metrics system tracks:
 - Configuration validation results and errors
 - Cache performance and hit rates
 - Configuration change frequency and impact
+
+Counters, event counts and timing distributions are recorded without taking
+the metrics lock: counters are sharded per thread and timings go into
+bounded streaming quantile sketches (see metric_store). High-volume event
+types can be sampled, with sampled records weighted to estimate the total.
+The collected data can be exported in the Prometheus text format.
 """
 
+import itertools
+import math
+import re
 import threading
 import time
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+from .metric_store import ShardedCounter, ShardedSketches
+
+# Content types for export_prometheus() output
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# Quantiles reported for timing distributions
+SUMMARY_QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+_INVALID_METRIC_CHARS = re.compile(r"[^a-zA-Z0-9_:]")
+
 
 class MetricType(Enum):
     """Types of configuration metrics."""
@@ -44,6 +64,7 @@ class ConfigurationEvent(Enum):
     ACCESS_PATTERN = "access_pattern"
     VALIDATION_ERROR = "validation_error"
     VALIDATION_WARNING = "validation_warning"
+    OPERATION_TIMED = "operation_timed"
 
 
 @dataclass
@@ -55,7 +76,7 @@ class MetricValue:
     tags: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class TimingMetric:
     """Container for timing measurements."""
 
@@ -74,26 +95,54 @@ class ConfigurationMetrics:
     operational health indicators.
     """
 
-    def __init__(self, enable_detailed_tracking: bool = True) -> None:
+    def __init__(
+        self,
+        enable_detailed_tracking: bool = True,
+        sample_rates: Mapping[ConfigurationEvent, int] | None = None,
+        timing_window: int = 1000,
+        relative_accuracy: float = 0.01,
+    ) -> None:
         """Initialize configuration metrics system.
 
         Args:
             enable_detailed_tracking: Whether to track detailed access patterns
+            sample_rates: Record one in this many events of a type, weighted
+                to estimate the total. Event counts stay exact; sampling thins
+                the event log, access patterns (ACCESS_PATTERN) and timings
+                (OPERATION_TIMED). Unlisted types are recorded every time.
+            timing_window: Number of recent timings kept per operation
+            relative_accuracy: Relative error of timing quantile estimates
+
+        Raises:
+            ValueError: If a sample rate is less than 1
         """
+        if sample_rates and min(sample_rates.values()) < 1:
+            raise ValueError("Sample rates must be at least 1")
+
         self._enable_detailed_tracking = enable_detailed_tracking
         self._lock = threading.RLock()
 
+        # Sampling: each event type has an endless iterator of record weights,
+        # rate followed by rate - 1 zeros. next() on itertools iterators runs
+        # in C, so it is atomic and needs no lock.
+        self._sample_rates: dict[ConfigurationEvent, int] = dict(sample_rates or {})
+        self._samplers: dict[ConfigurationEvent, Iterator[int]] = {
+            event: _sample_weights(self._sample_rates.get(event, 1))
+            for event in ConfigurationEvent
+        }
+        self._timing_weights = self._samplers[ConfigurationEvent.OPERATION_TIMED]
+        self._access_weights = self._samplers[ConfigurationEvent.ACCESS_PATTERN]
+
         # Core metrics storage
-        self._counters: dict[str, int] = defaultdict(int)
+        self._counters: ShardedCounter[str] = ShardedCounter()
         self._gauges: dict[str, float] = {}
-        self._histograms: dict[str, list[float]] = defaultdict(list)
-        self._timers: dict[str, deque[TimingMetric]] = defaultdict(
-            lambda: deque(maxlen=1000)
-        )
+        self._histograms = ShardedSketches(relative_accuracy)
+        self._timing_window = timing_window
+        self._timers: dict[str, deque[TimingMetric]] = {}
 
         # Event tracking
         self._events: deque[dict[str, Any]] = deque(maxlen=10000)
-        self._event_counts: dict[ConfigurationEvent, int] = defaultdict(int)
+        self._event_counts: ShardedCounter[ConfigurationEvent] = ShardedCounter()
 
         # Access pattern tracking
         self._access_patterns: dict[str, dict[str, Any]] = defaultdict(
@@ -139,23 +188,22 @@ class ConfigurationMetrics:
             details: Optional additional event details
             tags: Optional tags for categorizing the event
         """
-        with self._lock:
-            timestamp = time.time()
-
-            # Store event
-            event_data = {
-                "event": event,
-                "timestamp": timestamp,
-                "details": details or {},
-                "tags": tags or {},
-            }
-            self._events.append(event_data)
-
-            # Update event counts
-            self._event_counts[event] += 1
+        timestamp = time.time()
+
+        # Counts stay exact; only the event log is sampled
+        self._event_counts.increment(event)
+        if next(self._samplers[event]):
+            self._events.append(
+                {
+                    "event": event,
+                    "timestamp": timestamp,
+                    "details": details or {},
+                    "tags": tags or {},
+                }
+            )
 
-            # Update specific metrics based on event type
-            self._update_event_metrics(event, details, timestamp)
+        # Update specific metrics based on event type
+        self._update_event_metrics(event, details, timestamp)
 
     def record_timing(
         self,
@@ -172,41 +220,57 @@ class ConfigurationMetrics:
             success: Whether the operation was successful
             tags: Optional tags for categorizing the timing
         """
-        with self._lock:
-            timing = TimingMetric(
+        # Update success/failure counters
+        if success:
+            self._counters.increment(f"{operation}_success")
+        else:
+            self._counters.increment(f"{operation}_failure")
+
+        weight = next(self._timing_weights)
+        if not weight:
+            return
+
+        # Update histogram data
+        self._histograms.observe(f"{operation}_duration", duration, weight)
+
+        timings = self._timers.get(operation)
+        if timings is None:
+            timings = self._timers.setdefault(
+                operation, deque(maxlen=self._timing_window)
+            )
+        timings.append(
+            TimingMetric(
                 operation=operation,
                 duration=duration,
                 timestamp=time.time(),
                 success=success,
                 tags=tags or {},
             )
+        )
 
-            self._timers[operation].append(timing)
-
-            # Update histogram data
-            self._histograms[f"{operation}_duration"].append(duration)
-
-            # Update success/failure counters
-            if success:
-                self._counters[f"{operation}_success"] += 1
-            else:
-                self._counters[f"{operation}_failure"] += 1
-
-    def record_access_pattern(self, key: str, access_type: str = "read") -> None:
+    def record_access_pattern(
+        self, key: str, access_type: str = "read", count: int = 1
+    ) -> None:
         """Record configuration access pattern for analysis.
 
         Args:
             key: Configuration key accessed
             access_type: Type of access (read, write, validate)
+            count: Number of accesses represented, for sampled recording
         """
         if not self._enable_detailed_tracking:
             return
 
+        weight = next(self._access_weights)
+        if not weight:
+            return
+        count *= weight
+
         with self._lock:
             timestamp = time.time()
             pattern = self._access_patterns[key]
 
-            pattern["count"] += 1
+            pattern["count"] += count
             pattern["last_access"] = timestamp
 
             if pattern["first_access"] is None:
@@ -218,7 +282,7 @@ class ConfigurationMetrics:
                     pattern["access_frequency"] = pattern["count"] / (time_span / 3600)
 
             # Record general access counter
-            self._counters[f"access_{access_type}"] += 1
+            self._counters.increment(f"access_{access_type}", count)
 
     def record_cache_performance(
         self, hits: int, misses: int, evictions: int = 0
@@ -240,7 +304,7 @@ class ConfigurationMetrics:
                     hits / self._cache_performance["total_requests"]
                 )
 
-            self._counters["cache_evictions"] = evictions
+            self._counters.set("cache_evictions", evictions)
 
     def record_error(
         self, error_type: str, error_message: str, context: dict[str, Any] | None = None
@@ -257,7 +321,7 @@ class ConfigurationMetrics:
 
             # Update error counts
             self._error_counts[error_type] += 1
-            self._counters[f"error_{error_type}"] += 1
+            self._counters.increment(f"error_{error_type}")
 
             # Store recent error details
             error_data = {
@@ -281,8 +345,7 @@ class ConfigurationMetrics:
             value: Value to add to counter
             tags: Optional tags for the metric
         """
-        with self._lock:
-            self._counters[name] += value
+        self._counters.increment(name, value)
 
     def set_gauge(
         self, name: str, value: float, tags: dict[str, str] | None = None
@@ -324,6 +387,13 @@ class ConfigurationMetrics:
                 },
                 "performance_summary": self._get_performance_summary(),
                 "access_patterns_summary": self._get_access_patterns_summary(),
+                "timing_distributions": {
+                    name: sketch.summary(SUMMARY_QUANTILES)
+                    for name, sketch in self._histograms.snapshot().items()
+                },
+                "sample_rates": {
+                    event.value: rate for event, rate in self._sample_rates.items()
+                },
             }
 
     def get_timing_statistics(self, operation: str) -> dict[str, float]:
@@ -335,33 +405,33 @@ class ConfigurationMetrics:
         Returns:
             Dictionary with timing statistics (min, max, avg, p95, etc.)
         """
-        with self._lock:
-            timings = self._timers.get(operation, deque(maxlen=1000))
+        # Writers append without the lock; copying the deque is one C-level
+        # operation, so it never sees a concurrent append mid-iteration
+        timings = tuple(self._timers.get(operation, ()))
 
-            if not timings:
-                return {"count": 0}
+        if not timings:
+            return {"count": 0}
 
-            durations = [t.duration for t in timings]
-            durations.sort()
+        durations = sorted(t.duration for t in timings)
 
-            count = len(durations)
-            total = sum(durations)
+        count = len(durations)
+        total = sum(durations)
 
-            stats = {
-                "count": count,
-                "total": total,
-                "min": min(durations),
-                "max": max(durations),
-                "avg": total / count,
-                "median": durations[count // 2],
-            }
+        stats = {
+            "count": count,
+            "total": total,
+            "min": durations[0],
+            "max": durations[-1],
+            "avg": total / count,
+            "median": durations[count // 2],
+        }
 
-            # Calculate percentiles
-            if count >= 5:
-                stats["p95"] = durations[int(count * 0.95)]
-                stats["p99"] = durations[int(count * 0.99)]
+        # Calculate percentiles
+        if count >= 5:
+            stats["p95"] = durations[int(count * 0.95)]
+            stats["p99"] = durations[int(count * 0.99)]
 
-            return stats
+        return stats
 
     def get_recent_events(
         self, event_type: ConfigurationEvent | None = None, limit: int = 100
@@ -408,6 +478,85 @@ class ConfigurationMetrics:
             self._health_checks.clear()
             self._start_time = time.time()
 
+    def export_prometheus(
+        self, namespace: str = "agentic_config", openmetrics: bool = False
+    ) -> str:
+        """Render the metrics summary in the Prometheus text format.
+
+        Counters, event and error counts become counters, gauges and cache
+        performance become gauges, and timing distributions become summaries
+        with quantile estimates from the sketches.
+
+        Args:
+            namespace: Prefix of every metric name
+            openmetrics: Render the OpenMetrics variant, which names counter
+                families without "_total" and ends with "# EOF"
+
+        Returns:
+            Exposition text; serve it with PROMETHEUS_CONTENT_TYPE or
+            OPENMETRICS_CONTENT_TYPE
+        """
+        summary = self.get_metrics_summary()
+        writer = _ExpositionWriter(namespace, openmetrics)
+
+        writer.gauge(
+            "runtime_seconds",
+            "Seconds since metrics collection started",
+            [({}, summary["runtime_seconds"])],
+        )
+        writer.gauge(
+            "health_status",
+            "Configuration system health, 1 for the current status",
+            [
+                ({"status": status}, float(summary["health_status"] == status))
+                for status in ("healthy", "degraded", "unhealthy")
+            ],
+        )
+
+        for name, value in sorted(summary["counters"].items()):
+            writer.counter(name, f"Configuration counter {name}", [({}, value)])
+        writer.counter(
+            "events",
+            "Configuration events by type",
+            [
+                ({"event": event}, count)
+                for event, count in sorted(summary["event_counts"].items())
+            ],
+        )
+        writer.counter(
+            "errors",
+            "Configuration errors by type",
+            [
+                ({"type": error_type}, count)
+                for error_type, count in sorted(
+                    summary["error_summary"]["error_types"].items()
+                )
+            ],
+        )
+
+        for name, value in sorted(summary["gauges"].items()):
+            writer.gauge(name, f"Configuration gauge {name}", [({}, value)])
+        cache = summary["cache_performance"]
+        writer.gauge(
+            "cache_requests",
+            "Configuration cache requests",
+            [({}, cache["total_requests"])],
+        )
+        writer.gauge(
+            "cache_hit_ratio",
+            "Configuration cache hit ratio",
+            [({}, cache["hit_rate"])],
+        )
+
+        for name, stats in sorted(summary["timing_distributions"].items()):
+            writer.summary(
+                f"{name}_seconds",
+                f"Duration of {name.removesuffix('_duration')}",
+                stats,
+            )
+
+        return writer.render()
+
     def _update_event_metrics(
         self,
         event: ConfigurationEvent,
@@ -431,7 +580,7 @@ class ConfigurationMetrics:
             ConfigurationEvent.CONFIG_ERROR,
             ConfigurationEvent.VALIDATION_ERROR,
         ]:
-            self._counters["total_errors"] += 1
+            self._counters.increment("total_errors")
 
     def _get_performance_summary(self) -> dict[str, Any]:
         """Get performance metrics summary."""
@@ -500,6 +649,96 @@ class ConfigurationMetrics:
             self._health_status = "healthy"
 
 
+def _sample_weights(rate: int) -> Iterator[int]:
+    """Get an endless iterator of weights recording one in rate events."""
+    if rate == 1:
+        return itertools.repeat(1)
+    return itertools.cycle([rate, *itertools.repeat(0, rate - 1)])
+
+
+class _ExpositionWriter:
+    """Accumulate metric families in the Prometheus text format."""
+
+    def __init__(self, namespace: str, openmetrics: bool) -> None:
+        self._namespace = namespace
+        self._openmetrics = openmetrics
+        self._lines: list[str] = []
+        self._seen: set[str] = set()
+
+    def counter(
+        self, name: str, help_text: str, samples: list[tuple[dict[str, str], float]]
+    ) -> None:
+        """Add a counter family; sample names get the "_total" suffix."""
+        family = self._name(name.removesuffix("_total"))
+        type_name = family if self._openmetrics else f"{family}_total"
+        if samples and self._header(type_name, "counter", help_text):
+            for labels, value in samples:
+                self._sample(f"{family}_total", labels, value)
+
+    def gauge(
+        self, name: str, help_text: str, samples: list[tuple[dict[str, str], float]]
+    ) -> None:
+        """Add a gauge family."""
+        family = self._name(name)
+        if samples and self._header(family, "gauge", help_text):
+            for labels, value in samples:
+                self._sample(family, labels, value)
+
+    def summary(self, name: str, help_text: str, stats: dict[str, Any]) -> None:
+        """Add a summary family from QuantileSketch.summary() output."""
+        family = self._name(name)
+        if not stats.get("count") or not self._header(family, "summary", help_text):
+            return
+        for q in SUMMARY_QUANTILES:
+            self._sample(family, {"quantile": f"{q:g}"}, stats[f"p{q * 100:g}"])
+        self._sample(f"{family}_sum", {}, stats["sum"])
+        self._sample(f"{family}_count", {}, stats["count"])
+
+    def render(self) -> str:
+        """Get the exposition text."""
+        lines = [*self._lines, "# EOF"] if self._openmetrics else self._lines
+        return "\n".join(lines) + "\n"
+
+    def _name(self, name: str) -> str:
+        name = _INVALID_METRIC_CHARS.sub("_", f"{self._namespace}_{name}")
+        return f"_{name}" if name[0].isdigit() else name
+
+    def _header(self, family: str, metric_type: str, help_text: str) -> bool:
+        # Names that collide after sanitizing are exported once
+        if family in self._seen:
+            return False
+        self._seen.add(family)
+        self._lines.append(f"# HELP {family} {_escape(help_text)}")
+        self._lines.append(f"# TYPE {family} {metric_type}")
+        return True
+
+    def _sample(self, name: str, labels: dict[str, str], value: float) -> None:
+        if labels:
+            rendered = ",".join(
+                f'{key}="{_escape(str(val), quote=True)}"'
+                for key, val in labels.items()
+            )
+            name = f"{name}{{{rendered}}}"
+        self._lines.append(f"{name} {_format_value(value)}")
+
+
+def _escape(text: str, quote: bool = False) -> str:
+    """Escape HELP text or, with quote, a label value."""
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as Prometheus expects."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer() and abs(value) < 2**53:
+        return str(int(value))
+    return repr(float(value))
+
+
 # Global metrics instance
 _global_metrics: ConfigurationMetrics | None = None
 _metrics_lock = threading.Lock()
@@ -13,13 +13,21 @@ Environment variables are substituted using the format ${VAR_NAME} with
 optional defaults: ${VAR_NAME:default_value}
 """
 
-import os
-import re
 from enum import Enum
 from typing import Any
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_validator,
+)
+
+from .environment import SUBSTITUTED_KEY, EnvironmentSubstitutor
+from .exceptions import EnvironmentVariableError
 
 
 class LogLevel(str, Enum):
@@ -71,6 +79,12 @@ class NotificationProvider(str, Enum):
     WEBHOOK = "webhook"
 
 
+def _deferred_sections(info: ValidationInfo) -> tuple[str, ...]:
+    """Get the sections whose validation is deferred by the context."""
+    context = info.context or {}
+    return tuple(context.get("deferred_sections", ()))
+
+
 class BaseConfigModel(BaseModel):
     """Base configuration model with environment variable substitution."""
 
@@ -84,15 +98,23 @@ class BaseConfigModel(BaseModel):
         extra = "forbid"  # Prevent extra fields
 
     @model_validator(mode="before")
-    def substitute_env_vars(cls, values: dict[str, Any]) -> dict[str, Any]:
+    def substitute_env_vars(
+        cls, values: dict[str, Any], info: ValidationInfo
+    ) -> dict[str, Any]:
         """Substitute environment variables in string values.
 
         Supports formats:
         - ${VAR_NAME} - Required environment variable
         - ${VAR_NAME:default} - Optional with default value
 
+        Sections listed in the validation context's "deferred_sections" are
+        left untouched; their own models substitute when they are validated.
+        Documents validated with SUBSTITUTED_CONTEXT were substituted by the
+        loader and are returned as they are.
+
         Args:
             values: Raw configuration values
+            info: Validation info carrying the optional context
 
         Returns:
             Configuration values with environment variables substituted
@@ -101,36 +123,18 @@ class BaseConfigModel(BaseModel):
             ValueError: If required environment variable is missing
         """
 
-        def substitute_value(value: Any) -> Any:
-            if isinstance(value, str):
-                # Pattern: ${VAR_NAME} or ${VAR_NAME:default}
-                pattern = r"\$\{([^}:]+)(?::([^}]*))?\}"
-
-                def replacer(match: re.Match[str]) -> str:
-                    var_name = match.group(1)
-                    default_value = (
-                        match.group(2) if match.group(2) is not None else None
-                    )
-
-                    env_value = os.getenv(var_name)
-                    if env_value is not None:
-                        return env_value
-                    elif default_value is not None:
-                        return default_value
-                    else:
-                        raise ValueError(
-                            f"Required environment variable '{var_name}' not found"
-                        )
-
-                return re.sub(pattern, replacer, value)
-            elif isinstance(value, dict):
-                return {k: substitute_value(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [substitute_value(item) for item in value]
-            else:
-                return value
-
-        return {key: substitute_value(value) for key, value in values.items()}
+        context = info.context or {}
+        if context.get(SUBSTITUTED_KEY):
+            # The loader substituted the whole document in a single pass
+            return values
+
+        try:
+            result = EnvironmentSubstitutor().substitute(
+                values, deferred=_deferred_sections(info)
+            )
+        except EnvironmentVariableError as e:
+            raise ValueError(str(e)) from e
+        return result.value  # type: ignore[no-any-return]
 
 
 class SystemConfig(BaseConfigModel):
@@ -517,6 +521,22 @@ class Config(BaseConfigModel):
             raise ValueError("At least one repository must be configured")
         return v
 
+    @field_validator("repositories", mode="wrap")
+    @classmethod
+    def defer_repositories(
+        cls, v: Any, handler: ValidatorFunctionWrapHandler, info: ValidationInfo
+    ) -> Any:
+        """Keep raw repository data when the section is loaded lazily.
+
+        Only the cheap structural checks run here; LazyConfig validates the
+        entries on first access.
+        """
+        if "repositories" not in _deferred_sections(info):
+            return handler(v)
+        if not isinstance(v, list):
+            raise ValueError("Repositories must be a list")
+        return cls.validate_repositories_not_empty(v)
+
     @model_validator(mode="after")
     def validate_consistent_configuration(self) -> "Config":
         """Validate cross-field consistency."""
@@ -0,0 +1,262 @@
+"""Effective per-repository configuration with memoized resolution.
+
+A repository's effective settings come from three layers, later ones winning:
+
+1. RepositoryConfig defaults, for repositories not listed in the file
+2. The repository's entry in the configuration file
+3. The database override, Repository.config_override
+
+Resolving deep-merges these layers, which is too slow to repeat for every
+pull request decision. The resolver merges once and memoizes the result per
+repository, keyed by the configuration snapshot version and the override
+version. A reload publishes a new snapshot, and changing an override bumps
+the override version, so a stale entry is never returned and a fresh one
+costs a dict lookup:
+
+    settings = get_repository_config_resolver().resolve(repository)
+    if settings.get("fix_categories.lint.enabled"):
+        ...
+"""
+
+import threading
+from collections.abc import Hashable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from .manager import ConfigurationManager, get_config_manager
+from .models import RepositoryConfig
+from .skip_patterns import SkipFilter, compile_skip_patterns
+from .snapshot import ConfigSnapshot, flatten_config
+from .watcher import ConfigChange
+
+if TYPE_CHECKING:
+    from src.models import Repository
+
+
+def apply_overrides(
+    base: Mapping[str, Any], overrides: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Deep-merge overrides into a copy of base.
+
+    Only mappings on the path of an override are copied; untouched branches
+    are shared with base. Dotted keys address nested values, so
+    {"fix_categories.lint.enabled": False} changes a single flag.
+
+    Args:
+        base: Configuration to override
+        overrides: Values taking precedence over base
+
+    Returns:
+        Merged configuration
+    """
+    merged = dict(base)
+    for key, value in overrides.items():
+        head, _, rest = key.partition(".")
+        current = merged.get(head)
+        if rest:
+            nested = current if isinstance(current, Mapping) else {}
+            value = apply_overrides(nested, {rest: value})
+        elif isinstance(current, Mapping) and isinstance(value, Mapping):
+            value = apply_overrides(current, value)
+        merged[head] = value
+    return merged
+
+
+@dataclass(frozen=True, slots=True)
+class RepositorySettings:
+    """Effective configuration of one repository.
+
+    Attributes:
+        url: Repository URL
+        version: Snapshot and override versions the settings were resolved at
+        config: Merged configuration as nested mappings
+        values: Read-only mapping of dotted keys to values
+        skip_filter: Compiled skip_patterns of the repository
+    """
+
+    url: str
+    version: tuple[Hashable, ...]
+    config: Mapping[str, Any] = field(repr=False)
+    values: Mapping[str, Any] = field(repr=False)
+    skip_filter: SkipFilter = field(repr=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a setting by dotted key.
+
+        Args:
+            key: Setting key in dot notation, e.g. "skip_patterns.authors"
+            default: Value returned when the key does not exist
+
+        Returns:
+            Setting value or default
+        """
+        return self.values.get(key, default)
+
+
+class RepositoryConfigResolver:
+    """Resolve and memoize effective per-repository configuration.
+
+    Reads take no lock: the memo is a dict replaced entry by entry, and an
+    entry whose version no longer matches is resolved again. Concurrent
+    misses for the same repository may both resolve it, which is harmless.
+    """
+
+    def __init__(self, manager: ConfigurationManager | None = None) -> None:
+        """Initialize resolver.
+
+        Args:
+            manager: Configuration manager to read from; defaults to the
+                global manager
+        """
+        self._manager = manager if manager is not None else get_config_manager()
+        self._lock = threading.Lock()
+        self._settings: dict[str, RepositorySettings] = {}
+        self._generation = 0
+        self._override_versions: dict[str, int] = {}
+        # (snapshot version, repository entries by URL)
+        self._configured_entries: tuple[int, dict[str, RepositoryConfig]] = (-1, {})
+        self._unsubscribe = self._manager.subscribe(
+            self._on_change, sections=["repositories"]
+        )
+
+    @property
+    def manager(self) -> ConfigurationManager:
+        """Configuration manager the resolver reads from."""
+        return self._manager
+
+    def resolve(self, repository: "Repository") -> RepositorySettings:
+        """Get the effective configuration of a repository.
+
+        The row's updated_at is part of the override version, so overrides
+        changed by another process are picked up once the row is reloaded.
+
+        Args:
+            repository: Repository row with its config_override
+
+        Returns:
+            Effective repository settings
+
+        Raises:
+            ConfigurationError: If no configuration is loaded
+        """
+        return self.resolve_url(
+            repository.url,
+            repository.config_override,
+            override_version=repository.updated_at,
+        )
+
+    def resolve_url(
+        self,
+        url: str,
+        config_override: Mapping[str, Any] | None = None,
+        override_version: Hashable = None,
+    ) -> RepositorySettings:
+        """Get the effective configuration of a repository by URL.
+
+        Args:
+            url: Repository URL
+            config_override: Override values taking precedence over the file
+            override_version: Value that changes whenever config_override does
+
+        Returns:
+            Effective repository settings
+
+        Raises:
+            ConfigurationError: If no configuration is loaded
+        """
+        snapshot = self._manager.snapshot
+        # Read before resolving, so a concurrent invalidation leaves the
+        # entry stale rather than hiding the change
+        version = (
+            snapshot.version,
+            self._generation,
+            self._override_versions.get(url, 0),
+            override_version,
+        )
+        settings = self._settings.get(url)
+        if settings is not None and settings.version == version:
+            return settings
+
+        config = apply_overrides(self._configured(snapshot, url), config_override or {})
+        settings = RepositorySettings(
+            url=url,
+            version=version,
+            config=MappingProxyType(config),
+            values=MappingProxyType(flatten_config(config)),
+            skip_filter=compile_skip_patterns(config.get("skip_patterns")),
+        )
+        self._settings[url] = settings
+        return settings
+
+    def invalidate(self, url: str | None = None) -> None:
+        """Discard memoized settings after an override changed.
+
+        Args:
+            url: Repository whose override changed; None discards every entry
+        """
+        with self._lock:
+            if url is None:
+                self._generation += 1
+                self._settings.clear()
+            else:
+                self._override_versions[url] = self._override_versions.get(url, 0) + 1
+                self._settings.pop(url, None)
+
+    def close(self) -> None:
+        """Stop following configuration changes and discard all entries."""
+        self._unsubscribe()
+        self._settings.clear()
+
+    def _configured(self, snapshot: ConfigSnapshot, url: str) -> dict[str, Any]:
+        """Get a repository's file entry, or the defaults if it has none."""
+        version, entries = self._configured_entries
+        if version != snapshot.version:
+            entries = {repo.url: repo for repo in snapshot.config.repositories}
+            self._configured_entries = (snapshot.version, entries)
+
+        entry = entries.get(url)
+        if entry is None:
+            entry = RepositoryConfig.model_construct(url=url)
+            return entry.model_dump(mode="json", exclude={"auth_token"})
+        return entry.model_dump(mode="json")
+
+    def _on_change(self, change: ConfigChange) -> None:
+        """Drop entries of a replaced repository list."""
+        # Entries are stale by version already; clearing frees removed ones
+        self._settings.clear()
+
+
+# Global resolver instance
+_global_resolver: RepositoryConfigResolver | None = None
+_resolver_lock = threading.Lock()
+
+
+def get_repository_config_resolver() -> RepositoryConfigResolver:
+    """Get the resolver of the global configuration manager.
+
+    Returns:
+        Global repository configuration resolver
+    """
+    global _global_resolver
+
+    manager = get_config_manager()
+    resolver = _global_resolver
+    if resolver is None or resolver.manager is not manager:
+        with _resolver_lock:
+            resolver = _global_resolver
+            if resolver is None or resolver.manager is not manager:
+                if resolver is not None:
+                    resolver.close()
+                resolver = _global_resolver = RepositoryConfigResolver(manager)
+    return resolver
+
+
+def invalidate_repository_config(url: str | None = None) -> None:
+    """Invalidate the global resolver's settings, if it has been created.
+
+    Args:
+        url: Repository whose override changed; None invalidates all
+    """
+    if _global_resolver is not None:
+        _global_resolver.invalidate(url)
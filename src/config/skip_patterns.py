@@ -0,0 +1,249 @@
+"""Compiled skip-pattern matching for pull requests and check runs.
+
+A repository's skip_patterns exclude pull requests by label, title or author
+and check runs by name. They are evaluated for every pull request and check
+run on every poll, so all patterns of a category are compiled once into:
+
+- a set of literal patterns, matched with one hash lookup, and
+- one regular expression alternating every glob pattern.
+
+Patterns are globs matched against the whole value, ignoring case. Only "*"
+(any run of characters) and "?" (one character) are wildcards; everything
+else is literal, so "dependabot[bot]" matches that login rather than being a
+character class.
+
+Compiled filters are cached by pattern content, so repositories and
+configuration snapshots with the same patterns share one filter.
+"""
+
+import functools
+import re
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+# Categories of RepositoryConfig.skip_patterns
+PR_LABELS = "pr_labels"
+PR_TITLES = "pr_titles"
+AUTHORS = "authors"
+CHECK_NAMES = "check_names"
+SKIP_CATEGORIES = (PR_LABELS, PR_TITLES, AUTHORS, CHECK_NAMES)
+
+_WILDCARDS = re.compile(r"[*?]")
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a glob pattern into a regular expression.
+
+    Args:
+        pattern: Pattern where "*" and "?" are the only wildcards
+
+    Returns:
+        Regular expression matching the same strings with fullmatch()
+    """
+    parts = []
+    for token in re.split(r"([*?])", pattern):
+        if token == "*":
+            parts.append(".*")
+        elif token == "?":
+            parts.append(".")
+        elif token:
+            parts.append(re.escape(token))
+    return "".join(parts)
+
+
+@dataclass(frozen=True, slots=True)
+class PatternSet:
+    """Compiled patterns of one skip category.
+
+    Attributes:
+        literals: Case-folded patterns without wildcards
+        regex: Alternation of all glob patterns, or None if there are none
+    """
+
+    literals: frozenset[str]
+    regex: re.Pattern[str] | None
+
+    @classmethod
+    def compile(cls, patterns: Iterable[str]) -> "PatternSet":
+        """Compile glob patterns.
+
+        Args:
+            patterns: Glob patterns of one category
+
+        Returns:
+            Compiled pattern set
+        """
+        literals = set()
+        globs = set()
+        for pattern in patterns:
+            folded = pattern.casefold()
+            if _WILDCARDS.search(folded):
+                globs.add(glob_to_regex(folded))
+            else:
+                literals.add(folded)
+
+        regex = None
+        if globs:
+            regex = re.compile("|".join(sorted(globs)), re.DOTALL)
+        return cls(literals=frozenset(literals), regex=regex)
+
+    def __bool__(self) -> bool:
+        return bool(self.literals) or self.regex is not None
+
+    def matches(self, value: str) -> bool:
+        """Check whether a value matches any pattern of the set."""
+        folded = value.casefold()
+        if folded in self.literals:
+            return True
+        return self.regex is not None and self.regex.fullmatch(folded) is not None
+
+
+class SkipFilter:
+    """Skip decisions for one set of skip patterns.
+
+    Payloads are GitHub REST API objects: pull requests with "title",
+    "user.login" and "labels", and check runs with "name".
+    """
+
+    __slots__ = ("authors", "check_names", "pr_labels", "pr_titles")
+
+    def __init__(
+        self,
+        pr_labels: PatternSet,
+        pr_titles: PatternSet,
+        authors: PatternSet,
+        check_names: PatternSet,
+    ) -> None:
+        """Initialize skip filter.
+
+        Args:
+            pr_labels: Patterns of labels excluding a pull request
+            pr_titles: Patterns of titles excluding a pull request
+            authors: Patterns of author logins excluding a pull request
+            check_names: Patterns of check run names to ignore
+        """
+        self.pr_labels = pr_labels
+        self.pr_titles = pr_titles
+        self.authors = authors
+        self.check_names = check_names
+
+    def pull_request_skip_reason(self, pull_request: Mapping[str, Any]) -> str | None:
+        """Get why a pull request is skipped.
+
+        Args:
+            pull_request: Pull request payload
+
+        Returns:
+            Category of the first matching pattern ("authors", "pr_labels" or
+            "pr_titles"), or None if the pull request is not skipped
+        """
+        if self.authors:
+            login = (pull_request.get("user") or {}).get("login")
+            if login and self.authors.matches(login):
+                return AUTHORS
+
+        if self.pr_labels:
+            for label in pull_request.get("labels") or ():
+                name = label.get("name") if isinstance(label, Mapping) else label
+                if name and self.pr_labels.matches(name):
+                    return PR_LABELS
+
+        if self.pr_titles:
+            title = pull_request.get("title")
+            if title and self.pr_titles.matches(title):
+                return PR_TITLES
+
+        return None
+
+    def skips_pull_request(self, pull_request: Mapping[str, Any]) -> bool:
+        """Check whether a pull request is excluded from processing."""
+        return self.pull_request_skip_reason(pull_request) is not None
+
+    def skips_check_run(self, check_run: Mapping[str, Any]) -> bool:
+        """Check whether a check run is ignored."""
+        name = check_run.get("name")
+        if not name:
+            return False
+        return self.check_names.matches(name)
+
+    def filter_pull_requests[P: Mapping[str, Any]](
+        self, pull_requests: Iterable[P]
+    ) -> list[P]:
+        """Keep the pull requests of a page that are not skipped.
+
+        Args:
+            pull_requests: Pull request payloads, e.g. one API page
+
+        Returns:
+            Payloads not excluded by any pattern, in order
+        """
+        if not (self.authors or self.pr_labels or self.pr_titles):
+            return list(pull_requests)
+        reason = self.pull_request_skip_reason
+        return [pr for pr in pull_requests if reason(pr) is None]
+
+    def filter_check_runs[C: Mapping[str, Any]](
+        self, check_runs: Iterable[C]
+    ) -> list[C]:
+        """Keep the check runs of a page that are not ignored.
+
+        Args:
+            check_runs: Check run payloads, e.g. one API page
+
+        Returns:
+            Payloads whose name matches no check_names pattern, in order
+        """
+        patterns = self.check_names
+        if not patterns:
+            return list(check_runs)
+
+        # Inline matches() so a page costs one call per check run
+        literals = patterns.literals
+        fullmatch = patterns.regex.fullmatch if patterns.regex is not None else None
+        kept = []
+        for check_run in check_runs:
+            name = check_run.get("name")
+            if name:
+                folded = name.casefold()
+                if folded in literals or (
+                    fullmatch is not None and fullmatch(folded) is not None
+                ):
+                    continue
+            kept.append(check_run)
+        return kept
+
+
+def compile_skip_patterns(
+    skip_patterns: Mapping[str, Sequence[str]] | None,
+) -> SkipFilter:
+    """Get the compiled filter for a repository's skip patterns.
+
+    Unknown categories are ignored.
+
+    Args:
+        skip_patterns: Patterns by category, as in RepositoryConfig
+
+    Returns:
+        Compiled skip filter, shared by all callers with the same patterns
+    """
+    skip_patterns = skip_patterns or {}
+    key = tuple(
+        tuple(sorted(set(skip_patterns.get(category) or ())))
+        for category in SKIP_CATEGORIES
+    )
+    return _compile_skip_patterns(key)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_skip_patterns(key: tuple[tuple[str, ...], ...]) -> SkipFilter:
+    """Compile normalized patterns, in SKIP_CATEGORIES order."""
+    pr_labels, pr_titles, authors, check_names = (
+        PatternSet.compile(patterns) for patterns in key
+    )
+    return SkipFilter(
+        pr_labels=pr_labels,
+        pr_titles=pr_titles,
+        authors=authors,
+        check_names=check_names,
+    )
@@ -0,0 +1,293 @@
+"""Immutable configuration snapshots for lock-free reads.
+
+On every load or reload the configuration is flattened once into a read-only
+mapping of dotted keys to values. The manager publishes the new snapshot with a
+single attribute assignment, so readers never take a lock: they either see the
+previous snapshot or the new one, never a partially updated configuration.
+
+Hot paths resolve an accessor once and read through it:
+
+    worker_timeout = manager.accessor("system.worker_timeout")
+    ...
+    timeout = worker_timeout.get()
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, cast
+
+from pydantic import BaseModel
+
+from .exceptions import ConfigurationError
+from .models import Config
+
+_MISSING: Any = object()
+
+
+def flatten_config(
+    value: Any, prefix: str = "", into: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """Flatten nested configuration models and mappings into dotted keys.
+
+    Every intermediate node is kept as well, so "database" and "database.url"
+    are both present. Lists are stored as values and not descended into, and
+    sections of a LazyConfig that are still deferred are left out.
+
+    Args:
+        value: Configuration model, mapping or plain value
+        prefix: Dotted key of value
+        into: Mapping to add entries to
+
+    Returns:
+        Mapping of dotted keys to values
+    """
+    flat = {} if into is None else into
+    if prefix:
+        flat[prefix] = value
+
+    if isinstance(value, BaseModel):
+        # Lazily loaded sections stay unflattened until first accessed
+        deferred = getattr(value, "deferred_sections", ())
+        children: Mapping[Any, Any] = {
+            name: getattr(value, name)
+            for name in type(value).model_fields
+            if name not in deferred
+        }
+    elif isinstance(value, Mapping):
+        children = value
+    else:
+        return flat
+
+    for key, child in children.items():
+        if isinstance(key, Enum):
+            key = key.value
+        if isinstance(key, str):
+            flatten_config(child, f"{prefix}.{key}" if prefix else key, flat)
+    return flat
+
+
+def resolve_path(config: Any, key: str, default: Any = None) -> Any:
+    """Resolve a dotted key by walking attributes and mapping items.
+
+    Args:
+        config: Root configuration object
+        key: Configuration key in dot notation
+        default: Value returned when the key does not resolve
+
+    Returns:
+        Resolved value or default
+    """
+    value = config
+    try:
+        for part in key.split("."):
+            if hasattr(value, part):
+                value = getattr(value, part)
+            elif isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                return default
+    except (AttributeError, KeyError, TypeError):
+        return default
+    return value
+
+
+@dataclass(frozen=True, slots=True)
+class ConfigSnapshot:
+    """Immutable, flattened view of one configuration version.
+
+    Attributes:
+        version: Increasing number of the published snapshot
+        config: Configuration the snapshot was built from
+        values: Read-only mapping of dotted keys to values, overrides applied
+            to the overridden keys, their descendants and their ancestors
+    """
+
+    version: int
+    config: Config
+    values: Mapping[str, Any] = field(repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        config: Config,
+        version: int,
+        overrides: Mapping[str, Any] | None = None,
+    ) -> "ConfigSnapshot":
+        """Flatten config and apply overrides into a new snapshot.
+
+        An override replaces its key and everything below it, and the
+        sections above it are rebuilt with the new value, so reading
+        "database.pool_size" and reading "database" agree.
+
+        Args:
+            config: Configuration to snapshot
+            version: Version number of the snapshot
+            overrides: Optional dotted-key overrides taking precedence
+
+        Returns:
+            New configuration snapshot
+        """
+        values = flatten_config(config)
+        for key, value in (overrides or {}).items():
+            _apply_override(values, key, value)
+        return cls(version=version, config=config, values=MappingProxyType(values))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a value by dotted key.
+
+        Keys outside the flattened fields, such as model properties, fall back
+        to walking the configuration object.
+
+        Args:
+            key: Configuration key in dot notation
+            default: Value returned when the key does not exist
+
+        Returns:
+            Configuration value or default
+        """
+        value = self.values.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Walk from the nearest flattened ancestor, which has overrides applied
+        parent_key, _, rest = key.rpartition(".")
+        while parent_key:
+            parent = self.values.get(parent_key, _MISSING)
+            if parent is not _MISSING:
+                return resolve_path(parent, rest, default)
+            parent_key, _, name = parent_key.rpartition(".")
+            rest = f"{name}.{rest}"
+        return resolve_path(self.config, key, default)
+
+
+def _apply_override(values: dict[str, Any], key: str, value: Any) -> None:
+    """Set an override in flattened values, including descendants and ancestors.
+
+    Args:
+        values: Flattened configuration to update in place
+        key: Dotted key being overridden
+        value: Override value
+    """
+    prefix = f"{key}."
+    for stale in [name for name in values if name.startswith(prefix)]:
+        del values[stale]
+    flatten_config(value, key, values)
+
+    child_key = key
+    while "." in child_key:
+        parent_key, _, name = child_key.rpartition(".")
+        parent = values.get(parent_key, _MISSING)
+        if parent is _MISSING:
+            return
+        rebuilt = _with_child(parent, name, values[child_key])
+        if rebuilt is _MISSING:
+            return
+        values[parent_key] = rebuilt
+        child_key = parent_key
+
+
+def _with_child(parent: Any, name: str, child: Any) -> Any:
+    """Copy a model or mapping with one child replaced, or return _MISSING."""
+    if isinstance(parent, BaseModel):
+        if name not in type(parent).model_fields:
+            return _MISSING
+        return parent.model_copy(update={name: child})
+    if isinstance(parent, Mapping):
+        key = next(
+            (
+                existing
+                for existing in parent
+                if (existing.value if isinstance(existing, Enum) else existing) == name
+            ),
+            name,
+        )
+        return {**parent, key: child}
+    return _MISSING
+
+
+class SnapshotSource:
+    """Holder of the currently published snapshot.
+
+    Writers replace the snapshot with publish(); readers load the `snapshot`
+    attribute, which is a single atomic read.
+    """
+
+    snapshot: ConfigSnapshot | None = None
+
+    def publish(
+        self, config: Config, overrides: Mapping[str, Any] | None = None
+    ) -> ConfigSnapshot:
+        """Build and publish a snapshot of config.
+
+        Callers serialize publish() themselves; readers are never blocked.
+
+        Args:
+            config: Configuration to publish
+            overrides: Optional dotted-key overrides
+
+        Returns:
+            Published snapshot
+        """
+        current = self.snapshot
+        version = current.version + 1 if current is not None else 1
+        snapshot = ConfigSnapshot.build(config, version, overrides)
+        self.snapshot = snapshot
+        return snapshot
+
+
+class ConfigAccessor[T]:
+    """Pre-resolved accessor for a single configuration key.
+
+    The value is looked up once per snapshot version and then returned from
+    the accessor itself, so repeated reads cost an attribute comparison.
+    """
+
+    __slots__ = ("_cached", "_default", "_source", "key")
+
+    def __init__(self, source: SnapshotSource, key: str, default: Any = _MISSING):
+        """Initialize and resolve the accessor.
+
+        Args:
+            source: Snapshot source to read from
+            key: Configuration key in dot notation
+            default: Value for when the key is missing; if omitted, a missing
+                key raises ConfigurationError
+
+        Raises:
+            ConfigurationError: If no configuration is loaded, or the key does
+                not exist and no default was given
+        """
+        self.key = key
+        self._source = source
+        self._default = default
+        # (version, value) pair, replaced as a whole so threads never see a
+        # value paired with another snapshot's version
+        self._cached: tuple[int, T] = (-1, cast(T, None))
+        self.get()
+
+    def get(self) -> T:
+        """Get the key's value in the current snapshot.
+
+        Returns:
+            Current configuration value
+
+        Raises:
+            ConfigurationError: If the key no longer exists and has no default
+        """
+        snapshot = self._source.snapshot
+        if snapshot is None:
+            raise ConfigurationError("No configuration loaded")
+        version, value = self._cached
+        if version != snapshot.version:
+            value = snapshot.get(self.key, self._default)
+            if value is _MISSING:
+                raise ConfigurationError(f"Unknown configuration key '{self.key}'")
+            self._cached = (snapshot.version, value)
+        return value
+
+    @property
+    def version(self) -> int:
+        """Snapshot version of the last resolved value."""
+        return self._cached[0]
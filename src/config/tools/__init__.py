@@ -4,12 +4,14 @@ Configuration Tools Package
 This package provides command-line tools for working with configuration files:
 
 - validate.py: Comprehensive configuration validation
+- connectivity.py: Concurrent connectivity probes used by validate.py
 - diff.py: Configuration comparison and difference analysis
 
 These tools can be used during development, deployment, and maintenance
 to ensure configuration correctness and track changes between environments.
 """
 
+from .connectivity import ConnectivityChecker, ConnectivityReport, ProbeResult
 from .diff import ConfigDiff, ConfigurationDiffer, DiffSeverity, DiffType
 from .validate import ConfigurationValidator
 
@@ -17,6 +19,9 @@ __all__ = [
     "ConfigDiff",
     "ConfigurationDiffer",
     "ConfigurationValidator",
+    "ConnectivityChecker",
+    "ConnectivityReport",
     "DiffSeverity",
     "DiffType",
+    "ProbeResult",
 ]
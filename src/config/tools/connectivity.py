@@ -0,0 +1,278 @@
+"""
+Concurrent connectivity checks for configured external services.
+
+Each external dependency of a configuration (database, queue, LLM providers,
+notification channels) becomes a probe. All probes run concurrently on one
+event loop, each under its own timeout, so checking dozens of channels takes
+about as long as the slowest one instead of the sum of all of them.
+
+The result is a ConnectivityReport with the outcome and duration of every
+probe, suitable for printing or for JSON output in deploy pipelines.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+
+import aiohttp
+
+ProbeStatus = Literal["passed", "failed", "timeout", "skipped"]
+ProbeSeverity = Literal["error", "warning"]
+
+
+class ProbeSkipped(Exception):
+    """Raised by a probe check that cannot run, e.g. a missing client library."""
+
+
+@dataclass(frozen=True)
+class ServiceEndpoints:
+    """Base URLs of the public APIs probed.
+
+    Overridable so checks can target proxies or local stand-in servers.
+    """
+
+    anthropic: str = "https://api.anthropic.com"
+    openai: str = "https://api.openai.com"
+    telegram: str = "https://api.telegram.org"
+
+
+@dataclass
+class Probe:
+    """A single connectivity check.
+
+    Attributes:
+        name: Human-readable target, e.g. "LLM provider 'anthropic'"
+        kind: Service category: database, queue, llm or notification
+        check: Coroutine function raising on failure
+        severity: Whether a failure is reported as an error or a warning
+    """
+
+    name: str
+    kind: str
+    check: Callable[[], Awaitable[None]]
+    severity: ProbeSeverity = "warning"
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one probe."""
+
+    name: str
+    kind: str
+    status: ProbeStatus
+    duration: float
+    severity: ProbeSeverity
+    message: str = ""
+
+
+@dataclass
+class ConnectivityReport:
+    """Outcome and timing of a connectivity check run."""
+
+    results: list[ProbeResult] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def failures(self) -> list[ProbeResult]:
+        """Probes that failed or timed out."""
+        return [r for r in self.results if r.status in ("failed", "timeout")]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every probe passed or was skipped."""
+        return not self.failures
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dictionary."""
+        counts: dict[str, int] = {}
+        for result in self.results:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        return {
+            "duration_seconds": round(self.duration, 3),
+            "probe_count": len(self.results),
+            "status_counts": counts,
+            "probes": [
+                {**asdict(r), "duration": round(r.duration, 3)}
+                for r in sorted(self.results, key=lambda r: r.duration, reverse=True)
+            ],
+        }
+
+
+class ConnectivityChecker:
+    """Run connectivity probes concurrently with per-probe timeouts."""
+
+    def __init__(self, timeout: float = 10.0, max_concurrency: int = 32):
+        """Initialize connectivity checker.
+
+        Args:
+            timeout: Seconds each probe may take before it counts as timed out
+            max_concurrency: Maximum number of probes in flight at once
+        """
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+
+    async def run(self, probes: list[Probe]) -> ConnectivityReport:
+        """Run all probes and collect their results.
+
+        Args:
+            probes: Probes to run
+
+        Returns:
+            Report with one result per probe, in probe order
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        start = time.perf_counter()
+
+        async def bounded(probe: Probe) -> ProbeResult:
+            async with semaphore:
+                return await self._run_probe(probe)
+
+        results = await asyncio.gather(*(bounded(probe) for probe in probes))
+        return ConnectivityReport(
+            results=list(results), duration=time.perf_counter() - start
+        )
+
+    async def _run_probe(self, probe: Probe) -> ProbeResult:
+        """Run a single probe, converting its outcome into a result."""
+        start = time.perf_counter()
+        status: ProbeStatus = "passed"
+        message = ""
+        try:
+            async with asyncio.timeout(self.timeout):
+                await probe.check()
+        except TimeoutError:
+            status = "timeout"
+            message = f"timed out after {self.timeout:g}s"
+        except ProbeSkipped as e:
+            status = "skipped"
+            message = str(e)
+        except Exception as e:
+            status = "failed"
+            message = str(e) or type(e).__name__
+
+        return ProbeResult(
+            name=probe.name,
+            kind=probe.kind,
+            status=status,
+            duration=time.perf_counter() - start,
+            severity=probe.severity,
+            message=message,
+        )
+
+
+async def check_database(url: str, connect_timeout: float = 10.0) -> None:
+    """Check a database with DatabaseConnectionManager.health_check.
+
+    Raises:
+        ProbeSkipped: If the database dependencies are not installed
+        ValueError: If the health check fails
+    """
+    try:
+        from src.database.config import DatabaseConfig, DatabasePoolConfig
+        from src.database.connection import DatabaseConnectionManager
+    except ImportError as e:
+        raise ProbeSkipped(f"database module not available: {e}") from e
+
+    # The async engine needs the asyncpg driver in the URL
+    for scheme in ("postgresql://", "postgres://"):
+        if url.startswith(scheme):
+            url = "postgresql+asyncpg://" + url.removeprefix(scheme)
+
+    config = DatabaseConfig(
+        database_url=url,
+        pool=DatabasePoolConfig(
+            pool_size=1, max_overflow=0, adaptive_concurrency=False
+        ),
+        connect_timeout=max(1, int(connect_timeout)),
+        instrument_queries=False,
+    )
+    manager = DatabaseConnectionManager(config)
+    try:
+        if not await manager.health_check():
+            raise ValueError("health check query failed")
+    finally:
+        await manager.close()
+
+
+async def check_redis(url: str) -> None:
+    """Check a Redis queue with PING.
+
+    Raises:
+        ProbeSkipped: If the redis package is not installed
+    """
+    try:
+        import redis.asyncio as redis
+    except ImportError as e:
+        raise ProbeSkipped("redis module not available") from e
+
+    client = redis.from_url(url)
+    try:
+        await client.ping()
+    finally:
+        await client.aclose()
+
+
+class HttpProbes:
+    """HTTP probe checks sharing one client session."""
+
+    def __init__(
+        self, session: aiohttp.ClientSession, endpoints: ServiceEndpoints
+    ) -> None:
+        self.session = session
+        self.endpoints = endpoints
+
+    async def anthropic(self, api_key: str) -> None:
+        """Check an Anthropic API key."""
+        headers = {"x-api-key": api_key, "content-type": "application/json"}
+        url = f"{self.endpoints.anthropic}/v1/messages"
+        async with self.session.get(url, headers=headers) as response:
+            # A bare GET is a bad request; only 401 means the key is invalid
+            if response.status == 401:
+                raise ValueError("Anthropic API key is invalid")
+
+    async def openai(self, api_key: str) -> None:
+        """Check an OpenAI API key."""
+        headers = {"Authorization": f"Bearer {api_key}"}
+        url = f"{self.endpoints.openai}/v1/models"
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 401:
+                raise ValueError("OpenAI API key is invalid")
+            if response.status != 200:
+                raise ValueError(f"OpenAI API returned status {response.status}")
+
+    async def azure_openai(self, api_key: str, endpoint: str) -> None:
+        """Check an Azure OpenAI key and endpoint."""
+        if not endpoint:
+            raise ValueError("Azure OpenAI endpoint is required")
+        url = f"{endpoint}/openai/deployments?api-version=2023-05-15"
+        async with self.session.get(url, headers={"api-key": api_key}) as response:
+            if response.status == 401:
+                raise ValueError("Azure OpenAI API key is invalid")
+            # 404 is OK if there are no deployments
+            if response.status not in (200, 404):
+                raise ValueError(f"Azure OpenAI API returned status {response.status}")
+
+    async def slack(self, webhook_url: str) -> None:
+        """Check a Slack webhook by posting a test message."""
+        payload = {"text": "Configuration validation test - please ignore"}
+        async with self.session.post(webhook_url, json=payload) as response:
+            if response.status != 200:
+                raise ValueError(f"Slack webhook returned status {response.status}")
+
+    async def telegram(self, bot_token: str) -> None:
+        """Check a Telegram bot token."""
+        url = f"{self.endpoints.telegram}/bot{bot_token}/getMe"
+        async with self.session.get(url) as response:
+            if response.status != 200:
+                raise ValueError(f"Telegram bot API returned status {response.status}")
+            data = await response.json(content_type=None)
+        if not data.get("ok"):
+            raise ValueError("Telegram bot token is invalid")
+
+    async def webhook(self, webhook_url: str) -> None:
+        """Check that a generic webhook answers without a server error."""
+        async with self.session.head(webhook_url) as response:
+            if response.status >= 500:
+                raise ValueError(f"Webhook returned server error {response.status}")
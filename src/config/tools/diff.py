@@ -11,9 +11,13 @@ Usage:
 """
 
 import argparse
+import difflib
+import functools
 import json
 import os
+import re
 import sys
+from collections.abc import Callable, Hashable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -24,6 +28,67 @@ import yaml
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Lists of mappings matched by an identifying field instead of by position,
+# by list path with item segments removed
+DEFAULT_LIST_KEYS: dict[str, str] = {
+    "repositories": "url",
+    "notification.channels": "provider",
+}
+
+# A path segment after the first: ".key", "[3]" or "[url=...]"
+_PATH_SEGMENT = r"(?:\.[^.\[\]]+|\[[^\]]*\])"
+_LIST_ITEM = re.compile(r"\[[^\]]*\]")
+
+
+@functools.lru_cache(maxsize=128)
+def compile_path_patterns(patterns: frozenset[str]) -> re.Pattern[str]:
+    """
+    Compile dotted path patterns into a single regular expression.
+
+    A "*" matches one path segment: a mapping key or a list item such as
+    "[3]" or "[url=https://github.com/org/repo]". Use fullmatch() on paths.
+
+    Args:
+        patterns: Patterns such as "llm.*.api_key"
+
+    Returns:
+        Compiled expression matching any of the patterns
+    """
+    alternatives = []
+    for pattern in sorted(patterns):
+        first, *rest = pattern.split(".")
+        regex = r"[^.\[\]]+" if first == "*" else re.escape(first)
+        for part in rest:
+            regex += _PATH_SEGMENT if part == "*" else r"\." + re.escape(part)
+        alternatives.append(f"(?:{regex})")
+    return re.compile("|".join(alternatives) or "(?!)")
+
+
+def _item_keys(items: list[Any], field: str) -> list[Any] | None:
+    """Get each item's identifying field, or None if not all unique."""
+    keys = []
+    for item in items:
+        if not isinstance(item, dict) or field not in item:
+            return None
+        try:
+            hash(item[field])
+        except TypeError:
+            return None
+        keys.append(item[field])
+    return keys if len(set(keys)) == len(keys) else None
+
+
+def _fingerprint(value: Any) -> Hashable:
+    """Get a canonical key identifying a value for move detection."""
+    if value is None or isinstance(value, str | int | float):
+        # The type keeps 1, 1.0 and True apart
+        return (type(value), value)
+    try:
+        return json.dumps(value, sort_keys=True, default=str)
+    except TypeError:
+        # Mappings with keys of mixed types cannot be sorted
+        return repr(value)
+
 
 class DiffType(Enum):
     """Types of configuration differences."""
@@ -32,6 +97,7 @@ class DiffType(Enum):
     REMOVED = "removed"
     CHANGED = "changed"
     TYPE_CHANGED = "type_changed"
+    MOVED = "moved"
 
 
 class DiffSeverity(Enum):
@@ -57,35 +123,59 @@ class ConfigDiff:
 
 
 class ConfigurationDiffer:
-    """Compare configuration files and identify differences."""
-
-    def __init__(self, verbose: bool = False):
+    """Compare configuration files and identify differences.
+
+    Lists listed in list_keys are matched by an identifying field, so
+    inserting a repository reports one addition instead of a change to
+    every later position. With detect_moves, reordered items are reported as
+    moves, and unkeyed lists are aligned by content (longest common
+    subsequence of item fingerprints) instead of by position.
+    """
+
+    def __init__(
+        self,
+        verbose: bool = False,
+        list_keys: Mapping[str, str] | None = None,
+        detect_moves: bool = False,
+    ):
         self.verbose = verbose
         self.diffs: list[ConfigDiff] = []
+        self.list_keys = dict(DEFAULT_LIST_KEYS if list_keys is None else list_keys)
+        self.detect_moves = detect_moves
 
         # Security-sensitive paths that require special attention
-        self.security_sensitive_paths = {
-            "database.url",
-            "queue.url",
-            "llm.*.api_key",
-            "notification.channels.*.telegram_bot_token",
-            "notification.channels.*.slack_webhook_url",
-            "notification.channels.*.email_password",
-            "repositories.*.auth_token",
-        }
+        self.security_sensitive_paths = frozenset(
+            {
+                "database.url",
+                "queue.url",
+                "llm.*.api_key",
+                "notification.channels.*.telegram_bot_token",
+                "notification.channels.*.slack_webhook_url",
+                "notification.channels.*.email_password",
+                "repositories.*.auth_token",
+            }
+        )
 
         # Performance-critical paths
-        self.performance_critical_paths = {
-            "database.pool_size",
-            "database.max_overflow",
-            "database.pool_timeout",
-            "queue.batch_size",
-            "queue.visibility_timeout",
-            "system.worker_timeout",
-            "system.max_retry_attempts",
-            "llm.*.timeout",
-            "llm.*.rate_limit_rpm",
-        }
+        self.performance_critical_paths = frozenset(
+            {
+                "database.pool_size",
+                "database.max_overflow",
+                "database.pool_timeout",
+                "queue.batch_size",
+                "queue.visibility_timeout",
+                "system.worker_timeout",
+                "system.max_retry_attempts",
+                "llm.*.timeout",
+                "llm.*.rate_limit_rpm",
+            }
+        )
+
+        # Compiled once; every compared path is checked against both sets
+        self._security_matcher = compile_path_patterns(self.security_sensitive_paths)
+        self._performance_matcher = compile_path_patterns(
+            self.performance_critical_paths
+        )
 
     def compare_configs(self, config1_path: str, config2_path: str) -> list[ConfigDiff]:
         """
@@ -115,6 +205,24 @@ class ConfigurationDiffer:
 
         return self.diffs
 
+    def compare_dicts(
+        self, config1: dict[Any, Any], config2: dict[Any, Any]
+    ) -> list[ConfigDiff]:
+        """
+        Compare two already parsed configurations.
+
+        Args:
+            config1: Baseline configuration data
+            config2: Comparison configuration data
+
+        Returns:
+            List of ConfigDiff objects representing differences
+        """
+        self.diffs.clear()
+        self._compare_nested_dicts(config1, config2, "")
+        self.diffs.sort(key=lambda d: (d.severity.value, d.path))
+        return list(self.diffs)
+
     def _load_config_file(self, file_path: str) -> dict[Any, Any] | None:
         """Load and parse a configuration file."""
         try:
@@ -227,6 +335,18 @@ class ConfigurationDiffer:
 
     def _compare_lists(self, path: str, list1: list, list2: list) -> None:
         """Compare two lists."""
+        key_field = self.list_keys.get(_LIST_ITEM.sub("", path))
+        if key_field:
+            keys1 = _item_keys(list1, key_field)
+            keys2 = _item_keys(list2, key_field)
+            if keys1 is not None and keys2 is not None:
+                self._compare_keyed_lists(path, key_field, list1, keys1, list2, keys2)
+                return
+
+        if self.detect_moves:
+            self._compare_aligned_lists(path, list1, list2)
+            return
+
         if len(list1) != len(list2):
             self._handle_value_change(path, list1, list2)
             return
@@ -236,6 +356,101 @@ class ConfigurationDiffer:
             item_path = f"{path}[{i}]"
             self._compare_values(item_path, item1, item2)
 
+    def _compare_keyed_lists(
+        self,
+        path: str,
+        field: str,
+        list1: list,
+        keys1: list[Any],
+        list2: list,
+        keys2: list[Any],
+    ) -> None:
+        """Compare lists of mappings matched by their key field.
+
+        Items are addressed as "path[field=value]".
+        """
+        items1 = dict(zip(keys1, list1, strict=True))
+        items2 = dict(zip(keys2, list2, strict=True))
+
+        def item_path(key: Any) -> str:
+            return f"{path}[{field}={key}]"
+
+        for key in keys1:
+            if key not in items2:
+                self._handle_removed_key(item_path(key), items1[key])
+        for key in keys2:
+            if key not in items1:
+                self._handle_added_key(item_path(key), items2[key])
+            else:
+                self._compare_values(item_path(key), items1[key], items2[key])
+
+        if self.detect_moves:
+            self._report_moves(
+                [key for key in keys1 if key in items2],
+                [key for key in keys2 if key in items1],
+                {key: i for i, key in enumerate(keys1)},
+                {key: j for j, key in enumerate(keys2)},
+                item_path,
+            )
+
+    def _report_moves(
+        self,
+        order1: list[Any],
+        order2: list[Any],
+        positions1: dict[Any, int],
+        positions2: dict[Any, int],
+        item_path: Callable[[Any], str],
+    ) -> None:
+        """Report items outside the longest common subsequence as moved."""
+        if order1 == order2:
+            return
+        matcher = difflib.SequenceMatcher(None, order1, order2, autojunk=False)
+        in_place = set()
+        for block in matcher.get_matching_blocks():
+            in_place.update(order2[block.b : block.b + block.size])
+        for key in order2:
+            if key not in in_place:
+                self._handle_move(item_path(key), positions1[key], positions2[key])
+
+    def _compare_aligned_lists(self, path: str, list1: list, list2: list) -> None:
+        """Compare lists aligned by content instead of position.
+
+        Removed items are addressed by their old index, added, moved and
+        changed items by their new index.
+        """
+        prints1 = [_fingerprint(item) for item in list1]
+        prints2 = [_fingerprint(item) for item in list2]
+        if prints1 == prints2:
+            return
+        matcher = difflib.SequenceMatcher(None, prints1, prints2, autojunk=False)
+        opcodes = [op for op in matcher.get_opcodes() if op[0] != "equal"]
+
+        # Identical items that left one place and appeared in another moved
+        removed: dict[Hashable, list[int]] = {}
+        for _, i1, i2, _, _ in opcodes:
+            for i in range(i1, i2):
+                removed.setdefault(prints1[i], []).append(i)
+        moved_from: dict[int, int] = {}
+        for _, _, _, j1, j2 in opcodes:
+            for j in range(j1, j2):
+                if candidates := removed.get(prints2[j]):
+                    moved_from[j] = candidates.pop(0)
+        moved_old = set(moved_from.values())
+
+        for _, i1, i2, j1, j2 in opcodes:
+            old = [i for i in range(i1, i2) if i not in moved_old]
+            new = [j for j in range(j1, j2) if j not in moved_from]
+            # Remaining items of a replaced block were edited in place
+            for i, j in zip(old, new, strict=False):
+                self._compare_values(f"{path}[{j}]", list1[i], list2[j])
+            for i in old[len(new) :]:
+                self._handle_removed_key(f"{path}[{i}]", list1[i])
+            for j in new[len(old) :]:
+                self._handle_added_key(f"{path}[{j}]", list2[j])
+
+        for j, i in sorted(moved_from.items()):
+            self._handle_move(f"{path}[{j}]", i, j)
+
     def _handle_added_key(self, path: str, value: Any) -> None:
         """Handle a key that was added."""
         severity = self._determine_severity(path, DiffType.ADDED, None, value)
@@ -294,6 +509,27 @@ class ConfigurationDiffer:
             )
         )
 
+    def _handle_move(self, path: str, old_position: int, new_position: int) -> None:
+        """Handle a list item that moved to another position."""
+        self.diffs.append(
+            ConfigDiff(
+                path=path,
+                diff_type=DiffType.MOVED,
+                old_value=old_position,
+                new_value=new_position,
+                severity=self._determine_severity(
+                    path, DiffType.MOVED, old_position, new_position
+                ),
+                description=(
+                    f"Configuration list item moved: {path} "
+                    f"(position {old_position} → {new_position})"
+                ),
+                recommendations=self._get_recommendations(
+                    path, DiffType.MOVED, old_position, new_position
+                ),
+            )
+        )
+
     def _handle_type_change(self, path: str, old_value: Any, new_value: Any) -> None:
         """Handle a value type that changed."""
         severity = DiffSeverity.HIGH  # Type changes are usually significant
@@ -362,27 +598,15 @@ class ConfigurationDiffer:
 
     def _is_security_sensitive(self, path: str) -> bool:
         """Check if a path is security-sensitive."""
-        for sensitive_path in self.security_sensitive_paths:
-            if self._path_matches_pattern(path, sensitive_path):
-                return True
-        return False
+        return self._security_matcher.fullmatch(path) is not None
 
     def _is_performance_critical(self, path: str) -> bool:
         """Check if a path is performance-critical."""
-        for critical_path in self.performance_critical_paths:
-            if self._path_matches_pattern(path, critical_path):
-                return True
-        return False
+        return self._performance_matcher.fullmatch(path) is not None
 
     def _path_matches_pattern(self, path: str, pattern: str) -> bool:
         """Check if a path matches a pattern (supporting * wildcards)."""
-        import re
-
-        # Convert pattern to regex
-        regex_pattern = pattern.replace("*", "[^.]+")
-        regex_pattern = f"^{regex_pattern}$"
-
-        return bool(re.match(regex_pattern, path))
+        return compile_path_patterns(frozenset({pattern})).fullmatch(path) is not None
 
     def _get_recommendations(
         self, path: str, diff_type: DiffType, old_value: Any, new_value: Any
@@ -414,6 +638,11 @@ class ConfigurationDiffer:
                     "verify this is safe"
                 )
 
+        elif diff_type == DiffType.MOVED:
+            recommendations.append(
+                "Confirm the new order is intended where list order matters"
+            )
+
         elif diff_type == DiffType.CHANGED:
             if self._is_security_sensitive(path):
                 recommendations.append(
@@ -612,6 +841,12 @@ Examples:
         help="Show actual values in output (may expose sensitive data)",
     )
 
+    parser.add_argument(
+        "--detect-moves",
+        action="store_true",
+        help="Report reordered list items as moves and align unkeyed lists",
+    )
+
     parser.add_argument(
         "--security-focus",
         action="store_true",
@@ -633,7 +868,7 @@ Examples:
     args = parser.parse_args()
 
     # Run comparison
-    differ = ConfigurationDiffer(args.verbose)
+    differ = ConfigurationDiffer(args.verbose, detect_moves=args.detect_moves)
 
     try:
         diffs = differ.compare_configs(args.config1, args.config2)
@@ -737,6 +972,7 @@ Examples:
                         DiffType.REMOVED: "-",
                         DiffType.CHANGED: "🔄",
                         DiffType.TYPE_CHANGED: "🔀",
+                        DiffType.MOVED: "↕",
                     }
 
                     severity_icon = severity_emoji[diff.severity]
@@ -751,6 +987,8 @@ Examples:
                         print(f"   Added: {diff.new_value}")
                     elif diff.diff_type == DiffType.REMOVED:
                         print(f"   Removed: {diff.old_value}")
+                    elif diff.diff_type == DiffType.MOVED:
+                        print(f"   Position: {diff.old_value} → {diff.new_value}")
                     elif diff.diff_type == DiffType.TYPE_CHANGED:
                         print(
                             f"   {type(diff.old_value).__name__} → "
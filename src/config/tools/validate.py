@@ -15,30 +15,54 @@ Usage:
 """
 
 import argparse
+import asyncio
 import json
 import os
 import sys
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+import aiohttp
 import yaml
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src.config import ConfigurationError, load_config
+from src.config.environment import EnvironmentSubstitutor, SubstitutionResult
+from src.config.tools.connectivity import (
+    ConnectivityChecker,
+    ConnectivityReport,
+    HttpProbes,
+    Probe,
+    ServiceEndpoints,
+    check_database,
+    check_redis,
+)
 
 
 class ConfigurationValidator:
     """Comprehensive configuration validator with multiple validation levels."""
 
-    def __init__(self, config_path: str | None = None, verbose: bool = False):
+    def __init__(
+        self,
+        config_path: str | None = None,
+        verbose: bool = False,
+        probe_timeout: float = 10.0,
+        endpoints: ServiceEndpoints | None = None,
+    ):
         self.config_path = config_path or "config.yaml"
         self.verbose = verbose
+        self.probe_timeout = probe_timeout
+        self.endpoints = endpoints or ServiceEndpoints()
+        self.connectivity_report: ConnectivityReport | None = None
         self.errors: list[str] = []
         self.warnings: list[str] = []
         self.recommendations: list[str] = []
         self.config_data: dict | None = None
+        # (document, substitution) of the last substituted config_data
+        self._substitution: tuple[Any, SubstitutionResult] | None = None
 
     def validate_all(
         self,
@@ -126,15 +150,10 @@ class ConfigurationValidator:
         if not self.config_data:
             return
 
-        # Extract environment variable references
-        env_vars = self._extract_env_vars(self.config_data)
+        environment = self._substitute()
 
         # Check required environment variables
-        missing_vars = []
-        for var_name, has_default in env_vars.items():
-            if not has_default and not os.getenv(var_name):
-                missing_vars.append(var_name)
-
+        missing_vars = sorted(environment.missing)
         if missing_vars:
             self.errors.extend(
                 [
@@ -146,56 +165,43 @@ class ConfigurationValidator:
         # Check for potentially insecure default values
         insecure_defaults = ["password", "secret", "key", "token"]
 
-        for var_name, has_default in env_vars.items():
-            if has_default:
-                for insecure_term in insecure_defaults:
-                    if insecure_term in var_name.lower():
-                        self.warnings.append(
-                            f"Environment variable '{var_name}' has a default value "
-                            f"but appears to contain sensitive data"
-                        )
-                        break
+        for var_name in sorted(environment.defaulted):
+            for insecure_term in insecure_defaults:
+                if insecure_term in var_name.lower():
+                    self.warnings.append(
+                        f"Environment variable '{var_name}' has a default value "
+                        f"but appears to contain sensitive data"
+                    )
+                    break
 
         if self.verbose:
-            print(f"✅ Found {len(env_vars)} environment variable references")
+            print(
+                f"✅ Found {len(environment.dependencies)} environment variable "
+                "references"
+            )
             if missing_vars:
                 print(f"❌ {len(missing_vars)} required variables missing")
 
-    def _extract_env_vars(
-        self, data: Any, env_vars: dict[str, bool] | None = None
-    ) -> dict[str, bool]:
-        """
-        Recursively extract environment variable references from configuration.
+    def _substitute(self) -> SubstitutionResult:
+        """Substitute environment variables in the loaded file once.
+
+        Missing required variables are replaced by empty strings and
+        reported in the result instead of failing.
 
         Returns:
-            Dictionary mapping variable names to whether they have defaults
+            Substituted configuration data and its variable references
         """
-        if env_vars is None:
-            env_vars = {}
-
-        if isinstance(data, dict):
-            for value in data.values():
-                self._extract_env_vars(value, env_vars)
-        elif isinstance(data, list):
-            for item in data:
-                self._extract_env_vars(item, env_vars)
-        elif isinstance(data, str) and "${" in data:
-            # Extract environment variable references
-            import re
-
-            pattern = r"\$\{([^}]+)\}"
-            matches = re.findall(pattern, data)
-
-            for match in matches:
-                if ":" in match:
-                    # Has default value
-                    var_name = match.split(":")[0]
-                    env_vars[var_name] = True
-                else:
-                    # No default value
-                    env_vars[match] = False
-
-        return env_vars
+        if self._substitution is None or self._substitution[0] is not self.config_data:
+            result = EnvironmentSubstitutor().substitute(
+                self.config_data or {}, strict=False
+            )
+            self._substitution = (self.config_data, result)
+        return self._substitution[1]
+
+    def _resolved_data(self) -> dict[str, Any]:
+        """Get the configuration data with environment variables substituted."""
+        resolved = self._substitute().value
+        return resolved if isinstance(resolved, dict) else {}
 
     def _validate_security(self) -> None:
         """Validate security best practices."""
@@ -491,298 +497,181 @@ class ConfigurationValidator:
             )
 
     def _validate_connectivity(self) -> None:
-        """Validate connectivity to external services."""
+        """Validate connectivity to external services.
+
+        All services are probed concurrently, each under probe_timeout.
+        """
         if self.verbose:
             print("🔍 Testing connectivity to external services...")
 
-        # Test database connectivity
-        self._test_database_connectivity()
-
-        # Test queue connectivity
-        self._test_queue_connectivity()
+        report = asyncio.run(self._check_connectivity())
+        self.connectivity_report = report
 
-        # Test LLM provider connectivity
-        self._test_llm_connectivity()
+        for result in report.results:
+            if result.status == "passed":
+                if self.verbose:
+                    print(
+                        f"✅ {result.name} connectivity test passed "
+                        f"({result.duration:.2f}s)"
+                    )
+            elif result.status == "skipped":
+                self.warnings.append(
+                    f"{result.name} connectivity test skipped ({result.message})"
+                )
+            else:
+                issues = self.errors if result.severity == "error" else self.warnings
+                issues.append(
+                    f"{result.name} connectivity test failed: {result.message}"
+                )
 
-        # Test notification connectivity
-        self._test_notification_connectivity()
+        if self.verbose:
+            print(
+                f"⏱️  {len(report.results)} connectivity probes completed in "
+                f"{report.duration:.2f}s"
+            )
 
-    def _test_database_connectivity(self) -> None:
-        """Test database connectivity."""
+    async def _check_connectivity(self) -> ConnectivityReport:
+        """Build and run connectivity probes for all configured services."""
+        timeout = aiohttp.ClientTimeout(total=self.probe_timeout)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            http = HttpProbes(session, self.endpoints)
+            probes = [
+                *self._database_probes(),
+                *self._queue_probes(),
+                *self._llm_probes(http),
+                *self._notification_probes(http),
+            ]
+            checker = ConnectivityChecker(timeout=self.probe_timeout)
+            return await checker.run(probes)
+
+    def _database_probes(self) -> list[Probe]:
+        """Create the database connectivity probe."""
         if not self.config_data:
-            return
-
-        try:
-            # Note: test_connection may not exist, so we'll skip the import for now
-            # from src.database.connection import test_connection
-
-            db_config = self.config_data.get("database", {})
-            if isinstance(db_config, dict):
-                db_url = db_config.get("url", "")
-                if db_url and isinstance(db_url, str):
-                    # Substitute environment variables
-                    resolved_url = self._resolve_env_vars(db_url)
-                    if resolved_url:
-                        # Skip actual connection test since test_connection may
-                        # not exist
-                        # test_connection(resolved_url)
-                        if self.verbose:
-                            print(
-                                "✅ Database connectivity test skipped "
-                                "(test_connection not available)"
-                            )
-                    else:
-                        self.warnings.append(
-                            "Could not resolve database URL environment variables"
-                        )
+            return []
 
-        except ImportError:
-            self.warnings.append(
-                "Database connectivity test skipped (database module not available)"
+        db_config = self._resolved_data().get("database", {})
+        if not isinstance(db_config, dict):
+            return []
+        resolved_url = db_config.get("url")
+        if not isinstance(resolved_url, str):
+            return []
+        if not resolved_url:
+            self.warnings.append("Could not resolve database URL environment variables")
+            return []
+
+        return [
+            Probe(
+                "Database",
+                "database",
+                partial(check_database, resolved_url, self.probe_timeout),
+                severity="error",
             )
-        except Exception as e:
-            self.errors.append(f"Database connectivity test failed: {e}")
+        ]
 
-    def _test_queue_connectivity(self) -> None:
-        """Test queue connectivity."""
+    def _queue_probes(self) -> list[Probe]:
+        """Create the queue connectivity probe."""
         if not self.config_data:
-            return
-
-        try:
-            import redis
-
-            queue_config = self.config_data.get("queue", {})
-            if isinstance(queue_config, dict):
-                queue_url = queue_config.get("url", "")
-                if queue_url and isinstance(queue_url, str):
-                    resolved_url = self._resolve_env_vars(queue_url)
-                    if resolved_url:
-                        r = redis.from_url(resolved_url)
-                        r.ping()
-                        if self.verbose:
-                            print("✅ Queue connectivity test passed")
-                    else:
-                        self.warnings.append(
-                            "Could not resolve queue URL environment variables"
-                        )
+            return []
 
-        except ImportError:
-            self.warnings.append(
-                "Queue connectivity test skipped (redis module not available)"
-            )
-        except Exception as e:
-            self.errors.append(f"Queue connectivity test failed: {e}")
-
-    def _test_llm_connectivity(self) -> None:
-        """Test LLM provider connectivity."""
+        queue_config = self._resolved_data().get("queue", {})
+        if not isinstance(queue_config, dict):
+            return []
+        resolved_url = queue_config.get("url")
+        if not isinstance(resolved_url, str):
+            return []
+        if not resolved_url:
+            self.warnings.append("Could not resolve queue URL environment variables")
+            return []
+
+        return [Probe("Queue", "queue", partial(check_redis, resolved_url), "error")]
+
+    def _llm_probes(self, http: HttpProbes) -> list[Probe]:
+        """Create one connectivity probe per LLM provider."""
         if not self.config_data:
-            return
+            return []
 
-        llm_config = self.config_data.get("llm", {})
+        llm_config = self._resolved_data().get("llm", {})
         if not isinstance(llm_config, dict):
-            return
+            return []
 
-        for provider_name, provider_config in llm_config.items():
-            if not isinstance(provider_config, dict):
-                continue
-
-            try:
-                self._test_single_llm_provider(provider_name, provider_config)
-                if self.verbose:
-                    print(f"✅ LLM provider '{provider_name}' connectivity test passed")
-            except Exception as e:
-                self.warnings.append(
-                    f"LLM provider '{provider_name}' connectivity test failed: {e}"
-                )
+        return [
+            Probe(
+                f"LLM provider '{provider_name}'",
+                "llm",
+                partial(self._check_llm_provider, http, provider_name, provider_config),
+            )
+            for provider_name, provider_config in llm_config.items()
+            if isinstance(provider_config, dict)
+        ]
 
-    def _test_single_llm_provider(
-        self, provider_name: str, provider_config: dict[str, Any]
+    async def _check_llm_provider(
+        self, http: HttpProbes, provider_name: str, provider_config: dict[str, Any]
     ) -> None:
         """Test connectivity to a single LLM provider."""
         provider_type = provider_config.get("provider")
-        api_key = self._resolve_env_vars(provider_config.get("api_key", ""))
+        api_key = provider_config.get("api_key", "")
 
         if not api_key:
             raise ValueError(f"API key not available for provider {provider_name}")
 
         if provider_type == "anthropic":
-            self._test_anthropic_connectivity(api_key)
+            await http.anthropic(api_key)
         elif provider_type == "openai":
-            self._test_openai_connectivity(api_key)
+            await http.openai(api_key)
         elif provider_type == "azure_openai":
-            endpoint = self._resolve_env_vars(provider_config.get("endpoint", ""))
-            if endpoint is not None:
-                self._test_azure_openai_connectivity(api_key, endpoint)
-            else:
+            endpoint = provider_config.get("endpoint", "")
+            if not endpoint:
                 raise ValueError("Azure OpenAI endpoint could not be resolved")
-        else:
+            await http.azure_openai(api_key, endpoint)
+        elif len(api_key) < 10:
             # For other providers, just check if the API key looks valid
-            if len(api_key) < 10:
-                raise ValueError("API key appears to be invalid (too short)")
+            raise ValueError("API key appears to be invalid (too short)")
 
-    def _test_anthropic_connectivity(self, api_key: str) -> None:
-        """Test Anthropic API connectivity."""
-        import requests
-
-        headers = {"x-api-key": api_key, "content-type": "application/json"}
-
-        # Simple test request to check authentication
-        response = requests.get(
-            "https://api.anthropic.com/v1/messages", headers=headers, timeout=10
-        )
-
-        # We expect a 400 (bad request) since we're not sending a proper message
-        # But if we get 401 (unauthorized), the API key is invalid
-        if response.status_code == 401:
-            raise ValueError("Anthropic API key is invalid")
-
-    def _test_openai_connectivity(self, api_key: str) -> None:
-        """Test OpenAI API connectivity."""
-        import requests
-
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-        }
-
-        # Test with models endpoint
-        response = requests.get(
-            "https://api.openai.com/v1/models", headers=headers, timeout=10
-        )
-
-        if response.status_code == 401:
-            raise ValueError("OpenAI API key is invalid")
-        elif response.status_code != 200:
-            raise ValueError(f"OpenAI API returned status {response.status_code}")
-
-    def _test_azure_openai_connectivity(self, api_key: str, endpoint: str) -> None:
-        """Test Azure OpenAI API connectivity."""
-        import requests
-
-        if not endpoint:
-            raise ValueError("Azure OpenAI endpoint is required")
-
-        headers = {"api-key": api_key, "Content-Type": "application/json"}
-
-        # Test with deployments endpoint
-        response = requests.get(
-            f"{endpoint}/openai/deployments?api-version=2023-05-15",
-            headers=headers,
-            timeout=10,
-        )
-
-        if response.status_code == 401:
-            raise ValueError("Azure OpenAI API key is invalid")
-        elif response.status_code not in [200, 404]:  # 404 is OK if no deployments
-            raise ValueError(f"Azure OpenAI API returned status {response.status_code}")
-
-    def _test_notification_connectivity(self) -> None:
-        """Test notification service connectivity."""
+    def _notification_probes(self, http: HttpProbes) -> list[Probe]:
+        """Create one connectivity probe per notification channel."""
         if not self.config_data:
-            return
+            return []
 
-        notification_config = self.config_data.get("notification", {})
+        notification_config = self._resolved_data().get("notification", {})
         if not isinstance(notification_config, dict):
-            return
+            return []
 
         channels = notification_config.get("channels", [])
         if not isinstance(channels, list):
-            return
+            return []
 
+        probes = []
         for i, channel in enumerate(channels):
             if not isinstance(channel, dict):
                 continue
-
-            try:
-                self._test_single_notification_channel(channel)
-                provider = channel.get("provider", f"channel_{i}")
-                if self.verbose:
-                    print(
-                        f"✅ Notification channel '{provider}' connectivity test passed"
-                    )
-            except Exception as e:
-                provider = channel.get("provider", f"channel_{i}")
-                self.warnings.append(
-                    f"Notification channel '{provider}' connectivity test failed: {e}"
+            provider = channel.get("provider", f"channel_{i}")
+            probes.append(
+                Probe(
+                    f"Notification channel '{provider}'",
+                    "notification",
+                    partial(self._check_notification_channel, http, channel),
                 )
+            )
+        return probes
 
-    def _test_single_notification_channel(self, channel: dict[str, Any]) -> None:
+    async def _check_notification_channel(
+        self, http: HttpProbes, channel: dict[str, Any]
+    ) -> None:
         """Test connectivity to a single notification channel."""
         provider = channel.get("provider")
 
         if provider == "slack":
-            webhook_url = self._resolve_env_vars(channel.get("slack_webhook_url", ""))
+            webhook_url = channel.get("slack_webhook_url", "")
             if webhook_url:
-                self._test_slack_webhook(webhook_url)
+                await http.slack(webhook_url)
         elif provider == "telegram":
-            bot_token = self._resolve_env_vars(channel.get("telegram_bot_token", ""))
+            bot_token = channel.get("telegram_bot_token", "")
             if bot_token:
-                self._test_telegram_bot(bot_token)
+                await http.telegram(bot_token)
         elif provider == "webhook":
-            webhook_url = self._resolve_env_vars(channel.get("webhook_url", ""))
+            webhook_url = channel.get("webhook_url", "")
             if webhook_url:
-                self._test_generic_webhook(webhook_url)
-
-    def _test_slack_webhook(self, webhook_url: str) -> None:
-        """Test Slack webhook connectivity."""
-        import requests
-
-        test_payload = {"text": "Configuration validation test - please ignore"}
-
-        response = requests.post(webhook_url, json=test_payload, timeout=10)
-
-        if response.status_code != 200:
-            raise ValueError(f"Slack webhook returned status {response.status_code}")
-
-    def _test_telegram_bot(self, bot_token: str) -> None:
-        """Test Telegram bot connectivity."""
-        import requests
-
-        response = requests.get(
-            f"https://api.telegram.org/bot{bot_token}/getMe", timeout=10
-        )
-
-        if response.status_code != 200:
-            raise ValueError(f"Telegram bot API returned status {response.status_code}")
-
-        data = response.json()
-        if not data.get("ok"):
-            raise ValueError("Telegram bot token is invalid")
-
-    def _test_generic_webhook(self, webhook_url: str) -> None:
-        """Test generic webhook connectivity."""
-        import requests
-
-        # Simple HEAD request to test connectivity
-        response = requests.head(webhook_url, timeout=10)
-
-        # Accept any response that's not a connection error
-        if response.status_code >= 500:
-            raise ValueError(f"Webhook returned server error {response.status_code}")
-
-    def _resolve_env_vars(self, value: str) -> str | None:
-        """Resolve environment variables in a string value."""
-        if not isinstance(value, str) or "${" not in value:
-            return value
-
-        import re
-
-        def replace_env_var(match: Any) -> str:
-            var_spec = match.group(1)
-            if ":" in var_spec:
-                var_name, default_value = var_spec.split(":", 1)
-                return os.getenv(var_name, default_value)
-            else:
-                return os.getenv(var_spec, "")
-
-        pattern = r"\$\{([^}]+)\}"
-        resolved = re.sub(pattern, replace_env_var, value)
-
-        # Return None if any variables couldn't be resolved
-        if "${" in resolved:
-            return None
-
-        return resolved
+                await http.webhook(webhook_url)
 
 
 def main() -> None:
@@ -826,6 +715,13 @@ Examples:
         help="Test connectivity to external services (requires network access)",
     )
 
+    parser.add_argument(
+        "--probe-timeout",
+        type=float,
+        default=10.0,
+        help="Seconds each connectivity probe may take (default: 10)",
+    )
+
     parser.add_argument(
         "--schema-only",
         action="store_true",
@@ -871,7 +767,9 @@ Examples:
         check_connectivity = args.check_connectivity
 
     # Run validation
-    validator = ConfigurationValidator(args.config, args.verbose)
+    validator = ConfigurationValidator(
+        args.config, args.verbose, probe_timeout=args.probe_timeout
+    )
 
     try:
         errors, warnings, recommendations = validator.validate_all(
@@ -896,6 +794,8 @@ Examples:
                     "recommendation_count": len(recommendations),
                 },
             }
+            if validator.connectivity_report:
+                result["connectivity"] = validator.connectivity_report.to_dict()
             print(json.dumps(result, indent=2))
         else:
             # Human-readable output
@@ -918,6 +818,15 @@ Examples:
                 for recommendation in recommendations:
                     print(f"  • {recommendation}")
 
+            if validator.connectivity_report:
+                report = validator.connectivity_report
+                print(f"\n⏱️  CONNECTIVITY ({report.duration:.2f}s total):")
+                for probe in report.to_dict()["probes"]:
+                    print(
+                        f"  • {probe['name']}: {probe['status']} "
+                        f"({probe['duration']:.2f}s)"
+                    )
+
             print("\n📊 SUMMARY:")
             print(f"  Errors: {len(errors)}")
             print(f"  Warnings: {len(warnings)}")
@@ -52,13 +52,17 @@ class ConfigurationValidator:
         self.validation_errors.clear()
         self.warnings.clear()
 
-        # Basic validation
+        # Basic validation; lazily loaded sections validate on first access
+        deferred: frozenset[str] = getattr(
+            self.config, "deferred_sections", frozenset()
+        )
         self._validate_system_config()
         self._validate_database_config()
         self._validate_queue_config()
         self._validate_llm_configs()
         self._validate_notification_configs()
-        self._validate_repository_configs()
+        if "repositories" not in deferred:
+            self._validate_repository_configs()
 
         # Advanced validation
         if check_dependencies:
@@ -73,6 +77,31 @@ class ConfigurationValidator:
 
         return self.validation_errors.copy(), self.warnings.copy()
 
+    def validate_section(self, section: str) -> tuple[list[str], list[str]]:
+        """Run the basic validation of a single configuration section.
+
+        Args:
+            section: Section name, e.g. "repositories"
+
+        Returns:
+            Tuple of (errors, warnings)
+        """
+        validators = {
+            "system": self._validate_system_config,
+            "database": self._validate_database_config,
+            "queue": self._validate_queue_config,
+            "llm": self._validate_llm_configs,
+            "notification": self._validate_notification_configs,
+            "repositories": self._validate_repository_configs,
+        }
+        if section not in validators:
+            raise ValueError(f"Unknown configuration section: {section}")
+
+        self.validation_errors.clear()
+        self.warnings.clear()
+        validators[section]()
+        return self.validation_errors.copy(), self.warnings.copy()
+
     def _validate_system_config(self) -> None:
         """Validate system configuration."""
         system = self.config.system
@@ -0,0 +1,276 @@
+"""File watching hot reload for configuration.
+
+A ConfigWatcher follows the configuration file and reloads it on change:
+
+1. Changes are detected with inotify through the optional ``watchdog``
+   package, or by polling the file's stat signature.
+2. Bursts of events, such as editors writing a temp file and renaming it, are
+   debounced into a single reload.
+3. The file is parsed and validated on the watcher thread, never on the
+   threads reading configuration.
+4. The manager diffs old and new configuration, publishes the new snapshot,
+   invalidates only affected cache entries and notifies subscribers of the
+   sections that changed.
+
+A file that fails to parse or validate is reported and the running
+configuration is kept.
+"""
+
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from .exceptions import ConfigurationError
+from .models import Config
+
+if TYPE_CHECKING:
+    from .manager import ConfigurationManager
+    from .tools.diff import ConfigDiff
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+WatchBackend = Literal["auto", "inotify", "polling"]
+
+_SECTION_SPLIT = re.compile(r"[.\[]")
+
+
+def config_section(path: str) -> str:
+    """Get the top-level section of a dotted diff path."""
+    return _SECTION_SPLIT.split(path, maxsplit=1)[0]
+
+
+def diff_configs(old: Config, new: Config) -> list["ConfigDiff"]:
+    """Compute the structural differences between two configurations.
+
+    Args:
+        old: Currently active configuration
+        new: Newly loaded configuration
+
+    Returns:
+        Differences with dotted paths such as "database.pool_size"
+    """
+    # Imported here: the tools package imports src.config for its CLIs
+    from .tools.diff import ConfigurationDiffer
+
+    return ConfigurationDiffer().compare_dicts(
+        old.model_dump(mode="json"), new.model_dump(mode="json")
+    )
+
+
+@dataclass(frozen=True)
+class ConfigChange:
+    """A configuration change applied to the manager.
+
+    Attributes:
+        old: Configuration before the change
+        new: Configuration after the change
+        diffs: Structural differences between the two
+    """
+
+    old: Config
+    new: Config
+    diffs: list["ConfigDiff"] = field(default_factory=list)
+
+    @property
+    def paths(self) -> list[str]:
+        """Dotted paths that changed."""
+        return [diff.path for diff in self.diffs]
+
+    @property
+    def sections(self) -> frozenset[str]:
+        """Top-level sections that changed, e.g. {"notification"}."""
+        return frozenset(config_section(path) for path in self.paths)
+
+    def affects(self, section: str) -> bool:
+        """Check if a top-level section changed."""
+        return section in self.sections
+
+
+class _FileEventHandler(FileSystemEventHandler):
+    """Forward watchdog events for one file to the watcher."""
+
+    def __init__(self, watcher: "ConfigWatcher") -> None:
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event: "FileSystemEvent") -> None:
+        target = str(self._watcher.path)
+        paths = {os.fsdecode(event.src_path)}
+        if dest := getattr(event, "dest_path", ""):
+            paths.add(os.fsdecode(dest))
+        if target in paths:
+            self._watcher.notify_change()
+
+
+class ConfigWatcher:
+    """Watch a configuration file and hot reload it into a manager."""
+
+    def __init__(
+        self,
+        manager: "ConfigurationManager",
+        path: str | Path,
+        backend: WatchBackend = "auto",
+        poll_interval: float = 1.0,
+        debounce: float = 0.5,
+    ) -> None:
+        """Initialize configuration watcher.
+
+        Args:
+            manager: Manager to apply reloaded configuration to
+            path: Configuration file to watch
+            backend: "inotify" (requires watchdog), "polling", or "auto" to
+                use inotify when available
+            poll_interval: Seconds between stat checks when polling
+            debounce: Seconds without further changes before reloading
+
+        Raises:
+            ConfigurationError: If inotify is requested but unavailable
+        """
+        if backend == "inotify" and not WATCHDOG_AVAILABLE:
+            raise ConfigurationError(
+                "The inotify backend requires the watchdog package"
+            )
+        if backend == "auto":
+            backend = "inotify" if WATCHDOG_AVAILABLE else "polling"
+
+        self.manager = manager
+        self.path = Path(path).resolve()
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+
+        self.reloads = 0
+        self.failures = 0
+        self.last_error: str | None = None
+
+        self._signature = self._stat()
+        self._last_change: float | None = None
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._observer: Any = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the watcher thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start watching in a background thread."""
+        if self.is_running:
+            return
+
+        self._stop.clear()
+        if self.backend == "inotify":
+            self._observer = Observer()
+            self._observer.schedule(
+                _FileEventHandler(self), str(self.path.parent), recursive=False
+            )
+            self._observer.start()
+
+        self._thread = threading.Thread(
+            target=self._run, name="config-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop watching and wait for the watcher thread to exit."""
+        self._stop.set()
+        self._wakeup.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout)
+            self._observer = None
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def notify_change(self) -> None:
+        """Record a change event, restarting the debounce window."""
+        self._last_change = time.monotonic()
+        self._wakeup.set()
+
+    def poll(self) -> bool:
+        """Check the file's stat signature and record a change if it differs.
+
+        Returns:
+            True if a change was detected
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            # A missing file is usually mid-replace; wait for it to reappear
+            return False
+        self._signature = signature
+        self.notify_change()
+        return True
+
+    def reload(self) -> "ConfigChange | None":
+        """Parse, validate and apply the configuration file now.
+
+        Returns:
+            Applied change, or None if the file was invalid
+        """
+        try:
+            change = self.manager.reload_file(self.path)
+        except ConfigurationError as e:
+            self.failures += 1
+            self.last_error = str(e)
+            logger.error(f"Keeping current configuration, reload failed: {e}")
+            if self.manager._metrics:
+                self.manager._metrics.record_error(
+                    "config_reload_error", str(e), {"config_path": str(self.path)}
+                )
+            return None
+
+        self.reloads += 1
+        self.last_error = None
+        if change.diffs:
+            logger.info(
+                f"Reloaded configuration, changed sections: "
+                f"{', '.join(sorted(change.sections))}"
+            )
+        return change
+
+    def _run(self) -> None:
+        """Detect changes and reload once the debounce window has passed."""
+        while not self._stop.is_set():
+            if self._observer is None:
+                self.poll()
+
+            timeout = self.poll_interval
+            if self._last_change is not None:
+                remaining = self._last_change + self.debounce - time.monotonic()
+                if remaining <= 0:
+                    self._last_change = None
+                    self._signature = self._stat()
+                    try:
+                        self.reload()
+                    except Exception as e:
+                        logger.exception(f"Unexpected error reloading config: {e}")
+                    continue
+                timeout = min(timeout, remaining)
+
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    def _stat(self) -> tuple[int, int, int] | None:
+        """Get the file's identity and modification signature."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
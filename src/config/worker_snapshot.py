@@ -0,0 +1,192 @@
+"""Binary snapshots of validated configuration for worker startup.
+
+Every worker process otherwise parses the YAML file, substitutes environment
+variables and validates every model before it can do any work. With many
+workers and repositories that cost is paid over and over for the same
+configuration. Instead, the parent process validates once and writes a
+snapshot file, and workers load it without parsing or Pydantic validation:
+
+    manager.export_snapshot(snapshot_path)      # parent, after loading
+    ...
+    manager.load_snapshot(snapshot_path)        # each worker
+
+A snapshot is a marshal-encoded tree of model field values, read through a
+memory map so concurrent workers share the page cache. Its header carries the
+format version and a hash of the Config JSON schema; a snapshot written by a
+different schema, or for a configuration file that has changed since, is
+rejected and callers fall back to a full load.
+
+Snapshots hold the substituted configuration, secrets included, so they are
+written with owner-only permissions.
+"""
+
+import functools
+import hashlib
+import json
+import marshal
+import mmap
+import os
+import tempfile
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+from . import models
+from .models import Config
+
+FORMAT_VERSION = 1
+
+_MAGIC = "agentic-config-snapshot"
+
+# Tags of encoded values; plain tuples never occur in encoded data
+_MODEL = 0
+_ENUM = 1
+_TUPLE = 2
+
+# Classes a snapshot may reference, by name
+_MODELS: dict[str, type[BaseModel]] = {
+    cls.__name__: cls
+    for cls in vars(models).values()
+    if isinstance(cls, type)
+    and issubclass(cls, BaseModel)
+    and cls.__module__ == models.__name__
+}
+_ENUMS: dict[str, type[Enum]] = {
+    cls.__name__: cls
+    for cls in vars(models).values()
+    if isinstance(cls, type)
+    and issubclass(cls, Enum)
+    and cls.__module__ == models.__name__
+}
+
+
+@functools.cache
+def schema_hash() -> str:
+    """Get the hash identifying the Config schema snapshots are written for."""
+    schema = json.dumps(Config.model_json_schema(), sort_keys=True)
+    return hashlib.sha256(schema.encode()).hexdigest()
+
+
+def _file_digest(path: Path) -> str:
+    """Get the SHA-256 of a file's content."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _header(source: tuple[str, str] | None) -> tuple[Any, ...]:
+    """Get the header of a snapshot for a configuration source."""
+    return (_MAGIC, FORMAT_VERSION, marshal.version, schema_hash(), source)
+
+
+def _encode(value: Any) -> Any:
+    """Encode a configuration value into marshal-safe data."""
+    if isinstance(value, BaseModel):
+        cls = Config if isinstance(value, Config) else type(value)
+        fields = {name: _encode(getattr(value, name)) for name in cls.model_fields}
+        return (_MODEL, cls.__name__, fields, tuple(sorted(value.model_fields_set)))
+    if isinstance(value, Enum):
+        return (_ENUM, type(value).__name__, value.value)
+    if isinstance(value, dict):
+        return {_encode(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return (_TUPLE, [_encode(item) for item in value])
+    if value is None or isinstance(value, str | int | float):
+        return value
+    raise ValueError(f"Cannot snapshot value of type {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Decode data written by _encode."""
+    if isinstance(value, tuple):
+        tag = value[0]
+        if tag == _MODEL:
+            _, name, fields, fields_set = value
+            decoded = {key: _decode(item) for key, item in fields.items()}
+            return _MODELS[name].model_construct(set(fields_set), **decoded)
+        if tag == _ENUM:
+            return _ENUMS[value[1]](value[2])
+        if tag == _TUPLE:
+            return tuple(_decode(item) for item in value[1])
+        raise ValueError(f"Unknown snapshot tag: {tag!r}")
+    if isinstance(value, dict):
+        return {_decode(key): _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+def write_config_snapshot(
+    config: Config, path: str | Path, source: str | Path | None = None
+) -> Path:
+    """Write a validated configuration to a snapshot file.
+
+    Args:
+        config: Validated configuration; lazy sections are materialized
+        path: Snapshot file to write, replaced atomically
+        source: Configuration file the configuration was loaded from; the
+            snapshot is rejected once that file changes
+
+    Returns:
+        Path of the written snapshot
+
+    Raises:
+        ValueError: If the configuration holds values that cannot be encoded
+        OSError: If the file cannot be written
+    """
+    path = Path(path)
+    source_key = None
+    if source is not None:
+        source_path = Path(source).resolve()
+        source_key = (str(source_path), _file_digest(source_path))
+
+    payload = marshal.dumps((_header(source_key), _encode(config)))
+
+    path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, suffix=".tmp", delete=False
+    ) as tmp:
+        tmp.write(payload)
+    os.chmod(tmp.name, 0o600)
+    os.replace(tmp.name, path)
+    return path
+
+
+def read_config_snapshot(path: str | Path) -> Config | None:
+    """Load a configuration from a snapshot file without validation.
+
+    Args:
+        path: Snapshot file written by write_config_snapshot()
+
+    Returns:
+        Configuration, or None if the snapshot is missing, unreadable,
+        written for another schema, or its source file has changed
+    """
+    try:
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data,
+        ):
+            header, encoded = marshal.loads(data)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(header, tuple) or header[:4] != _header(None)[:4]:
+        return None
+
+    source = header[4]
+    if source is not None:
+        source_path, digest = source
+        try:
+            if _file_digest(Path(source_path)) != digest:
+                return None
+        except OSError:
+            return None
+
+    try:
+        config = _decode(encoded)
+    except (KeyError, ValueError, TypeError):
+        return None
+    return config if isinstance(config, Config) else None
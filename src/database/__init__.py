@@ -29,6 +29,21 @@ from .health import (
     quick_health_check,
     reset_health_checker,
 )
+from .partitioning import (
+    PartitionError,
+    PartitionInfo,
+    PartitionMaintainer,
+    PartitionManager,
+    RetentionResult,
+)
+from .replicas import (
+    ReplicaRouter,
+    ReplicaState,
+    RoutingSession,
+    consistency_scope,
+    read_only,
+    read_only_scope,
+)
 
 __all__ = [
     # Configuration
@@ -42,14 +57,27 @@ __all__ = [
     "HealthCheckResult",
     # Health monitoring
     "HealthStatus",
+    # Partition maintenance
+    "PartitionError",
+    "PartitionInfo",
+    "PartitionMaintainer",
+    "PartitionManager",
+    # Read replica routing
+    "ReplicaRouter",
+    "ReplicaState",
+    "RetentionResult",
+    "RoutingSession",
     "check_database_health",
     "close_database_connections",
     "comprehensive_health_check",
+    "consistency_scope",
     "get_connection_manager",
     "get_database_config",
     "get_database_session",
     "get_health_checker",
     "quick_health_check",
+    "read_only",
+    "read_only_scope",
     "reset_connection_manager",
     "reset_database_config",
     "reset_health_checker",
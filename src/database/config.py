@@ -5,7 +5,7 @@ proper defaults, and production-ready connection pool settings.
 """
 
 import os
-from typing import Any
+from typing import Annotated, Any
 from urllib.parse import urlparse
 
 from pydantic import (
@@ -14,7 +14,7 @@ from pydantic import (
     field_validator,
     model_validator,
 )
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class DatabasePoolConfig(BaseModel):
@@ -37,6 +37,20 @@ class DatabasePoolConfig(BaseModel):
     pool_timeout: int = Field(
         default=30, description="Timeout in seconds to get a connection from the pool"
     )
+    adaptive_concurrency: bool = Field(
+        default=False,
+        description="Adjust session concurrency from pool metrics (experimental)",
+    )
+    adaptive_min_concurrency: int = Field(
+        default=2, description="Lowest session concurrency the controller may set"
+    )
+    adaptive_interval: float = Field(
+        default=5.0, description="Seconds between adaptive concurrency adjustments"
+    )
+    adaptive_target_wait: float = Field(
+        default=0.05,
+        description="p95 session slot wait in seconds above which concurrency grows",
+    )
 
 
 class DatabaseConfig(BaseSettings):
@@ -54,6 +68,13 @@ class DatabaseConfig(BaseSettings):
     - DATABASE_POOL_PRE_PING: Enable pre-ping (default: true)
     - DATABASE_POOL_RECYCLE: Pool recycle time in seconds (default: 3600)
     - DATABASE_POOL_TIMEOUT: Pool timeout in seconds (default: 30)
+    - DATABASE_POOL_ADAPTIVE_CONCURRENCY: Adaptive session limit (default: false)
+    - DATABASE_STATEMENT_CACHE_SIZE: Prepared statements per connection (default: 256)
+    - DATABASE_QUERY_CACHE_SIZE: Compiled statements per engine (default: 1000)
+    - DATABASE_INSTRUMENT_QUERIES: Record query metrics (default: true)
+    - DATABASE_CAPTURE_SLOW_QUERY_PLANS: EXPLAIN slow queries (default: true)
+    - DATABASE_REPLICA_URLS: Comma-separated read replica URLs (default: none)
+    - DATABASE_REPLICA_MAX_LAG: Max replica lag in seconds for reads (default: 5)
     """
 
     # Database connection settings
@@ -90,6 +111,55 @@ class DatabaseConfig(BaseSettings):
         default=10, description="Connection timeout in seconds"
     )
     command_timeout: int = Field(default=60, description="Command timeout in seconds")
+    statement_cache_size: int = Field(
+        default=256,
+        ge=0,
+        description="Prepared statements cached per connection (0 behind PgBouncer)",
+    )
+    query_cache_size: int = Field(
+        default=1000,
+        ge=0,
+        description="Compiled SQL statements cached per engine",
+    )
+    instrument_queries: bool = Field(
+        default=True,
+        description="Record per-statement latency in the performance monitor",
+    )
+    capture_slow_query_plans: bool = Field(
+        default=True,
+        description="Sample EXPLAIN plans of slow statements and alert on changes",
+    )
+    explain_analyze_slow_queries: bool = Field(
+        default=False,
+        description=(
+            "Re-execute side-effect-free slow reads under EXPLAIN ANALYZE "
+            "instead of only planning them"
+        ),
+    )
+
+    # Partition maintenance settings
+    partition_maintenance_interval: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Seconds between monthly partition provisioning runs (0 disables)",
+    )
+    partition_months_ahead: int = Field(
+        default=3, ge=0, description="Months ahead to keep partitions provisioned"
+    )
+
+    # Read replica settings
+    replica_urls: Annotated[list[str], NoDecode] = Field(
+        default_factory=list,
+        description="Read replica URLs for read-only repository methods",
+    )
+    replica_max_lag: float = Field(
+        default=5.0,
+        ge=0,
+        description="Maximum replication lag in seconds for a replica to serve reads",
+    )
+    replica_check_interval: float = Field(
+        default=5.0, gt=0, description="Seconds between replica lag checks"
+    )
 
     model_config = SettingsConfigDict(
         env_prefix="DATABASE_",
@@ -109,6 +179,20 @@ class DatabaseConfig(BaseSettings):
                 raise ValueError("Invalid database URL format")
         return v
 
+    @field_validator("replica_urls", mode="before")
+    @classmethod
+    def validate_replica_urls(cls, v: Any) -> Any:
+        """Split comma-separated replica URLs and validate each one."""
+        if v is None:
+            return []
+        if isinstance(v, str):
+            v = [url.strip() for url in v.split(",") if url.strip()]
+        for url in v:
+            parsed = urlparse(url)
+            if not all([parsed.scheme, parsed.hostname]):
+                raise ValueError("Invalid replica URL format")
+        return v
+
     @field_validator("pool", mode="before")
     @classmethod
     def validate_pool_config(cls, v: Any) -> Any:
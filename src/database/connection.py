@@ -20,7 +20,16 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 
+from src.performance.connection_pool import (
+    AdaptivePoolController,
+    ConnectionPoolOptimizer,
+)
+from src.performance.instrumentation import QueryInstrumentation
+from src.performance.plan_capture import SlowQueryPlanCapture
+
 from .config import DatabaseConfig, get_database_config
+from .partitioning import PartitionMaintainer
+from .replicas import ROUTER_INFO_KEY, ReplicaRouter, RoutingSession
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +49,10 @@ class DatabaseConnectionManager:
         self.config = config or get_database_config()
         self._engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._pool_controller: AdaptivePoolController | None = None
+        self._replica_router: ReplicaRouter | None = None
+        self._partition_maintainer: PartitionMaintainer | None = None
+        self._instrumentation: QueryInstrumentation | None = None
 
     @property
     def engine(self) -> AsyncEngine:
@@ -52,17 +65,72 @@ class DatabaseConnectionManager:
     def session_factory(self) -> async_sessionmaker[AsyncSession]:
         """Get or create async session factory."""
         if self._session_factory is None:
+            # Sessions route read-only repository methods to replicas when
+            # replicas are configured
+            router = self.replica_router
+            routing: dict[str, Any] = {}
+            if router is not None:
+                routing = {
+                    "sync_session_class": RoutingSession,
+                    "info": {ROUTER_INFO_KEY: router},
+                }
             self._session_factory = async_sessionmaker(
                 bind=self.engine,
                 class_=AsyncSession,
                 expire_on_commit=False,  # Keep objects usable after commit
+                **routing,
             )
         return self._session_factory
 
-    def _create_engine(self) -> AsyncEngine:
-        """Create async SQLAlchemy engine with optimized settings."""
-        engine = create_async_engine(
-            self.config.get_sqlalchemy_url(),
+    @property
+    def pool_controller(self) -> AdaptivePoolController | None:
+        """Get the adaptive session concurrency controller, if enabled."""
+        if self._engine is None:
+            self._engine = self._create_engine()
+        return self._pool_controller
+
+    @property
+    def instrumentation(self) -> QueryInstrumentation | None:
+        """Get the primary engine's query instrumentation, if enabled."""
+        if self._engine is None:
+            self._engine = self._create_engine()
+        return self._instrumentation
+
+    @property
+    def replica_router(self) -> ReplicaRouter | None:
+        """Get the read replica router, if replica URLs are configured."""
+        if self._replica_router is None and self.config.replica_urls:
+            replicas = [self._build_engine(url) for url in self.config.replica_urls]
+            if self.config.instrument_queries:
+                for replica in replicas:
+                    QueryInstrumentation().attach(replica.sync_engine)
+            self._replica_router = ReplicaRouter(
+                self.engine,
+                replicas,
+                max_lag=self.config.replica_max_lag,
+                check_interval=self.config.replica_check_interval,
+            )
+        return self._replica_router
+
+    @property
+    def partition_maintainer(self) -> PartitionMaintainer | None:
+        """Get the partition provisioning task, if enabled on PostgreSQL."""
+        if (
+            self._partition_maintainer is None
+            and self.config.partition_maintenance_interval > 0
+            and self.engine.dialect.name == "postgresql"
+        ):
+            self._partition_maintainer = PartitionMaintainer(
+                self.session_factory,
+                interval=self.config.partition_maintenance_interval,
+                months_ahead=self.config.partition_months_ahead,
+            )
+        return self._partition_maintainer
+
+    def _build_engine(self, url: str) -> AsyncEngine:
+        """Create an async engine for url with the configured pool settings."""
+        return create_async_engine(
+            url,
             # Connection pool settings
             poolclass=AsyncAdaptedQueuePool,
             pool_size=self.config.pool.pool_size,
@@ -74,7 +142,12 @@ class DatabaseConnectionManager:
             connect_args={
                 "timeout": self.config.connect_timeout,
                 "command_timeout": self.config.command_timeout,
+                # Hot repository statements stay prepared on each connection,
+                # both in asyncpg and in SQLAlchemy's asyncpg adapter
+                "statement_cache_size": self.config.statement_cache_size,
+                "prepared_statement_cache_size": self.config.statement_cache_size,
             },
+            query_cache_size=self.config.query_cache_size,
             # Logging and debugging
             echo=self.config.should_echo_sql(),
             echo_pool=False,  # Set to True for pool debugging
@@ -82,9 +155,38 @@ class DatabaseConnectionManager:
             future=True,  # Use SQLAlchemy 2.0 style
         )
 
+    def _create_engine(self) -> AsyncEngine:
+        """Create async SQLAlchemy engine with optimized settings."""
+        engine = self._build_engine(self.config.get_sqlalchemy_url())
+
         # Register connection event handlers for monitoring
         self._register_connection_events(engine)
 
+        # Record every statement's latency, rows and errors by fingerprint, and
+        # sample EXPLAIN plans of slow statements on PostgreSQL
+        if self.config.instrument_queries:
+            plan_capture = (
+                SlowQueryPlanCapture(
+                    engine, analyze=self.config.explain_analyze_slow_queries
+                )
+                if self.config.capture_slow_query_plans
+                and engine.dialect.name == "postgresql"
+                else None
+            )
+            self._instrumentation = QueryInstrumentation(plan_capture=plan_capture)
+            self._instrumentation.attach(engine.sync_engine)
+
+        # Bound session concurrency in front of the pool and let the
+        # controller adjust it from pool metrics instead of hand tuning
+        if self.config.pool.adaptive_concurrency:
+            self._pool_controller = AdaptivePoolController(
+                ConnectionPoolOptimizer(engine),
+                min_limit=self.config.pool.adaptive_min_concurrency,
+                interval=self.config.pool.adaptive_interval,
+                target_wait=self.config.pool.adaptive_target_wait,
+                acquire_timeout=self.config.pool.pool_timeout,
+            )
+
         logger.info(
             "Created database engine",
             extra={
@@ -126,6 +228,26 @@ class DatabaseConnectionManager:
                 extra={"error": str(exception) if exception else None},
             )
 
+    @asynccontextmanager
+    async def _session_slot(self) -> AsyncGenerator[None, None]:
+        """Hold an adaptive concurrency slot while a session is open."""
+        controller = self.pool_controller
+        if controller is None:
+            yield
+            return
+        async with controller.slot():
+            yield
+
+    def _open_session(self) -> AsyncSession:
+        """Create a session, starting background maintenance on first use."""
+        factory = self.session_factory
+        if self._replica_router is not None:
+            self._replica_router.start()
+        maintainer = self.partition_maintainer
+        if maintainer is not None:
+            maintainer.start()
+        return factory()
+
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session with automatic cleanup.
@@ -135,15 +257,16 @@ class DatabaseConnectionManager:
                 # Use session for database operations
                 result = await session.execute(query)
         """
-        session = self.session_factory()
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        async with self._session_slot():
+            session = self._open_session()
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
 
     @asynccontextmanager
     async def get_transaction(self) -> AsyncGenerator[AsyncSession, None]:
@@ -155,15 +278,16 @@ class DatabaseConnectionManager:
                 # Transaction is NOT automatically committed
                 await session.commit()  # Explicit commit required
         """
-        session = self.session_factory()
-        try:
-            yield session
-            # No automatic commit - caller must commit explicitly
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        async with self._session_slot():
+            session = self._open_session()
+            try:
+                yield session
+                # No automatic commit - caller must commit explicitly
+            except Exception:
+                await session.rollback()
+                raise
+            finally:
+                await session.close()
 
     async def health_check(self) -> bool:
         """Perform database health check.
@@ -187,6 +311,13 @@ class DatabaseConnectionManager:
 
     async def close(self) -> None:
         """Close database engine and clean up connections."""
+        if self._pool_controller:
+            await self._pool_controller.stop()
+        if self._partition_maintainer:
+            await self._partition_maintainer.stop()
+        if self._replica_router:
+            await self._replica_router.dispose()
+            logger.info("Read replica engines disposed")
         if self._engine:
             await self._engine.dispose()
             logger.info("Database engine disposed")
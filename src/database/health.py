@@ -14,7 +14,11 @@ from typing import Any
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 
+from src.performance.connection_pool import AdaptivePoolController
+from src.performance.instrumentation import QueryInstrumentation
+
 from .connection import DatabaseConnectionManager, get_connection_manager
+from .replicas import ReplicaRouter
 
 logger = logging.getLogger(__name__)
 
@@ -149,6 +153,18 @@ class DatabaseHealthChecker:
                 "total_capacity": total_capacity,
             }
 
+            controller = self.connection_manager.pool_controller
+            if isinstance(controller, AdaptivePoolController):
+                details["adaptive_concurrency"] = controller.get_metrics()
+
+            instrumentation = self.connection_manager.instrumentation
+            if isinstance(instrumentation, QueryInstrumentation):
+                details["compiled_cache"] = instrumentation.compile_cache.to_dict()
+
+            router = self.connection_manager.replica_router
+            if isinstance(router, ReplicaRouter):
+                details["read_replicas"] = router.get_metrics()
+
             # Determine health status based on utilization
             if utilization >= 95:
                 status = HealthStatus.UNHEALTHY
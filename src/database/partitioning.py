@@ -0,0 +1,510 @@
+"""Monthly range partition management for high-volume tables.
+
+check_runs and pr_state_history are range-partitioned by month on created_at
+(see the partition_check_runs_and_state_history migration). This module keeps
+future partitions provisioned and applies retention by detaching and dropping
+whole partitions, optionally archiving them to compressed local files first.
+PartitionMaintainer provisions partitions at startup and periodically.
+Tables that are not partitioned (e.g. schemas created with create_all in
+development) fall back to a single set-based DELETE.
+"""
+
+import asyncio
+import enum
+import gzip
+import json
+import logging
+import re
+import uuid
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+PARTITIONED_TABLES = frozenset({"check_runs", "pr_state_history"})
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{4})_(\d{2})$")
+_ARCHIVE_BATCH_SIZE = 1000
+
+
+class PartitionError(Exception):
+    """Exception raised during partition maintenance."""
+
+    pass
+
+
+@dataclass
+class PartitionInfo:
+    """A monthly partition and its created_at range."""
+
+    name: str
+    table_name: str
+    range_start: datetime
+    range_end: datetime
+
+
+@dataclass
+class RetentionResult:
+    """Outcome of applying retention to a table.
+
+    partitions_removed lists months dropped whole, and partitions_rebuilt
+    months re-created holding only their kept rows. With drop=False nothing
+    is dropped; detached_tables lists the tables left in place instead.
+    """
+
+    table_name: str
+    rows_removed: int = 0
+    rows_kept: int = 0
+    partitions_removed: list[str] = field(default_factory=list)
+    partitions_rebuilt: list[str] = field(default_factory=list)
+    detached_tables: list[str] = field(default_factory=list)
+    archive_files: list[Path] = field(default_factory=list)
+    used_partitions: bool = True
+
+
+def _next_month(value: datetime) -> datetime:
+    """Return the first instant of the month after value's month."""
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def parse_partition_name(table_name: str, name: str) -> PartitionInfo | None:
+    """Derive a partition's range from its name, or None if not monthly."""
+    if not name.startswith(f"{table_name}_p"):
+        return None
+
+    match = _PARTITION_SUFFIX.search(name)
+    if match is None:
+        return None
+
+    start = datetime(int(match.group(1)), int(match.group(2)), 1, tzinfo=UTC)
+    return PartitionInfo(
+        name=name,
+        table_name=table_name,
+        range_start=start,
+        range_end=_next_month(start),
+    )
+
+
+class PartitionManager:
+    """Provision monthly partitions and apply partition-level retention."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize with the session used for maintenance statements."""
+        self.session = session
+
+    async def is_partitioned(self, table_name: str) -> bool:
+        """Check whether a table is a partitioned (parent) table."""
+        table_name = self._validate_table(table_name)
+        result = await self.session.execute(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table)"
+            ),
+            {"table": table_name},
+        )
+        return bool(result.scalar_one())
+
+    async def ensure_partitions(
+        self,
+        table_name: str,
+        months_ahead: int = 3,
+        from_month: datetime | None = None,
+    ) -> int:
+        """Create any missing monthly partitions up to months_ahead.
+
+        Returns the number of partitions created.
+        """
+        table_name = self._validate_table(table_name)
+        result = await self.session.execute(
+            text("SELECT ensure_monthly_partitions(:table, :from_month, :ahead)"),
+            {
+                "table": table_name,
+                "from_month": from_month or datetime.now(UTC),
+                "ahead": months_ahead,
+            },
+        )
+        created = int(result.scalar_one())
+        if created:
+            logger.info(
+                f"Created {created} partition(s) for {table_name}",
+                extra={"table": table_name, "created": created},
+            )
+        return created
+
+    async def list_partitions(self, table_name: str) -> list[PartitionInfo]:
+        """List a table's monthly partitions ordered by range start."""
+        table_name = self._validate_table(table_name)
+        result = await self.session.execute(
+            text(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = :table"
+            ),
+            {"table": table_name},
+        )
+
+        partitions = [
+            info
+            for (name,) in result.all()
+            if (info := parse_partition_name(table_name, name)) is not None
+        ]
+        return sorted(partitions, key=lambda info: info.range_start)
+
+    async def get_expired_partitions(
+        self, table_name: str, older_than: datetime
+    ) -> list[PartitionInfo]:
+        """Get partitions whose whole range lies before older_than."""
+        cutoff = older_than if older_than.tzinfo else older_than.replace(tzinfo=UTC)
+        return [
+            info
+            for info in await self.list_partitions(table_name)
+            if info.range_end <= cutoff
+        ]
+
+    async def apply_retention(
+        self,
+        table_name: str,
+        older_than: datetime,
+        keep_latest_per_pr: int = 0,
+        archive_dir: Path | str | None = None,
+        archive_format: str = "jsonl",
+        drop: bool = True,
+    ) -> RetentionResult:
+        """Remove data older than a cutoff a whole partition at a time.
+
+        Only partitions entirely older than the cutoff are removed, so data in
+        the partially expired month stays until that month fully expires. The
+        latest keep_latest_per_pr rows per PR are preserved by rebuilding the
+        month's partition with only those rows, so they stay out of the
+        default partition. With drop=False, removed partitions are detached
+        and left in place as standalone tables instead of being dropped.
+        """
+        table_name = self._validate_table(table_name)
+        if archive_format not in ("jsonl", "parquet"):
+            raise PartitionError(f"Unsupported archive format: {archive_format}")
+
+        if not await self.is_partitioned(table_name):
+            return await self._delete_expired_rows(
+                table_name, older_than, keep_latest_per_pr
+            )
+
+        outcome = RetentionResult(table_name=table_name)
+        for info in await self.get_expired_partitions(table_name, older_than):
+            count_result = await self.session.execute(
+                text(f"SELECT count(*) FROM {info.name}")  # nosec B608
+            )
+            partition_rows = int(count_result.scalar_one())
+
+            stash = keep_latest_per_pr > 0
+            kept = 0
+            if stash:
+                kept = await self._stash_latest_rows(
+                    table_name, info.name, keep_latest_per_pr
+                )
+                if kept == partition_rows:
+                    # Every row is still among its PR's latest; nothing to remove
+                    await self.session.execute(text("DROP TABLE _retention_survivors"))
+                    continue
+
+            if archive_dir is not None:
+                outcome.archive_files.append(
+                    await self.archive_partition(info, archive_dir, archive_format)
+                )
+
+            if table_name == "check_runs":
+                await self._delete_orphaned_analysis(info.name, stash)
+
+            await self.session.execute(
+                text(f"ALTER TABLE {table_name} DETACH PARTITION {info.name}")
+            )
+
+            detached = info.name
+            if kept:
+                detached = await self._rebuild_partition(info)
+                outcome.partitions_rebuilt.append(info.name)
+            if stash:
+                await self.session.execute(text("DROP TABLE _retention_survivors"))
+
+            if drop:
+                await self.session.execute(text(f"DROP TABLE {detached}"))
+                if not kept:
+                    outcome.partitions_removed.append(info.name)
+            else:
+                outcome.detached_tables.append(detached)
+
+            outcome.rows_removed += partition_rows - kept
+            outcome.rows_kept += kept
+            logger.info(
+                f"{'Rebuilt' if kept else 'Removed'} partition {info.name} "
+                f"of {table_name}",
+                extra={
+                    "table": table_name,
+                    "partition": info.name,
+                    "detached_table": detached,
+                    "rows": partition_rows,
+                    "kept": kept,
+                    "dropped": drop,
+                },
+            )
+
+        return outcome
+
+    async def archive_partition(
+        self,
+        info: PartitionInfo,
+        archive_dir: Path | str,
+        archive_format: str = "jsonl",
+    ) -> Path:
+        """Stream a partition's rows into a compressed local archive file.
+
+        JSONL archives are gzip-compressed; Parquet archives use pyarrow with
+        zstd compression and require pyarrow to be installed.
+        """
+        directory = Path(archive_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if archive_format == "parquet":
+            return await self._archive_parquet(info, directory)
+        return await self._archive_jsonl(info, directory)
+
+    async def _archive_jsonl(self, info: PartitionInfo, directory: Path) -> Path:
+        """Archive a partition as gzip-compressed JSON lines."""
+        path = directory / f"{info.name}.jsonl.gz"
+        stream = await self.session.stream(
+            text(f"SELECT * FROM {info.name}")  # nosec B608
+        )
+
+        with gzip.open(path, "wt", encoding="utf-8") as archive:
+            async for batch in stream.mappings().partitions(_ARCHIVE_BATCH_SIZE):
+                for row in batch:
+                    archive.write(json.dumps(_archive_row(row)) + "\n")
+
+        return path
+
+    async def _archive_parquet(self, info: PartitionInfo, directory: Path) -> Path:
+        """Archive a partition as a zstd-compressed Parquet file."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise PartitionError(
+                "Parquet archival requires pyarrow; install it or use 'jsonl'"
+            ) from e
+
+        path = directory / f"{info.name}.parquet"
+        stream = await self.session.stream(
+            text(f"SELECT * FROM {info.name}")  # nosec B608
+        )
+
+        writer = None
+        try:
+            async for batch in stream.mappings().partitions(_ARCHIVE_BATCH_SIZE):
+                table = pa.Table.from_pylist([_archive_row(row) for row in batch])
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema, compression="zstd")
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        if writer is None:
+            pq.write_table(pa.table({}), path, compression="zstd")
+
+        return path
+
+    async def _stash_latest_rows(
+        self, table_name: str, partition: str, keep_latest_per_pr: int
+    ) -> int:
+        """Copy rows among the latest N per PR out of a partition.
+
+        Ranking happens across the whole table before the partition is
+        detached, so a row is only kept if it is still one of its PR's latest.
+        """
+        await self.session.execute(
+            text(
+                "CREATE TEMP TABLE _retention_survivors ON COMMIT DROP AS "  # nosec B608
+                f"SELECT p.* FROM {partition} p WHERE p.id IN ("
+                "SELECT id FROM ("
+                "SELECT id, row_number() OVER ("
+                "PARTITION BY pr_id ORDER BY created_at DESC) AS rn "
+                f"FROM {table_name} "
+                f"WHERE pr_id IN (SELECT pr_id FROM {partition})"
+                ") ranked WHERE rn <= :keep)"
+            ),
+            {"keep": keep_latest_per_pr},
+        )
+        result = await self.session.execute(
+            text("SELECT count(*) FROM _retention_survivors")
+        )
+        return int(result.scalar_one())
+
+    async def _rebuild_partition(self, info: PartitionInfo) -> str:
+        """Re-create a detached partition holding only the stashed survivors.
+
+        The detached table is renamed out of the way and a fresh partition for
+        the same month is attached, so kept rows stay in their own month.
+        Returns the name of the detached table to remove.
+        """
+        retired = f"{info.name}_retired"
+        await self.session.execute(text(f"ALTER TABLE {info.name} RENAME TO {retired}"))
+        await self.session.execute(
+            text(
+                f"CREATE TABLE {info.name} (LIKE {info.table_name} "
+                "INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"INSERT INTO {info.name} "  # nosec B608
+                "SELECT * FROM _retention_survivors"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"ALTER TABLE {info.table_name} ATTACH PARTITION {info.name} "
+                f"FOR VALUES FROM ('{info.range_start.isoformat()}') "
+                f"TO ('{info.range_end.isoformat()}')"
+            )
+        )
+        return retired
+
+    async def _delete_orphaned_analysis(
+        self, partition: str, exclude_survivors: bool
+    ) -> None:
+        """Delete analysis results that reference check runs being removed.
+
+        analysis_results cannot keep a foreign key to the partitioned
+        check_runs table, so its rows are cleaned up here instead.
+        """
+        statement = (
+            "DELETE FROM analysis_results "  # nosec B608
+            f"WHERE check_run_id IN (SELECT id FROM {partition})"
+        )
+        if exclude_survivors:
+            statement += (
+                " AND check_run_id NOT IN (SELECT id FROM _retention_survivors)"
+            )
+        await self.session.execute(text(statement))
+
+    async def _delete_expired_rows(
+        self, table_name: str, older_than: datetime, keep_latest_per_pr: int
+    ) -> RetentionResult:
+        """Delete expired rows in one set-based statement (unpartitioned)."""
+        keep_clause = ""
+        params: dict[str, Any] = {"older_than": older_than}
+        if keep_latest_per_pr > 0:
+            keep_clause = (
+                " AND id NOT IN (SELECT id FROM ("
+                "SELECT id, row_number() OVER ("
+                "PARTITION BY pr_id ORDER BY created_at DESC) AS rn "
+                f"FROM {table_name}) ranked WHERE rn <= :keep)"
+            )
+            params["keep"] = keep_latest_per_pr
+
+        result = await self.session.execute(
+            text(
+                f"DELETE FROM {table_name} "  # nosec B608
+                f"WHERE created_at < :older_than{keep_clause}"
+            ),
+            params,
+        )
+        return RetentionResult(
+            table_name=table_name,
+            rows_removed=cast(CursorResult[Any], result).rowcount,
+            used_partitions=False,
+        )
+
+    def _validate_table(self, table_name: str) -> str:
+        """Only allow known partitioned tables to reach DDL statements."""
+        if table_name not in PARTITIONED_TABLES:
+            raise PartitionError(f"Table {table_name!r} is not managed by partitions")
+        return table_name
+
+
+class PartitionMaintainer:
+    """Keep future monthly partitions provisioned from a background task.
+
+    Runs ensure_partitions for every partitioned table when started and then
+    every interval, so a new month's rows get their own partition instead of
+    accumulating in the default partition.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        interval: float = 3600.0,
+        months_ahead: int = 3,
+    ):
+        """Initialize the maintainer.
+
+        Args:
+            session_factory: Factory for sessions on the primary database
+            interval: Seconds between provisioning runs
+            months_ahead: Months ahead of the current one to provision
+        """
+        self.session_factory = session_factory
+        self.interval = interval
+        self.months_ahead = months_ahead
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start periodic provisioning on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop periodic provisioning."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def run_once(self) -> int:
+        """Provision partitions for every partitioned table once.
+
+        Returns the number of partitions created.
+        """
+        created = 0
+        for table_name in sorted(PARTITIONED_TABLES):
+            async with self.session_factory() as session, session.begin():
+                manager = PartitionManager(session)
+                if await manager.is_partitioned(table_name):
+                    created += await manager.ensure_partitions(
+                        table_name, months_ahead=self.months_ahead
+                    )
+        return created
+
+    async def _run(self) -> None:
+        """Provision partitions every interval until cancelled."""
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("Partition maintenance failed")
+            await asyncio.sleep(self.interval)
+
+
+def _archive_row(row: Any) -> dict[str, Any]:
+    """Convert a result mapping into archive-friendly primitive values."""
+    converted: dict[str, Any] = {}
+    for key, value in row.items():
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        elif isinstance(value, datetime | date):
+            value = value.isoformat()
+        elif isinstance(value, dict | list):
+            value = json.dumps(value)
+        converted[key] = value
+    return converted
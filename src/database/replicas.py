@@ -0,0 +1,336 @@
+"""Read-replica routing with lag awareness and read-your-writes consistency.
+
+Read-only repository methods (marked with ``read_only``) are routed to a
+healthy replica whose replication lag is within bounds; everything else,
+and any read that follows a write in the same session or consistency scope,
+goes to the primary.
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+import time
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Session.info key holding the ReplicaRouter used by RoutingSession
+ROUTER_INFO_KEY = "replica_router"
+_WROTE_INFO_KEY = "replica_router_wrote"
+
+# Replay lag in seconds; 0 when the replica has replayed everything it
+# received, or when the server is not in recovery at all
+_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+""")
+
+_read_only: ContextVar[bool] = ContextVar("replica_read_only", default=False)
+
+
+class _WriteScope:
+    """Time of the last write issued within a consistency scope."""
+
+    __slots__ = ("last_write",)
+
+    def __init__(self) -> None:
+        self.last_write: float | None = None
+
+
+_write_scope: ContextVar[_WriteScope | None] = ContextVar(
+    "replica_write_scope", default=None
+)
+
+
+@contextmanager
+def read_only_scope() -> Iterator[None]:
+    """Allow reads issued inside the block to be served by a replica."""
+    token = _read_only.set(True)
+    try:
+        yield
+    finally:
+        _read_only.reset(token)
+
+
+def read_only[**P, R](
+    func: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Mark an async repository method as safe to serve from a replica."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        token = _read_only.set(True)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _read_only.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def consistency_scope() -> Iterator[None]:
+    """Give reads in the block read-your-writes consistency across sessions.
+
+    After a write anywhere in the scope, replica reads are only allowed from
+    replicas whose lag is below the time elapsed since that write. Nested
+    scopes share the outermost one. Without a scope, stickiness is per
+    session.
+    """
+    if _write_scope.get() is not None:
+        yield
+        return
+
+    token = _write_scope.set(_WriteScope())
+    try:
+        yield
+    finally:
+        _write_scope.reset(token)
+
+
+@dataclass
+class ReplicaState:
+    """Health and lag of one replica as last observed."""
+
+    name: str
+    engine: AsyncEngine
+    healthy: bool = False  # Unknown until the first successful check
+    lag_seconds: float | None = None
+    consecutive_failures: int = 0
+    last_error: str | None = None
+    last_checked: float | None = None
+
+
+class ReplicaRouter:
+    """Choose between the primary and replicas for each statement.
+
+    A background task polls each replica's replay lag every check_interval
+    seconds. A replica serves reads only while it is healthy and its lag is
+    at most max_lag; it is marked unhealthy after failure_threshold failed
+    checks, or immediately when a statement on it hits a disconnect. When no
+    replica qualifies, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: list[AsyncEngine],
+        max_lag: float = 5.0,
+        check_interval: float = 5.0,
+        failure_threshold: int = 2,
+        check_timeout: float = 2.0,
+    ):
+        """Initialize router.
+
+        Args:
+            primary: Engine for writes and fallback reads
+            replicas: Engines for read replicas
+            max_lag: Maximum replay lag in seconds for a replica to serve reads
+            check_interval: Seconds between replica health checks
+            failure_threshold: Failed checks before a replica is unhealthy
+            check_timeout: Seconds allowed for one health check
+        """
+        self.primary = primary
+        self.replicas = [
+            ReplicaState(
+                name=engine.url.render_as_string(hide_password=True), engine=engine
+            )
+            for engine in replicas
+        ]
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.failure_threshold = failure_threshold
+        self.check_timeout = check_timeout
+        self.counters = {"primary_reads": 0, "replica_reads": 0, "writes": 0}
+        self._next = itertools.count()
+        self._task: asyncio.Task[None] | None = None
+
+        for replica in self.replicas:
+            event.listen(
+                replica.engine.sync_engine,
+                "handle_error",
+                functools.partial(self._on_replica_error, replica),
+            )
+
+    def start(self) -> None:
+        """Start background health checks on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop background health checks."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def dispose(self) -> None:
+        """Stop health checks and dispose replica engines."""
+        await self.stop()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    async def check_replicas(self) -> None:
+        """Measure lag and health of every replica once."""
+        await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+
+    def route_read(self) -> Engine:
+        """Return the engine a read in the current context should use."""
+        if not _read_only.get():
+            self.counters["primary_reads"] += 1
+            return self.primary.sync_engine
+
+        scope = _write_scope.get()
+        since_write = (
+            time.monotonic() - scope.last_write
+            if scope is not None and scope.last_write is not None
+            else None
+        )
+        replica = self.choose_replica(since_write)
+        if replica is None:
+            self.counters["primary_reads"] += 1
+            return self.primary.sync_engine
+
+        self.counters["replica_reads"] += 1
+        return replica.engine.sync_engine
+
+    def route_write(self) -> Engine:
+        """Record a write in the current scope and return the primary."""
+        self.counters["writes"] += 1
+        scope = _write_scope.get()
+        if scope is not None:
+            scope.last_write = time.monotonic()
+        return self.primary.sync_engine
+
+    def choose_replica(self, since_write: float | None = None) -> ReplicaState | None:
+        """Pick an eligible replica round-robin, or None for the primary.
+
+        Args:
+            since_write: Seconds since the last write in the current scope;
+                replicas lagging more than this are skipped so the write is
+                visible
+        """
+        eligible = [
+            replica
+            for replica in self.replicas
+            if replica.healthy
+            and replica.lag_seconds is not None
+            and replica.lag_seconds <= self.max_lag
+            and (since_write is None or replica.lag_seconds <= since_write)
+        ]
+        if not eligible:
+            return None
+        return eligible[next(self._next) % len(eligible)]
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get routing counters and per-replica state for export."""
+        return {
+            **self.counters,
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "lag_seconds": replica.lag_seconds,
+                    "consecutive_failures": replica.consecutive_failures,
+                    "last_error": replica.last_error,
+                }
+                for replica in self.replicas
+            ],
+        }
+
+    async def _run(self) -> None:
+        """Check replicas every interval until cancelled."""
+        while True:
+            try:
+                await self.check_replicas()
+            except Exception:
+                logger.exception("Replica health check failed")
+            await asyncio.sleep(self.check_interval)
+
+    async def _check(self, replica: ReplicaState) -> None:
+        """Measure one replica's lag and update its health."""
+        try:
+            async with asyncio.timeout(self.check_timeout):
+                async with replica.engine.connect() as conn:
+                    lag = (await conn.execute(_LAG_QUERY)).scalar()
+        except Exception as e:
+            replica.consecutive_failures += 1
+            replica.last_error = str(e)
+            if (
+                replica.healthy
+                and replica.consecutive_failures >= self.failure_threshold
+            ):
+                replica.healthy = False
+                logger.warning(
+                    "Read replica marked unhealthy",
+                    extra={"replica": replica.name, "error": str(e)},
+                )
+        else:
+            if not replica.healthy:
+                logger.info("Read replica healthy", extra={"replica": replica.name})
+            replica.healthy = True
+            replica.lag_seconds = float(lag or 0)
+            replica.consecutive_failures = 0
+            replica.last_error = None
+        replica.last_checked = time.monotonic()
+
+    def _on_replica_error(self, replica: ReplicaState, context: Any) -> None:
+        """Take a replica out of rotation as soon as it drops connections."""
+        if context.is_disconnect and replica.healthy:
+            replica.healthy = False
+            replica.last_error = str(context.original_exception)
+            logger.warning(
+                "Read replica disconnected",
+                extra={"replica": replica.name, "error": replica.last_error},
+            )
+
+
+class RoutingSession(Session):
+    """Session that routes statements through a ReplicaRouter.
+
+    Flushes, DML and locking selects go to the primary and make the session
+    sticky to it. Other statements go to a replica only inside ``read_only``
+    code and only while the session has not written. Sessions created
+    without a router in ``info`` behave like a plain Session.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any = None,
+        clause: Any = None,
+        **kw: Any,
+    ) -> Any:
+        """Return the primary or a replica engine for the statement."""
+        router: ReplicaRouter | None = self.info.get(ROUTER_INFO_KEY)
+        if router is None:
+            return super().get_bind(mapper, clause=clause, **kw)
+
+        if (
+            self._flushing
+            or getattr(clause, "is_dml", False)
+            or getattr(clause, "_for_update_arg", None) is not None
+        ):
+            self.info[_WROTE_INFO_KEY] = True
+            return router.route_write()
+
+        if self.info.get(_WROTE_INFO_KEY) or not getattr(clause, "is_select", False):
+            router.counters["primary_reads"] += 1
+            return router.primary.sync_engine
+
+        return router.route_read()
@@ -2,12 +2,16 @@
 
 import asyncio
 import logging
-from collections.abc import AsyncGenerator
+import random
+from collections.abc import AsyncGenerator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any
 
+from sqlalchemy import delete, event, inspect, tuple_, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper
 
 logger = logging.getLogger(__name__)
 
@@ -126,8 +130,62 @@ async def database_transaction(
         yield tx_session
 
 
+# SQLSTATEs of transient concurrency failures worth retrying
+DEADLOCK_DETECTED = "40P01"
+SERIALIZATION_FAILURE = "40001"
+_TRANSIENT_SQLSTATES = {
+    DEADLOCK_DETECTED: "deadlock",
+    SERIALIZATION_FAILURE: "serialization_failure",
+}
+
+
+def get_sqlstate(error: BaseException) -> str | None:
+    """Get the SQLSTATE of a database error or of the error that caused it."""
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        orig = getattr(current, "orig", None)
+        for candidate in (current, orig):
+            code = getattr(candidate, "sqlstate", None) or getattr(
+                candidate, "pgcode", None
+            )
+            if isinstance(code, str):
+                return code
+        current = current.__cause__
+    return None
+
+
+def classify_transient_error(error: BaseException) -> str | None:
+    """Classify deadlocks and serialization failures.
+
+    Returns:
+        "deadlock", "serialization_failure", or None for other errors
+    """
+    sqlstate = get_sqlstate(error)
+    return _TRANSIENT_SQLSTATES.get(sqlstate) if sqlstate else None
+
+
+@dataclass
+class BatchRetryStats:
+    """Outcome of RetryableTransaction.execute_batches."""
+
+    items: int = 0
+    batches: int = 0
+    retries: int = 0
+    deadlocks: int = 0
+    final_batch_size: int = 0
+
+
 class RetryableTransaction:
-    """Transaction manager with retry logic for transient failures."""
+    """Transaction manager with retry logic for transient failures.
+
+    execute() retries the whole operation. execute_batches() runs large
+    workloads in savepoint-scoped chunks so a deadlock only re-runs the
+    chunk that hit it, shrinking chunks under contention and growing them
+    back after consecutive successes. Retry delays use full jitter so
+    competing workers do not collide again in lockstep.
+    """
 
     def __init__(
         self,
@@ -136,6 +194,7 @@ class RetryableTransaction:
         base_delay: float = 0.1,
         backoff_factor: float = 2.0,
         auto_commit: bool = True,
+        max_delay: float = 5.0,
     ):
         """Initialize retryable transaction.
 
@@ -145,12 +204,19 @@ class RetryableTransaction:
             base_delay: Base delay between retries in seconds
             backoff_factor: Exponential backoff multiplier
             auto_commit: Whether to auto-commit on success
+            max_delay: Upper bound of the backoff before jitter, in seconds
         """
         self.session = session
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.backoff_factor = backoff_factor
         self.auto_commit = auto_commit
+        self.max_delay = max_delay
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Get a fully jittered exponential backoff delay for an attempt."""
+        ceiling = min(self.max_delay, self.base_delay * self.backoff_factor**attempt)
+        return random.uniform(0, ceiling)
 
     async def execute(self, operation: Any) -> Any:
         """Execute operation with retry logic.
@@ -176,10 +242,11 @@ class RetryableTransaction:
             except SQLAlchemyError as e:
                 last_exception = e
                 if attempt < self.max_retries:
-                    delay = self.base_delay * (self.backoff_factor**attempt)
+                    delay = self.backoff_delay(attempt)
+                    kind = classify_transient_error(e) or "error"
                     logger.warning(
-                        f"Transaction attempt {attempt + 1} failed, "
-                        f"retrying in {delay}s: {e}"
+                        f"Transaction attempt {attempt + 1} failed ({kind}), "
+                        f"retrying in {delay:.3f}s: {e}"
                     )
                     await asyncio.sleep(delay)
                 else:
@@ -196,6 +263,87 @@ class RetryableTransaction:
             f"Transaction failed after {self.max_retries + 1} attempts"
         ) from last_exception
 
+    async def execute_batches[T](
+        self,
+        items: Sequence[T],
+        operation: Callable[[AsyncSession, Sequence[T]], Awaitable[Any]],
+        batch_size: int = 500,
+        min_batch_size: int = 1,
+        grow_after: int = 3,
+    ) -> BatchRetryStats:
+        """Apply operation to items in savepoint-scoped chunks.
+
+        Each chunk runs inside a SAVEPOINT. A deadlock rolls back only that
+        savepoint; the chunk's items are retried after a jittered backoff
+        with the batch size halved. After grow_after consecutive successful
+        chunks the batch size doubles again, up to batch_size.
+
+        Serialization failures cannot be fixed inside the transaction, whose
+        snapshot is fixed, so they and other errors fail the transaction and
+        are retried as a whole like execute().
+
+        Args:
+            items: Items to process, e.g. rows to upsert
+            operation: Async callable applying one chunk within the session
+            batch_size: Initial and maximum chunk size
+            min_batch_size: Smallest chunk size to shrink to
+            grow_after: Successful chunks before the batch size grows
+
+        Returns:
+            Chunk, retry and deadlock counts of the successful attempt
+
+        Raises:
+            TransactionError: When a chunk or the transaction exhausts retries
+        """
+        if batch_size < 1 or not 1 <= min_batch_size <= batch_size:
+            raise ValueError("Require 1 <= min_batch_size <= batch_size")
+
+        async def run(session: AsyncSession) -> BatchRetryStats:
+            stats = BatchRetryStats(items=len(items))
+            size = batch_size
+            streak = 0
+            attempt = 0
+            position = 0
+
+            while position < len(items):
+                chunk = items[position : position + size]
+                try:
+                    async with session.begin_nested():
+                        await operation(session, chunk)
+                except SQLAlchemyError as e:
+                    if classify_transient_error(e) != "deadlock":
+                        raise
+                    stats.deadlocks += 1
+                    if attempt >= self.max_retries:
+                        raise TransactionError(
+                            f"Batch at offset {position} deadlocked {attempt + 1} times"
+                        ) from e
+                    size = max(min_batch_size, size // 2)
+                    streak = 0
+                    stats.retries += 1
+                    delay = self.backoff_delay(attempt)
+                    attempt += 1
+                    logger.warning(
+                        f"Deadlock in batch at offset {position}, retrying "
+                        f"{size} items in {delay:.3f}s"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                position += len(chunk)
+                stats.batches += 1
+                attempt = 0
+                streak += 1
+                if streak >= grow_after and size < batch_size:
+                    size = min(batch_size, size * 2)
+                    streak = 0
+
+            stats.final_batch_size = size
+            return stats
+
+        stats: BatchRetryStats = await self.execute(run)
+        return stats
+
 
 @asynccontextmanager
 async def retryable_transaction(
@@ -273,8 +421,36 @@ def transactional(auto_commit: bool = True, retries: int = 0) -> Any:
     return decorator
 
 
+@dataclass
+class UnitOfWorkStats:
+    """Entities and SQL statements of one unit of work commit."""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+    statements: int = 0  # Cursor executions, an executemany batch counts once
+
+
+_OPERATION_TYPES = ("create", "update", "delete")
+
+
 class UnitOfWork:
-    """Unit of Work pattern implementation for complex operations."""
+    """Unit of Work pattern implementation for complex operations.
+
+    Operations are grouped by kind and entity type and applied in batches:
+    creates and updates parent tables first, deletes children first. Creates
+    and updates of entities already persistent in the session are left to
+    the flush, which batches same-shaped INSERT/UPDATE rows into executemany
+    statements. Detached updates become one bulk UPDATE by primary key per
+    type, and deletes of types without ORM delete cascades one DELETE ... IN
+    per type.
+
+    A detached update writes only the columns changed since the entity was
+    loaded, so columns other writers changed meanwhile are kept. Unlike
+    merge, it does not insert a row that no longer exists: the commit fails
+    with StaleDataError instead. Detached entities with changed
+    relationships are still merged so the ORM cascades apply.
+    """
 
     def __init__(self, session: AsyncSession):
         """Initialize unit of work.
@@ -285,6 +461,7 @@ class UnitOfWork:
         self.session = session
         self._operations: list[tuple[str, Any, dict[str, Any]]] = []
         self._committed = False
+        self.last_stats: UnitOfWorkStats | None = None
 
     def add_operation(self, operation_type: str, entity: Any, **kwargs: Any) -> None:
         """Add an operation to the unit of work.
@@ -299,33 +476,173 @@ class UnitOfWork:
 
         self._operations.append((operation_type, entity, kwargs))
 
-    async def commit(self) -> None:
-        """Execute all operations in a single transaction."""
+    async def commit(self) -> UnitOfWorkStats:
+        """Execute all operations in a single transaction.
+
+        Returns:
+            Entity and statement counts of the commit
+        """
         if self._committed:
             raise TransactionError("Unit of work already committed")
 
+        groups = self._group_operations()
+        stats = UnitOfWorkStats()
+
         async with database_transaction(self.session) as session:
-            for operation_type, entity, _kwargs in self._operations:
-                if operation_type == "create":
-                    session.add(entity)
-                elif operation_type == "update":
-                    await session.merge(entity)
-                elif operation_type == "delete":
-                    await session.delete(entity)
-                else:
-                    raise ValueError(f"Unknown operation type: {operation_type}")
+            connection = await session.connection()
+            sync_connection = connection.sync_connection
+            assert sync_connection is not None
+
+            def count_statement(*_: Any) -> None:
+                stats.statements += 1
 
-            # Flush to ensure all operations are applied
-            await session.flush()
+            event.listen(sync_connection, "before_cursor_execute", count_statement)
+            try:
+                await self._apply(session, groups, stats)
+            finally:
+                event.remove(sync_connection, "before_cursor_execute", count_statement)
 
         self._committed = True
-        logger.debug(f"Unit of work committed {len(self._operations)} operations")
+        self.last_stats = stats
+        logger.debug(
+            f"Unit of work committed {len(self._operations)} operations "
+            f"in {stats.statements} statements"
+        )
+        return stats
 
     async def rollback(self) -> None:
         """Clear all pending operations."""
         self._operations.clear()
         logger.debug("Unit of work rolled back")
 
+    def _group_operations(self) -> dict[str, dict[Mapper[Any], list[Any]]]:
+        """Group entities by operation type and mapper, in dependency order."""
+        groups: dict[str, dict[Mapper[Any], list[Any]]] = {
+            operation_type: {} for operation_type in _OPERATION_TYPES
+        }
+        for operation_type, entity, _kwargs in self._operations:
+            if operation_type not in groups:
+                raise ValueError(f"Unknown operation type: {operation_type}")
+            mapper = inspect(entity).mapper
+            groups[operation_type].setdefault(mapper, []).append(entity)
+
+        for operation_type, by_mapper in groups.items():
+            # Parents before children for writes, children first for deletes
+            ordered = sorted(
+                by_mapper, key=_dependency_rank, reverse=operation_type == "delete"
+            )
+            groups[operation_type] = {mapper: by_mapper[mapper] for mapper in ordered}
+        return groups
+
+    async def _apply(
+        self,
+        session: AsyncSession,
+        groups: dict[str, dict[Mapper[Any], list[Any]]],
+        stats: UnitOfWorkStats,
+    ) -> None:
+        """Apply grouped operations with as few statements as possible."""
+        bulk_updates: dict[Mapper[Any], list[dict[str, Any]]] = {}
+
+        for entities in groups["create"].values():
+            session.add_all(entities)
+            stats.inserted += len(entities)
+
+        for mapper, entities in groups["update"].items():
+            for entity in entities:
+                key = inspect(entity).key
+                if entity in session:
+                    # Already tracked: the flush writes any changes
+                    continue
+                if key is None or key in session.identity_map:
+                    # Transient entities keep merge's insert-or-update
+                    # semantics; an identity-mapped copy merges without a SELECT
+                    await session.merge(entity)
+                else:
+                    # Detached but known to exist: update changes by primary
+                    # key, merging only when relationship cascades are needed
+                    changes = _changed_column_values(mapper, entity)
+                    if changes is None:
+                        await session.merge(entity)
+                    elif len(changes) > len(mapper.primary_key):
+                        bulk_updates.setdefault(mapper, []).append(changes)
+            stats.updated += len(entities)
+
+        # Inserts and in-session updates, batched per table by the flush
+        await session.flush()
+
+        for mapper, rows in bulk_updates.items():
+            await session.execute(update(mapper), rows)
+
+        for mapper, entities in groups["delete"].items():
+            if _has_delete_cascade(mapper):
+                # Let the ORM delete the dependent rows it cascades to
+                for entity in entities:
+                    await session.delete(entity)
+                await session.flush()
+            else:
+                await self._bulk_delete(session, mapper, entities)
+            stats.deleted += len(entities)
+
+    async def _bulk_delete(
+        self, session: AsyncSession, mapper: Mapper[Any], entities: list[Any]
+    ) -> None:
+        """Delete entities of one type with a single DELETE ... IN statement."""
+        keys = [mapper.primary_key_from_instance(entity) for entity in entities]
+        if len(mapper.primary_key) == 1:
+            condition = mapper.primary_key[0].in_([key[0] for key in keys])
+        else:
+            # Composite keys, e.g. (id, created_at) on partitioned tables
+            condition = tuple_(*mapper.primary_key).in_([tuple(k) for k in keys])
+        await session.execute(
+            delete(mapper).where(condition),
+            execution_options={"synchronize_session": False},
+        )
+        for entity in entities:
+            if entity in session:
+                session.expunge(entity)
+
+
+def _dependency_rank(mapper: Mapper[Any]) -> int:
+    """Rank a mapper's table so referenced tables come first."""
+    table = mapper.local_table
+    metadata = getattr(table, "metadata", None)
+    if metadata is None or table not in metadata.sorted_tables:
+        return 0
+    return int(metadata.sorted_tables.index(table))
+
+
+def _has_delete_cascade(mapper: Mapper[Any]) -> bool:
+    """Return whether deleting the mapper's rows cascades in the ORM."""
+    return any(rel.cascade.delete for rel in mapper.relationships)
+
+
+def _changed_column_values(mapper: Mapper[Any], entity: Any) -> dict[str, Any] | None:
+    """Get the primary key and changed columns of an entity for a bulk UPDATE.
+
+    Generated columns and columns with an onupdate default (updated_at) are
+    left out so the database computes them.
+
+    Returns:
+        Values by attribute key, or None if a relationship changed and the
+        entity needs merge's cascades
+    """
+    state = inspect(entity)
+    if any(state.attrs[rel.key].history.has_changes() for rel in mapper.relationships):
+        return None
+
+    values = {
+        mapper.get_property_by_column(column).key: value
+        for column, value in zip(mapper.primary_key, state.identity, strict=True)
+    }
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        if column.primary_key or column.computed is not None or column.onupdate:
+            continue
+        history = state.attrs[prop.key].history
+        if history.has_changes() and history.added:
+            values[prop.key] = history.added[0]
+    return values
+
 
 @asynccontextmanager
 async def unit_of_work(session: AsyncSession) -> AsyncGenerator[UnitOfWork, None]:
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from . import CheckRun, FixAttempt, PullRequest
 
-from sqlalchemy import Float, ForeignKey, String, Text
+from sqlalchemy import Float, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,10 +18,9 @@ class AnalysisResult(BaseModel):
 
     __tablename__ = "analysis_results"
 
-    # Foreign key to check run
-    check_run_id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), ForeignKey("check_runs.id"), nullable=False
-    )
+    # Check run reference; check_runs is partitioned on created_at, so there is
+    # no foreign key and partition retention removes orphaned results instead
+    check_run_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
 
     # Analysis results
     category: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -34,7 +33,9 @@ class AnalysisResult(BaseModel):
 
     # Relationships
     check_run: Mapped["CheckRun"] = relationship(
-        "CheckRun", back_populates="analysis_results"
+        "CheckRun",
+        primaryjoin="foreign(AnalysisResult.check_run_id) == CheckRun.id",
+        back_populates="analysis_results",
     )
     fix_attempts: Mapped[list["FixAttempt"]] = relationship(
         "FixAttempt", back_populates="analysis_result", cascade="all, delete-orphan"
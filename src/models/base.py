@@ -46,6 +46,9 @@ class BaseModel(Base):
         """Convert model instance to dictionary."""
         result = {}
         for column in self.__table__.columns:
+            if column.computed is not None:
+                # Generated columns are database-side helpers, not entity data
+                continue
             value = getattr(self, column.name)
             if isinstance(value, datetime):
                 value = value.isoformat()
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from . import AnalysisResult, PullRequest
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, PrimaryKeyConstraint, String, Text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,6 +19,16 @@ class CheckRun(BaseModel):
     """Model for GitHub check run tracking."""
 
     __tablename__ = "check_runs"
+    __table_args__ = (PrimaryKeyConstraint("id", "created_at", name="check_runs_pkey"),)
+
+    # Range-partitioned by month on created_at, which PostgreSQL requires in the
+    # primary key; set client-side so the identity is known before the INSERT
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
 
     # Foreign key to pull request
     pr_id: Mapped[uuid.UUID] = mapped_column(
@@ -55,8 +65,12 @@ class CheckRun(BaseModel):
     pull_request: Mapped["PullRequest"] = relationship(
         "PullRequest", back_populates="check_runs"
     )
+    # analysis_results.check_run_id has no foreign key (partitioned target)
     analysis_results: Mapped[list["AnalysisResult"]] = relationship(
-        "AnalysisResult", back_populates="check_run", cascade="all, delete-orphan"
+        "AnalysisResult",
+        primaryjoin="CheckRun.id == foreign(AnalysisResult.check_run_id)",
+        back_populates="check_run",
+        cascade="all, delete-orphan",
     )
 
     def __repr__(self) -> str:
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
     Integer,
@@ -16,12 +17,42 @@ from sqlalchemy import (
     Text,
     UniqueConstraint,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.compiler import DDLCompiler
 
 from .base import BaseModel
 from .enums import PRState, TriggerEvent
 
+# Text search configuration used for the generated search_vector column and
+# for queries against it; both sides must agree for the GIN index to be used.
+SEARCH_CONFIG = "english"
+
+
+class PostgresComputed(Computed):
+    """Generated column expression rendered only on PostgreSQL.
+
+    Other dialects (SQLite in tests and development) create a plain nullable
+    column instead, as they lack PostgreSQL's text search functions.
+    """
+
+
+@compiles(PostgresComputed)
+def _compile_computed(
+    element: PostgresComputed, compiler: DDLCompiler, **kw: Any
+) -> str:
+    """Omit the generation expression outside PostgreSQL."""
+    return ""
+
+
+@compiles(PostgresComputed, "postgresql")
+def _compile_computed_postgresql(
+    element: PostgresComputed, compiler: DDLCompiler, **kw: Any
+) -> str:
+    """Render the generation expression as a regular computed column."""
+    return str(compiler.visit_computed_column(element, **kw))
+
 
 class PullRequest(BaseModel):
     """Model for pull request tracking."""
@@ -58,6 +89,18 @@ class PullRequest(BaseModel):
         DateTime(timezone=True), nullable=True
     )
 
+    # Full-text search document maintained by PostgreSQL (title ranks above body)
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR().with_variant(Text(), "sqlite"),
+        PostgresComputed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(body, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        nullable=True,
+    )
+
     # Relationships
     repository: Mapped["Repository"] = relationship(
         "Repository", back_populates="pull_requests"
@@ -1,12 +1,12 @@
 """Repository SQLAlchemy model."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from . import PullRequest
 
-from sqlalchemy import Boolean, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy import Boolean, DateTime, Integer, String, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -38,6 +38,14 @@ class Repository(BaseModel):
     polling_interval_minutes: Mapped[int] = mapped_column(
         Integer, default=15, nullable=False
     )
+    # Due time for the next poll; a claimed repository is pushed forward by its
+    # lease until update_last_polled() reschedules it from last_polled_at
+    next_poll_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=func.now(),
+        server_default=func.now(),
+        nullable=False,
+    )
     failure_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     last_failure_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
@@ -124,8 +132,14 @@ class Repository(BaseModel):
         return self.name
 
     def update_last_polled(self) -> None:
-        """Update the last polled timestamp to now."""
+        """Update the last polled timestamp to now and schedule the next poll."""
         self.last_polled_at = datetime.now(UTC)
+        self.schedule_next_poll()
+
+    def schedule_next_poll(self) -> None:
+        """Set next_poll_at one polling interval after the last poll (or now)."""
+        base = self.last_polled_at or datetime.now(UTC)
+        self.next_poll_at = base + timedelta(minutes=self.polling_interval_minutes)
 
     def increment_failure_count(self, reason: str | None = None) -> None:
         """Increment failure count and update failure details."""
@@ -1,12 +1,13 @@
 """PRStateHistory SQLAlchemy model."""
 
 import uuid
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from . import PullRequest
 
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import DateTime, ForeignKey, PrimaryKeyConstraint, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,6 +19,18 @@ class PRStateHistory(BaseModel):
     """Model for tracking pull request state changes."""
 
     __tablename__ = "pr_state_history"
+    __table_args__ = (
+        PrimaryKeyConstraint("id", "created_at", name="pr_state_history_pkey"),
+    )
+
+    # Range-partitioned by month on created_at, which PostgreSQL requires in the
+    # primary key; set client-side so the identity is known before the INSERT
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+    )
 
     # Foreign key to pull request
     pr_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,14 +1,60 @@
 """Performance monitoring and optimization utilities."""
 
-from .connection_pool import ConnectionPoolOptimizer
+from .connection_pool import (
+    AdaptiveConcurrencyLimiter,
+    AdaptivePoolController,
+    ConnectionPoolOptimizer,
+    PoolControllerDecision,
+)
+from .histogram import StreamingHistogram
+from .index_advisor import (
+    IndexCandidate,
+    IndexRecommendation,
+    WorkloadIndexAdvisor,
+    render_alembic_migration,
+    write_alembic_migration,
+)
+from .instrumentation import (
+    QueryInstrumentation,
+    attribute_queries,
+    fingerprint_statement,
+    query_origin,
+)
 from .monitoring import PerformanceMonitor, query_timer, track_performance
+from .n_plus_one import (
+    NPlusOneDetector,
+    NPlusOneError,
+    NPlusOneFinding,
+    NPlusOneReport,
+)
 from .optimizations import QueryOptimizer, eager_load_relationships
+from .plan_capture import PlanChangeAlert, PlanSnapshot, SlowQueryPlanCapture
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AdaptivePoolController",
     "ConnectionPoolOptimizer",
+    "IndexCandidate",
+    "IndexRecommendation",
+    "NPlusOneDetector",
+    "NPlusOneError",
+    "NPlusOneFinding",
+    "NPlusOneReport",
     "PerformanceMonitor",
+    "PlanChangeAlert",
+    "PlanSnapshot",
+    "PoolControllerDecision",
+    "QueryInstrumentation",
     "QueryOptimizer",
+    "SlowQueryPlanCapture",
+    "StreamingHistogram",
+    "WorkloadIndexAdvisor",
+    "attribute_queries",
     "eager_load_relationships",
+    "fingerprint_statement",
+    "query_origin",
     "query_timer",
+    "render_alembic_migration",
     "track_performance",
+    "write_alembic_migration",
 ]
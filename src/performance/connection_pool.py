@@ -3,13 +3,19 @@
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncEngine
 from sqlalchemy.pool import QueuePool, StaticPool
 
+from .histogram import StreamingHistogram
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +51,7 @@ class ConnectionPoolOptimizer:
             "pool_timeouts": 0,
             "checkout_times": [],
             "total_checkouts": 0,
+            "total_checkins": 0,
         }
         self._setup_pool_monitoring()
 
@@ -76,6 +83,8 @@ class ConnectionPoolOptimizer:
                 checkout_times_list = self._stats["checkout_times"]
                 if isinstance(checkout_times_list, list):
                     checkout_times_list.append(checkout_time)
+                total_checkins = self._stats.get("total_checkins", 0)
+                self._stats["total_checkins"] = int(total_checkins) + 1  # type: ignore[call-overload]
                 # Keep only recent checkout times
                 checkout_times_list = self._stats["checkout_times"]
                 if (
@@ -282,6 +291,399 @@ class ConnectionPoolOptimizer:
         }
 
 
+class AdaptiveConcurrencyLimiter:
+    """Async semaphore whose limit can be changed while it is in use.
+
+    Waiters are served in FIFO order. Lowering the limit never interrupts
+    holders; new acquisitions simply wait until usage drops below it. Wait
+    times are collected into a histogram that the controller drains on each
+    sampling interval.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize limiter.
+
+        Args:
+            limit: Initial number of concurrent holders
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        self._limit = limit
+        self._in_use = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._wait_times = StreamingHistogram()
+        self.timeouts = 0
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_use(self) -> int:
+        """Get the number of slots currently held."""
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        """Get the number of tasks waiting for a slot."""
+        return len(self._waiters)
+
+    async def acquire(self, timeout: float | None = None) -> None:
+        """Wait for a slot.
+
+        Raises:
+            TimeoutError: If no slot frees up within timeout seconds
+        """
+        if self._in_use < self._limit and not self._waiters:
+            self._in_use += 1
+            self._wait_times.add(0.0)
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we gave up on it
+                self.release()
+            else:
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            if isinstance(e, TimeoutError):
+                self.timeouts += 1
+            raise
+        finally:
+            self._wait_times.add(time.perf_counter() - start)
+
+    def release(self) -> None:
+        """Return a slot and hand it to the next waiter if allowed."""
+        self._in_use -= 1
+        self._wake()
+
+    def set_limit(self, limit: int) -> None:
+        """Change the concurrency limit, waking waiters if it grew."""
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        self._limit = limit
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(self, timeout: float | None = None) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(timeout)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def drain_wait_times(self) -> StreamingHistogram:
+        """Return wait times recorded since the last drain and reset them."""
+        wait_times, self._wait_times = self._wait_times, StreamingHistogram()
+        return wait_times
+
+    def _wake(self) -> None:
+        """Grant free slots to waiters in arrival order."""
+        while self._waiters and self._in_use < self._limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_use += 1
+                waiter.set_result(None)
+
+
+@dataclass(frozen=True)
+class PoolSample:
+    """Pool and limiter signals observed over one controller interval."""
+
+    capacity: int
+    checked_out: int
+    overflow: int
+    utilization: float
+    wait_p95: float
+    waiting: int
+    timeouts: int
+    avg_checkout_time: float
+
+
+@dataclass(frozen=True)
+class PoolControllerDecision:
+    """One adjustment (or deliberate non-adjustment) of the limit."""
+
+    action: str  # "increase", "decrease" or "hold"
+    previous_limit: int
+    limit: int
+    reason: str
+    sample: PoolSample
+    timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+
+class AdaptivePoolController:
+    """Closed-loop control of session concurrency in front of the pool.
+
+    Every interval the controller samples slot wait times from its limiter
+    and utilization, overflow and checkout hold times from the pool events
+    registered by ConnectionPoolOptimizer, then adjusts the limiter:
+
+    - high pool utilization together with checkout hold times inflated
+      beyond latency_tolerance times their baseline means the database is
+      saturated and extra concurrency only adds queueing there, so the limit
+      shrinks multiplicatively;
+    - slot waits above target_wait (or limiter timeouts) while hold times
+      are normal mean the limit itself is the bottleneck, so it grows by
+      increase_step.
+
+    A direction must persist for stable_intervals samples before acting, and
+    no further change is made for cooldown_intervals after one, so the limit
+    does not oscillate around a threshold. The limit stays within
+    [min_limit, max_limit], where max_limit defaults to the pool's
+    pool_size + max_overflow.
+    """
+
+    def __init__(
+        self,
+        optimizer: ConnectionPoolOptimizer,
+        min_limit: int = 2,
+        max_limit: int | None = None,
+        interval: float = 5.0,
+        target_wait: float = 0.05,
+        high_utilization: float = 0.9,
+        latency_tolerance: float = 2.0,
+        increase_step: int = 1,
+        decrease_factor: float = 0.75,
+        stable_intervals: int = 3,
+        cooldown_intervals: int = 2,
+        acquire_timeout: float | None = None,
+        history_size: int = 100,
+    ):
+        """Initialize controller.
+
+        Args:
+            optimizer: Pool optimizer whose event statistics are sampled
+            min_limit: Lowest concurrency the controller may set
+            max_limit: Highest concurrency; defaults to the pool capacity
+            interval: Seconds between samples
+            target_wait: p95 slot wait in seconds above which the limit grows
+            high_utilization: Pool utilization at which the limit may shrink
+            latency_tolerance: Hold time to baseline ratio treated as
+                database saturation
+            increase_step: Slots added per increase
+            decrease_factor: Multiplier applied to the limit per decrease
+            stable_intervals: Consecutive samples required before a change
+            cooldown_intervals: Samples skipped after a change
+            acquire_timeout: Seconds to wait for a slot before TimeoutError
+            history_size: Number of decisions retained
+        """
+        self.optimizer = optimizer
+        self.capacity = self._pool_capacity()
+        self.max_limit = max_limit or self.capacity
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.interval = interval
+        self.target_wait = target_wait
+        self.high_utilization = high_utilization
+        self.latency_tolerance = latency_tolerance
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.stable_intervals = stable_intervals
+        self.cooldown_intervals = cooldown_intervals
+        self.acquire_timeout = acquire_timeout
+
+        self.limiter = AdaptiveConcurrencyLimiter(self.max_limit)
+        self.decisions: deque[PoolControllerDecision] = deque(maxlen=history_size)
+        self.counters = {"increase": 0, "decrease": 0, "hold": 0}
+        self._streak = 0
+        self._cooldown = 0
+        self._timeouts_seen = 0
+        self._checkins_seen = self._total_checkins()
+        self._baseline_hold: float | None = None
+        self._last_sample: PoolSample | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot, starting the control loop if needed."""
+        self.start()
+        async with self.limiter.slot(self.acquire_timeout):
+            yield
+
+    def start(self) -> None:
+        """Start the background control loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background control loop."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def step(self) -> PoolControllerDecision:
+        """Sample the pool and apply one control decision."""
+        return self.evaluate(self.sample())
+
+    def sample(self) -> PoolSample:
+        """Collect pool and limiter signals since the previous sample."""
+        pool = self.optimizer.engine.pool
+        checked_out = int(getattr(pool, "checkedout", lambda: 0)())
+        overflow = max(int(getattr(pool, "overflow", lambda: 0)()), 0)
+        wait_times = self.limiter.drain_wait_times()
+        timeouts = self.limiter.timeouts - self._timeouts_seen
+        self._timeouts_seen = self.limiter.timeouts
+
+        # Only hold times of connections checked in since the previous sample,
+        # so a quiet interval does not act on old latencies
+        checkins = self._total_checkins()
+        new_checkins = checkins - self._checkins_seen
+        self._checkins_seen = checkins
+        checkout_times = self.optimizer._stats["checkout_times"]
+        recent = (
+            checkout_times[-new_checkins:]
+            if new_checkins > 0 and isinstance(checkout_times, list)
+            else []
+        )
+
+        return PoolSample(
+            capacity=self.capacity,
+            checked_out=checked_out,
+            overflow=overflow,
+            utilization=checked_out / max(self.capacity, 1),
+            wait_p95=wait_times.quantile(0.95),
+            waiting=self.limiter.waiting,
+            timeouts=timeouts,
+            avg_checkout_time=sum(recent) / len(recent) if recent else 0.0,
+        )
+
+    def _total_checkins(self) -> int:
+        """Get the number of checkins the optimizer has timed so far."""
+        total = self.optimizer._stats.get("total_checkins", 0)
+        return total if isinstance(total, int) else 0
+
+    def evaluate(self, sample: PoolSample) -> PoolControllerDecision:
+        """Apply hysteresis to a sample and adjust the limit if warranted."""
+        self._last_sample = sample
+        limit = self.limiter.limit
+        hold = sample.avg_checkout_time
+        baseline = self._baseline_hold
+        ratio = hold / baseline if baseline else 0.0
+        inflated = ratio > self.latency_tolerance
+        waiting = sample.wait_p95 > self.target_wait or sample.timeouts > 0
+
+        if inflated and sample.utilization >= self.high_utilization:
+            signal = -1
+            reason = (
+                f"checkout hold {hold * 1000:.1f}ms is "
+                f"{ratio:.1f}x baseline at "
+                f"{sample.utilization:.0%} pool utilization"
+            )
+        elif waiting and not inflated:
+            signal = 1
+            reason = (
+                f"p95 slot wait {sample.wait_p95 * 1000:.1f}ms > "
+                f"{self.target_wait * 1000:.1f}ms"
+                + (f", {sample.timeouts} timeouts" if sample.timeouts else "")
+            )
+        else:
+            signal = 0
+            reason = (
+                "slots contended but database latency inflated"
+                if waiting
+                else "within targets"
+            )
+
+        # Baseline tracks the lowest hold times, drifting up slowly
+        if hold > 0 and not inflated:
+            self._baseline_hold = (
+                hold
+                if baseline is None or hold < baseline
+                else baseline * 0.95 + hold * 0.05
+            )
+
+        if signal == 0 or (self._streak > 0) != (signal > 0):
+            self._streak = signal
+        else:
+            self._streak += signal
+
+        new_limit = limit
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            if signal:
+                reason += " (cooling down)"
+        elif abs(self._streak) >= self.stable_intervals:
+            if signal > 0:
+                new_limit = min(self.max_limit, limit + self.increase_step)
+            else:
+                new_limit = max(
+                    self.min_limit, min(limit - 1, int(limit * self.decrease_factor))
+                )
+        elif signal:
+            reason += f" ({abs(self._streak)}/{self.stable_intervals} samples)"
+
+        if new_limit != limit:
+            self.limiter.set_limit(new_limit)
+            self._streak = 0
+            self._cooldown = self.cooldown_intervals
+            action = "increase" if new_limit > limit else "decrease"
+            logger.info(
+                "Adjusted database session concurrency",
+                extra={
+                    "previous_limit": limit,
+                    "limit": new_limit,
+                    "reason": reason,
+                },
+            )
+        else:
+            action = "hold"
+
+        decision = PoolControllerDecision(action, limit, new_limit, reason, sample)
+        self.counters[action] += 1
+        self.decisions.append(decision)
+        return decision
+
+    def get_metrics(self) -> dict[str, Any]:
+        """Get controller gauges and decision counters for export."""
+        sample = self._last_sample
+        last = self.decisions[-1] if self.decisions else None
+        return {
+            "limit": self.limiter.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_use": self.limiter.in_use,
+            "waiting": self.limiter.waiting,
+            "acquire_timeouts_total": self.limiter.timeouts,
+            "wait_p95_ms": sample.wait_p95 * 1000 if sample else 0.0,
+            "pool_utilization": sample.utilization if sample else 0.0,
+            "pool_overflow": sample.overflow if sample else 0,
+            "avg_checkout_time_ms": sample.avg_checkout_time * 1000 if sample else 0.0,
+            "baseline_checkout_time_ms": (self._baseline_hold or 0.0) * 1000,
+            "decisions_total": dict(self.counters),
+            "last_decision": (
+                {"action": last.action, "limit": last.limit, "reason": last.reason}
+                if last
+                else None
+            ),
+        }
+
+    async def _run(self) -> None:
+        """Sample and adjust every interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                self.step()
+            except Exception:
+                logger.exception("Adaptive pool controller step failed")
+
+    def _pool_capacity(self) -> int:
+        """Return pool_size + max_overflow of the optimizer's pool."""
+        pool = self.optimizer.engine.pool
+        size = int(getattr(pool, "size", lambda: 0)())
+        max_overflow = int(getattr(pool, "_max_overflow", 0))
+        return max(size + max(max_overflow, 0), 1)
+
+
 class PoolConfigurationManager:
     """Manage optimal pool configurations for different environments."""
 
@@ -0,0 +1,141 @@
+"""Fixed-memory streaming histograms for latency percentiles."""
+
+import heapq
+import math
+from collections.abc import Iterable
+
+
+class StreamingHistogram:
+    """Log-bucketed histogram with bounded relative error (DDSketch-style).
+
+    Each value lands in bucket ``ceil(log_gamma(value))`` where
+    ``gamma = (1 + a) / (1 - a)`` for relative accuracy ``a``, so any quantile
+    is reported within ``a`` of the true value. Buckets are stored sparsely and
+    capped at max_buckets by collapsing the lowest ones, which keeps memory
+    bounded regardless of how many values are added and only costs accuracy
+    on the fastest (least interesting) latencies.
+    """
+
+    __slots__ = (
+        "_buckets",
+        "_gamma",
+        "_log_gamma",
+        "_zero_count",
+        "count",
+        "max",
+        "max_buckets",
+        "min",
+        "min_value",
+        "relative_accuracy",
+        "sum",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        max_buckets: int = 2048,
+        min_value: float = 1e-6,
+    ):
+        """Initialize an empty histogram.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported quantiles
+            max_buckets: Upper bound on the number of populated buckets
+            min_value: Values at or below this are counted in a zero bucket
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        if max_buckets < 1:
+            raise ValueError("max_buckets must be positive")
+
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Record a single value."""
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value <= self.min_value:
+            self._zero_count += 1
+            return
+
+        key = math.ceil(math.log(value) / self._log_gamma)
+        buckets = self._buckets
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: "StreamingHistogram") -> None:
+        """Fold another histogram with the same accuracy into this one."""
+        if other._gamma != self._gamma:
+            raise ValueError("Cannot merge histograms with different accuracy")
+        if other.count == 0:
+            return
+
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._zero_count += other._zero_count
+        buckets = self._buckets
+        for key, bucket_count in other._buckets.items():
+            buckets[key] = buckets.get(key, 0) + bucket_count
+        while len(buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, q: float) -> float:
+        """Return the approximate value at quantile q (0 <= q <= 1)."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Return approximate values for several quantiles in one bucket pass."""
+        requested = list(qs)
+        if any(not 0 <= q <= 1 for q in requested):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if self.count == 0:
+            return [0.0] * len(requested)
+
+        order = sorted(range(len(requested)), key=requested.__getitem__)
+        results = [self.max] * len(requested)
+        keys = iter(sorted(self._buckets))
+        running = self._zero_count
+        value = self.min
+        for index in order:
+            rank = requested[index] * (self.count - 1)
+            while running <= rank:
+                key = next(keys, None)
+                if key is None:
+                    break
+                running += self._buckets[key]
+                value = self._bucket_value(key)
+            else:
+                results[index] = min(max(value, self.min), self.max)
+        return results
+
+    @property
+    def mean(self) -> float:
+        """Return the exact mean of recorded values."""
+        return self.sum / self.count if self.count else 0.0
+
+    def _bucket_value(self, key: int) -> float:
+        """Return the representative value of a bucket."""
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def _collapse(self) -> None:
+        """Merge the two lowest buckets to stay within max_buckets."""
+        lowest, second = heapq.nsmallest(2, self._buckets)
+        self._buckets[second] += self._buckets.pop(lowest)
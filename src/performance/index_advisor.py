@@ -0,0 +1,728 @@
+"""Workload-driven index advice from pg_stat_statements."""
+
+import hashlib
+import json
+import logging
+import re
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from .indexes import IndexSuggestion
+
+logger = logging.getLogger(__name__)
+
+_IDENT = r'"?([A-Za-z_]\w*)"?'
+_CLAUSE_KEYWORDS = (
+    "WHERE|JOIN|ON|LEFT|RIGHT|INNER|OUTER|CROSS|FULL|ORDER|GROUP|HAVING|LIMIT|"
+    "OFFSET|FOR|UNION|USING|SET|RETURNING|WINDOW|FETCH|LATERAL"
+)
+_TABLE_REF = re.compile(
+    rf"\b(?:FROM|JOIN|UPDATE)\s+(?:ONLY\s+)?(?:\w+\.)?{_IDENT}"
+    rf"(?:\s+(?:AS\s+)?(?!(?:{_CLAUSE_KEYWORDS})\b){_IDENT})?",
+    re.I,
+)
+_SECTION_END = (
+    r"(?=\bGROUP\s+BY\b|\bORDER\s+BY\b|\bLIMIT\b|\bOFFSET\b|\bFOR\s+UPDATE\b"
+    r"|\bFOR\s+SHARE\b|\bRETURNING\b|\bHAVING\b|\bUNION\b|$)"
+)
+_WHERE = re.compile(rf"\bWHERE\b(.*?){_SECTION_END}", re.I | re.S)
+_ORDER_BY = re.compile(r"\bORDER\s+BY\b(.*?)(?=\bLIMIT\b|\bOFFSET\b|\bFOR\b|$)", re.I)
+_SELECT_LIST = re.compile(r"^\s*SELECT\s+(?:DISTINCT\s+)?(.*?)\s+FROM\b", re.I | re.S)
+_COLUMN = rf"(?:{_IDENT}\.)?{_IDENT}"
+_VALUE = r"(?:\$\d+|\?|'(?:[^']|'')*'|-?\d+(?:\.\d+)?|TRUE\b|FALSE\b)"
+_EQUALITY = re.compile(rf"{_COLUMN}\s*(?:=\s*(?:ANY\s*\()?{_VALUE}|\bIN\s*\()", re.I)
+_NOW = r"(?:now\(\)|CURRENT_TIMESTAMP\b|CURRENT_DATE\b)"
+_RANGE = re.compile(
+    rf"{_COLUMN}\s*(?:<=|>=|<|>|\bBETWEEN\b|\bLIKE\b|\bILIKE\b)\s*"
+    rf"(?:{_VALUE}|{_NOW})",
+    re.I,
+)
+_NULL_TEST = re.compile(rf"{_COLUMN}\s+IS\s+(NOT\s+)?NULL\b", re.I)
+_JOIN_EQUALITY = re.compile(rf"{_COLUMN}\s*=\s*{_COLUMN}(?!\s*\()", re.I)
+_PARAM = re.compile(r"\$(\d+)")
+_CONSTANT = re.compile(r"^(?:'(?:[^']|'')*'|TRUE|FALSE)$", re.I)
+
+# Columns included in a covering index before it stops paying for itself
+_MAX_INCLUDE = 3
+_MAX_IDENTIFIER = 63
+
+
+@dataclass(frozen=True)
+class WorkloadStatement:
+    """A normalized statement and its cumulative cost from pg_stat_statements."""
+
+    query: str
+    calls: int
+    total_exec_time: float  # milliseconds
+    mean_exec_time: float  # milliseconds
+    rows: int = 0
+
+
+@dataclass
+class QueryPattern:
+    """Predicates and sort keys one statement applies to one table."""
+
+    table: str
+    equality: list[str] = field(default_factory=list)
+    ranges: list[str] = field(default_factory=list)
+    null_tests: dict[str, bool] = field(default_factory=dict)  # column -> NOT NULL
+    constants: dict[str, str] = field(default_factory=dict)
+    order_by: list[str] = field(default_factory=list)
+    selected: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class IndexCandidate:
+    """A composite, partial and/or covering index proposed for a table."""
+
+    table: str
+    columns: tuple[str, ...]
+    include: tuple[str, ...] = ()
+    where: str | None = None
+
+    @property
+    def name(self) -> str:
+        """Return a deterministic index name within PostgreSQL's length limit."""
+        columns = "_".join(re.sub(r"\W+", "_", column) for column in self.columns)
+        name = f"idx_{self.table}_{columns}".lower()
+        if self.where:
+            name += "_partial"
+        if self.include:
+            name += "_covering"
+        if len(name) > _MAX_IDENTIFIER:
+            digest = hashlib.sha1(self.create_sql_body().encode()).hexdigest()[:8]
+            name = f"{name[: _MAX_IDENTIFIER - 9]}_{digest}"
+        return name
+
+    def create_sql(self) -> str:
+        """Return the CREATE INDEX statement for the candidate."""
+        return f"CREATE INDEX {self.name} {self.create_sql_body()}"
+
+    def create_sql_body(self) -> str:
+        """Return the CREATE INDEX clauses following the index name."""
+        sql = f"ON {self.table} ({', '.join(self.columns)})"
+        if self.include:
+            sql += f" INCLUDE ({', '.join(self.include)})"
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+    def covers(self, other: "IndexCandidate") -> bool:
+        """Check whether this index serves every lookup other would."""
+        return (
+            self.table == other.table
+            and self.where == other.where
+            and self.columns[: len(other.columns)] == other.columns
+            and set(other.include) <= set(self.columns) | set(self.include)
+        )
+
+
+@dataclass
+class IndexRecommendation:
+    """A candidate validated against the planner with its estimated benefit."""
+
+    candidate: IndexCandidate
+    statements: list[WorkloadStatement]
+    cost_before: float
+    cost_after: float
+    saved_time_ms: float
+
+    @property
+    def improvement(self) -> float:
+        """Return the relative planner cost reduction on affected statements."""
+        if self.cost_before <= 0:
+            return 0.0
+        return (self.cost_before - self.cost_after) / self.cost_before
+
+    def to_suggestion(self) -> IndexSuggestion:
+        """Convert to the IndexSuggestion used by IndexOptimizer reports."""
+        improvement = self.improvement
+        calls = sum(statement.calls for statement in self.statements)
+        return IndexSuggestion(
+            table_name=self.candidate.table,
+            columns=list(self.candidate.columns),
+            index_type="btree",
+            partial_condition=self.candidate.where,
+            rationale=(
+                f"Cuts planner cost of {len(self.statements)} statements "
+                f"({calls} calls) by {improvement:.0%}"
+            ),
+            estimated_benefit=(
+                "high"
+                if improvement >= 0.8
+                else "medium"
+                if improvement >= 0.5
+                else "low"
+            ),
+            sql_command=f"{self.candidate.create_sql()};",
+        )
+
+
+def parse_statement(query: str) -> list[QueryPattern]:
+    """Extract per-table predicates, sort keys and selected columns.
+
+    This is a pattern-based reader for the flat SELECT/UPDATE/DELETE
+    statements the ORM generates, not a full SQL parser: subqueries and
+    expressions it does not recognize are ignored.
+    """
+    tables: dict[str, str] = {}
+    for match in _TABLE_REF.finditer(query):
+        table, alias = match.group(1), match.group(2)
+        tables[table] = table
+        if alias:
+            tables[alias] = table
+    if not tables:
+        return []
+
+    real_tables = list(dict.fromkeys(tables.values()))
+    patterns = {table: QueryPattern(table) for table in real_tables}
+
+    def resolve(qualifier: str | None, column: str) -> QueryPattern | None:
+        if qualifier is not None:
+            table = tables.get(qualifier)
+            return patterns.get(table) if table else None
+        return patterns[real_tables[0]] if len(real_tables) == 1 else None
+
+    def add(target: list[str], column: str) -> None:
+        if column not in target:
+            target.append(column)
+
+    conditions = " ".join(
+        [match.group(1) for match in _WHERE.finditer(query)]
+        + re.findall(r"\bON\b(.*?)(?=\bWHERE\b|\bJOIN\b|$)", query, re.I)
+    )
+
+    for match in _NULL_TEST.finditer(conditions):
+        pattern = resolve(match.group(1), match.group(2))
+        if pattern is not None:
+            pattern.null_tests[match.group(2)] = match.group(3) is not None
+
+    for match in _EQUALITY.finditer(conditions):
+        pattern = resolve(match.group(1), match.group(2))
+        if pattern is None:
+            continue
+        value = match.group(0).split("=", 1)[-1].strip()
+        if _CONSTANT.match(value):
+            pattern.constants[match.group(2)] = value
+        else:
+            add(pattern.equality, match.group(2))
+
+    for match in _JOIN_EQUALITY.finditer(conditions):
+        for qualifier, column in (match.group(1, 2), match.group(3, 4)):
+            if qualifier is None:
+                continue
+            pattern = resolve(qualifier, column)
+            if pattern is not None and column not in pattern.constants:
+                add(pattern.equality, column)
+
+    for match in _RANGE.finditer(conditions):
+        pattern = resolve(match.group(1), match.group(2))
+        if pattern is not None and match.group(2) not in pattern.equality:
+            add(pattern.ranges, match.group(2))
+
+    order = _ORDER_BY.search(query)
+    if order:
+        for item in order.group(1).split(","):
+            column = re.match(rf"\s*{_COLUMN}\s*(ASC|DESC)?\s*$", item, re.I)
+            if column is None:
+                break
+            pattern = resolve(column.group(1), column.group(2))
+            if pattern is None:
+                break
+            suffix = " DESC" if (column.group(3) or "").upper() == "DESC" else ""
+            add(pattern.order_by, f"{column.group(2)}{suffix}")
+
+    select = _SELECT_LIST.match(query)
+    if select and "*" not in select.group(1):
+        for item in select.group(1).split(","):
+            column = re.match(rf"\s*{_COLUMN}(?:\s+AS\s+\w+)?\s*$", item, re.I)
+            if column is None:
+                continue
+            pattern = resolve(column.group(1), column.group(2))
+            if pattern is not None:
+                add(pattern.selected, column.group(2))
+
+    return [
+        pattern
+        for pattern in patterns.values()
+        if pattern.equality or pattern.ranges or pattern.order_by
+    ]
+
+
+def generate_candidates(patterns: Iterable[QueryPattern]) -> list[IndexCandidate]:
+    """Propose composite, partial and covering indexes for query patterns.
+
+    Keys follow the usual B-tree ordering: equality columns first, then the
+    sort keys when the statement orders by this table, otherwise the first
+    range column. Constant and NULL filters become the partial predicate, and
+    a covering variant adds the remaining selected columns with INCLUDE.
+    """
+    candidates: dict[IndexCandidate, None] = {}
+    for pattern in patterns:
+        filtered = set(pattern.constants) | set(pattern.null_tests)
+        key = [column for column in pattern.equality if column not in filtered]
+        sort_columns = [column.split(" ")[0] for column in pattern.order_by]
+        if pattern.order_by and not set(sort_columns) & set(key):
+            key.extend(pattern.order_by)
+        elif pattern.ranges:
+            key.append(pattern.ranges[0])
+        if not key:
+            continue
+
+        predicates = [
+            f"{column} = {value}" for column, value in pattern.constants.items()
+        ] + [
+            f"{column} IS {'NOT ' if not_null else ''}NULL"
+            for column, not_null in pattern.null_tests.items()
+        ]
+        where = " AND ".join(predicates) or None
+
+        base = IndexCandidate(pattern.table, tuple(key), where=where)
+        candidates[base] = None
+        if where is not None:
+            candidates[IndexCandidate(pattern.table, tuple(key))] = None
+
+        key_columns = {column.split(" ")[0] for column in key}
+        include = tuple(
+            column for column in pattern.selected if column not in key_columns
+        )
+        if 0 < len(include) <= _MAX_INCLUDE:
+            candidates[IndexCandidate(pattern.table, tuple(key), include, where)] = None
+
+    return list(candidates)
+
+
+class WorkloadIndexAdvisor:
+    """Recommend indexes from the statements that actually dominate load.
+
+    The top statements by total execution time are read from
+    ``pg_stat_statements``, parsed into per-table predicates and sort keys,
+    and turned into candidate indexes. Each candidate is validated by
+    comparing generic-plan costs of the affected statements with and without
+    it through HypoPG hypothetical indexes. Without HypoPG, candidates are
+    skipped unless build_real_indexes is set, in which case the real index is
+    built inside a savepoint that is rolled back. That build holds a SHARE
+    lock blocking writes to the table for as long as it runs (lock_timeout
+    only bounds the wait for the lock), so only opt in against a local or
+    staging database. Winners are chosen greedily by estimated time saved.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        top_statements: int = 50,
+        min_improvement: float = 0.3,
+        max_indexes: int = 5,
+        lock_timeout_ms: int = 2000,
+        build_real_indexes: bool = False,
+    ):
+        """Initialize advisor.
+
+        Args:
+            engine: Engine for the database whose workload is analyzed
+            top_statements: Number of statements read by total time
+            min_improvement: Minimum relative cost reduction on at least one
+                statement for a candidate to be kept
+            max_indexes: Maximum number of recommendations returned
+            lock_timeout_ms: lock_timeout for fallback index builds
+            build_real_indexes: Whether to build real indexes in savepoints
+                when HypoPG is not installed; never enable on production
+        """
+        self.engine = engine
+        self.top_statements = top_statements
+        self.min_improvement = min_improvement
+        self.max_indexes = max_indexes
+        self.lock_timeout_ms = lock_timeout_ms
+        self.build_real_indexes = build_real_indexes
+
+    async def recommend(self) -> list[IndexRecommendation]:
+        """Analyze the current workload and return validated recommendations.
+
+        Everything runs in one transaction begun before the first statement
+        (executing first would autobegin one) and rolled back at the end;
+        what-if indexes are additionally confined to savepoints.
+        """
+        async with self.engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                extensions = await self._installed_extensions(conn)
+                if "pg_stat_statements" not in extensions:
+                    logger.warning(
+                        "pg_stat_statements is not installed; "
+                        "cannot derive indexes from the workload"
+                    )
+                    return []
+                if "hypopg" not in extensions and not self.build_real_indexes:
+                    logger.warning(
+                        "hypopg is not installed; skipping index candidates "
+                        "instead of building real indexes"
+                    )
+                    return []
+
+                statements = await self.fetch_workload(conn)
+                existing = await self._existing_indexes(conn)
+                return await self.evaluate(
+                    conn,
+                    statements,
+                    existing,
+                    use_hypopg="hypopg" in extensions,
+                )
+            finally:
+                await transaction.rollback()
+
+    async def fetch_workload(self, conn: AsyncConnection) -> list[WorkloadStatement]:
+        """Read the top statements of the current database by total time."""
+        result = await conn.execute(
+            text("""
+                SELECT s.query, s.calls, s.total_exec_time, s.mean_exec_time, s.rows
+                FROM pg_stat_statements s
+                JOIN pg_database d ON d.oid = s.dbid
+                WHERE d.datname = current_database()
+                  AND s.query ~* '^\\s*(SELECT|WITH|UPDATE|DELETE)\\s'
+                  AND s.query !~* '(pg_stat_statements|pg_catalog|hypopg)'
+                ORDER BY s.total_exec_time DESC
+                LIMIT :limit
+            """),
+            {"limit": self.top_statements},
+        )
+        return [
+            WorkloadStatement(
+                query=row.query,
+                calls=int(row.calls),
+                total_exec_time=float(row.total_exec_time),
+                mean_exec_time=float(row.mean_exec_time),
+                rows=int(row.rows),
+            )
+            for row in result
+        ]
+
+    async def evaluate(
+        self,
+        conn: AsyncConnection,
+        statements: Sequence[WorkloadStatement],
+        existing: Iterable[IndexCandidate] = (),
+        use_hypopg: bool = False,
+    ) -> list[IndexRecommendation]:
+        """Generate candidates for statements and validate them on conn.
+
+        Must run inside a transaction on conn; the caller rolls it back.
+        """
+        by_table: dict[str, list[WorkloadStatement]] = {}
+        patterns: list[QueryPattern] = []
+        for statement in statements:
+            for pattern in parse_statement(statement.query):
+                patterns.append(pattern)
+                by_table.setdefault(pattern.table, []).append(statement)
+
+        existing = list(existing)
+        candidates = [
+            candidate
+            for candidate in generate_candidates(patterns)
+            if not any(index.covers(candidate) for index in existing)
+        ]
+        if not candidates:
+            return []
+
+        baseline: dict[str, float] = {}
+        for table_statements in by_table.values():
+            for statement in table_statements:
+                if statement.query not in baseline:
+                    cost = await self._plan_cost(conn, statement.query)
+                    if cost is not None:
+                        baseline[statement.query] = cost
+
+        recommendations = []
+        for candidate in candidates:
+            affected = [
+                statement
+                for statement in dict.fromkeys(by_table.get(candidate.table, []))
+                if statement.query in baseline
+            ]
+            if not affected:
+                continue
+            costs = await self._costs_with_index(
+                conn, candidate, [statement.query for statement in affected], use_hypopg
+            )
+            if costs is None:
+                continue
+
+            before = after = saved = 0.0
+            best_gain = 0.0
+            for statement, cost in zip(affected, costs, strict=True):
+                base = baseline[statement.query]
+                gain = (base - cost) / base if base > 0 else 0.0
+                best_gain = max(best_gain, gain)
+                if gain > 0:
+                    before += base
+                    after += cost
+                    saved += statement.total_exec_time * gain
+            if best_gain >= self.min_improvement:
+                recommendations.append(
+                    IndexRecommendation(
+                        candidate,
+                        [
+                            statement
+                            for statement, cost in zip(affected, costs, strict=True)
+                            if cost < baseline[statement.query]
+                        ],
+                        before,
+                        after,
+                        saved,
+                    )
+                )
+
+        return self._select_winners(recommendations)
+
+    def _select_winners(
+        self, recommendations: list[IndexRecommendation]
+    ) -> list[IndexRecommendation]:
+        """Pick the highest-saving candidates, skipping ones already covered."""
+        winners: list[IndexRecommendation] = []
+        for recommendation in sorted(
+            recommendations, key=lambda r: r.saved_time_ms, reverse=True
+        ):
+            if any(
+                winner.candidate.covers(recommendation.candidate)
+                or recommendation.candidate.covers(winner.candidate)
+                for winner in winners
+            ):
+                continue
+            winners.append(recommendation)
+            if len(winners) >= self.max_indexes:
+                break
+        return winners
+
+    async def _costs_with_index(
+        self,
+        conn: AsyncConnection,
+        candidate: IndexCandidate,
+        queries: list[str],
+        use_hypopg: bool,
+    ) -> list[float] | None:
+        """Plan queries with the candidate index present.
+
+        Returns None, skipping the candidate, if it cannot be evaluated or
+        would need a real index build that was not opted into.
+        """
+        if not use_hypopg and not self.build_real_indexes:
+            logger.warning(
+                "Skipping index candidate without hypopg",
+                extra={"index": candidate.create_sql()},
+            )
+            return None
+
+        try:
+            savepoint = await conn.begin_nested()
+            try:
+                if use_hypopg:
+                    await conn.execute(
+                        text("SELECT indexrelid FROM hypopg_create_index(:sql)"),
+                        {"sql": candidate.create_sql()},
+                    )
+                else:
+                    await conn.exec_driver_sql(
+                        f"SET LOCAL lock_timeout = {int(self.lock_timeout_ms)}"
+                    )
+                    await conn.exec_driver_sql(candidate.create_sql())
+
+                costs = []
+                for query in queries:
+                    cost = await self._plan_cost(conn, query)
+                    costs.append(cost if cost is not None else float("inf"))
+                return costs
+            finally:
+                await savepoint.rollback()
+                if use_hypopg:
+                    await conn.execute(text("SELECT hypopg_reset()"))
+        except Exception as e:
+            logger.debug(
+                "Failed to evaluate index candidate",
+                extra={"index": candidate.create_sql(), "error": str(e)},
+            )
+            return None
+
+    @staticmethod
+    async def _plan_cost(conn: AsyncConnection, query: str) -> float | None:
+        """Return the generic-plan total cost of a normalized statement.
+
+        pg_stat_statements replaces constants with $n placeholders, so the
+        statement is prepared and explained with NULL arguments under
+        plan_cache_mode = force_generic_plan, which plans it independently
+        of parameter values.
+        """
+        name = f"index_advisor_{uuid4().hex[:12]}"
+        params = max((int(n) for n in _PARAM.findall(query)), default=0)
+        arguments = f"({', '.join(['NULL'] * params)})" if params else ""
+        prepared = False
+        try:
+            savepoint = await conn.begin_nested()
+            try:
+                await conn.exec_driver_sql(
+                    "SET LOCAL plan_cache_mode = force_generic_plan"
+                )
+                await conn.exec_driver_sql(f"PREPARE {name} AS {query}")
+                prepared = True
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (FORMAT JSON) EXECUTE {name}{arguments}"
+                )
+                plan = result.scalar()
+            finally:
+                await savepoint.rollback()
+                # Prepared statements are not transactional
+                if prepared:
+                    await conn.exec_driver_sql(f"DEALLOCATE {name}")
+        except Exception as e:
+            logger.debug(
+                "Failed to plan workload statement",
+                extra={"query": query[:200], "error": str(e)},
+            )
+            return None
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return float(plan[0]["Plan"]["Total Cost"]) if plan else None
+
+    @staticmethod
+    async def _installed_extensions(conn: AsyncConnection) -> set[str]:
+        """Return which of the extensions the advisor uses are installed."""
+        result = await conn.execute(
+            text(
+                "SELECT extname FROM pg_extension "
+                "WHERE extname IN ('pg_stat_statements', 'hypopg')"
+            )
+        )
+        return {row.extname for row in result}
+
+    @staticmethod
+    async def _existing_indexes(conn: AsyncConnection) -> list[IndexCandidate]:
+        """Read existing B-tree indexes as candidates for coverage checks."""
+        result = await conn.execute(
+            text("""
+                SELECT
+                    t.relname AS table_name,
+                    array_agg(a.attname ORDER BY k.ord)
+                        FILTER (WHERE k.ord <= ix.indnkeyatts) AS columns,
+                    array_agg(a.attname ORDER BY k.ord)
+                        FILTER (WHERE k.ord > ix.indnkeyatts) AS include,
+                    pg_get_expr(ix.indpred, ix.indrelid) AS predicate
+                FROM pg_index ix
+                JOIN pg_class t ON t.oid = ix.indrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                JOIN pg_class i ON i.oid = ix.indexrelid
+                JOIN pg_am am ON am.oid = i.relam
+                CROSS JOIN LATERAL unnest(ix.indkey) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                WHERE n.nspname = 'public' AND am.amname = 'btree'
+                GROUP BY t.relname, ix.indexrelid, ix.indnkeyatts, ix.indpred,
+                    ix.indrelid
+            """)
+        )
+        return [
+            IndexCandidate(
+                row.table_name,
+                tuple(row.columns or ()),
+                tuple(row.include or ()),
+                row.predicate,
+            )
+            for row in result
+        ]
+
+
+def render_alembic_migration(
+    recommendations: Sequence[IndexRecommendation],
+    revision: str,
+    down_revision: str | None,
+    message: str = "add_workload_indexes",
+    create_date: datetime | None = None,
+) -> str:
+    """Render an Alembic migration creating the recommended indexes."""
+    create_date = (create_date or datetime.now(UTC)).astimezone(UTC)
+    upgrade: list[str] = []
+    downgrade: list[str] = []
+    rationale: list[str] = []
+    for recommendation in recommendations:
+        candidate = recommendation.candidate
+        columns = ", ".join(
+            f"sa.text('{column}')" if " " in column else f"'{column}'"
+            for column in candidate.columns
+        )
+        options = ""
+        if candidate.include:
+            include = ", ".join(f"'{column}'" for column in candidate.include)
+            options += f"\n        postgresql_include=[{include}],"
+        if candidate.where:
+            where = candidate.where.replace('"', '\\"')
+            options += f'\n        postgresql_where=sa.text("{where}"),'
+        upgrade.append(
+            "    op.create_index(\n"
+            f"        '{candidate.name}',\n"
+            f"        '{candidate.table}',\n"
+            f"        [{columns}],{options}\n"
+            "    )"
+        )
+        downgrade.insert(
+            0,
+            f"    op.drop_index('{candidate.name}', table_name='{candidate.table}')",
+        )
+        rationale.append(
+            f"{candidate.name}: {recommendation.to_suggestion().rationale}, "
+            f"~{recommendation.saved_time_ms:.0f} ms of recorded time."
+        )
+
+    down = f'"{down_revision}"' if down_revision else "None"
+    return f'''"""{message}
+
+Revision ID: {revision}
+Revises: {down_revision or ""}
+Create Date: {create_date:%Y-%m-%d %H:%M:%S.%f}+00:00
+
+Indexes recommended by WorkloadIndexAdvisor from pg_stat_statements.
+{chr(10).join(rationale)}
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "{revision}"
+down_revision: Union[str, None] = {down}
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Apply migration changes."""
+{chr(10).join(upgrade) or "    pass"}
+
+
+def downgrade() -> None:
+    """Revert migration changes."""
+{chr(10).join(downgrade) or "    pass"}
+'''
+
+
+def write_alembic_migration(
+    recommendations: Sequence[IndexRecommendation],
+    versions_dir: str | Path,
+    down_revision: str | None,
+    message: str = "add_workload_indexes",
+) -> Path:
+    """Write the migration to versions_dir using the repo's file template."""
+    revision = uuid4().hex[:12]
+    create_date = datetime.now(UTC)
+    path = Path(versions_dir) / (f"{create_date:%Y%m%d_%H%M}_{revision}_{message}.py")
+    path.write_text(
+        render_alembic_migration(
+            recommendations, revision, down_revision, message, create_date
+        )
+    )
+    return path
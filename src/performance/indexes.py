@@ -193,7 +193,7 @@ class IndexOptimizer:
                 rationale="Fast lookup by external check ID from GitHub",
                 estimated_benefit="high",
                 sql_command=(
-                    "CREATE UNIQUE INDEX idx_check_runs_external_id ON "
+                    "CREATE INDEX idx_check_runs_external_id ON "
                     "check_runs(external_id);"
                 ),
             ),
@@ -303,6 +303,33 @@ class IndexOptimizer:
             ),
         ]
 
+    async def recommend_from_workload(
+        self,
+        top_statements: int = 50,
+        min_improvement: float = 0.3,
+        build_real_indexes: bool = False,
+    ) -> list[IndexSuggestion]:
+        """Recommend indexes validated against the recorded query workload.
+
+        Unlike get_recommended_indexes, candidates are derived from the top
+        statements in pg_stat_statements and kept only if they lower the
+        planner's cost (see WorkloadIndexAdvisor). Without HypoPG nothing is
+        recommended unless build_real_indexes opts into building each
+        candidate for real, which blocks writes and is unsafe in production.
+        """
+        from .index_advisor import WorkloadIndexAdvisor
+
+        advisor = WorkloadIndexAdvisor(
+            self.engine,
+            top_statements=top_statements,
+            min_improvement=min_improvement,
+            build_real_indexes=build_real_indexes,
+        )
+        return [
+            recommendation.to_suggestion()
+            for recommendation in await advisor.recommend()
+        ]
+
     async def analyze_missing_indexes(
         self, session: AsyncSession
     ) -> list[IndexSuggestion]:
@@ -485,24 +512,33 @@ class IndexOptimizer:
     async def _estimate_column_selectivity(
         self, session: AsyncSession, table_name: str, columns: list[str]
     ) -> float:
-        """Estimate selectivity of columns for index effectiveness."""
+        """Estimate selectivity of columns for index effectiveness.
+
+        Composite indexes are estimated on the combination of all their
+        columns, since correlated columns are far less selective together
+        than their individual distinct counts suggest.
+        """
         try:
-            # Simple approach: get distinct count for first column
             if not columns:
                 return 0.5
 
             # Validate identifiers to prevent SQL injection
             safe_table_name = self._validate_identifier(table_name)
-            safe_column_name = self._validate_identifier(columns[0])
+            safe_columns = [self._validate_identifier(column) for column in columns]
 
-            if not safe_table_name or not safe_column_name:
+            if not safe_table_name or not all(safe_columns):
                 return 0.5  # Invalid identifiers
 
             # Use text() with safe identifiers (already validated)
             # SQL injection is prevented by identifier validation above
+            distinct_key = (
+                safe_columns[0]
+                if len(safe_columns) == 1
+                else f"({', '.join(str(column) for column in safe_columns)})"
+            )
             query_str = f"""
                 SELECT
-                    COUNT(DISTINCT {safe_column_name}) as distinct_count,
+                    COUNT(DISTINCT {distinct_key}) as distinct_count,
                     COUNT(*) as total_count
                 FROM {safe_table_name};
             """  # nosec B608
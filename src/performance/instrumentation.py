@@ -0,0 +1,271 @@
+"""Automatic SQL instrumentation through SQLAlchemy engine events."""
+
+import functools
+import re
+import time
+from collections.abc import Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.engine.default import CacheStats
+
+from .monitoring import PerformanceMonitor, get_performance_monitor
+
+if TYPE_CHECKING:
+    from .plan_capture import SlowQueryPlanCapture
+
+# Name of the repository method (or other code path) issuing the current SQL
+_query_origin: ContextVar[str | None] = ContextVar("query_origin", default=None)
+
+_START_TIMES_KEY = "query_instrumentation_start"
+
+_BIND_PARAM = re.compile(r"%\(\w+\)s|\$\d+|(?<![:\w]):\w+|\?")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_VALUES_ROWS = re.compile(r"(\(\?(?:, \?)*\))(?:, \(\?(?:, \?)*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint_statement(statement: str) -> str:
+    """Normalize a SQL statement so executions differing only in values match.
+
+    Bind parameters and string/numeric literals become ``?``, IN lists of any
+    length become ``IN (...)``, multi-row VALUES collapse to one row, and
+    whitespace is collapsed. Results are memoized since ORM statements repeat.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _VALUES_ROWS.sub(r"\1, ...", normalized)
+
+
+def get_query_origin() -> str | None:
+    """Return the code path currently attributed with issued queries."""
+    return _query_origin.get()
+
+
+@contextmanager
+def query_origin(name: str) -> Iterator[None]:
+    """Attribute queries issued inside the block to name."""
+    token = _query_origin.set(name)
+    try:
+        yield
+    finally:
+        _query_origin.reset(token)
+
+
+def attribute_queries[**P, R](
+    func: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """Attribute queries issued by an async method to ``<Class>.<method>``.
+
+    The class is taken from the bound instance, so inherited methods report
+    the concrete repository they were called on. Nested attributed calls
+    report the innermost method.
+    """
+    method_name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        origin = f"{type(args[0]).__name__}.{method_name}" if args else method_name
+        token = _query_origin.set(origin)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _query_origin.reset(token)
+
+    return wrapper
+
+
+@dataclass
+class CompileCacheStats:
+    """SQL compilation cache outcomes of executed statements."""
+
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0  # Textual SQL, caching disabled or no cache key
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Fraction of cache lookups served without compiling, if any."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def record(self, outcome: CacheStats) -> None:
+        """Count one execution's cache outcome."""
+        if outcome is CacheStats.CACHE_HIT:
+            self.hits += 1
+        elif outcome is CacheStats.CACHE_MISS:
+            self.misses += 1
+        else:
+            self.uncached += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a dictionary for metrics export."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class QueryInstrumentation:
+    """Record latency, row counts and errors of every cursor execution.
+
+    Statements are keyed by their fingerprint, prefixed with the attributed
+    origin when one is set, e.g.
+    ``PullRequestRepository.get_by_id | SELECT ... WHERE pull_requests.id = ?``.
+    SQLAlchemy compiled cache hits and misses are counted overall and per
+    origin.
+    """
+
+    def __init__(
+        self,
+        monitor: PerformanceMonitor | None = None,
+        plan_capture: "SlowQueryPlanCapture | None" = None,
+    ):
+        """Initialize instrumentation.
+
+        Args:
+            monitor: Monitor to record into; defaults to the global monitor
+                resolved at record time
+            plan_capture: Receives statements slower than the monitor's
+                slow_query_threshold for EXPLAIN sampling
+        """
+        self._monitor = monitor
+        self.plan_capture = plan_capture
+        self.compile_cache = CompileCacheStats()
+        self._compile_cache_by_origin: dict[str, CompileCacheStats] = {}
+
+    @property
+    def monitor(self) -> PerformanceMonitor:
+        """Get the monitor queries are recorded into."""
+        return self._monitor or get_performance_monitor()
+
+    def attach(self, engine: Engine) -> None:
+        """Register the cursor execution hooks on a (sync) engine."""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "after_execute", self._after_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def detach(self, engine: Engine) -> None:
+        """Remove the cursor execution hooks from an engine."""
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(engine, "after_execute", self._after_execute)
+        event.remove(engine, "handle_error", self._handle_error)
+
+    def compile_cache_stats(self) -> dict[str, Any]:
+        """Get compiled cache outcomes overall and by query origin."""
+        return {
+            **self.compile_cache.to_dict(),
+            "by_origin": {
+                origin: stats.to_dict()
+                for origin, stats in sorted(self._compile_cache_by_origin.items())
+            },
+        }
+
+    @staticmethod
+    def query_key(statement: str) -> str:
+        """Build the monitor key for a statement in the current context."""
+        fingerprint = fingerprint_statement(statement)
+        origin = _query_origin.get()
+        return f"{origin} | {fingerprint}" if origin else fingerprint
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Push the start time for the statement about to run."""
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Record a successful execution."""
+        elapsed = self._pop_elapsed(conn)
+        if elapsed is None:
+            return
+
+        rowcount = getattr(cursor, "rowcount", -1)
+        monitor = self.monitor
+        monitor.record(
+            query_hash=self.query_key(statement),
+            execution_time=elapsed,
+            row_count=rowcount if rowcount is not None and rowcount >= 0 else None,
+        )
+
+        if self.plan_capture is not None and elapsed > monitor.slow_query_threshold:
+            self.plan_capture.submit(
+                fingerprint_statement(statement), statement, parameters, executemany
+            )
+
+    def _after_execute(
+        self,
+        conn: Connection,
+        clauseelement: Any,
+        multiparams: Any,
+        params: Any,
+        execution_options: Any,
+        result: Any,
+    ) -> None:
+        """Count whether the statement's compiled form came from the cache."""
+        outcome = getattr(getattr(result, "context", None), "cache_hit", None)
+        if not isinstance(outcome, CacheStats):
+            return
+
+        self.compile_cache.record(outcome)
+        origin = _query_origin.get()
+        if origin is not None:
+            stats = self._compile_cache_by_origin.get(origin)
+            if stats is None:
+                stats = self._compile_cache_by_origin[origin] = CompileCacheStats()
+            stats.record(outcome)
+
+    def _handle_error(self, exception_context: ExceptionContext) -> None:
+        """Record a failed execution."""
+        conn = exception_context.connection
+        statement = exception_context.statement
+        if conn is None or statement is None:
+            return
+
+        elapsed = self._pop_elapsed(conn)
+        if elapsed is None:
+            return
+
+        self.monitor.record(
+            query_hash=self.query_key(statement),
+            execution_time=elapsed,
+            success=False,
+            error_message=str(exception_context.original_exception),
+        )
+
+    @staticmethod
+    def _pop_elapsed(conn: Connection) -> float | None:
+        """Pop the matching start time and return the elapsed seconds."""
+        start_times = conn.info.get(_START_TIMES_KEY)
+        if not start_times:
+            return None
+        start: float = start_times.pop()
+        return time.perf_counter() - start
@@ -1,15 +1,18 @@
 """Performance monitoring utilities."""
 
-import asyncio
 import functools
 import logging
+import math
+import threading
 import time
-from collections import defaultdict, deque
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any, TypeVar
 
+from .histogram import StreamingHistogram
+
 logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -41,33 +44,90 @@ class PerformanceStats:
     cache_hit_rate: float
     slow_query_count: int
     error_count: int
+    p50_time: float = 0.0
+    p95_time: float = 0.0
+    p99_time: float = 0.0
+    p999_time: float = 0.0
+
+
+PERCENTILES = (0.5, 0.95, 0.99, 0.999)
+
+
+class _QueryStats:
+    """Streaming counters and latency histogram for one query pattern."""
+
+    __slots__ = ("cache_hits", "error_count", "histogram", "slow_count")
+
+    def __init__(self, relative_accuracy: float):
+        self.histogram = StreamingHistogram(relative_accuracy)
+        self.error_count = 0
+        self.cache_hits = 0
+        self.slow_count = 0
+
+    def merge(self, other: "_QueryStats") -> None:
+        """Fold another pattern's statistics into this one."""
+        self.histogram.merge(other.histogram)
+        self.error_count += other.error_count
+        self.cache_hits += other.cache_hits
+        self.slow_count += other.slow_count
+
+
+class _TimeBucket:
+    """Per-pattern statistics for one fixed-width time window."""
+
+    __slots__ = ("end", "patterns", "start")
+
+    def __init__(self, start: float, width: float):
+        self.start = start
+        self.end = start + width
+        self.patterns: dict[str, _QueryStats] = {}
 
 
 class PerformanceMonitor:
-    """Monitor and track database performance metrics."""
+    """Monitor and track database performance metrics.
+
+    Executions are folded into fixed-memory streaming histograms per query
+    pattern and per time bucket instead of being kept individually, so memory
+    is bounded by patterns x buckets and percentiles are read in time
+    proportional to the number of histogram buckets. Only slow queries are
+    retained as individual QueryMetrics.
+    """
 
     def __init__(
         self,
         slow_query_threshold: float = 1.0,
         max_history_size: int = 10000,
         enable_logging: bool = True,
+        bucket_width: timedelta = timedelta(minutes=1),
+        retention: timedelta = timedelta(hours=24),
+        relative_accuracy: float = 0.01,
     ):
         """Initialize performance monitor.
 
         Args:
             slow_query_threshold: Threshold in seconds for slow query detection
-            max_history_size: Maximum number of metrics to keep in memory
+            max_history_size: Maximum number of slow queries to keep in memory
             enable_logging: Whether to log performance warnings
+            bucket_width: Width of each time bucket; time filters such as
+                ``since`` are applied at this granularity
+            retention: How long time buckets are kept before being dropped
+            relative_accuracy: Relative error bound of reported percentiles
         """
         self.slow_query_threshold = slow_query_threshold
         self.max_history_size = max_history_size
         self.enable_logging = enable_logging
-
-        self._metrics: deque[QueryMetrics] = deque(maxlen=max_history_size)
-        self._query_stats: dict[str, list[float]] = defaultdict(list)
-        self._lock = asyncio.Lock()
-
-    async def record_query(
+        self.relative_accuracy = relative_accuracy
+
+        self._bucket_width = bucket_width.total_seconds()
+        self._retention = retention.total_seconds()
+        max_buckets = max(1, math.ceil(retention / bucket_width))
+        self._buckets: deque[_TimeBucket] = deque(maxlen=max_buckets)
+        self._current: _TimeBucket | None = None
+        self._slow_queries: deque[QueryMetrics] = deque(maxlen=max_history_size)
+        # Only taken when a new time bucket is opened, not per query
+        self._rotate_lock = threading.Lock()
+
+    def record(
         self,
         query_hash: str,
         execution_time: float,
@@ -76,133 +136,211 @@ class PerformanceMonitor:
         row_count: int | None = None,
         cache_hit: bool = False,
     ) -> None:
-        """Record a query execution."""
-        async with self._lock:
-            metric = QueryMetrics(
-                query_hash=query_hash,
-                execution_time=execution_time,
-                timestamp=datetime.utcnow(),
-                success=success,
-                error_message=error_message,
-                row_count=row_count,
-                cache_hit=cache_hit,
-            )
+        """Record a query execution without awaiting or locking.
 
-            self._metrics.append(metric)
+        Safe to call from synchronous hooks. Updates touch only the current
+        bucket's counters, so the hot path is a handful of dict and integer
+        operations.
+        """
+        now = time.time()
+        bucket = self._current
+        if bucket is None or now >= bucket.end:
+            bucket = self._rotate(now)
+
+        stats = bucket.patterns.get(query_hash)
+        if stats is None:
+            stats = bucket.patterns.setdefault(
+                query_hash, _QueryStats(self.relative_accuracy)
+            )
 
-            if success:
-                self._query_stats[query_hash].append(execution_time)
-                # Keep only recent stats per query
-                if len(self._query_stats[query_hash]) > 100:
-                    self._query_stats[query_hash] = self._query_stats[query_hash][-100:]
+        stats.histogram.add(execution_time)
+        if not success:
+            stats.error_count += 1
+        if cache_hit:
+            stats.cache_hits += 1
 
-            # Log slow queries
-            if self.enable_logging and execution_time > self.slow_query_threshold:
+        if execution_time > self.slow_query_threshold:
+            stats.slow_count += 1
+            self._slow_queries.append(
+                QueryMetrics(
+                    query_hash=query_hash,
+                    execution_time=execution_time,
+                    timestamp=datetime.utcnow(),
+                    success=success,
+                    error_message=error_message,
+                    row_count=row_count,
+                    cache_hit=cache_hit,
+                )
+            )
+            if self.enable_logging:
                 logger.warning(
                     f"Slow query detected: {query_hash} took {execution_time:.2f}s"
                 )
 
+    async def record_query(
+        self,
+        query_hash: str,
+        execution_time: float,
+        success: bool = True,
+        error_message: str | None = None,
+        row_count: int | None = None,
+        cache_hit: bool = False,
+    ) -> None:
+        """Record a query execution."""
+        self.record(
+            query_hash=query_hash,
+            execution_time=execution_time,
+            success=success,
+            error_message=error_message,
+            row_count=row_count,
+            cache_hit=cache_hit,
+        )
+
     async def get_stats(
         self,
         since: datetime | None = None,
         query_pattern: str | None = None,
     ) -> PerformanceStats:
         """Get aggregated performance statistics."""
-        async with self._lock:
-            # Filter metrics by time and pattern
-            filtered_metrics = []
-            for metric in self._metrics:
-                if since and metric.timestamp < since:
-                    continue
-                if query_pattern and query_pattern not in metric.query_hash:
-                    continue
-                filtered_metrics.append(metric)
-
-            if not filtered_metrics:
-                return PerformanceStats(
-                    total_queries=0,
-                    total_time=0.0,
-                    avg_time=0.0,
-                    min_time=0.0,
-                    max_time=0.0,
-                    success_rate=0.0,
-                    cache_hit_rate=0.0,
-                    slow_query_count=0,
-                    error_count=0,
-                )
-
-            # Calculate statistics
-            execution_times = [m.execution_time for m in filtered_metrics]
-            successful_queries = [m for m in filtered_metrics if m.success]
-            cache_hits = [m for m in filtered_metrics if m.cache_hit]
-            slow_queries = [
-                m
-                for m in filtered_metrics
-                if m.execution_time > self.slow_query_threshold
-            ]
-            errors = [m for m in filtered_metrics if not m.success]
-
+        merged = _QueryStats(self.relative_accuracy)
+        for query_hash, stats in self._iter_pattern_stats(since):
+            if query_pattern and query_pattern not in query_hash:
+                continue
+            merged.merge(stats)
+
+        histogram = merged.histogram
+        if histogram.count == 0:
             return PerformanceStats(
-                total_queries=len(filtered_metrics),
-                total_time=sum(execution_times),
-                avg_time=sum(execution_times) / len(execution_times),
-                min_time=min(execution_times),
-                max_time=max(execution_times),
-                success_rate=len(successful_queries) / len(filtered_metrics),
-                cache_hit_rate=len(cache_hits) / len(filtered_metrics),
-                slow_query_count=len(slow_queries),
-                error_count=len(errors),
+                total_queries=0,
+                total_time=0.0,
+                avg_time=0.0,
+                min_time=0.0,
+                max_time=0.0,
+                success_rate=0.0,
+                cache_hit_rate=0.0,
+                slow_query_count=0,
+                error_count=0,
             )
 
+        p50, p95, p99, p999 = histogram.quantiles(PERCENTILES)
+        return PerformanceStats(
+            total_queries=histogram.count,
+            total_time=histogram.sum,
+            avg_time=histogram.mean,
+            min_time=histogram.min,
+            max_time=histogram.max,
+            success_rate=(histogram.count - merged.error_count) / histogram.count,
+            cache_hit_rate=merged.cache_hits / histogram.count,
+            slow_query_count=merged.slow_count,
+            error_count=merged.error_count,
+            p50_time=p50,
+            p95_time=p95,
+            p99_time=p99,
+            p999_time=p999,
+        )
+
     async def get_slow_queries(
         self,
         limit: int = 10,
         since: datetime | None = None,
     ) -> list[QueryMetrics]:
         """Get slowest queries."""
-        async with self._lock:
-            filtered_metrics = []
-            for metric in self._metrics:
-                if since and metric.timestamp < since:
-                    continue
-                if metric.execution_time > self.slow_query_threshold:
-                    filtered_metrics.append(metric)
-
-            # Sort by execution time (descending)
-            filtered_metrics.sort(key=lambda m: m.execution_time, reverse=True)
-            return filtered_metrics[:limit]
+        filtered_metrics = [
+            metric
+            for metric in list(self._slow_queries)
+            if since is None or metric.timestamp >= since
+        ]
+
+        # Sort by execution time (descending)
+        filtered_metrics.sort(key=lambda m: m.execution_time, reverse=True)
+        return filtered_metrics[:limit]
 
     async def get_query_patterns(self) -> dict[str, dict[str, Any]]:
-        """Get statistics for each query pattern."""
-        async with self._lock:
-            patterns = {}
-            for query_hash, times in self._query_stats.items():
-                if times:
-                    patterns[query_hash] = {
-                        "count": len(times),
-                        "avg_time": sum(times) / len(times),
-                        "min_time": min(times),
-                        "max_time": max(times),
-                        "total_time": sum(times),
-                    }
-            return patterns
+        """Get statistics for each query pattern over the retention window."""
+        merged: dict[str, _QueryStats] = {}
+        for query_hash, stats in self._iter_pattern_stats(None):
+            if query_hash not in merged:
+                merged[query_hash] = _QueryStats(self.relative_accuracy)
+            merged[query_hash].merge(stats)
+
+        patterns = {}
+        for query_hash, stats in merged.items():
+            histogram = stats.histogram
+            p50, p95, p99, p999 = histogram.quantiles(PERCENTILES)
+            patterns[query_hash] = {
+                "count": histogram.count,
+                "avg_time": histogram.mean,
+                "min_time": histogram.min,
+                "max_time": histogram.max,
+                "total_time": histogram.sum,
+                "p50_time": p50,
+                "p95_time": p95,
+                "p99_time": p99,
+                "p999_time": p999,
+            }
+        return patterns
 
     async def clear_stats(self, older_than: datetime | None = None) -> int:
-        """Clear old statistics."""
-        async with self._lock:
+        """Clear old statistics, returning the number of queries dropped.
+
+        With older_than, only time buckets that ended before it are dropped.
+        """
+        with self._rotate_lock:
             if older_than is None:
-                count = len(self._metrics)
-                self._metrics.clear()
-                self._query_stats.clear()
+                count = sum(self._bucket_count(bucket) for bucket in self._buckets)
+                self._buckets.clear()
+                self._current = None
+                self._slow_queries.clear()
                 return count
 
-            # Remove old metrics
-            original_count = len(self._metrics)
-            self._metrics = deque(
-                (m for m in self._metrics if m.timestamp >= older_than),
+            cutoff = _epoch(older_than)
+            removed = 0
+            while self._buckets and self._buckets[0].end <= cutoff:
+                removed += self._bucket_count(self._buckets.popleft())
+            if self._current is not None and self._current.end <= cutoff:
+                self._current = None
+            self._slow_queries = deque(
+                (m for m in self._slow_queries if m.timestamp >= older_than),
                 maxlen=self.max_history_size,
             )
-            return original_count - len(self._metrics)
+            return removed
+
+    def _rotate(self, now: float) -> _TimeBucket:
+        """Open the time bucket containing now, if no other caller has."""
+        with self._rotate_lock:
+            bucket = self._current
+            if bucket is None or now >= bucket.end:
+                expired = now - self._retention
+                while self._buckets and self._buckets[0].end <= expired:
+                    self._buckets.popleft()
+                start = now - (now % self._bucket_width)
+                bucket = _TimeBucket(start, self._bucket_width)
+                self._buckets.append(bucket)
+                self._current = bucket
+            return bucket
+
+    def _iter_pattern_stats(
+        self, since: datetime | None
+    ) -> Iterator[tuple[str, _QueryStats]]:
+        """Yield per-pattern stats from time buckets that end after since."""
+        cutoff = _epoch(since) if since is not None else None
+        # Snapshot containers so concurrent recording cannot break iteration
+        for bucket in list(self._buckets):
+            if cutoff is not None and bucket.end <= cutoff:
+                continue
+            yield from list(bucket.patterns.items())
+
+    @staticmethod
+    def _bucket_count(bucket: _TimeBucket) -> int:
+        """Return the number of queries recorded in a time bucket."""
+        return sum(stats.histogram.count for stats in bucket.patterns.values())
+
+
+def _epoch(value: datetime) -> float:
+    """Convert a datetime to epoch seconds, treating naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
 
 
 # Global performance monitor instance
@@ -325,6 +463,8 @@ class PerformanceReporter:
             "summary": {
                 "total_queries": stats.total_queries,
                 "avg_response_time": f"{stats.avg_time:.3f}s",
+                "p95_response_time": f"{stats.p95_time:.3f}s",
+                "p99_response_time": f"{stats.p99_time:.3f}s",
                 "success_rate": f"{stats.success_rate:.1%}",
                 "cache_hit_rate": f"{stats.cache_hit_rate:.1%}",
                 "slow_queries": stats.slow_query_count,
@@ -343,6 +483,7 @@ class PerformanceReporter:
                 pattern: {
                     "count": data["count"],
                     "avg_time": f"{data['avg_time']:.3f}s",
+                    "p99_time": f"{data['p99_time']:.3f}s",
                     "total_time": f"{data['total_time']:.3f}s",
                 }
                 for pattern, data in sorted(
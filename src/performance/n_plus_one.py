@@ -0,0 +1,212 @@
+"""N+1 query detection for repository calls and relationship loading."""
+
+import logging
+import re
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import ORMExecuteState, Session, raiseload
+
+from .instrumentation import fingerprint_statement, get_query_origin
+
+logger = logging.getLogger(__name__)
+
+# Execution option carrying the relationship a lazy load was issued for
+_LAZY_LOAD_OPTION = "n_plus_one_lazy_load"
+
+# Only reads count: batched writes and savepoints repeat by design
+_SELECT = re.compile(r"^\s*(?:SELECT|WITH)\b", re.I)
+
+
+class NPlusOneError(Exception):
+    """Raised in strict mode when an N+1 query pattern is detected."""
+
+
+@dataclass(frozen=True)
+class NPlusOneFinding:
+    """A statement or relationship load repeated within one scope."""
+
+    kind: str  # "lazy_load" or "repeated_query"
+    target: str  # relationship such as "PullRequest.check_runs", or fingerprint
+    count: int
+    origin: str | None = None
+
+    def describe(self) -> str:
+        """Return a one-line human readable description."""
+        where = f" from {self.origin}" if self.origin else ""
+        if self.kind == "lazy_load":
+            return (
+                f"{self.count} lazy loads of {self.target}{where}; "
+                f"eager load it with selectinload()"
+            )
+        return f"{self.count} executions{where} of: {self.target}"
+
+
+@dataclass
+class NPlusOneReport:
+    """Statement counts collected during one detection scope."""
+
+    scope: str
+    statements: Counter[tuple[str | None, str]] = field(default_factory=Counter)
+    lazy_loads: Counter[tuple[str | None, str]] = field(default_factory=Counter)
+    findings: list[NPlusOneFinding] = field(default_factory=list)
+
+    @property
+    def statement_count(self) -> int:
+        """Return the total number of SELECT statements executed in the scope."""
+        return sum(self.statements.values()) + sum(self.lazy_loads.values())
+
+    def summary(self) -> str:
+        """Return an aggregated, multi-line summary of the scope."""
+        lines = [
+            f"N+1 report for {self.scope}: {self.statement_count} statements, "
+            f"{len(self.statements)} distinct, "
+            f"{sum(self.lazy_loads.values())} lazy loads"
+        ]
+        lines.extend(f"  - {finding.describe()}" for finding in self.findings)
+        return "\n".join(lines)
+
+
+class _Scope:
+    """Mutable state of an active detection scope."""
+
+    __slots__ = ("report", "strict")
+
+    def __init__(self, report: NPlusOneReport, strict: bool):
+        self.report = report
+        self.strict = strict
+
+
+_active_scope: ContextVar[_Scope | None] = ContextVar("n_plus_one_scope", default=None)
+_install_lock = threading.Lock()
+_installed = False
+
+
+class NPlusOneDetector:
+    """Detect N+1 query patterns within a request or job scope.
+
+    Inside ``scope()`` every executed statement is counted by origin and
+    fingerprint, and every lazy relationship load by origin and relationship.
+    Anything repeated at least threshold times is reported as a finding.
+
+    In strict mode, ORM selects issued in the scope get
+    ``raiseload("*", sql_only=True)``, so any lazy load that would emit SQL
+    raises immediately, and findings raise NPlusOneError when the scope exits.
+
+    Usage:
+        with NPlusOneDetector().scope("poll_repository") as report:
+            await poll(repository)
+        logger.info(report.summary())
+    """
+
+    def __init__(self, threshold: int = 5, strict: bool = False):
+        """Initialize detector.
+
+        Args:
+            threshold: Repetitions of one statement or lazy load that count
+                as an N+1 pattern
+            strict: Raise on lazy loads and on findings instead of logging
+        """
+        self.threshold = threshold
+        self.strict = strict
+        _install_listeners()
+
+    @contextmanager
+    def scope(self, name: str = "scope") -> Iterator[NPlusOneReport]:
+        """Collect statements issued in the block into a report.
+
+        The report's findings are filled in when the block exits.
+        """
+        report = NPlusOneReport(scope=name)
+        token = _active_scope.set(_Scope(report, self.strict))
+        try:
+            yield report
+        finally:
+            _active_scope.reset(token)
+            report.findings = self._analyze(report)
+
+        if report.findings:
+            if self.strict:
+                raise NPlusOneError(report.summary())
+            logger.warning(report.summary())
+
+    def _analyze(self, report: NPlusOneReport) -> list[NPlusOneFinding]:
+        """Build findings for loads and statements at or above threshold."""
+        findings = [
+            NPlusOneFinding("lazy_load", relationship, count, origin)
+            for (origin, relationship), count in report.lazy_loads.most_common()
+            if count >= self.threshold
+        ]
+        findings.extend(
+            NPlusOneFinding("repeated_query", fingerprint, count, origin)
+            for (origin, fingerprint), count in report.statements.most_common()
+            if count >= self.threshold
+        )
+        return findings
+
+
+def _install_listeners() -> None:
+    """Register the global engine and session listeners once per process."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
+        event.listen(Engine, "before_cursor_execute", _on_cursor_execute)
+        _installed = True
+
+
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Tag lazy loads and apply raiseload to top-level selects in strict mode."""
+    scope = _active_scope.get()
+    if scope is None or not orm_execute_state.is_select:
+        return
+
+    if orm_execute_state.lazy_loaded_from is not None:
+        prop = getattr(orm_execute_state.loader_strategy_path, "prop", None)
+        relationship = str(prop) if prop is not None else "<unknown>"
+        orm_execute_state.update_execution_options(**{_LAZY_LOAD_OPTION: relationship})
+    elif (
+        scope.strict
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.is_column_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            raiseload("*", sql_only=True)
+        )
+
+
+def _on_cursor_execute(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Count a SELECT against the active scope, if any."""
+    scope = _active_scope.get()
+    if scope is None or not _SELECT.match(statement):
+        return
+    if context is not None and (
+        context.isinsert or context.isupdate or context.isdelete
+    ):
+        return
+
+    origin = get_query_origin()
+    relationship = (
+        context.execution_options.get(_LAZY_LOAD_OPTION)
+        if context is not None
+        else None
+    )
+    if relationship is not None:
+        scope.report.lazy_loads[(origin, relationship)] += 1
+    else:
+        scope.report.statements[(origin, fingerprint_statement(statement))] += 1
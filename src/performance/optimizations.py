@@ -1,6 +1,7 @@
 """Query optimization utilities and eager loading strategies."""
 
 import functools
+import re
 from collections.abc import Callable
 from typing import Any, TypeVar
 
@@ -13,6 +14,9 @@ from ..models.base import BaseModel
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Monthly partition suffixes, e.g. check_runs_p2026_10 or its indexes
+_PARTITION_SUFFIX = re.compile(r"_p\d{4}_\d{2}(?=_|$)|_default$")
+
 
 class QueryOptimizer:
     """Utilities for optimizing database queries."""
@@ -298,25 +302,29 @@ class QueryPlanAnalyzer:
         except Exception as e:
             return {"error": str(e), "suggestions": []}
 
-    def _parse_execution_plan(self, plan: dict[str, Any]) -> dict[str, Any]:
+    @classmethod
+    def _parse_execution_plan(cls, plan: dict[str, Any]) -> dict[str, Any]:
         """Parse PostgreSQL execution plan and provide suggestions."""
         suggestions: list[str] = []
         issues: list[str] = []
 
         # Analyze plan recursively
-        self._analyze_plan_node(plan["Plan"], suggestions, issues)
+        cls._analyze_plan_node(plan["Plan"], suggestions, issues)
 
         return {
             "execution_time": plan.get("Execution Time", 0),
             "planning_time": plan.get("Planning Time", 0),
             "total_cost": plan["Plan"]["Total Cost"],
+            "bottleneck": cls._find_bottleneck(plan["Plan"]),
+            "plan_shape": cls._plan_shape(plan["Plan"]),
             "issues": issues,
             "suggestions": suggestions,
             "raw_plan": plan,
         }
 
+    @classmethod
     def _analyze_plan_node(
-        self, node: dict[str, Any], suggestions: list[str], issues: list[str]
+        cls, node: dict[str, Any], suggestions: list[str], issues: list[str]
     ) -> None:
         """Analyze a single node in the execution plan."""
         node_type = node.get("Node Type", "")
@@ -337,7 +345,70 @@ class QueryPlanAnalyzer:
 
         # Analyze child nodes
         for child in node.get("Plans", []):
-            self._analyze_plan_node(child, suggestions, issues)
+            cls._analyze_plan_node(child, suggestions, issues)
+
+    @classmethod
+    def _find_bottleneck(cls, root: dict[str, Any]) -> dict[str, Any]:
+        """Find the plan node with the largest exclusive (self) cost.
+
+        With ANALYZE data the exclusive cost is the node's actual time across
+        all loops minus its children's; otherwise the planner's total cost
+        minus its children's is used.
+        """
+        analyzed = "Actual Total Time" in root
+        best: dict[str, Any] = root
+        best_exclusive = -1.0
+
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            children = node.get("Plans", [])
+            exclusive = cls._node_cost(node, analyzed) - sum(
+                cls._node_cost(child, analyzed) for child in children
+            )
+            if exclusive > best_exclusive:
+                best, best_exclusive = node, exclusive
+            stack.extend(children)
+
+        return {
+            "node_type": best.get("Node Type", ""),
+            "relation": best.get("Relation Name"),
+            "index": best.get("Index Name"),
+            "exclusive_time" if analyzed else "exclusive_cost": max(best_exclusive, 0),
+            "actual_rows": best.get("Actual Rows"),
+            "plan_rows": best.get("Plan Rows"),
+        }
+
+    @staticmethod
+    def _node_cost(node: dict[str, Any], analyzed: bool) -> float:
+        """Return a node's inclusive time (ms, across loops) or total cost."""
+        if analyzed:
+            return float(node.get("Actual Total Time", 0)) * float(
+                node.get("Actual Loops", 1)
+            )
+        return float(node.get("Total Cost", 0))
+
+    @classmethod
+    def _plan_shape(cls, node: dict[str, Any]) -> str:
+        """Return a stable signature of the plan's node types and relations.
+
+        Costs, row counts and monthly partition suffixes are left out, and
+        identical sibling subplans (e.g. one per partition under an Append)
+        are collapsed, so the shape only changes when the strategy does.
+        """
+        label = str(node.get("Node Type", "?"))
+        target = node.get("Index Name") or node.get("Relation Name")
+        if target:
+            label += f"[{_PARTITION_SUFFIX.sub('', target)}]"
+
+        children: list[str] = []
+        for child in node.get("Plans", []):
+            shape = cls._plan_shape(child)
+            if shape not in children:
+                children.append(shape)
+        if children:
+            label += f"({', '.join(children)})"
+        return label
 
 
 # Pre-configured optimization strategies
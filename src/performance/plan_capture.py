@@ -0,0 +1,297 @@
+"""Automatic EXPLAIN capture for slow statements with plan regression alerts."""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .instrumentation import query_origin
+from .optimizations import QueryPlanAnalyzer
+
+logger = logging.getLogger(__name__)
+
+# With analyze enabled, only statements that read without writing, locking or
+# calling functions with side effects are re-executed under EXPLAIN ANALYZE
+_READ = re.compile(r"^\s*(?:SELECT|WITH)\b", re.I)
+_WRITE_OR_LOCK = re.compile(
+    r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO)\b|\bFOR\s+(?:KEY\s+)?SHARE\b", re.I
+)
+_SIDE_EFFECT_FUNCTION = re.compile(
+    r"\b(?:nextval|setval|pg_(?:try_)?advisory_\w*lock\w*|pg_notify|"
+    r"pg_sleep\w*|pg_cancel_backend|pg_terminate_backend|set_config|"
+    r"txid_current|pg_current_xact_id|dblink\w*|lo_\w+)\s*\(",
+    re.I,
+)
+_EXPLAIN = re.compile(r"^\s*EXPLAIN\b", re.I)
+_SCAN = re.compile(
+    r"((?:Bitmap Heap|Bitmap Index|Index Only|Index|Seq) Scan)\[([^\]]+)\]"
+)
+
+
+def is_safe_to_analyze(statement: str) -> bool:
+    """Check whether a statement can be re-executed by EXPLAIN ANALYZE.
+
+    Only plain reads qualify; statements that write, lock rows or call known
+    functions with side effects are excluded. User-defined volatile functions
+    cannot be detected, which is why analyze is opt-in.
+    """
+    return bool(
+        _READ.match(statement)
+        and not _WRITE_OR_LOCK.search(statement)
+        and not _SIDE_EFFECT_FUNCTION.search(statement)
+    )
+
+
+@dataclass(frozen=True)
+class PlanSnapshot:
+    """The captured plan of one statement fingerprint."""
+
+    fingerprint: str
+    shape: str
+    total_cost: float
+    execution_time: float | None
+    bottleneck: dict[str, Any]
+    captured_at: datetime
+
+
+@dataclass(frozen=True)
+class PlanChangeAlert:
+    """A fingerprint whose plan shape changed or whose cost jumped."""
+
+    fingerprint: str
+    previous: PlanSnapshot
+    current: PlanSnapshot
+    reasons: list[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        """Return a one-line human readable description."""
+        return f"Plan change for {self.fingerprint}: {'; '.join(self.reasons)}"
+
+
+class SlowQueryPlanCapture:
+    """Sample EXPLAIN plans of slow statements and track plan regressions.
+
+    QueryInstrumentation submits statements slower than the monitor's
+    slow_query_threshold. Submissions are sampled and rate limited per
+    fingerprint and globally, then explained in a background task on a
+    separate pooled connection inside a rolled-back transaction. Statements
+    are only planned by default. With analyze=True, reads that neither write,
+    lock rows nor call functions with side effects (nextval, advisory locks,
+    pg_notify, ...) get ``EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)``; anything
+    else is still only planned, never re-executed.
+
+    The latest plan is kept per fingerprint. When a new plan's shape differs
+    (for example an Index Scan turning into a Seq Scan) or its cost grows by
+    cost_jump_ratio, a PlanChangeAlert is logged and passed to subscribers.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        min_interval: float = 900.0,
+        max_per_minute: int = 6,
+        sample_rate: float = 1.0,
+        max_in_flight: int = 2,
+        cost_jump_ratio: float = 2.0,
+        statement_timeout_ms: int = 30_000,
+        max_fingerprints: int = 1000,
+        analyze: bool = False,
+    ):
+        """Initialize plan capture.
+
+        Args:
+            engine: Engine providing the separate connection used for EXPLAIN
+            min_interval: Minimum seconds between captures of one fingerprint
+            max_per_minute: Global cap on captures per minute
+            sample_rate: Fraction of eligible slow statements to capture
+            max_in_flight: Maximum concurrent EXPLAIN executions
+            cost_jump_ratio: Cost growth factor that raises an alert
+            statement_timeout_ms: statement_timeout applied to each EXPLAIN
+            max_fingerprints: Number of fingerprints whose plans are retained
+            analyze: Re-execute side-effect-free reads under EXPLAIN ANALYZE
+        """
+        self.engine = engine
+        self.min_interval = min_interval
+        self.max_per_minute = max_per_minute
+        self.sample_rate = sample_rate
+        self.max_in_flight = max_in_flight
+        self.cost_jump_ratio = cost_jump_ratio
+        self.statement_timeout_ms = statement_timeout_ms
+        self.max_fingerprints = max_fingerprints
+        self.analyze = analyze
+
+        self._plans: OrderedDict[str, PlanSnapshot] = OrderedDict()
+        self._last_capture: dict[str, float] = {}
+        self._tokens = float(max_per_minute)
+        self._tokens_at = time.monotonic()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._subscribers: list[Callable[[PlanChangeAlert], None]] = []
+
+    def subscribe(self, callback: Callable[[PlanChangeAlert], None]) -> None:
+        """Register a callback invoked for every plan change alert."""
+        self._subscribers.append(callback)
+
+    def get_plan(self, fingerprint: str) -> PlanSnapshot | None:
+        """Get the latest captured plan for a fingerprint."""
+        return self._plans.get(fingerprint)
+
+    def submit(
+        self, fingerprint: str, statement: str, parameters: Any, executemany: bool
+    ) -> bool:
+        """Schedule an EXPLAIN for a slow statement if sampling allows it.
+
+        Must be called from the event loop thread (including SQLAlchemy's
+        greenlets). Returns True if a capture was scheduled.
+        """
+        if executemany or _EXPLAIN.match(statement):
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if not self._should_capture(fingerprint):
+            return False
+
+        task = loop.create_task(self._capture(fingerprint, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    def record_plan(
+        self, fingerprint: str, plan: dict[str, Any]
+    ) -> PlanChangeAlert | None:
+        """Store a plan for a fingerprint and alert if it regressed."""
+        parsed = QueryPlanAnalyzer._parse_execution_plan(plan)
+        snapshot = PlanSnapshot(
+            fingerprint=fingerprint,
+            shape=parsed["plan_shape"],
+            total_cost=float(parsed["total_cost"]),
+            execution_time=plan.get("Execution Time"),
+            bottleneck=parsed["bottleneck"],
+            captured_at=datetime.now(UTC),
+        )
+
+        previous = self._plans.get(fingerprint)
+        self._plans[fingerprint] = snapshot
+        self._plans.move_to_end(fingerprint)
+        while len(self._plans) > self.max_fingerprints:
+            evicted, _ = self._plans.popitem(last=False)
+            self._last_capture.pop(evicted, None)
+
+        if previous is None:
+            return None
+
+        reasons = self._compare(previous, snapshot)
+        if not reasons:
+            return None
+
+        alert = PlanChangeAlert(fingerprint, previous, snapshot, reasons)
+        logger.warning(alert.describe())
+        for callback in self._subscribers:
+            try:
+                callback(alert)
+            except Exception:
+                logger.exception("Plan change subscriber failed")
+        return alert
+
+    async def wait_idle(self) -> None:
+        """Wait for all scheduled captures to finish."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _should_capture(self, fingerprint: str) -> bool:
+        """Apply in-flight, per-fingerprint, sampling and global rate limits."""
+        if len(self._tasks) >= self.max_in_flight:
+            return False
+
+        now = time.monotonic()
+        last = self._last_capture.get(fingerprint)
+        if last is not None and now - last < self.min_interval:
+            return False
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+
+        # Token bucket refilled at max_per_minute tokens per minute
+        self._tokens = min(
+            float(self.max_per_minute),
+            self._tokens + (now - self._tokens_at) * self.max_per_minute / 60,
+        )
+        self._tokens_at = now
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        self._last_capture[fingerprint] = now
+        return True
+
+    async def _capture(self, fingerprint: str, statement: str, parameters: Any) -> None:
+        """Run EXPLAIN on a separate connection and record the plan."""
+        options = (
+            "ANALYZE, BUFFERS, FORMAT JSON"
+            if self.analyze and is_safe_to_analyze(statement)
+            else "FORMAT JSON"
+        )
+        try:
+            with query_origin(type(self).__name__):
+                async with self.engine.connect() as conn:
+                    transaction = await conn.begin()
+                    try:
+                        await conn.exec_driver_sql(
+                            "SET LOCAL statement_timeout = "
+                            f"{int(self.statement_timeout_ms)}"
+                        )
+                        result = await conn.exec_driver_sql(
+                            f"EXPLAIN ({options}) {statement}", parameters or ()
+                        )
+                        plan_data = result.scalar()
+                    finally:
+                        await transaction.rollback()
+        except Exception as e:
+            logger.debug(
+                "Failed to capture query plan",
+                extra={"fingerprint": fingerprint, "error": str(e)},
+            )
+            return
+
+        if isinstance(plan_data, str):
+            plan_data = json.loads(plan_data)
+        if plan_data:
+            self.record_plan(fingerprint, plan_data[0])
+
+    def _compare(self, previous: PlanSnapshot, current: PlanSnapshot) -> list[str]:
+        """Describe how a plan regressed relative to the previous capture."""
+        reasons: list[str] = []
+
+        if previous.shape != current.shape:
+            before = set(_SCAN.findall(previous.shape))
+            after = set(_SCAN.findall(current.shape))
+            changes = [f"{scan} on {target}" for scan, target in sorted(after - before)]
+            removed = [f"{scan} on {target}" for scan, target in sorted(before - after)]
+            if changes or removed:
+                reasons.append(
+                    f"scans changed from [{', '.join(removed)}] "
+                    f"to [{', '.join(changes)}]"
+                )
+            else:
+                reasons.append("plan shape changed")
+
+        if (
+            previous.total_cost > 0
+            and current.total_cost >= previous.total_cost * self.cost_jump_ratio
+        ):
+            reasons.append(
+                f"cost jumped {previous.total_cost:.1f} -> "
+                f"{current.total_cost:.1f} "
+                f"({current.total_cost / previous.total_cost:.1f}x)"
+            )
+
+        return reasons
@@ -2,6 +2,13 @@
 
 from .base import BaseRepository
 from .check_run import CheckRunRepository
+from .projections import (
+    CheckRunStatusRow,
+    PullRequestPollRow,
+    PullRequestSearchHit,
+    PullRequestSummaryRow,
+    RepositoryPollRow,
+)
 from .pull_request import PullRequestRepository
 from .repository import RepositoryRepository
 from .state_history import PRStateHistoryRepository
@@ -9,7 +16,12 @@ from .state_history import PRStateHistoryRepository
 __all__ = [
     "BaseRepository",
     "CheckRunRepository",
+    "CheckRunStatusRow",
     "PRStateHistoryRepository",
+    "PullRequestPollRow",
     "PullRequestRepository",
+    "PullRequestSearchHit",
+    "PullRequestSummaryRow",
+    "RepositoryPollRow",
     "RepositoryRepository",
 ]
@@ -1,17 +1,26 @@
 """Abstract base repository with common CRUD operations."""
 
+import inspect
 import uuid
+from collections.abc import Mapping
 from typing import Any
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Result, Select, func, select
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models.base import BaseModel
+from src.performance.instrumentation import attribute_queries
 
 
 class BaseRepository[ModelType: BaseModel]:
     """Abstract base repository with common CRUD operations."""
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Attribute SQL issued by each public async method to the repository."""
+        super().__init_subclass__(**kwargs)
+        _attribute_public_methods(cls)
+
     def __init__(self, session: AsyncSession, model_class: type[ModelType]):
         """Initialize repository with database session and model class."""
         self.session = session
@@ -27,6 +36,12 @@ class BaseRepository[ModelType: BaseModel]:
 
     async def get_by_id(self, entity_id: uuid.UUID) -> ModelType | None:
         """Get entity by ID."""
+        if len(sa_inspect(self.model_class).primary_key) > 1:
+            # Partitioned tables key rows by (id, created_at); id stays unique
+            result = await self.session.execute(
+                select(self.model_class).where(self.model_class.id == entity_id)
+            )
+            return result.scalar_one_or_none()
         return await self.session.get(self.model_class, entity_id)
 
     async def get_by_id_or_raise(self, entity_id: uuid.UUID) -> ModelType:
@@ -93,23 +108,60 @@ class BaseRepository[ModelType: BaseModel]:
         """Build base query for the model."""
         return select(self.model_class)
 
-    async def _execute_query(self, query: Select[tuple[ModelType]]) -> list[ModelType]:
-        """Execute query and return results."""
-        result = await self.session.execute(query)
+    async def _execute_query(
+        self,
+        query: Select[tuple[ModelType]],
+        params: Mapping[str, Any] | None = None,
+    ) -> list[ModelType]:
+        """Execute query and return results.
+
+        params supplies values for bindparam() placeholders of statements
+        built once at import time (see the cached statements in subclasses).
+        """
+        result = await self._execute(query, params)
         return list(result.scalars().all())
 
     async def _execute_single_query(
-        self, query: Select[tuple[ModelType]]
+        self,
+        query: Select[tuple[ModelType]],
+        params: Mapping[str, Any] | None = None,
     ) -> ModelType | None:
         """Execute query and return single result."""
-        result = await self.session.execute(query)
+        result = await self._execute(query, params)
         return result.scalar_one_or_none()
 
+    async def _execute(
+        self, query: Select[Any], params: Mapping[str, Any] | None
+    ) -> Result[Any]:
+        """Execute query, passing params only when the statement needs them."""
+        result: Result[Any]
+        if params is None:
+            result = await self.session.execute(query)
+        else:
+            result = await self.session.execute(query, params)
+        return result
+
+    async def _execute_projection[RowType](
+        self, query: Select[Any], row_type: type[RowType]
+    ) -> list[RowType]:
+        """Execute a column query and map each row onto a projection type.
+
+        Rows are built straight from the result tuples, so nothing is added to
+        the session identity map or tracked for changes.
+        """
+        result = await self.session.execute(query)
+        return [row_type(*row) for row in result.all()]
+
     async def _execute_count_query(self, query: Select[tuple[int]]) -> int:
         """Execute count query and return result."""
         result = await self.session.execute(query)
         return result.scalar_one()
 
+    def _dialect_name(self) -> str:
+        """Return the SQL dialect name of the session's bind, if known."""
+        bind = self.session.bind
+        return bind.dialect.name if bind is not None else ""
+
     async def commit(self) -> None:
         """Commit the current transaction."""
         await self.session.commit()
@@ -125,3 +177,13 @@ class BaseRepository[ModelType: BaseModel]:
     async def refresh(self, entity: ModelType) -> None:
         """Refresh entity from database."""
         await self.session.refresh(entity)
+
+
+def _attribute_public_methods(cls: type) -> None:
+    """Wrap public coroutine methods defined on cls with attribute_queries."""
+    for name, member in list(vars(cls).items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(member):
+            setattr(cls, name, attribute_queries(member))
+
+
+_attribute_public_methods(BaseRepository)
@@ -1,16 +1,69 @@
 """CheckRun repository with domain-specific operations."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
-from sqlalchemy import and_, desc, func, select, update
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    bindparam,
+    desc,
+    func,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.database.partitioning import PartitionManager
+from src.database.replicas import read_only
 from src.models import CheckConclusion, CheckRun, CheckStatus
 
 from .base import BaseRepository
+from .projections import CheckRunStatusRow
+
+
+def _latest_per_check_name_query(
+    *columns: Any, pr_filter: ColumnElement[bool]
+) -> Select[Any]:
+    """Build a DISTINCT ON query keeping the newest run per (PR, check name).
+
+    Ties on created_at are broken by id so exactly one row is returned per
+    check name. Served by idx_check_runs_pr_name_created.
+    """
+    return (
+        select(*columns)
+        .where(pr_filter)
+        .distinct(CheckRun.pr_id, CheckRun.check_name)
+        .order_by(
+            CheckRun.pr_id,
+            CheckRun.check_name,
+            desc(CheckRun.created_at),
+            desc(CheckRun.id),
+        )
+    )
+
+
+# Hot lookups are built once with bound parameters, so calls skip statement
+# construction and reuse the memoized cache key and compiled SQL
+_BY_EXTERNAL_ID = (
+    select(CheckRun)
+    .where(CheckRun.external_id == bindparam("external_id"))
+    # external_id is only unique per created_at (partition key), so a
+    # re-ingested run resolves to its newest row
+    .order_by(desc(CheckRun.created_at))
+    .limit(1)
+    .options(
+        selectinload(CheckRun.pull_request),
+        selectinload(CheckRun.analysis_results),
+    )
+)
+_LATEST_FOR_PR = _latest_per_check_name_query(
+    CheckRun, pr_filter=CheckRun.pr_id == bindparam("pr_id")
+).options(selectinload(CheckRun.analysis_results))
 
 
 class CheckRunRepository(BaseRepository[CheckRun]):
@@ -22,15 +75,9 @@ class CheckRunRepository(BaseRepository[CheckRun]):
 
     async def get_by_external_id(self, external_id: str) -> CheckRun | None:
         """Get check run by external (GitHub) ID."""
-        query = (
-            select(CheckRun)
-            .where(CheckRun.external_id == external_id)
-            .options(
-                selectinload(CheckRun.pull_request),
-                selectinload(CheckRun.analysis_results),
-            )
+        return await self._execute_single_query(
+            _BY_EXTERNAL_ID, {"external_id": external_id}
         )
-        return await self._execute_single_query(query)
 
     async def get_by_pr_and_check_name(
         self, pr_id: uuid.UUID, check_name: str
@@ -59,43 +106,70 @@ class CheckRunRepository(BaseRepository[CheckRun]):
 
     async def get_latest_for_pr(self, pr_id: uuid.UUID) -> list[CheckRun]:
         """Get the latest check run for each check name for a PR."""
-        # Subquery to get the latest created_at for each check_name
-        latest_subquery = (
-            select(
-                CheckRun.check_name,
-                func.max(CheckRun.created_at).label("latest_created_at"),
-            )
-            .where(CheckRun.pr_id == pr_id)
-            .group_by(CheckRun.check_name)
-            .subquery()
+        return await self._execute_query(_LATEST_FOR_PR, {"pr_id": pr_id})
+
+    async def get_latest_for_prs(
+        self, pr_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[CheckRun]]:
+        """Get the latest check run per check name for many PRs in one query.
+
+        Returns a mapping with an entry (possibly empty) for every requested PR,
+        each list ordered by check name.
+        """
+        if not pr_ids:
+            return {}
+
+        query = self._latest_per_check_name(CheckRun, pr_ids=pr_ids).options(
+            selectinload(CheckRun.analysis_results)
         )
 
-        # Main query to get the actual check runs
+        latest: dict[uuid.UUID, list[CheckRun]] = {pr_id: [] for pr_id in pr_ids}
+        for check in await self._execute_query(query):
+            latest[check.pr_id].append(check)
+        return latest
+
+    async def get_latest_rows_for_pr(self, pr_id: uuid.UUID) -> list[CheckRunStatusRow]:
+        """Get the latest check run per check name as lightweight status rows."""
+        query = self._latest_per_check_name(
+            *CheckRunStatusRow.columns(), pr_ids=[pr_id]
+        )
+        return await self._execute_projection(query, CheckRunStatusRow)
+
+    async def get_failed_checks_for_pr(self, pr_id: uuid.UUID) -> list[CheckRun]:
+        """Get all failed check runs for a PR (latest for each check name)."""
+        latest_ids = self._latest_per_check_name(CheckRun.id, pr_ids=[pr_id])
+
         query = (
             select(CheckRun)
-            .join(
-                latest_subquery,
+            .where(
                 and_(
-                    CheckRun.check_name == latest_subquery.c.check_name,
-                    CheckRun.created_at == latest_subquery.c.latest_created_at,
-                ),
+                    CheckRun.id.in_(latest_ids),
+                    CheckRun.status == CheckStatus.COMPLETED,
+                    CheckRun.conclusion == CheckConclusion.FAILURE,
+                )
             )
-            .where(CheckRun.pr_id == pr_id)
             .order_by(CheckRun.check_name)
             .options(selectinload(CheckRun.analysis_results))
         )
         return await self._execute_query(query)
 
-    async def get_failed_checks_for_pr(self, pr_id: uuid.UUID) -> list[CheckRun]:
-        """Get all failed check runs for a PR (latest for each check name)."""
-        latest_checks = await self.get_latest_for_pr(pr_id)
-        return [check for check in latest_checks if check.is_failed]
+    def _latest_per_check_name(
+        self, *columns: Any, pr_ids: list[uuid.UUID]
+    ) -> Select[Any]:
+        """Build the latest-run-per-check-name query for the given PRs."""
+        pr_filter = (
+            CheckRun.pr_id == pr_ids[0]
+            if len(pr_ids) == 1
+            else CheckRun.pr_id.in_(pr_ids)
+        )
+        return _latest_per_check_name_query(*columns, pr_filter=pr_filter)
 
     async def get_recent_failures(
         self, hours: int = 24, limit: int | None = None
     ) -> list[CheckRun]:
         """Get recent check run failures."""
-        since = datetime.now(UTC).replace(hour=datetime.now(UTC).hour - hours)
+        # A constant lower bound on created_at lets PostgreSQL prune partitions
+        since = datetime.now(UTC) - timedelta(hours=hours)
 
         query = (
             select(CheckRun)
@@ -193,6 +267,7 @@ class CheckRunRepository(BaseRepository[CheckRun]):
             check for check in all_checks if check.get_failure_category() == category
         ]
 
+    @read_only
     async def get_check_statistics(
         self, pr_id: uuid.UUID | None = None, since: datetime | None = None
     ) -> dict[str, Any]:
@@ -268,14 +343,28 @@ class CheckRunRepository(BaseRepository[CheckRun]):
         return result.rowcount
 
     async def cleanup_old_checks(
-        self, older_than: datetime, keep_latest_per_pr: int = 10
+        self,
+        older_than: datetime,
+        keep_latest_per_pr: int = 10,
+        archive_dir: Path | str | None = None,
+        archive_format: str = "jsonl",
     ) -> int:
-        """Clean up old check runs, keeping the latest N per PR."""
-        # This is a complex operation that would need careful implementation
-        # For now, return 0 as placeholder
-        # TODO: Implement proper cleanup logic with ranking and deletion
-        return 0
+        """Clean up old check runs, keeping the latest N per PR.
+
+        Drops whole monthly partitions older than the cutoff, optionally
+        archiving them first. Returns the number of check runs removed.
+        """
+        manager = PartitionManager(self.session)
+        result = await manager.apply_retention(
+            "check_runs",
+            older_than,
+            keep_latest_per_pr=keep_latest_per_pr,
+            archive_dir=archive_dir,
+            archive_format=archive_format,
+        )
+        return result.rows_removed
 
+    @read_only
     async def get_check_duration_stats(
         self, check_name: str | None = None, since: datetime | None = None
     ) -> dict[str, Any]:
@@ -0,0 +1,168 @@
+"""Lightweight read-model projections for hot repository read paths.
+
+Projection rows select a fixed set of columns and map each result row onto a
+slotted, frozen dataclass. They never enter the session identity map and carry
+no change-tracking state, which makes them much cheaper to build and hold than
+full ORM entities when a caller only needs a handful of fields.
+"""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from src.models import (
+    CheckConclusion,
+    CheckRun,
+    CheckStatus,
+    PRState,
+    PullRequest,
+    Repository,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PullRequestPollRow:
+    """Columns the PR poll loop needs to decide what to check next."""
+
+    id: uuid.UUID
+    repository_id: uuid.UUID
+    pr_number: int
+    state: PRState
+    draft: bool
+    head_sha: str
+    last_checked_at: datetime | None
+
+    @classmethod
+    def columns(cls) -> tuple[Any, ...]:
+        """Return the selected columns, in field order."""
+        return (
+            PullRequest.id,
+            PullRequest.repository_id,
+            PullRequest.pr_number,
+            PullRequest.state,
+            PullRequest.draft,
+            PullRequest.head_sha,
+            PullRequest.last_checked_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PullRequestSummaryRow:
+    """Display-level PR fields without body, metadata or relationships."""
+
+    id: uuid.UUID
+    repository_id: uuid.UUID
+    pr_number: int
+    title: str
+    author: str
+    state: PRState
+    draft: bool
+    head_sha: str
+    created_at: datetime
+
+    @classmethod
+    def columns(cls) -> tuple[Any, ...]:
+        """Return the selected columns, in field order."""
+        return (
+            PullRequest.id,
+            PullRequest.repository_id,
+            PullRequest.pr_number,
+            PullRequest.title,
+            PullRequest.author,
+            PullRequest.state,
+            PullRequest.draft,
+            PullRequest.head_sha,
+            PullRequest.created_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PullRequestSearchHit:
+    """A ranked PR search result with highlighted title and body snippets."""
+
+    id: uuid.UUID
+    repository_id: uuid.UUID
+    pr_number: int
+    title: str
+    author: str
+    state: PRState
+    updated_at: datetime
+    rank: float
+    title_highlight: str
+    body_highlight: str | None
+
+    @classmethod
+    def columns(cls) -> tuple[Any, ...]:
+        """Return the selected entity columns, in field order.
+
+        rank and the highlight fields are computed per query and appended by
+        the caller.
+        """
+        return (
+            PullRequest.id,
+            PullRequest.repository_id,
+            PullRequest.pr_number,
+            PullRequest.title,
+            PullRequest.author,
+            PullRequest.state,
+            PullRequest.updated_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CheckRunStatusRow:
+    """Status fields of a check run without output text or metadata."""
+
+    id: uuid.UUID
+    pr_id: uuid.UUID
+    external_id: str
+    check_name: str
+    status: CheckStatus
+    conclusion: CheckConclusion | None
+    created_at: datetime
+
+    @classmethod
+    def columns(cls) -> tuple[Any, ...]:
+        """Return the selected columns, in field order."""
+        return (
+            CheckRun.id,
+            CheckRun.pr_id,
+            CheckRun.external_id,
+            CheckRun.check_name,
+            CheckRun.status,
+            CheckRun.conclusion,
+            CheckRun.created_at,
+        )
+
+    @property
+    def is_failed(self) -> bool:
+        """Check if check run failed."""
+        return (
+            self.status == CheckStatus.COMPLETED
+            and self.conclusion == CheckConclusion.FAILURE
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RepositoryPollRow:
+    """Columns the repository poller needs to schedule work."""
+
+    id: uuid.UUID
+    url: str
+    full_name: str | None
+    polling_interval_minutes: int
+    last_polled_at: datetime | None
+    failure_count: int
+
+    @classmethod
+    def columns(cls) -> tuple[Any, ...]:
+        """Return the selected columns, in field order."""
+        return (
+            Repository.id,
+            Repository.url,
+            Repository.full_name,
+            Repository.polling_interval_minutes,
+            Repository.last_polled_at,
+            Repository.failure_count,
+        )
@@ -4,14 +4,38 @@ import uuid
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import and_, desc, func, or_, select, text
+from sqlalchemy import and_, bindparam, desc, func, literal, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 
+from src.database.replicas import read_only
 from src.models import CheckRun, PRState, PullRequest, Repository, TriggerEvent
+from src.models.pull_request import SEARCH_CONFIG
 
 from .base import BaseRepository
+from .projections import (
+    PullRequestPollRow,
+    PullRequestSearchHit,
+    PullRequestSummaryRow,
+)
+
+# Hot lookups are built once with bound parameters, so calls skip statement
+# construction and reuse the memoized cache key and compiled SQL
+_BY_REPO_AND_NUMBER = (
+    select(PullRequest)
+    .where(
+        and_(
+            PullRequest.repository_id == bindparam("repository_id"),
+            PullRequest.pr_number == bindparam("pr_number"),
+        )
+    )
+    .options(
+        selectinload(PullRequest.repository),
+        selectinload(PullRequest.check_runs),
+        selectinload(PullRequest.state_history),
+    )
+)
 
 
 class PullRequestRepository(BaseRepository[PullRequest]):
@@ -25,21 +49,10 @@ class PullRequestRepository(BaseRepository[PullRequest]):
         self, repository_id: uuid.UUID, pr_number: int
     ) -> PullRequest | None:
         """Get PR by repository ID and PR number."""
-        query = (
-            select(PullRequest)
-            .where(
-                and_(
-                    PullRequest.repository_id == repository_id,
-                    PullRequest.pr_number == pr_number,
-                )
-            )
-            .options(
-                selectinload(PullRequest.repository),
-                selectinload(PullRequest.check_runs),
-                selectinload(PullRequest.state_history),
-            )
+        return await self._execute_single_query(
+            _BY_REPO_AND_NUMBER,
+            {"repository_id": repository_id, "pr_number": pr_number},
         )
-        return await self._execute_single_query(query)
 
     async def get_by_repo_url_and_number(
         self, repo_url: str, pr_number: int
@@ -61,17 +74,9 @@ class PullRequestRepository(BaseRepository[PullRequest]):
         self, repository_id: uuid.UUID, include_drafts: bool = False
     ) -> list[PullRequest]:
         """Get all active PRs for a repository."""
-        conditions = [
-            PullRequest.repository_id == repository_id,
-            PullRequest.state == PRState.OPENED,
-        ]
-
-        if not include_drafts:
-            conditions.append(~PullRequest.draft)
-
         query = (
             select(PullRequest)
-            .where(and_(*conditions))
+            .where(and_(*self._active_pr_conditions(repository_id, include_drafts)))
             .order_by(desc(PullRequest.created_at))
             .options(
                 selectinload(PullRequest.repository),
@@ -80,21 +85,24 @@ class PullRequestRepository(BaseRepository[PullRequest]):
         )
         return await self._execute_query(query)
 
+    async def get_active_prs_for_repo_rows(
+        self, repository_id: uuid.UUID, include_drafts: bool = False
+    ) -> list[PullRequestSummaryRow]:
+        """Get active PRs for a repository as lightweight summary rows."""
+        query = (
+            select(*PullRequestSummaryRow.columns())
+            .where(and_(*self._active_pr_conditions(repository_id, include_drafts)))
+            .order_by(desc(PullRequest.created_at))
+        )
+        return await self._execute_projection(query, PullRequestSummaryRow)
+
     async def get_prs_needing_check(
         self, last_checked_before: datetime, limit: int | None = None
     ) -> list[PullRequest]:
         """Get PRs that need checking (haven't been checked recently)."""
-        conditions = [
-            PullRequest.state == PRState.OPENED,
-            or_(
-                PullRequest.last_checked_at.is_(None),
-                PullRequest.last_checked_at < last_checked_before,
-            ),
-        ]
-
         query = (
             select(PullRequest)
-            .where(and_(*conditions))
+            .where(and_(*self._needs_check_conditions(last_checked_before)))
             .order_by(PullRequest.last_checked_at.asc().nulls_first())
             .options(
                 selectinload(PullRequest.repository),
@@ -107,6 +115,49 @@ class PullRequestRepository(BaseRepository[PullRequest]):
 
         return await self._execute_query(query)
 
+    async def get_prs_needing_check_rows(
+        self, last_checked_before: datetime, limit: int | None = None
+    ) -> list[PullRequestPollRow]:
+        """Get PRs that need checking as lightweight poll rows.
+
+        Same selection and ordering as get_prs_needing_check(), but only the
+        columns the poll loop uses are fetched and no relationships are loaded.
+        """
+        query = (
+            select(*PullRequestPollRow.columns())
+            .where(and_(*self._needs_check_conditions(last_checked_before)))
+            .order_by(PullRequest.last_checked_at.asc().nulls_first())
+        )
+
+        if limit:
+            query = query.limit(limit)
+
+        return await self._execute_projection(query, PullRequestPollRow)
+
+    def _active_pr_conditions(
+        self, repository_id: uuid.UUID, include_drafts: bool
+    ) -> list[Any]:
+        """Build filter conditions for active PRs of a repository."""
+        conditions = [
+            PullRequest.repository_id == repository_id,
+            PullRequest.state == PRState.OPENED,
+        ]
+
+        if not include_drafts:
+            conditions.append(~PullRequest.draft)
+
+        return conditions
+
+    def _needs_check_conditions(self, last_checked_before: datetime) -> list[Any]:
+        """Build filter conditions for open PRs that are due for a check."""
+        return [
+            PullRequest.state == PRState.OPENED,
+            or_(
+                PullRequest.last_checked_at.is_(None),
+                PullRequest.last_checked_at < last_checked_before,
+            ),
+        ]
+
     async def update_state(
         self,
         pr_id: uuid.UUID,
@@ -227,6 +278,7 @@ class PullRequestRepository(BaseRepository[PullRequest]):
 
         return await self._execute_query(query)
 
+    @read_only
     async def get_pr_statistics(
         self, repository_id: uuid.UUID | None = None
     ) -> dict[str, Any]:
@@ -275,6 +327,7 @@ class PullRequestRepository(BaseRepository[PullRequest]):
             "draft": draft_count,
         }
 
+    @read_only
     async def search_prs(
         self,
         query_text: str | None = None,
@@ -284,30 +337,36 @@ class PullRequestRepository(BaseRepository[PullRequest]):
         limit: int | None = None,
         offset: int | None = None,
     ) -> list[PullRequest]:
-        """Search PRs with various filters."""
-        conditions = []
+        """Search PRs with various filters.
+
+        On PostgreSQL, query_text is matched against the search_vector
+        full-text index using web search syntax and results are ordered by
+        relevance. Other dialects fall back to ILIKE matching on title and
+        body, ordered by most recently updated.
+        """
+        conditions = self._search_filter_conditions(author, state, repository_id)
+        order_by: list[Any] = []
 
         if query_text:
-            conditions.append(
-                or_(
-                    PullRequest.title.ilike(f"%{query_text}%"),
-                    PullRequest.body.ilike(f"%{query_text}%"),
+            if self._dialect_name() == "postgresql":
+                tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+                conditions.append(PullRequest.search_vector.op("@@")(tsquery))
+                order_by.append(
+                    desc(func.ts_rank_cd(PullRequest.search_vector, tsquery))
+                )
+            else:
+                conditions.append(
+                    or_(
+                        PullRequest.title.ilike(f"%{query_text}%"),
+                        PullRequest.body.ilike(f"%{query_text}%"),
+                    )
                 )
-            )
-
-        if author:
-            conditions.append(PullRequest.author.ilike(f"%{author}%"))
-
-        if state:
-            conditions.append(PullRequest.state == state)
-
-        if repository_id:
-            conditions.append(PullRequest.repository_id == repository_id)
 
+        order_by.append(desc(PullRequest.updated_at))
         query = (
             select(PullRequest)
             .where(and_(*conditions) if conditions else text("1=1"))
-            .order_by(desc(PullRequest.updated_at))
+            .order_by(*order_by)
             .options(
                 selectinload(PullRequest.repository),
                 selectinload(PullRequest.check_runs),
@@ -322,6 +381,80 @@ class PullRequestRepository(BaseRepository[PullRequest]):
 
         return await self._execute_query(query)
 
+    @read_only
+    async def search_prs_ranked(
+        self,
+        query_text: str,
+        author: str | None = None,
+        state: PRState | None = None,
+        repository_id: uuid.UUID | None = None,
+        limit: int = 20,
+        offset: int | None = None,
+    ) -> list[PullRequestSearchHit]:
+        """Search PRs by relevance, returning highlighted snippets.
+
+        Highlights wrap matched terms in <b></b> via ts_headline. Only the
+        returned page is highlighted, so the cost stays proportional to limit.
+        On non-PostgreSQL dialects results come from ILIKE matching with a
+        rank of 0.0 and the raw title and body as highlights.
+        """
+        conditions = self._search_filter_conditions(author, state, repository_id)
+
+        if self._dialect_name() != "postgresql":
+            conditions.append(
+                or_(
+                    PullRequest.title.ilike(f"%{query_text}%"),
+                    PullRequest.body.ilike(f"%{query_text}%"),
+                )
+            )
+            query = select(
+                *PullRequestSearchHit.columns(),
+                literal(0.0),
+                PullRequest.title,
+                PullRequest.body,
+            ).order_by(desc(PullRequest.updated_at))
+        else:
+            tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query_text)
+            conditions.append(PullRequest.search_vector.op("@@")(tsquery))
+            rank = func.ts_rank_cd(PullRequest.search_vector, tsquery)
+            query = select(
+                *PullRequestSearchHit.columns(),
+                rank,
+                func.ts_headline(SEARCH_CONFIG, PullRequest.title, tsquery),
+                func.ts_headline(
+                    SEARCH_CONFIG,
+                    PullRequest.body,
+                    tsquery,
+                    "MaxFragments=2, MaxWords=30, MinWords=10",
+                ),
+            ).order_by(desc(rank), desc(PullRequest.updated_at))
+
+        query = query.where(and_(*conditions)).limit(limit)
+        if offset:
+            query = query.offset(offset)
+
+        return await self._execute_projection(query, PullRequestSearchHit)
+
+    @staticmethod
+    def _search_filter_conditions(
+        author: str | None,
+        state: PRState | None,
+        repository_id: uuid.UUID | None,
+    ) -> list[Any]:
+        """Build the non-text filter conditions shared by the PR searches."""
+        conditions: list[Any] = []
+
+        if author:
+            conditions.append(PullRequest.author.ilike(f"%{author}%"))
+
+        if state:
+            conditions.append(PullRequest.state == state)
+
+        if repository_id:
+            conditions.append(PullRequest.repository_id == repository_id)
+
+        return conditions
+
     async def bulk_update_last_checked(
         self, pr_ids: list[uuid.UUID], checked_at: datetime | None = None
     ) -> int:
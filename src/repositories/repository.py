@@ -1,16 +1,19 @@
 """Repository repository for configuration and tracking operations."""
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import and_, desc, func, or_, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.config.resolver import invalidate_repository_config
+from src.database.replicas import read_only
 from src.models import Repository, RepositoryStatus
 
 from .base import BaseRepository
+from .projections import RepositoryPollRow
 
 
 class RepositoryRepository(BaseRepository[Repository]):
@@ -59,33 +62,74 @@ class RepositoryRepository(BaseRepository[Repository]):
 
     async def get_repositories_needing_poll(self) -> list[Repository]:
         """Get repositories that need polling."""
-        now = datetime.now(UTC)
-
         query = (
             select(Repository)
-            .where(
-                and_(
-                    Repository.status == RepositoryStatus.ACTIVE,
-                    or_(
-                        Repository.last_polled_at.is_(None),
-                        func.extract("epoch", now - Repository.last_polled_at)
-                        > (Repository.polling_interval_minutes * 60),
-                    ),
-                )
-            )
-            .order_by(Repository.last_polled_at.asc().nulls_first())
+            .where(self._needs_poll_condition())
+            .order_by(Repository.next_poll_at)
         )
         return await self._execute_query(query)
 
+    async def get_repositories_needing_poll_rows(self) -> list[RepositoryPollRow]:
+        """Get repositories that need polling as lightweight poll rows."""
+        query = (
+            select(*RepositoryPollRow.columns())
+            .where(self._needs_poll_condition())
+            .order_by(Repository.next_poll_at)
+        )
+        return await self._execute_projection(query, RepositoryPollRow)
+
+    async def claim_repositories_for_poll(
+        self, limit: int, lease_seconds: int = 300
+    ) -> list[Repository]:
+        """Atomically lease up to limit due repositories to the calling worker.
+
+        Due rows are locked with FOR UPDATE SKIP LOCKED, so concurrent workers
+        never claim the same repository, and their next_poll_at is pushed
+        forward by the lease. update_last_polled() then reschedules the
+        repository from its poll time; if the worker dies instead, the lease
+        expires and the repository becomes due again.
+        """
+        if limit <= 0:
+            return []
+
+        due = (
+            select(Repository.id)
+            .where(self._needs_poll_condition())
+            .order_by(Repository.next_poll_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Repository)
+            .where(Repository.id.in_(due))
+            .values(next_poll_at=func.now() + timedelta(seconds=lease_seconds))
+            .returning(Repository)
+        )
+
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    def _needs_poll_condition(self) -> Any:
+        """Build the filter condition for active repositories due for a poll.
+
+        Compares against the database clock so every worker shares one notion
+        of "due" and the partial index on next_poll_at can serve the scan.
+        """
+        return and_(
+            Repository.status == RepositoryStatus.ACTIVE,
+            Repository.next_poll_at <= func.now(),
+        )
+
     async def update_last_polled(
         self, repository_id: uuid.UUID, timestamp: datetime | None = None
     ) -> Repository:
-        """Update last polled timestamp."""
+        """Update last polled timestamp and schedule the next poll."""
         if timestamp is None:
             timestamp = datetime.now(UTC)
 
         repository = await self.get_by_id_or_raise(repository_id)
         repository.last_polled_at = timestamp
+        repository.schedule_next_poll()
 
         await self.flush()
         await self.refresh(repository)
@@ -159,6 +203,7 @@ class RepositoryRepository(BaseRepository[Repository]):
         """Update polling interval for a repository."""
         repository = await self.get_by_id_or_raise(repository_id)
         repository.polling_interval_minutes = interval_minutes
+        repository.schedule_next_poll()
 
         await self.flush()
         await self.refresh(repository)
@@ -173,6 +218,7 @@ class RepositoryRepository(BaseRepository[Repository]):
 
         await self.flush()
         await self.refresh(repository)
+        invalidate_repository_config(repository.url)
         return repository
 
     async def remove_config_override(
@@ -184,8 +230,10 @@ class RepositoryRepository(BaseRepository[Repository]):
 
         await self.flush()
         await self.refresh(repository)
+        invalidate_repository_config(repository.url)
         return repository
 
+    @read_only
     async def get_repository_statistics(self) -> dict[str, Any]:
         """Get overall repository statistics."""
         # Count by status
@@ -221,6 +269,7 @@ class RepositoryRepository(BaseRepository[Repository]):
             "avg_failure_count": float(avg_failure_count),
         }
 
+    @read_only
     async def search_repositories(
         self,
         query_text: str | None = None,
@@ -229,7 +278,12 @@ class RepositoryRepository(BaseRepository[Repository]):
         limit: int | None = None,
         offset: int | None = None,
     ) -> list[Repository]:
-        """Search repositories with various filters."""
+        """Search repositories with various filters.
+
+        On PostgreSQL the ILIKE filters are served by the pg_trgm GIN indexes on
+        name, full_name, url and description, and query_text matches are
+        ordered by trigram similarity so the closest names come first.
+        """
         conditions = []
 
         if query_text:
@@ -248,10 +302,25 @@ class RepositoryRepository(BaseRepository[Repository]):
         if owner:
             conditions.append(Repository.full_name.ilike(f"{owner}/%"))
 
+        order_by: list[Any] = []
+        if query_text and self._dialect_name() == "postgresql":
+            order_by.append(
+                desc(
+                    func.greatest(
+                        func.similarity(Repository.name, query_text),
+                        func.similarity(
+                            func.coalesce(Repository.full_name, ""), query_text
+                        ),
+                        func.similarity(Repository.url, query_text),
+                    )
+                )
+            )
+        order_by.append(Repository.name)
+
         query = (
             select(Repository)
             .where(and_(*conditions) if conditions else text("1=1"))
-            .order_by(Repository.name)
+            .order_by(*order_by)
         )
 
         if offset:
@@ -272,7 +341,11 @@ class RepositoryRepository(BaseRepository[Repository]):
         stmt = (
             update(Repository)
             .where(Repository.id.in_(repository_ids))
-            .values(polling_interval_minutes=interval_minutes)
+            .values(
+                polling_interval_minutes=interval_minutes,
+                next_poll_at=func.coalesce(Repository.last_polled_at, func.now())
+                + timedelta(minutes=interval_minutes),
+            )
         )
 
         result = await self.session.execute(stmt)
@@ -2,12 +2,15 @@
 
 import uuid
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 from sqlalchemy import and_, desc, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.database.partitioning import PartitionManager
+from src.database.replicas import read_only
 from src.models import PRState, PRStateHistory, TriggerEvent
 
 from .base import BaseRepository
@@ -164,6 +167,7 @@ class PRStateHistoryRepository(BaseRepository[PRStateHistory]):
 
         return await self._execute_query(query)
 
+    @read_only
     async def get_activity_timeline(
         self, pr_id: uuid.UUID, include_metadata: bool = True
     ) -> list[dict[str, Any]]:
@@ -193,6 +197,7 @@ class PRStateHistoryRepository(BaseRepository[PRStateHistory]):
 
         return timeline
 
+    @read_only
     async def get_transition_statistics(
         self, since: datetime | None = None
     ) -> dict[str, Any]:
@@ -318,10 +323,23 @@ class PRStateHistoryRepository(BaseRepository[PRStateHistory]):
         return result
 
     async def cleanup_old_history(
-        self, older_than: datetime, keep_latest_per_pr: int = 50
+        self,
+        older_than: datetime,
+        keep_latest_per_pr: int = 50,
+        archive_dir: Path | str | None = None,
+        archive_format: str = "jsonl",
     ) -> int:
-        """Clean up old state history entries, keeping the latest N per PR."""
-        # This would be a complex operation requiring careful ranking and deletion
-        # For now, return 0 as placeholder
-        # TODO: Implement proper cleanup logic
-        return 0
+        """Clean up old state history entries, keeping the latest N per PR.
+
+        Drops whole monthly partitions older than the cutoff, optionally
+        archiving them first. Returns the number of entries removed.
+        """
+        manager = PartitionManager(self.session)
+        result = await manager.apply_retention(
+            "pr_state_history",
+            older_than,
+            keep_latest_per_pr=keep_latest_per_pr,
+            archive_dir=archive_dir,
+            archive_format=archive_format,
+        )
+        return result.rows_removed
@@ -234,6 +234,8 @@ class TestDatabaseMigration:
                 "idx_check_runs_pr_id",
                 "idx_check_runs_status",
                 "idx_pr_state_history_pr_id",
+                "idx_pull_requests_search_vector",
+                "idx_repositories_name_trgm",
             ]
 
             for index_name in expected_indexes:
@@ -268,12 +270,12 @@ class TestDatabaseMigration:
 
             fk_constraints = result.fetchall()
 
-            # Check key foreign key relationships
+            # Check key foreign key relationships. analysis_results.check_run_id
+            # has no foreign key since check_runs is partitioned by created_at.
             expected_fks = [
                 ("pull_requests", "repository_id", "repositories", "id"),
                 ("check_runs", "pr_id", "pull_requests", "id"),
                 ("pr_state_history", "pr_id", "pull_requests", "id"),
-                ("analysis_results", "check_run_id", "check_runs", "id"),
                 ("fix_attempts", "analysis_result_id", "analysis_results", "id"),
                 ("reviews", "pr_id", "pull_requests", "id"),
             ]
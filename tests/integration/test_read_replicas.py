@@ -0,0 +1,155 @@
+"""
+Integration tests for read-replica routing using testcontainers.
+
+Two independent PostgreSQL containers stand in for a primary and a replica.
+The stand-in replica is not in recovery, so its measured lag is 0, and each
+database holds a different marker row so tests can see which one served a
+read.
+
+Requirements:
+- Docker must be installed and running
+- testcontainers-python package (installed via requirements.txt)
+"""
+
+from collections.abc import AsyncGenerator, Generator
+from contextlib import suppress
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, MetaData, String, Table, create_engine, insert, select
+from testcontainers.postgres import PostgresContainer
+
+from src.database.config import DatabaseConfig, DatabasePoolConfig
+from src.database.connection import DatabaseConnectionManager
+from src.database.replicas import read_only_scope
+
+metadata = MetaData()
+markers = Table("replica_markers", metadata, Column("source", String(20)))
+
+
+def start_container() -> PostgresContainer:
+    """Start a PostgreSQL container with the standard test credentials."""
+    return PostgresContainer(
+        image="postgres:15-alpine",
+        username="test_user",
+        password="test_password",
+        dbname="test_agentic_workflow",
+    ).start()
+
+
+def seed(container: PostgresContainer, source: str) -> None:
+    """Create the marker table holding a single row naming the database."""
+    engine = create_engine(container.get_connection_url())
+    with engine.begin() as conn:
+        metadata.create_all(conn)
+        conn.execute(insert(markers).values(source=source))
+    engine.dispose()
+
+
+def async_url(container: PostgresContainer) -> str:
+    """Get the container's URL for the asyncpg driver."""
+    return container.get_connection_url().replace(
+        "postgresql+psycopg2", "postgresql+asyncpg"
+    )
+
+
+@pytest.fixture(scope="module")
+def containers() -> Generator[tuple[PostgresContainer, PostgresContainer], None, None]:
+    """Start the primary and replica containers for the module."""
+    primary = start_container()
+    replica = start_container()
+    try:
+        seed(primary, "primary")
+        seed(replica, "replica")
+        yield primary, replica
+    finally:
+        # The fallback test stops the replica itself
+        with suppress(Exception):
+            replica.stop()
+        primary.stop()
+
+
+@pytest_asyncio.fixture
+async def manager(
+    containers: tuple[PostgresContainer, PostgresContainer],
+) -> AsyncGenerator[DatabaseConnectionManager, None]:
+    """Create a connection manager routing reads to the replica container."""
+    primary, replica = containers
+    config = DatabaseConfig(
+        database_url=async_url(primary),
+        replica_urls=[async_url(replica)],
+        pool=DatabasePoolConfig(pool_size=2, max_overflow=2),
+    )
+    manager = DatabaseConnectionManager(config)
+    router = manager.replica_router
+    assert router is not None
+    await router.check_replicas()
+    yield manager
+    await manager.close()
+
+
+async def read_marker(manager: DatabaseConnectionManager) -> str | None:
+    """Read the marker row through a read-only scope in a new session."""
+    async with manager.get_session() as session:
+        with read_only_scope():
+            return (await session.execute(select(markers.c.source))).scalar()
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_read_only_queries_use_replica(
+    manager: DatabaseConnectionManager,
+) -> None:
+    """
+    Why: Read-only repository work should be offloaded to replicas
+    What: Tests read-only selects are served by the replica and other
+          selects by the primary
+    How: Reads the marker row inside and outside a read-only scope
+    """
+    assert await read_marker(manager) == "replica"
+
+    async with manager.get_session() as session:
+        assert (await session.execute(select(markers.c.source))).scalar() == "primary"
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_reads_after_write_stay_on_primary(
+    manager: DatabaseConnectionManager,
+) -> None:
+    """
+    Why: A session must read its own writes even on a lagging replica
+    What: Tests a read-only select after an insert in the same session
+          sees the primary's data
+    How: Inserts a row and reads marker rows in the same session
+    """
+    async with manager.get_transaction() as session:
+        await session.execute(insert(markers).values(source="written"))
+        with read_only_scope():
+            rows = (await session.execute(select(markers.c.source))).scalars().all()
+        await session.rollback()
+
+    assert sorted(rows) == ["primary", "written"]
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_falls_back_to_primary_when_replica_down(
+    containers: tuple[PostgresContainer, PostgresContainer],
+    manager: DatabaseConnectionManager,
+) -> None:
+    """
+    Why: Losing a replica must not fail reads
+    What: Tests the replica is taken out of rotation after failed checks
+          and read-only selects fall back to the primary
+    How: Stops the replica container (last test in the module) and rechecks
+    """
+    router = manager.replica_router
+    assert router is not None
+    containers[1].stop()
+
+    for _ in range(router.failure_threshold):
+        await router.check_replicas()
+
+    assert not router.replicas[0].healthy
+    assert await read_marker(manager) == "primary"
@@ -0,0 +1,79 @@
+"""
+Shared fixtures for performance benchmarks.
+
+Database-backed benchmarks run against a PostgreSQL testcontainer so timings
+and memory figures reflect the real driver and dialect.
+"""
+
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+from testcontainers.postgres import PostgresContainer
+
+from src.database.config import (
+    DatabaseConfig,
+    DatabasePoolConfig,
+    reset_database_config,
+)
+from src.database.connection import DatabaseConnectionManager, reset_connection_manager
+from src.models.base import Base
+
+
+@pytest.fixture(scope="module")
+def postgres_container() -> Generator[PostgresContainer, None, None]:
+    """Create PostgreSQL container for database benchmarks."""
+    with PostgresContainer(
+        image="postgres:15-alpine",
+        username="test_user",
+        password="test_password",
+        dbname="test_performance",
+    ) as postgres:
+        yield postgres
+
+
+@pytest.fixture
+def database_config(postgres_container: PostgresContainer) -> DatabaseConfig:
+    """Create database config for the benchmark PostgreSQL instance."""
+    reset_database_config()
+    reset_connection_manager()
+
+    connection_url = postgres_container.get_connection_url()
+    async_url = connection_url.replace("postgresql+psycopg2", "postgresql+asyncpg")
+
+    pool_config = DatabasePoolConfig(
+        pool_size=5,
+        max_overflow=5,
+        pool_timeout=30,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+    )
+
+    return DatabaseConfig(database_url=async_url, pool=pool_config)
+
+
+@pytest_asyncio.fixture
+async def connection_manager(
+    database_config: DatabaseConfig,
+) -> AsyncGenerator[DatabaseConnectionManager, None]:
+    """Create connection manager for the benchmark database."""
+    manager = DatabaseConnectionManager(database_config)
+    yield manager
+    await manager.close()
+
+
+@pytest_asyncio.fixture
+async def database_session(
+    connection_manager: DatabaseConnectionManager,
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create database session with a fresh schema."""
+    async with connection_manager.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with connection_manager.get_session() as session:
+        yield session
+        await session.rollback()
+
+    async with connection_manager.engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
@@ -0,0 +1,79 @@
+"""
+Benchmark for structural diffs of configurations with many repositories.
+
+Why: Positional list comparison turns one inserted repository into a change
+     for every later entry, so diffs of large configurations are slow and
+     unreadable, and hot reload invalidates far more than it needs to
+What: Compares keyed and positional diffs of a 10,000-repository configuration
+      with one repository inserted at the top, one modified and one removed,
+      plus keyed diffing with move detection
+How: Builds both documents in memory and times compare_dicts in each mode
+"""
+
+import time
+from typing import Any
+
+import pytest
+
+from src.config.tools.diff import ConfigurationDiffer, DiffType
+from src.config.utils import create_minimal_config
+
+REPOSITORY_COUNT = 10_000
+
+
+def _documents() -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build an old and a new document differing in three repositories."""
+    old = create_minimal_config().model_dump(mode="json")
+    template = old["repositories"][0]
+    old["repositories"] = [
+        {**template, "url": f"https://github.com/bench/repo-{number}"}
+        for number in range(REPOSITORY_COUNT)
+    ]
+
+    new = {**old, "repositories": [dict(entry) for entry in old["repositories"]]}
+    new["repositories"][REPOSITORY_COUNT // 2]["failure_threshold"] = 10
+    del new["repositories"][-1]
+    new["repositories"].insert(
+        0, {**template, "url": "https://github.com/bench/new-repo"}
+    )
+    return old, new
+
+
+def _time_diff(differ: ConfigurationDiffer, old: Any, new: Any) -> tuple[int, float]:
+    """Return the number of diffs and seconds taken by compare_dicts."""
+    start = time.perf_counter()
+    diffs = differ.compare_dicts(old, new)
+    return len(diffs), time.perf_counter() - start
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_keyed_diff_of_large_config() -> None:
+    """
+    Why: Validate that keyed diffs stay small and fast on large configurations
+    What: Benchmarks keyed, keyed with moves, and positional diffs
+    How: Diffs the same pair of documents with each differ configuration
+    """
+    old, new = _documents()
+
+    keyed_count, keyed = _time_diff(ConfigurationDiffer(), old, new)
+    moves_count, moves = _time_diff(ConfigurationDiffer(detect_moves=True), old, new)
+    positional_count, positional = _time_diff(
+        ConfigurationDiffer(list_keys={}, detect_moves=True), old, new
+    )
+
+    print(
+        f"\nDiff of {REPOSITORY_COUNT} repositories (1 added, 1 changed, 1 removed):"
+        f"\n  keyed:               {keyed * 1000:.0f} ms, {keyed_count} diffs"
+        f"\n  keyed, moves:        {moves * 1000:.0f} ms, {moves_count} diffs"
+        f"\n  aligned, unkeyed:    {positional * 1000:.0f} ms,"
+        f" {positional_count} diffs"
+    )
+
+    diffs = ConfigurationDiffer().compare_dicts(old, new)
+    assert sorted(diff.diff_type.value for diff in diffs) == [
+        DiffType.ADDED.value,
+        DiffType.CHANGED.value,
+        DiffType.REMOVED.value,
+    ]
+    assert moves_count == keyed_count
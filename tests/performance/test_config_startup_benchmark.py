@@ -0,0 +1,76 @@
+"""
+Benchmark for configuration startup time with many repositories.
+
+Why: CLI tools and short-lived workers pay the full configuration load before
+     their first read, and with thousands of repositories parsing the YAML and
+     validating every RepositoryConfig takes seconds
+What: Reports time-to-first-get for eager loading, lazy loading with a cold
+      document cache, and lazy loading with a warm cache
+How: Writes a configuration with 2,000 repositories, then times a fresh
+     manager from load_configuration through its first get() in each mode
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.config.manager import ConfigurationManager
+from src.config.utils import create_minimal_config
+
+REPOSITORY_COUNT = 2_000
+
+
+def _write_config(path: Path) -> None:
+    """Write a configuration file with REPOSITORY_COUNT repositories."""
+    document = create_minimal_config().model_dump(mode="json")
+    template = document["repositories"][0]
+    document["repositories"] = [
+        {**template, "url": f"https://github.com/bench/repo-{number}"}
+        for number in range(REPOSITORY_COUNT)
+    ]
+    path.write_text(yaml.safe_dump(document))
+
+
+def _time_to_first_get(path: Path, lazy: bool) -> float:
+    """Return seconds from creating a manager to its first get()."""
+    start = time.perf_counter()
+    manager = ConfigurationManager()
+    manager.load_configuration(str(path), lazy=lazy)
+    manager.get("system.worker_timeout")
+    return time.perf_counter() - start
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_time_to_first_get(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Why: Validate that lazy loading removes repository work from startup
+    What: Benchmarks eager, cold lazy and warm lazy time-to-first-get
+    How: Loads the same file in each mode with an isolated document cache
+    """
+    monkeypatch.setenv("AGENTIC_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+    path = tmp_path / "config.yaml"
+    _write_config(path)
+
+    eager = _time_to_first_get(path, lazy=False)
+    cold = _time_to_first_get(path, lazy=True)
+    warm = _time_to_first_get(path, lazy=True)
+
+    start = time.perf_counter()
+    manager = ConfigurationManager()
+    manager.load_configuration(str(path), lazy=True)
+    repositories = manager.config.repositories
+    materialize = time.perf_counter() - start
+
+    print(
+        f"\nTime to first get with {REPOSITORY_COUNT} repositories:"
+        f"\n  eager:            {eager * 1000:.0f} ms"
+        f"\n  lazy, cold cache: {cold * 1000:.0f} ms"
+        f"\n  lazy, warm cache: {warm * 1000:.0f} ms"
+        f"\n  lazy, warm cache, repositories read: {materialize * 1000:.0f} ms"
+    )
+
+    assert len(repositories) == REPOSITORY_COUNT
+    assert warm < eager
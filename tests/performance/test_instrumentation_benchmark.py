@@ -0,0 +1,75 @@
+"""
+Micro-benchmark for the cursor-level query instrumentation overhead.
+
+Why: The instrumentation hooks run on every statement, so their cost must stay
+     small relative to even the cheapest database round trip
+What: Compares per-statement wall time of an in-memory SQLite engine with and
+      without QueryInstrumentation attached, for repeated and varying SQL
+How: Executes the same workload on a bare and an instrumented engine and
+     reports the mean added microseconds per statement
+"""
+
+import time
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from src.performance.instrumentation import (
+    QueryInstrumentation,
+    fingerprint_statement,
+    query_origin,
+)
+from src.performance.monitoring import PerformanceMonitor
+
+STATEMENTS = 20_000
+ROUNDS = 3
+# Generous bound so the benchmark only fails on a real regression
+MAX_OVERHEAD_US = 100.0
+
+
+def _run(engine: Engine, vary_literals: bool) -> float:
+    """Return the best mean seconds per statement over ROUNDS."""
+    best = float("inf")
+    with engine.connect() as conn:
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            for number in range(STATEMENTS):
+                if vary_literals:
+                    conn.exec_driver_sql(f"SELECT {number % 500} WHERE 1 IN (1, 2)")
+                else:
+                    conn.execute(text("SELECT :value"), {"value": number})
+            best = min(best, (time.perf_counter() - start) / STATEMENTS)
+    return best
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.parametrize("vary_literals", [False, True], ids=["bound", "literal"])
+def test_instrumentation_overhead(vary_literals: bool) -> None:
+    """
+    Why: Quantify the per-query cost of always-on instrumentation
+    What: Measures added time per statement for bound and literal-varying SQL
+    How: Times identical workloads on bare and instrumented SQLite engines
+    """
+    bare = create_engine("sqlite://")
+    instrumented = create_engine("sqlite://")
+    monitor = PerformanceMonitor(enable_logging=False)
+    QueryInstrumentation(monitor).attach(instrumented)
+    fingerprint_statement.cache_clear()
+
+    baseline = _run(bare, vary_literals)
+    with query_origin("Benchmark.run"):
+        measured = _run(instrumented, vary_literals)
+
+    overhead_us = (measured - baseline) * 1_000_000
+    print(
+        f"\n{'literal' if vary_literals else 'bound'} statements x{STATEMENTS}:"
+        f"\n  bare:         {baseline * 1_000_000:.1f} us/stmt"
+        f"\n  instrumented: {measured * 1_000_000:.1f} us/stmt"
+        f"\n  overhead:     {overhead_us:.1f} us/stmt"
+        f"\n  fingerprint cache: {fingerprint_statement.cache_info()}"
+    )
+
+    stats = monitor._iter_pattern_stats(None)
+    assert sum(s.histogram.count for _, s in stats) == STATEMENTS * ROUNDS
+    assert overhead_us < MAX_OVERHEAD_US
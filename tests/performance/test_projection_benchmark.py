@@ -0,0 +1,129 @@
+"""
+Benchmark for lightweight read-model projections versus full ORM loading.
+
+Why: Hot read paths such as the PR poll loop only need a handful of columns,
+     so projection rows should be measurably cheaper than hydrating entities
+     with their JSONB metadata, bodies and eager-loaded relationships
+What: Compares wall time and peak allocated memory of get_prs_needing_check()
+      against get_prs_needing_check_rows() over a realistic data volume
+How: Seeds PostgreSQL with PRs carrying large bodies, metadata and check
+     runs, then runs each variant several times under tracemalloc
+"""
+
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.check_run import CheckRun
+from src.models.enums import CheckConclusion, CheckStatus, PRState
+from src.models.pull_request import PullRequest
+from src.models.repository import Repository
+
+PR_COUNT = 500
+CHECKS_PER_PR = 5
+ITERATIONS = 5
+
+
+async def _seed(session: AsyncSession) -> None:
+    """Insert one repository with PRs and check runs."""
+    repository = Repository(
+        url="https://github.com/bench/projections",
+        name="projections",
+        full_name="bench/projections",
+    )
+    session.add(repository)
+    await session.flush()
+
+    for number in range(PR_COUNT):
+        pr = PullRequest(
+            repository_id=repository.id,
+            pr_number=number + 1,
+            title=f"Benchmark PR {number}",
+            author="bench",
+            state=PRState.OPENED,
+            base_branch="main",
+            head_branch=f"feature/{number}",
+            base_sha="a" * 40,
+            head_sha="b" * 40,
+            url=f"https://github.com/bench/projections/pull/{number + 1}",
+            body="x" * 4096,
+            pr_metadata={"labels": ["bench"] * 20, "payload": "y" * 1024},
+        )
+        session.add(pr)
+        await session.flush()
+
+        for check in range(CHECKS_PER_PR):
+            session.add(
+                CheckRun(
+                    pr_id=pr.id,
+                    external_id=f"{number}-{check}",
+                    check_name=f"check-{check}",
+                    status=CheckStatus.COMPLETED,
+                    conclusion=CheckConclusion.SUCCESS,
+                    output_text="z" * 2048,
+                )
+            )
+
+    await session.flush()
+
+
+async def _measure(
+    session: AsyncSession, operation: Callable[[], Awaitable[list[Any]]]
+) -> tuple[float, int, int]:
+    """Return (seconds per call, peak bytes, row count) for an operation."""
+    elapsed = 0.0
+    peak = 0
+    count = 0
+
+    for _ in range(ITERATIONS):
+        session.expunge_all()
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = await operation()
+        elapsed += time.perf_counter() - start
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        count = len(results)
+        del results
+
+    return elapsed / ITERATIONS, peak, count
+
+
+@pytest.mark.integration
+@pytest.mark.performance
+@pytest.mark.slow
+async def test_poll_projection_vs_orm_loading(database_session: AsyncSession) -> None:
+    """
+    Why: Validate that projection rows reduce memory and latency on the poll path
+    What: Benchmarks ORM and projection variants of get_prs_needing_check
+    How: Measures mean wall time and tracemalloc peak for both variants and
+         asserts the projection returns the same rows with a lower peak
+    """
+    from src.repositories.pull_request import PullRequestRepository
+
+    await _seed(database_session)
+    repository = PullRequestRepository(database_session)
+    cutoff = datetime.now(UTC)
+
+    orm_time, orm_peak, orm_count = await _measure(
+        database_session, lambda: repository.get_prs_needing_check(cutoff)
+    )
+    row_time, row_peak, row_count = await _measure(
+        database_session, lambda: repository.get_prs_needing_check_rows(cutoff)
+    )
+
+    print(
+        f"\nget_prs_needing_check over {PR_COUNT} PRs:"
+        f"\n  ORM entities: {orm_time * 1000:.1f} ms, peak {orm_peak / 1024:.0f} KiB"
+        f"\n  projections:  {row_time * 1000:.1f} ms, peak {row_peak / 1024:.0f} KiB"
+        f"\n  speedup {orm_time / row_time:.1f}x, "
+        f"memory {orm_peak / max(row_peak, 1):.1f}x smaller"
+    )
+
+    assert orm_count == row_count == PR_COUNT
+    assert row_peak < orm_peak
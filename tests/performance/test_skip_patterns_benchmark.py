@@ -0,0 +1,85 @@
+"""
+Benchmark for skip-pattern filtering of pull request and check run pages.
+
+Why: Skip patterns are evaluated for every pull request and check run on
+     every poll, so per-pattern glob matching multiplies with both the number
+     of payloads and the number of patterns
+What: Compares the compiled SkipFilter with matching each pattern through
+      fnmatch on pages of check runs and pull requests
+How: Builds 100 check name patterns and 100 label patterns, filters pages of
+     10,000 payloads with both approaches and checks they agree
+"""
+
+import fnmatch
+import time
+from typing import Any
+
+import pytest
+
+from src.config.skip_patterns import compile_skip_patterns
+
+PATTERN_COUNT = 100
+PAGE_SIZE = 10_000
+
+
+def _naive_skips_check(name: str, patterns: list[str]) -> bool:
+    """Match a check name against each pattern in turn."""
+    return any(fnmatch.fnmatchcase(name.lower(), p.lower()) for p in patterns)
+
+
+def _naive_skips_pull(pull: dict[str, Any], patterns: list[str]) -> bool:
+    """Match every label of a pull request against each pattern in turn."""
+    return any(
+        fnmatch.fnmatchcase(label["name"].lower(), p.lower())
+        for label in pull["labels"]
+        for p in patterns
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_compiled_skip_filter_throughput() -> None:
+    """
+    Why: Validate that compiled matching scales with many patterns
+    What: Benchmarks compiled and per-pattern filtering of large pages
+    How: Times both approaches on the same pages and compares results
+    """
+    check_patterns = [f"suite-{n}/*" for n in range(PATTERN_COUNT // 2)] + [
+        f"check-{n}" for n in range(PATTERN_COUNT // 2)
+    ]
+    label_patterns = [f"label-{n}" for n in range(PATTERN_COUNT)]
+    checks = [{"name": f"suite-{n % 200}/job-{n}"} for n in range(PAGE_SIZE)]
+    pulls = [
+        {"number": n, "labels": [{"name": f"label-{n % 300}"}, {"name": "bug"}]}
+        for n in range(PAGE_SIZE)
+    ]
+
+    start = time.perf_counter()
+    skip = compile_skip_patterns(
+        {"check_names": check_patterns, "pr_labels": label_patterns}
+    )
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    kept_checks = skip.filter_check_runs(checks)
+    kept_pulls = skip.filter_pull_requests(pulls)
+    compiled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive_checks = [
+        c for c in checks if not _naive_skips_check(c["name"], check_patterns)
+    ]
+    naive_pulls = [p for p in pulls if not _naive_skips_pull(p, label_patterns)]
+    naive = time.perf_counter() - start
+
+    print(
+        f"\nFiltering {PAGE_SIZE} check runs and {PAGE_SIZE} pull requests"
+        f" against {PATTERN_COUNT} patterns each:"
+        f"\n  compile:             {compile_time * 1000:.1f} ms"
+        f"\n  compiled filter:     {compiled * 1000:.1f} ms"
+        f"\n  fnmatch per pattern: {naive * 1000:.1f} ms"
+    )
+
+    assert kept_checks == naive_checks
+    assert kept_pulls == naive_pulls
+    assert compiled < naive
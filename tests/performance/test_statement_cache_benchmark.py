@@ -0,0 +1,130 @@
+"""
+Benchmark for prebuilt hot-path statements versus per-call construction.
+
+Why: Lookups like get_by_external_id run for every webhook and poll cycle, so
+     the client-side CPU spent building select() constructs and generating
+     their cache keys adds up
+What: Compares per-call CPU time of the previous inline query construction
+      with the prebuilt bindparam statements now used by the repositories,
+      and reports the compiled cache hit ratio
+How: Seeds PostgreSQL with a PR and check runs, then times many lookups of
+     each variant with time.process_time so waiting on the server is excluded
+"""
+
+import time
+from collections.abc import Awaitable, Callable
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.database.connection import DatabaseConnectionManager
+from src.models.check_run import CheckRun
+from src.models.enums import CheckConclusion, CheckStatus, PRState
+from src.models.pull_request import PullRequest
+from src.models.repository import Repository
+
+CALLS = 2_000
+CHECK_COUNT = 10
+
+
+async def _seed(session: AsyncSession) -> None:
+    """Insert one repository and PR with a few check runs."""
+    repository = Repository(
+        url="https://github.com/bench/statements",
+        name="statements",
+        full_name="bench/statements",
+    )
+    session.add(repository)
+    await session.flush()
+
+    pr = PullRequest(
+        repository_id=repository.id,
+        pr_number=1,
+        title="Benchmark PR",
+        author="bench",
+        state=PRState.OPENED,
+        base_branch="main",
+        head_branch="feature/statements",
+        base_sha="a" * 40,
+        head_sha="b" * 40,
+        url="https://github.com/bench/statements/pull/1",
+    )
+    session.add(pr)
+    await session.flush()
+
+    for number in range(CHECK_COUNT):
+        session.add(
+            CheckRun(
+                pr_id=pr.id,
+                external_id=str(number),
+                check_name=f"check-{number}",
+                status=CheckStatus.COMPLETED,
+                conclusion=CheckConclusion.SUCCESS,
+            )
+        )
+    await session.flush()
+
+
+async def _cpu_per_call(operation: Callable[[int], Awaitable[object]]) -> float:
+    """Return client CPU seconds per call of operation over CALLS calls."""
+    start = time.process_time()
+    for number in range(CALLS):
+        await operation(number % CHECK_COUNT)
+    return (time.process_time() - start) / CALLS
+
+
+@pytest.mark.integration
+@pytest.mark.performance
+@pytest.mark.slow
+async def test_prebuilt_statements_vs_inline_construction(
+    connection_manager: DatabaseConnectionManager, database_session: AsyncSession
+) -> None:
+    """
+    Why: Validate that prebuilt statements lower per-call CPU on hot lookups
+    What: Benchmarks inline construction against get_by_external_id
+    How: Times both variants over the same lookups and reports CPU per call
+         and the compiled cache hit ratio
+    """
+    from src.repositories.check_run import CheckRunRepository
+
+    await _seed(database_session)
+    repository = CheckRunRepository(database_session)
+
+    async def inline(number: int) -> CheckRun | None:
+        query = (
+            select(CheckRun)
+            .where(CheckRun.external_id == str(number))
+            .options(
+                selectinload(CheckRun.pull_request),
+                selectinload(CheckRun.analysis_results),
+            )
+        )
+        result = await database_session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def prebuilt(number: int) -> CheckRun | None:
+        return await repository.get_by_external_id(str(number))
+
+    # Warm the compiled cache and prepared statements for both variants
+    await inline(0)
+    await prebuilt(0)
+
+    inline_cpu = await _cpu_per_call(inline)
+    prebuilt_cpu = await _cpu_per_call(prebuilt)
+
+    instrumentation = connection_manager.instrumentation
+    hit_ratio = (
+        instrumentation.compile_cache.hit_ratio if instrumentation is not None else None
+    )
+    print(
+        f"\nget_by_external_id CPU per call over {CALLS} calls:"
+        f"\n  inline construction: {inline_cpu * 1e6:.0f} us"
+        f"\n  prebuilt statement:  {prebuilt_cpu * 1e6:.0f} us"
+        f"\n  saved {(1 - prebuilt_cpu / inline_cpu) * 100:.0f}%, "
+        f"compiled cache hit ratio {hit_ratio}"
+    )
+
+    assert await prebuilt(3) is not None
+    assert prebuilt_cpu < inline_cpu
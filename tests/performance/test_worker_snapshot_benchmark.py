@@ -0,0 +1,101 @@
+"""
+Benchmark for configuration loading at worker process startup.
+
+Why: Every worker process parses the YAML file and validates every model
+     before its first task, so with many workers and repositories the same
+     configuration is validated over and over
+What: Compares 50 fresh worker processes loading the configuration file in
+      full with loading a snapshot exported by the parent
+How: Writes a configuration with 2,000 repositories, exports a snapshot,
+     then starts one process per worker in each mode and sums the time each
+     spends loading configuration
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.config.manager import ConfigurationManager
+from src.config.utils import create_minimal_config
+
+REPOSITORY_COUNT = 2_000
+WORKER_COUNT = 50
+
+
+def _write_config(path: Path) -> None:
+    """Write a configuration file with REPOSITORY_COUNT repositories."""
+    document = create_minimal_config().model_dump(mode="json")
+    template = document["repositories"][0]
+    document["repositories"] = [
+        {**template, "url": f"https://github.com/bench/repo-{number}"}
+        for number in range(REPOSITORY_COUNT)
+    ]
+    path.write_text(yaml.safe_dump(document))
+
+
+def _worker_startup(config_path: str, snapshot_path: str | None) -> float:
+    """Load configuration as a fresh worker and return the seconds it took."""
+    start = time.perf_counter()
+    manager = ConfigurationManager()
+    if snapshot_path is None:
+        manager.load_configuration(config_path)
+    else:
+        manager.load_snapshot(snapshot_path, config_path=config_path)
+    assert len(manager.config.repositories) == REPOSITORY_COUNT
+    return time.perf_counter() - start
+
+
+def _start_workers(config_path: Path, snapshot_path: Path | None) -> float:
+    """Start WORKER_COUNT processes and return their summed load time."""
+    with ProcessPoolExecutor(
+        max_workers=min(8, os.cpu_count() or 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        max_tasks_per_child=1,
+    ) as pool:
+        futures = [
+            pool.submit(
+                _worker_startup,
+                str(config_path),
+                str(snapshot_path) if snapshot_path else None,
+            )
+            for _ in range(WORKER_COUNT)
+        ]
+        return sum(future.result() for future in futures)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_worker_startup_from_snapshot(tmp_path: Path) -> None:
+    """
+    Why: Validate that snapshots remove validation from worker startup
+    What: Benchmarks full loads and snapshot loads in fresh processes
+    How: Starts the same number of workers in each mode and compares
+    """
+    config_path = tmp_path / "config.yaml"
+    _write_config(config_path)
+
+    start = time.perf_counter()
+    parent = ConfigurationManager()
+    parent.load_configuration(str(config_path))
+    snapshot_path = parent.export_snapshot(tmp_path / "config.snapshot")
+    export = time.perf_counter() - start
+
+    full = _start_workers(config_path, None)
+    snapshot = _start_workers(config_path, snapshot_path)
+
+    print(
+        f"\nConfiguration load time of {WORKER_COUNT} workers"
+        f" with {REPOSITORY_COUNT} repositories:"
+        f"\n  parent load and export: {export * 1000:.0f} ms"
+        f"\n  full load:              {full * 1000:.0f} ms total,"
+        f" {full / WORKER_COUNT * 1000:.0f} ms per worker"
+        f"\n  snapshot:               {snapshot * 1000:.0f} ms total,"
+        f" {snapshot / WORKER_COUNT * 1000:.0f} ms per worker"
+    )
+
+    assert snapshot < full / 2
@@ -0,0 +1,349 @@
+"""Unit tests for concurrent configuration connectivity checks.
+
+Probes run against local stand-in servers: an aiohttp application standing
+in for the LLM, Slack, Telegram and webhook APIs, and a minimal RESP server
+standing in for Redis.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import yaml
+from aiohttp import web
+
+from src.config.tools.connectivity import (
+    ConnectivityChecker,
+    Probe,
+    ServiceEndpoints,
+    check_database,
+    check_redis,
+)
+from src.config.tools.validate import ConfigurationValidator
+
+SLOW_DELAY = 0.3
+
+
+def stand_in_app() -> web.Application:
+    """Create an application answering like the probed services."""
+
+    async def anthropic(request: web.Request) -> web.Response:
+        if request.headers.get("x-api-key") != "sk-ant-valid-key":
+            return web.json_response({}, status=401)
+        return web.json_response({}, status=400)
+
+    async def openai(request: web.Request) -> web.Response:
+        if request.headers.get("Authorization") != "Bearer sk-openai-valid":
+            return web.json_response({}, status=401)
+        return web.json_response({"data": []})
+
+    async def telegram(request: web.Request) -> web.Response:
+        return web.json_response({"ok": request.match_info["token"] == "123:abc"})
+
+    async def slow_webhook(request: web.Request) -> web.Response:
+        await asyncio.sleep(SLOW_DELAY)
+        return web.Response()
+
+    async def failing_webhook(request: web.Request) -> web.Response:
+        return web.Response(status=503)
+
+    async def hanging_webhook(request: web.Request) -> web.Response:
+        await asyncio.sleep(30)
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get("/v1/messages", anthropic)
+    app.router.add_get("/v1/models", openai)
+    app.router.add_get("/bot{token}/getMe", telegram)
+    app.router.add_route("*", "/slow", slow_webhook)
+    app.router.add_route("*", "/failing", failing_webhook)
+    app.router.add_route("*", "/hanging", hanging_webhook)
+    return app
+
+
+@pytest.fixture
+async def http_server() -> AsyncIterator[str]:
+    """Serve the stand-in application on a free local port."""
+    runner = web.AppRunner(stand_in_app(), shutdown_timeout=0.1)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.fixture
+async def redis_server() -> AsyncIterator[str]:
+    """Serve a minimal RESP server answering PING with PONG."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while header := await reader.readline():
+                args = []
+                for _ in range(int(header[1:])):
+                    await reader.readline()  # $<length>
+                    args.append((await reader.readline()).strip().upper())
+                writer.write(b"+PONG\r\n" if args[:1] == [b"PING"] else b"+OK\r\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"redis://127.0.0.1:{port}/0"
+    server.close()
+    await server.wait_closed()
+
+
+def write_config(tmp_path: Path, data: dict) -> str:
+    """Write a configuration document and return its path."""
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(data))
+    return str(path)
+
+
+class TestConnectivityChecker:
+    """Tests for ConnectivityChecker concurrency, timeouts and reporting."""
+
+    async def test_probes_run_concurrently(self):
+        """
+        Why: Sequential probes made validation take minutes with many
+             channels
+        What: Tests that probes run concurrently, so total time is close to
+              the slowest probe rather than the sum
+        How: Runs ten probes sleeping 0.2s each and checks total duration
+        """
+
+        async def slow_check():
+            await asyncio.sleep(0.2)
+
+        probes = [Probe(f"probe {i}", "notification", slow_check) for i in range(10)]
+
+        report = await ConnectivityChecker(timeout=5).run(probes)
+
+        assert report.ok
+        assert [r.status for r in report.results] == ["passed"] * 10
+        assert report.duration < 1.0
+
+    async def test_timeouts_and_failures_are_reported(self):
+        """
+        Why: One hanging service must not block the others or the pipeline
+        What: Tests that slow probes time out individually and failures keep
+              their message and severity
+        How: Runs a hanging, a failing and a passing probe with a short timeout
+        """
+
+        async def hang():
+            await asyncio.sleep(30)
+
+        async def fail():
+            raise ValueError("connection refused")
+
+        async def succeed():
+            return None
+
+        report = await ConnectivityChecker(timeout=0.1).run(
+            [
+                Probe("hanging", "queue", hang, "error"),
+                Probe("failing", "llm", fail),
+                Probe("passing", "llm", succeed),
+            ]
+        )
+
+        hanging, failing, passing = report.results
+        assert hanging.status == "timeout"
+        assert hanging.severity == "error"
+        assert failing.status == "failed"
+        assert failing.message == "connection refused"
+        assert passing.status == "passed"
+        assert not report.ok
+        assert report.duration < 1.0
+
+        summary = report.to_dict()
+        assert summary["probe_count"] == 3
+        assert summary["status_counts"] == {"timeout": 1, "failed": 1, "passed": 1}
+        assert summary["probes"][0]["name"] == "hanging"  # slowest first
+
+
+class TestServiceChecks:
+    """Tests for the database and queue checks against stand-ins."""
+
+    async def test_redis_ping(self, redis_server):
+        """
+        Why: Queue connectivity must be verified with a real protocol round trip
+        What: Tests that check_redis succeeds against a server answering PING
+        How: Runs check_redis against the local RESP stand-in
+        """
+        await check_redis(redis_server)
+
+    async def test_redis_unreachable(self, unused_tcp_port):
+        """
+        Why: An unreachable queue must be reported as a failure
+        What: Tests that check_redis raises when nothing listens on the port
+        How: Runs check_redis against an unused local port
+        """
+        with pytest.raises(Exception):  # noqa: B017 - redis connection error
+            await check_redis(f"redis://127.0.0.1:{unused_tcp_port}/0")
+
+    async def test_database_uses_health_check(self):
+        """
+        Why: The database check used to be skipped entirely
+        What: Tests that check_database runs the connection manager health
+              check with an asyncpg URL and closes the engine
+        How: Patches health_check and close and inspects the manager
+        """
+        with (
+            patch(
+                "src.database.connection.DatabaseConnectionManager.health_check",
+                new_callable=AsyncMock,
+                return_value=True,
+            ) as health_check,
+            patch(
+                "src.database.connection.DatabaseConnectionManager.close",
+                new_callable=AsyncMock,
+            ) as close,
+        ):
+            await check_database("postgresql://user:pw@localhost:5432/app")
+
+        health_check.assert_awaited_once()
+        close.assert_awaited_once()
+
+    async def test_database_unhealthy(self, unused_tcp_port):
+        """
+        Why: A database that cannot be reached must fail the validation
+        What: Tests that check_database raises when the health check fails
+        How: Points check_database at an unused local port
+        """
+        url = f"postgresql+asyncpg://user:pw@127.0.0.1:{unused_tcp_port}/app"
+
+        with pytest.raises(ValueError, match="health check"):
+            await check_database(url, connect_timeout=1)
+
+
+class TestValidatorConnectivity:
+    """Tests for connectivity validation in the validate CLI.
+
+    The validator runs its own event loop, so it is called from a worker
+    thread while the stand-in servers keep serving on the test's loop.
+    """
+
+    async def test_validate_connectivity_against_stand_ins(
+        self, tmp_path, http_server, redis_server, monkeypatch
+    ):
+        """
+        Why: Validation must report every service's outcome and timing
+        What: Tests that the validator probes all configured services
+              concurrently and maps results to errors and warnings
+        How: Configures LLM providers, notification channels and a queue
+             pointing at stand-in servers and runs connectivity validation
+        """
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-valid-key")
+        config_path = write_config(
+            tmp_path,
+            {
+                "queue": {"url": redis_server},
+                "llm": {
+                    "anthropic": {
+                        "provider": "anthropic",
+                        "api_key": "${ANTHROPIC_API_KEY}",
+                    },
+                    "openai": {"provider": "openai", "api_key": "sk-openai-bad"},
+                },
+                "notification": {
+                    "channels": [
+                        {"provider": "telegram", "telegram_bot_token": "123:abc"},
+                        *(
+                            {
+                                "provider": "webhook",
+                                "webhook_url": f"{http_server}/slow",
+                            }
+                            for _ in range(5)
+                        ),
+                        {
+                            "provider": "slack",
+                            "slack_webhook_url": f"{http_server}/failing",
+                        },
+                    ]
+                },
+            },
+        )
+        endpoints = ServiceEndpoints(
+            anthropic=http_server, openai=http_server, telegram=http_server
+        )
+        validator = ConfigurationValidator(config_path, endpoints=endpoints)
+        validator.config_data = yaml.safe_load(Path(config_path).read_text())
+
+        start = time.perf_counter()
+        await asyncio.to_thread(validator._validate_connectivity)
+        elapsed = time.perf_counter() - start
+
+        report = validator.connectivity_report
+        assert report is not None
+        statuses = {r.name: r.status for r in report.results}
+        assert statuses["Queue"] == "passed"
+        assert statuses["LLM provider 'anthropic'"] == "passed"
+        assert statuses["LLM provider 'openai'"] == "failed"
+        assert statuses["Notification channel 'telegram'"] == "passed"
+        assert statuses["Notification channel 'slack'"] == "failed"
+        assert len(report.results) == 10
+
+        assert validator.errors == []
+        assert validator.warnings == [
+            "LLM provider 'openai' connectivity test failed: OpenAI API key is invalid",
+            "Notification channel 'slack' connectivity test failed: "
+            "Slack webhook returned status 503",
+        ]
+        # Five slow webhooks overlap instead of adding up
+        assert elapsed < 5 * SLOW_DELAY
+
+    async def test_hanging_service_times_out(self, tmp_path, http_server):
+        """
+        Why: A hanging endpoint must not stall the deploy pipeline
+        What: Tests that a hanging webhook times out after probe_timeout
+        How: Configures a webhook that never answers and a short timeout
+        """
+        config_path = write_config(
+            tmp_path,
+            {
+                "notification": {
+                    "channels": [
+                        {"provider": "webhook", "webhook_url": f"{http_server}/hanging"}
+                    ]
+                }
+            },
+        )
+        validator = ConfigurationValidator(config_path, probe_timeout=0.2)
+        validator.config_data = yaml.safe_load(Path(config_path).read_text())
+
+        await asyncio.to_thread(validator._validate_connectivity)
+
+        assert validator.connectivity_report is not None
+        (result,) = validator.connectivity_report.results
+        assert result.status == "timeout"
+        assert validator.warnings == [
+            "Notification channel 'webhook' connectivity test failed: "
+            "timed out after 0.2s"
+        ]
+
+    async def test_unreachable_database_is_an_error(self, tmp_path, unused_tcp_port):
+        """
+        Why: Database connectivity failures must fail validation
+        What: Tests that an unreachable database is reported as an error
+        How: Configures a database URL on an unused local port
+        """
+        config_path = write_config(
+            tmp_path,
+            {"database": {"url": f"postgresql://u:p@127.0.0.1:{unused_tcp_port}/db"}},
+        )
+        validator = ConfigurationValidator(config_path, probe_timeout=5)
+        validator.config_data = yaml.safe_load(Path(config_path).read_text())
+
+        await asyncio.to_thread(validator._validate_connectivity)
+
+        assert validator.errors == [
+            "Database connectivity test failed: health check query failed"
+        ]
@@ -0,0 +1,190 @@
+"""Unit tests for structural configuration diffs.
+
+This module tests keyed list matching, move detection for keyed and unkeyed
+lists, and compiled path patterns used to classify changes.
+"""
+
+from src.config.tools.diff import (
+    ConfigurationDiffer,
+    DiffSeverity,
+    DiffType,
+    compile_path_patterns,
+)
+
+
+def repository(name, **fields):
+    """Build a repository entry keyed by its URL."""
+    return {"url": f"https://github.com/org/{name}", **fields}
+
+
+class TestKeyedLists:
+    """Tests for lists matched by an identifying field."""
+
+    def test_insert_at_top_reports_one_addition(self):
+        """
+        Why: Positional comparison reports every shifted entry as changed
+        What: Tests that inserting a repository first yields one ADDED diff
+        How: Prepends a repository to a list of 50 and compares
+        """
+        old = {"repositories": [repository(f"repo-{i}") for i in range(50)]}
+        new = {"repositories": [repository("new"), *old["repositories"]]}
+
+        diffs = ConfigurationDiffer().compare_dicts(old, new)
+
+        assert [(d.diff_type, d.path) for d in diffs] == [
+            (DiffType.ADDED, "repositories[url=https://github.com/org/new]")
+        ]
+
+    def test_changed_field_is_addressed_by_key(self):
+        """
+        Why: Paths must identify the entry independently of its position
+        What: Tests that a modified field uses the keyed item path
+        How: Changes one repository's threshold and inspects the diff path
+        """
+        old = {"repositories": [repository("a", threshold=3), repository("b")]}
+        new = {"repositories": [repository("a", threshold=5), repository("b")]}
+
+        diffs = ConfigurationDiffer().compare_dicts(old, new)
+
+        assert len(diffs) == 1
+        assert diffs[0].path == "repositories[url=https://github.com/org/a].threshold"
+        assert (diffs[0].old_value, diffs[0].new_value) == (3, 5)
+
+    def test_duplicate_keys_fall_back_to_positions(self):
+        """
+        Why: Keys that do not identify entries uniquely cannot be matched
+        What: Tests that duplicate URLs keep positional comparison
+        How: Compares lists containing the same URL twice
+        """
+        old = {"repositories": [repository("a", x=1), repository("a", x=2)]}
+        new = {"repositories": [repository("a", x=1), repository("a", x=3)]}
+
+        diffs = ConfigurationDiffer().compare_dicts(old, new)
+
+        assert [d.path for d in diffs] == ["repositories[1].x"]
+
+    def test_custom_list_keys(self):
+        """
+        Why: Callers may key other lists or disable keying altogether
+        What: Tests list_keys overrides, including an empty mapping
+        How: Compares prepended lists with and without a key for the path
+        """
+        old = {"items": [{"id": 1}, {"id": 2}]}
+        new = {"items": [{"id": 0}, {"id": 1}, {"id": 2}]}
+
+        keyed = ConfigurationDiffer(list_keys={"items": "id"}).compare_dicts(old, new)
+        positional = ConfigurationDiffer(list_keys={}).compare_dicts(old, new)
+
+        assert [d.path for d in keyed] == ["items[id=0]"]
+        assert [(d.diff_type, d.path) for d in positional] == [
+            (DiffType.CHANGED, "items")
+        ]
+
+    def test_moves_detected_when_enabled(self):
+        """
+        Why: Reordering keyed entries is invisible without move detection
+        What: Tests that only entries outside the common order are moved
+        How: Moves the last repository to the front with detect_moves on/off
+        """
+        old = {"repositories": [repository(name) for name in "abcd"]}
+        new = {"repositories": [repository(name) for name in "dabc"]}
+
+        assert ConfigurationDiffer().compare_dicts(old, new) == []
+
+        diffs = ConfigurationDiffer(detect_moves=True).compare_dicts(old, new)
+
+        assert len(diffs) == 1
+        assert diffs[0].diff_type == DiffType.MOVED
+        assert diffs[0].path == "repositories[url=https://github.com/org/d]"
+        assert (diffs[0].old_value, diffs[0].new_value) == (3, 0)
+
+
+class TestAlignedLists:
+    """Tests for content-aligned comparison of unkeyed lists."""
+
+    def test_insert_reports_one_addition(self):
+        """
+        Why: Aligned comparison must not cascade an insert through the list
+        What: Tests that an inserted item is the only diff
+        How: Inserts a value in the middle of a list of strings
+        """
+        old = {"labels": ["a", "b", "c", "d"]}
+        new = {"labels": ["a", "b", "x", "c", "d"]}
+
+        diffs = ConfigurationDiffer(detect_moves=True).compare_dicts(old, new)
+
+        assert [(d.diff_type, d.path, d.new_value) for d in diffs] == [
+            (DiffType.ADDED, "labels[2]", "x")
+        ]
+
+    def test_identical_item_moved(self):
+        """
+        Why: An item removed in one place and added in another was moved
+        What: Tests that the pair is reported as a single MOVED diff
+        How: Moves the first item of a list to the end
+        """
+        old = {"labels": ["a", "b", "c"]}
+        new = {"labels": ["b", "c", "a"]}
+
+        diffs = ConfigurationDiffer(detect_moves=True).compare_dicts(old, new)
+
+        assert [(d.diff_type, d.path, d.old_value, d.new_value) for d in diffs] == [
+            (DiffType.MOVED, "labels[2]", 0, 2)
+        ]
+
+    def test_replaced_item_compared_in_place(self):
+        """
+        Why: Edited entries should show the changed field, not remove and add
+        What: Tests that a replaced item is compared field by field
+        How: Changes one field of the middle mapping in an unkeyed list
+        """
+        old = {"rules": [{"n": 1}, {"n": 2, "on": True}, {"n": 3}]}
+        new = {"rules": [{"n": 1}, {"n": 2, "on": False}, {"n": 3}]}
+
+        diffs = ConfigurationDiffer(detect_moves=True).compare_dicts(old, new)
+
+        assert [d.path for d in diffs] == ["rules[1].on"]
+
+
+class TestPathPatterns:
+    """Tests for compiled path pattern matching."""
+
+    def test_wildcard_matches_one_segment(self):
+        """
+        Why: "*" stands for exactly one key or list item
+        What: Tests matching of keys, indexes and keyed list items
+        How: Matches paths against a compiled set of patterns
+        """
+        matcher = compile_path_patterns(
+            frozenset({"llm.*.api_key", "repositories.*.auth_token"})
+        )
+
+        assert matcher.fullmatch("llm.anthropic.api_key")
+        assert matcher.fullmatch("repositories[0].auth_token")
+        assert matcher.fullmatch("repositories[url=https://x.y/o/r].auth_token")
+        assert not matcher.fullmatch("llm.anthropic.model")
+        assert not matcher.fullmatch("llm.a.b.api_key")
+
+    def test_empty_patterns_match_nothing(self):
+        """
+        Why: An empty pattern set must not match every path
+        What: Tests the compiled expression for no patterns
+        How: Matches an empty and a non-empty path
+        """
+        matcher = compile_path_patterns(frozenset())
+
+        assert not matcher.fullmatch("")
+        assert not matcher.fullmatch("database.url")
+
+    def test_repository_token_removal_is_critical(self):
+        """
+        Why: Tokens of repository entries are security-sensitive
+        What: Tests that removing a keyed repository's token is critical
+        How: Drops auth_token from one repository entry
+        """
+        old = {"repositories": [repository("a", auth_token="one")]}
+        new = {"repositories": [repository("a")]}
+
+        diffs = ConfigurationDiffer().compare_dicts(old, new)
+
+        assert diffs[0].severity == DiffSeverity.CRITICAL
@@ -0,0 +1,215 @@
+"""Unit tests for environment variable substitution.
+
+This module tests the single-pass substitution engine, its memoized lookups
+and dependency tracking, the loader's pre-substituted validation, and the
+manager's targeted reload when referenced variables change.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from src.config.environment import EnvironmentSubstitutor
+from src.config.exceptions import EnvironmentVariableError
+from src.config.lazy import ConfigDocumentCache
+from src.config.loader import ConfigurationLoader
+from src.config.manager import ConfigurationManager
+from src.config.tools.validate import ConfigurationValidator
+from src.config.utils import create_minimal_config
+
+REPO_URL = "https://github.com/example/repo"
+
+
+def make_document(repository_count=2):
+    """Create a document whose repositories share one token variable."""
+    document = create_minimal_config(repo_url=REPO_URL).model_dump(mode="json")
+    document["database"]["url"] = "${TEST_DB_URL:sqlite:///./test.db}"
+    document["repositories"] = [
+        {"url": f"https://github.com/org/repo-{number}", "auth_token": "${TEST_TOKEN}"}
+        for number in range(repository_count)
+    ]
+    return document
+
+
+class TestEnvironmentSubstitutor:
+    """Tests for substitution, memoization and dependency tracking."""
+
+    def test_substitutes_and_records_dependencies(self):
+        """
+        Why: Changed variables must map to the configuration keys using them
+        What: Tests values are replaced and every reference path is recorded
+        How: Substitutes a document referencing one variable twice
+        """
+        environment = EnvironmentSubstitutor({"TOKEN": "secret"})
+
+        result = environment.substitute(
+            {"a": "${TOKEN}", "b": [{"c": "x-${TOKEN}-${PORT:80}"}], "d": 1}
+        )
+
+        assert result.value == {"a": "secret", "b": [{"c": "x-secret-80"}], "d": 1}
+        assert result.dependencies == {"TOKEN": {"a", "b[0].c"}, "PORT": {"b[0].c"}}
+        assert result.defaulted == {"PORT"}
+        assert result.paths_for(["PORT"]) == {"b[0].c"}
+
+    def test_lookups_memoized_per_generation(self):
+        """
+        Why: A token shared by thousands of repositories should be read once
+        What: Tests lookups are memoized until refresh() sees a change
+        How: Counts environment reads and changes a variable between loads
+        """
+        environ = {"TOKEN": "one"}
+        reads = []
+
+        class CountingEnviron(dict):
+            def get(self, key, default=None):
+                reads.append(key)
+                return super().get(key, default)
+
+        environment = EnvironmentSubstitutor(CountingEnviron(environ))
+        environment.substitute([f"${{TOKEN}}-{i}" for i in range(100)])
+
+        assert reads == ["TOKEN"]
+        assert environment.refresh() == frozenset()
+
+        environment._environ["TOKEN"] = "two"  # type: ignore[index]
+
+        assert environment.refresh() == {"TOKEN"}
+        assert environment.generation == 1
+        assert environment.substitute("${TOKEN}").value == "two"
+
+    def test_deferred_sections_are_only_scanned(self):
+        """
+        Why: Lazily validated sections are substituted when materialized
+        What: Tests deferred keys keep references but record dependencies
+        How: Substitutes with a deferred top-level key
+        """
+        environment = EnvironmentSubstitutor({"TOKEN": "secret"})
+
+        result = environment.substitute(
+            {"repositories": [{"auth_token": "${TOKEN}"}], "x": "${TOKEN}"},
+            deferred=["repositories"],
+        )
+
+        assert result.value["repositories"] == [{"auth_token": "${TOKEN}"}]
+        assert result.value["x"] == "secret"
+        assert result.paths_for(["TOKEN"]) == {"repositories[0].auth_token", "x"}
+
+    def test_missing_variables(self):
+        """
+        Why: Validation tools report every missing variable instead of failing
+        What: Tests strict mode raises and non-strict mode collects names
+        How: Substitutes a reference to an unset variable both ways
+        """
+        environment = EnvironmentSubstitutor({})
+
+        with pytest.raises(EnvironmentVariableError, match="MISSING"):
+            environment.substitute({"a": "${MISSING}"})
+
+        result = environment.substitute({"a": "${MISSING}"}, strict=False)
+        assert result.value == {"a": ""}
+        assert result.missing == {"MISSING"}
+
+
+class TestLoaderSubstitution:
+    """Tests for substituting once at load time."""
+
+    def test_models_do_not_substitute_again(self, monkeypatch):
+        """
+        Why: Every model used to substitute its own values during validation
+        What: Tests the loader substitutes each reference exactly once
+        How: Counts substitution passes while loading a document
+        """
+        monkeypatch.setenv("TEST_TOKEN", "token")
+        document = make_document()
+        calls = []
+        original = EnvironmentSubstitutor.substitute
+
+        def counting(self, document, *args, **kwargs):
+            calls.append(document)
+            return original(self, document, *args, **kwargs)
+
+        with patch.object(EnvironmentSubstitutor, "substitute", counting):
+            config = ConfigurationLoader().load_from_dict(document, validate=False)
+
+        assert len(calls) == 1
+        assert [repo.auth_token for repo in config.repositories] == ["token", "token"]
+        assert config.database.url == "sqlite:///./test.db"
+
+    def test_lazy_load_substitutes_deferred_sections(self, tmp_path, monkeypatch):
+        """
+        Why: Deferred repositories must still see environment values
+        What: Tests materialized repositories are substituted
+        How: Loads lazily and accesses the repositories
+        """
+        monkeypatch.setenv("TEST_TOKEN", "token")
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(make_document()))
+        loader = ConfigurationLoader()
+
+        config = loader.load_lazy(path, cache=ConfigDocumentCache(tmp_path / "c"))
+
+        assert config.deferred_sections == {"repositories"}
+        assert config.repositories[1].auth_token == "token"
+        assert loader.env_dependencies["TEST_TOKEN"] == {
+            "repositories[0].auth_token",
+            "repositories[1].auth_token",
+        }
+
+
+class TestRefreshEnvironment:
+    """Tests for the manager's targeted environment reloads."""
+
+    @pytest.fixture
+    def manager(self, tmp_path, monkeypatch):
+        """Create a manager loaded from a file using TEST_TOKEN."""
+        monkeypatch.setenv("TEST_TOKEN", "one")
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(make_document()))
+        manager = ConfigurationManager()
+        manager.load_configuration(str(path), validate=False)
+        return manager
+
+    def test_reload_only_when_referenced_variable_changes(self, manager, monkeypatch):
+        """
+        Why: Rotating a secret should not require re-reading the file
+        What: Tests unrelated changes are ignored and referenced ones applied
+        How: Changes an unreferenced then a referenced variable
+        """
+        monkeypatch.setenv("UNRELATED_VARIABLE", "x")
+
+        assert manager.refresh_environment() is None
+
+        monkeypatch.setenv("TEST_TOKEN", "two")
+        change = manager.refresh_environment()
+
+        assert change is not None
+        assert change.sections == {"repositories"}
+        assert manager.config.repositories[0].auth_token == "two"
+        assert manager.refresh_environment() is None
+
+
+class TestValidateTool:
+    """Tests for the validate tool's environment checks."""
+
+    def test_reports_missing_and_sensitive_defaults(self, tmp_path, monkeypatch):
+        """
+        Why: The tool must report all problems from one substitution pass
+        What: Tests missing variables are errors and secret defaults warnings
+        How: Validates a file referencing unset and defaulted variables
+        """
+        monkeypatch.delenv("TEST_TOKEN", raising=False)
+        document = make_document()
+        document["llm"]["anthropic"]["api_key"] = "${TEST_API_KEY:dev-key}"
+        path = tmp_path / "config.yaml"
+        path.write_text(yaml.safe_dump(document))
+
+        errors, warnings, _ = ConfigurationValidator(str(path)).validate_all(
+            check_schema=False, check_security=False, check_performance=False
+        )
+
+        assert errors == ["Missing required environment variable: TEST_TOKEN"]
+        assert warnings == [
+            "Environment variable 'TEST_API_KEY' has a default value "
+            "but appears to contain sensitive data"
+        ]
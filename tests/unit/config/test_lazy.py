@@ -0,0 +1,222 @@
+"""Unit tests for lazy configuration loading.
+
+This module tests deferred validation of the repositories section, the
+on-disk document cache keyed by file hash, and the manager's lazy loading
+mode.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from src.config.exceptions import ConfigurationValidationError
+from src.config.lazy import ConfigDocumentCache, LazyConfig
+from src.config.loader import ConfigurationLoader
+from src.config.manager import ConfigurationManager
+from src.config.models import Config, RepositoryConfig
+from src.config.utils import create_minimal_config
+
+
+def make_document(repository_count: int = 3, **repository: Any) -> dict[str, Any]:
+    """Create a configuration document with several repositories."""
+    document = create_minimal_config().model_dump(mode="json")
+    template = {**document["repositories"][0], **repository}
+    document["repositories"] = [
+        {**template, "url": f"https://github.com/org/repo-{number}"}
+        for number in range(repository_count)
+    ]
+    return document
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Write a configuration file with three repositories."""
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(make_document()))
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ConfigDocumentCache:
+    """Create a document cache in a temporary directory."""
+    return ConfigDocumentCache(tmp_path / "cache")
+
+
+class TestLazyConfig:
+    """Tests for deferred section validation."""
+
+    def test_repositories_validate_on_first_access(self):
+        """
+        Why: Validating thousands of repositories dominates startup time
+        What: Tests repositories stay raw until accessed, then are models
+        How: Builds a LazyConfig and inspects it before and after access
+        """
+        config = LazyConfig.from_document(make_document())
+
+        assert config.deferred_sections == {"repositories"}
+        assert isinstance(config, Config)
+
+        repositories = config.repositories
+
+        assert all(isinstance(repo, RepositoryConfig) for repo in repositories)
+        assert repositories[1].url == "https://github.com/org/repo-1"
+        assert config.deferred_sections == frozenset()
+
+    def test_environment_variables_substituted_on_access(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Why: Deferred sections must resolve ${VAR} references like eager ones
+        What: Tests tokens are substituted when repositories materialize
+        How: References an environment variable from every repository token
+        """
+        monkeypatch.setenv("LAZY_TEST_TOKEN", "ghp_from_env")
+        config = LazyConfig.from_document(
+            make_document(auth_token="${LAZY_TEST_TOKEN}")
+        )
+
+        assert config.repositories[0].auth_token == "ghp_from_env"
+
+    def test_invalid_repositories_fail_on_access(self):
+        """
+        Why: Deferring validation must not let invalid entries through
+        What: Tests an invalid entry raises when the section is first read
+             and the section stays deferred for a later retry
+        How: Uses a non-GitHub URL in one repository
+        """
+        document = make_document()
+        document["repositories"][2]["url"] = "https://gitlab.com/org/repo"
+        config = LazyConfig.from_document(document)
+
+        with pytest.raises(ConfigurationValidationError, match="repositories"):
+            _ = config.repositories
+        assert config.deferred_sections == {"repositories"}
+
+    def test_empty_repositories_fail_at_load(self):
+        """
+        Why: Cheap structural checks should still fail fast at startup
+        What: Tests an empty repositories list is rejected eagerly
+        How: Builds a LazyConfig from a document without repositories
+        """
+        document = make_document()
+        document["repositories"] = []
+
+        with pytest.raises(ValueError, match="At least one repository"):
+            LazyConfig.from_document(document)
+
+    def test_dump_materializes_deferred_sections(self):
+        """
+        Why: Diffs and exports must see the whole configuration
+        What: Tests model_dump matches an eagerly loaded configuration
+        How: Compares dumps of lazy and eager configs from one document
+        """
+        document = make_document()
+
+        lazy = LazyConfig.from_document(document)
+
+        assert lazy.model_dump() == Config.model_validate(document).model_dump()
+
+
+class TestConfigDocumentCache:
+    """Tests for the parsed document cache."""
+
+    def test_reuses_parse_until_file_changes(
+        self, config_file: Path, cache: ConfigDocumentCache
+    ):
+        """
+        Why: Unchanged files should skip YAML parsing on the next start
+        What: Tests a second load hits and an edited file misses
+        How: Loads the file twice, edits it and loads again
+        """
+        first = cache.load(config_file)
+        second = ConfigDocumentCache(cache.cache_dir).load(config_file)
+        assert first == second
+
+        document = make_document(repository_count=1)
+        config_file.write_text(yaml.safe_dump(document))
+        reloaded = ConfigDocumentCache(cache.cache_dir)
+
+        assert len(reloaded.load(config_file)["repositories"]) == 1
+        assert reloaded.misses == 1
+
+    def test_cache_keeps_environment_references(
+        self,
+        tmp_path: Path,
+        cache: ConfigDocumentCache,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        Why: Secrets injected from the environment must not be written to disk
+        What: Tests the cache entry holds the unsubstituted reference
+        How: Loads a file referencing a set variable and reads the entry
+        """
+        monkeypatch.setenv("LAZY_SECRET_TOKEN", "super-secret-value")
+        path = tmp_path / "config.yaml"
+        path.write_text(
+            yaml.safe_dump(make_document(auth_token="${LAZY_SECRET_TOKEN}"))
+        )
+
+        cache.load(path)
+
+        (entry,) = cache.cache_dir.iterdir()
+        content = entry.read_bytes()
+        assert b"${LAZY_SECRET_TOKEN}" in content
+        assert b"super-secret-value" not in content
+
+    def test_corrupt_entry_is_ignored(
+        self, config_file: Path, cache: ConfigDocumentCache
+    ):
+        """
+        Why: A truncated cache file must never break startup
+        What: Tests a corrupt entry falls back to parsing the file
+        How: Overwrites the entry with garbage and loads again
+        """
+        cache.load(config_file)
+        (entry,) = cache.cache_dir.iterdir()
+        entry.write_bytes(b"\x00garbage")
+
+        document = cache.load(config_file)
+
+        assert len(document["repositories"]) == 3
+        assert cache.misses == 2
+
+
+class TestLazyLoading:
+    """Tests for lazy loading through the loader and manager."""
+
+    def test_loader_load_lazy(self, config_file: Path, cache: ConfigDocumentCache):
+        """
+        Why: The loader must record the file so reloads and watching work
+        What: Tests load_lazy returns a LazyConfig and sets the file path
+        How: Loads the configuration file lazily
+        """
+        loader = ConfigurationLoader()
+
+        config = loader.load_lazy(config_file, cache=cache)
+
+        assert isinstance(config, LazyConfig)
+        assert loader.config_file_path == config_file.resolve()
+
+    def test_manager_defers_repositories_until_used(
+        self,
+        config_file: Path,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        Why: Short-lived tools often never read repositories
+        What: Tests lazy loading validates the rest, serves gets without
+              materializing, and materializes on repository access
+        How: Loads lazily through the manager and reads values
+        """
+        monkeypatch.setenv("AGENTIC_CONFIG_CACHE_DIR", str(tmp_path / "cache"))
+        manager = ConfigurationManager()
+
+        manager.load_configuration(str(config_file), lazy=True)
+
+        assert manager.get("database.url") == "sqlite:///./test.db"
+        assert manager.config.deferred_sections == {"repositories"}  # type: ignore[attr-defined]
+        assert len(manager.get_repository_configs()) == 3
+        assert manager.get("repositories")[0].url == "https://github.com/org/repo-0"
@@ -0,0 +1,157 @@
+"""Unit tests for configuration metric storage primitives.
+
+This module tests the quantile sketch and the per-thread sharded counters and
+sketches backing ConfigurationMetrics.
+"""
+
+import random
+import threading
+
+import pytest
+
+from src.config.metric_store import QuantileSketch, ShardedCounter, ShardedSketches
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch accuracy and merging."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """
+        Why: Reported percentiles must be trustworthy without keeping samples
+        What: Tests that quantile estimates stay within the configured
+              relative accuracy of the exact values
+        How: Adds random durations and compares estimates with sorted data
+        """
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-3, 1) for _ in range(10000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for q in (0.5, 0.9, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+        assert sketch.count == 10000
+        assert sketch.min == values[0]
+        assert sketch.max == values[-1]
+
+    def test_merge_matches_single_sketch(self):
+        """
+        Why: Per-thread sketches are merged on read, so merging must not
+             change estimates
+        What: Tests that merging two sketches equals adding all values to one
+        How: Splits values across two sketches, merges and compares
+        """
+        values = [i / 100 for i in range(1, 1001)]
+        single = QuantileSketch()
+        left, right = QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            single.add(value)
+            (left if i % 2 else right).add(value)
+
+        left.merge(right)
+
+        assert left.count == single.count
+        assert left.total == pytest.approx(single.total)
+        for q in (0.1, 0.5, 0.95):
+            assert left.quantile(q) == single.quantile(q)
+
+    def test_memory_is_bounded(self):
+        """
+        Why: A sketch must not grow with the range of observed values
+        What: Tests that buckets are collapsed beyond max_buckets while high
+              quantiles stay accurate
+        How: Adds values spanning many orders of magnitude to a small sketch
+        """
+        sketch = QuantileSketch(max_buckets=64)
+        for exponent in range(-6, 6):
+            for i in range(1, 100):
+                sketch.add(i * 10.0**exponent)
+
+        assert len(sketch._buckets) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(8.7e6, rel=0.011)
+
+    def test_empty_and_weighted(self):
+        """
+        Why: Empty sketches and sampled (weighted) values must be handled
+        What: Tests empty summaries and weights counting as observations
+        How: Checks an empty sketch, then adds a weighted value
+        """
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        assert sketch.summary() == {"count": 0}
+
+        sketch.add(0.2, weight=10)
+        assert sketch.count == 10
+        assert sketch.summary()["sum"] == pytest.approx(2.0)
+
+
+class TestShardedMetrics:
+    """Tests for per-thread sharded counters and sketches."""
+
+    def test_concurrent_increments_are_exact(self):
+        """
+        Why: Lock-free counters must not lose increments under contention
+        What: Tests that concurrent increments from many threads add up
+        How: Increments from 8 threads while another thread reads totals
+        """
+        counter: ShardedCounter[str] = ShardedCounter()
+        start = threading.Barrier(9)
+
+        def increment():
+            start.wait()
+            for _ in range(5000):
+                counter.increment("reads")
+
+        def read():
+            start.wait()
+            for _ in range(200):
+                counter.snapshot()
+
+        threads = [threading.Thread(target=increment) for _ in range(8)]
+        threads.append(threading.Thread(target=read))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter["reads"] == 40000
+        assert "writes" not in counter
+
+    def test_set_and_clear(self):
+        """
+        Why: Some counters are reported as absolute values and all are reset
+        What: Tests that set() replaces the total and clear() empties it
+        How: Increments, sets, then clears a counter
+        """
+        counter: ShardedCounter[str] = ShardedCounter()
+        counter.increment("evictions", 5)
+        counter.set("evictions", 2)
+        assert counter["evictions"] == 2
+
+        counter.clear()
+        assert len(counter) == 0
+
+    def test_sketches_merge_across_threads(self):
+        """
+        Why: Timings recorded on different threads form one distribution
+        What: Tests that per-thread sketches are merged on read
+        How: Observes values from several threads and checks the merged sketch
+        """
+        sketches = ShardedSketches()
+
+        def observe(offset: int):
+            for i in range(100):
+                sketches.observe("load", (offset + i) / 1000)
+
+        threads = [threading.Thread(target=observe, args=(n * 100,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        merged = sketches["load"]
+        assert merged.count == 400
+        assert merged.min == 0
+        assert merged.max == pytest.approx(0.399)
@@ -4,6 +4,7 @@ This module tests the configuration metrics and monitoring system including
 event tracking, performance metrics, error monitoring, and health status.
 """
 
+import sys
 import threading
 import time
 from unittest.mock import patch
@@ -110,7 +111,9 @@ class TestConfigurationMetrics:
         # Check histograms
         histogram_key = f"{operation}_duration"
         assert histogram_key in metrics._histograms
-        assert metrics._histograms[histogram_key] == [duration]
+        sketch = metrics._histograms[histogram_key]
+        assert sketch.count == 1
+        assert sketch.min == sketch.max == duration
 
         # Check success counter
         assert metrics._counters[f"{operation}_success"] == 1
@@ -478,6 +481,176 @@ class TestConfigurationMetrics:
         assert len(errors) == 0
         assert metrics._counters["thread_test"] == 50  # 10 operations x 5 threads
 
+    def test_timing_reads_during_concurrent_writes(self):
+        """
+        Why: Timings are appended without the lock while readers iterate them
+        What: Tests statistics and summaries never fail while threads record
+        How: Runs writer threads and reads both views until the writers
+             finish, switching threads often to make interleaving likely
+        """
+        metrics = ConfigurationMetrics(timing_window=100)
+        errors = []
+        writing = threading.Event()
+        writing.set()
+
+        def write():
+            for i in range(20000):
+                metrics.record_timing("load", i / 1000)
+
+        def read():
+            try:
+                while writing.is_set():
+                    metrics.get_timing_statistics("load")
+                    metrics.get_metrics_summary()
+            except Exception as e:
+                errors.append(e)
+
+        writers = [threading.Thread(target=write) for _ in range(4)]
+        readers = [threading.Thread(target=read) for _ in range(2)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in writers + readers:
+                thread.start()
+            for thread in writers:
+                thread.join()
+        finally:
+            writing.clear()
+            sys.setswitchinterval(interval)
+        for thread in readers:
+            thread.join()
+
+        assert errors == []
+        assert metrics.get_timing_statistics("load")["count"] == 100
+
+    def test_sampled_events_keep_exact_counts(self):
+        """
+        Why: Sampling high-volume events must cut recording cost without
+             making event counts wrong
+        What: Tests that a sampled event type logs one in N events and
+              weights sampled access patterns and timings by N
+        How: Configures rates of 10, records 100 of each and checks counts,
+             log length and weighted totals
+        """
+        metrics = ConfigurationMetrics(
+            sample_rates={
+                ConfigurationEvent.CACHE_HIT: 10,
+                ConfigurationEvent.ACCESS_PATTERN: 10,
+                ConfigurationEvent.OPERATION_TIMED: 10,
+            }
+        )
+
+        for _ in range(100):
+            metrics.record_event(ConfigurationEvent.CACHE_HIT)
+            metrics.record_access_pattern("system.environment")
+            metrics.record_timing("lookup", 0.01)
+
+        assert metrics._event_counts[ConfigurationEvent.CACHE_HIT] == 100
+        assert len(metrics._events) == 10
+        assert metrics._access_patterns["system.environment"]["count"] == 100
+        assert metrics._counters["lookup_success"] == 100
+        assert len(metrics._timers["lookup"]) == 10
+        assert metrics._histograms["lookup_duration"].count == 100
+
+    def test_invalid_sample_rate_rejected(self):
+        """
+        Why: A rate below one has no meaning and would divide by zero
+        What: Tests that sample rates must be at least 1
+        How: Creates metrics with a rate of 0 and expects ValueError
+        """
+        with pytest.raises(ValueError, match="at least 1"):
+            ConfigurationMetrics(sample_rates={ConfigurationEvent.CACHE_HIT: 0})
+
+    def test_timings_are_bounded(self):
+        """
+        Why: Timing storage must not grow with the number of operations
+        What: Tests that raw timings are kept in a fixed window while the
+              distribution still covers every timing
+        How: Records more timings than the window and checks window size,
+             sketch count and quantile summary
+        """
+        metrics = ConfigurationMetrics(timing_window=50)
+
+        for i in range(1, 1001):
+            metrics.record_timing("load", i / 1000)
+
+        assert len(metrics._timers["load"]) == 50
+        assert metrics.get_timing_statistics("load")["min"] == 0.951
+
+        distribution = metrics.get_metrics_summary()["timing_distributions"][
+            "load_duration"
+        ]
+        assert distribution["count"] == 1000
+        assert distribution["p50"] == pytest.approx(0.5, rel=0.02)
+        assert distribution["p99"] == pytest.approx(0.99, rel=0.02)
+
+    def test_counters_from_exited_threads_are_kept(self):
+        """
+        Why: Per-thread counter shards must not lose counts when their
+             thread exits, nor pile up with short-lived threads
+        What: Tests that counts from finished threads are retained and their
+              shards retired
+        How: Increments from many short-lived threads and checks totals and
+             the number of live shards
+        """
+        metrics = ConfigurationMetrics()
+
+        for _ in range(20):
+            thread = threading.Thread(
+                target=metrics.increment_counter, args=("short_lived",)
+            )
+            thread.start()
+            thread.join()
+
+        assert metrics._counters["short_lived"] == 20
+        assert len(metrics._counters._shards) <= 1
+
+    def test_export_prometheus(self):
+        """
+        Why: Metrics need to be scrapeable by Prometheus without extra
+             dependencies
+        What: Tests that counters, events, gauges and timing summaries are
+              rendered in the text exposition format
+        How: Records metrics, exports them and checks families and samples
+        """
+        metrics = ConfigurationMetrics()
+        metrics.increment_counter("reloads", 3)
+        metrics.set_gauge("watched files", 2)
+        metrics.record_event(ConfigurationEvent.CONFIG_LOADED)
+        metrics.record_error("parse", 'bad "value"')
+        metrics.record_timing("load_config", 0.5)
+
+        text = metrics.export_prometheus()
+
+        assert "# TYPE agentic_config_reloads_total counter" in text
+        assert "agentic_config_reloads_total 3" in text
+        assert 'agentic_config_events_total{event="config_loaded"} 1' in text
+        assert 'agentic_config_errors_total{type="parse"} 1' in text
+        assert "# TYPE agentic_config_watched_files gauge" in text
+        assert "agentic_config_watched_files 2" in text
+        assert 'agentic_config_health_status{status="healthy"} 1' in text
+        assert "# TYPE agentic_config_load_config_duration_seconds summary" in text
+        assert 'agentic_config_load_config_duration_seconds{quantile="0.5"}' in text
+        assert "agentic_config_load_config_duration_seconds_count 1" in text
+        assert text.endswith("\n")
+        assert "# EOF" not in text
+
+    def test_export_openmetrics(self):
+        """
+        Why: OpenMetrics scrapers expect counter families without the
+             "_total" suffix and an end marker
+        What: Tests the OpenMetrics variant of the exposition
+        How: Exports with openmetrics=True and checks TYPE line and EOF
+        """
+        metrics = ConfigurationMetrics()
+        metrics.increment_counter("reloads")
+
+        text = metrics.export_prometheus(openmetrics=True)
+
+        assert "# TYPE agentic_config_reloads counter" in text
+        assert "agentic_config_reloads_total 1" in text
+        assert text.endswith("# EOF\n")
+
 
 class TestGlobalMetricsFunctions:
     """Tests for global metrics convenience functions."""
@@ -0,0 +1,209 @@
+"""Unit tests for per-repository configuration resolution.
+
+This module tests merging file entries, defaults and database overrides,
+memoization keyed by snapshot and override versions, and invalidation on
+reloads, override changes and repository updates.
+"""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.config.manager import ConfigurationManager
+from src.config.resolver import (
+    RepositoryConfigResolver,
+    apply_overrides,
+    get_repository_config_resolver,
+)
+from src.config.utils import create_minimal_config
+from src.models.repository import Repository
+from src.repositories.repository import RepositoryRepository
+
+REPO_URL = "https://github.com/example/repo"
+
+
+@pytest.fixture
+def manager():
+    """Create a manager with the minimal configuration loaded."""
+    return ConfigurationManager(create_minimal_config(repo_url=REPO_URL))
+
+
+@pytest.fixture
+def resolver(manager):
+    """Create a resolver reading from the manager."""
+    resolver = RepositoryConfigResolver(manager)
+    yield resolver
+    resolver.close()
+
+
+class TestApplyOverrides:
+    """Tests for deep-merging overrides."""
+
+    def test_nested_and_dotted_keys(self):
+        """
+        Why: Overrides change single settings without restating sections
+        What: Tests nested mappings merge and dotted keys address nested values
+        How: Applies both kinds of override and checks untouched values remain
+        """
+        base = {"a": {"x": 1, "y": 2}, "b": {"z": 3}, "c": [1]}
+
+        merged = apply_overrides(base, {"a": {"x": 10}, "b.z": 30, "d.e": 4})
+
+        assert merged == {
+            "a": {"x": 10, "y": 2},
+            "b": {"z": 30},
+            "c": [1],
+            "d": {"e": 4},
+        }
+        assert base["a"] == {"x": 1, "y": 2}
+
+    def test_untouched_branches_are_shared(self):
+        """
+        Why: Copying the whole configuration per repository wastes memory
+        What: Tests branches without overrides are not copied
+        How: Compares identities of overridden and untouched branches
+        """
+        base = {"a": {"x": 1}, "b": {"y": 2}}
+
+        merged = apply_overrides(base, {"a.x": 5})
+
+        assert merged["b"] is base["b"]
+        assert merged["a"] is not base["a"]
+
+
+class TestRepositoryConfigResolver:
+    """Tests for resolving and memoizing repository settings."""
+
+    def test_file_entry_with_override(self, resolver):
+        """
+        Why: Database overrides must win over the configuration file
+        What: Tests the effective value merges file entry and override
+        How: Resolves a configured repository with a nested override
+        """
+        settings = resolver.resolve_url(
+            REPO_URL, {"fix_categories": {"lint": {"enabled": False}}}
+        )
+
+        assert settings.get("auth_token") == "test-token"
+        assert settings.get("fix_categories.lint.enabled") is False
+        assert settings.get("fix_categories.lint.confidence_threshold") == 60
+        assert settings.config["polling_interval"] == 300
+
+    def test_unconfigured_repository_gets_defaults(self, resolver):
+        """
+        Why: Repositories added in the database may have no file entry
+        What: Tests defaults are used and no token is invented
+        How: Resolves a URL missing from the configuration
+        """
+        settings = resolver.resolve_url("https://github.com/other/repo")
+
+        assert settings.get("failure_threshold") == 5
+        assert settings.get("skip_patterns.authors") == ["dependabot[bot]"]
+        assert "auth_token" not in settings.values
+
+    def test_memoized_until_version_changes(self, resolver):
+        """
+        Why: Hot per-PR decisions must not repeat the merge
+        What: Tests the same settings object is returned for the same versions
+        How: Resolves twice, then with a different override version
+        """
+        first = resolver.resolve_url(REPO_URL, {"is_critical": True}, 1)
+
+        assert resolver.resolve_url(REPO_URL, {"is_critical": True}, 1) is first
+
+        second = resolver.resolve_url(REPO_URL, {"is_critical": False}, 2)
+        assert second is not first
+        assert second.get("is_critical") is False
+
+    def test_invalidate_discards_entry(self, resolver):
+        """
+        Why: An override changed in place keeps its override version
+        What: Tests invalidate() forces the next resolve to merge again
+        How: Mutates an override, invalidates the URL and resolves again
+        """
+        override = {"timezone": "UTC"}
+        resolver.resolve_url(REPO_URL, override)
+        override["timezone"] = "Europe/Berlin"
+
+        assert resolver.resolve_url(REPO_URL, override).get("timezone") == "UTC"
+
+        resolver.invalidate(REPO_URL)
+
+        assert resolver.resolve_url(REPO_URL, override).get("timezone") == (
+            "Europe/Berlin"
+        )
+
+    def test_reload_resolves_again(self, manager, resolver):
+        """
+        Why: A reload must be visible without restarting workers
+        What: Tests applying a new configuration yields new settings
+        How: Applies a configuration with another failure threshold
+        """
+        before = resolver.resolve_url(REPO_URL)
+        config = create_minimal_config(repo_url=REPO_URL)
+        config.repositories[0].failure_threshold = 9
+
+        manager.apply_configuration(config)
+        after = resolver.resolve_url(REPO_URL)
+
+        assert before.get("failure_threshold") == 5
+        assert after.get("failure_threshold") == 9
+
+    def test_resolve_uses_row_override_and_updated_at(self, resolver):
+        """
+        Why: Overrides written by other processes arrive with a new updated_at
+        What: Tests a reloaded row with a new updated_at is resolved again
+        How: Resolves a row, changes its override and timestamp, resolves again
+        """
+        repository = Repository(url=REPO_URL, name="repo")
+        repository.config_override = {"polling_interval": 600}
+        repository.updated_at = datetime(2024, 1, 1, tzinfo=UTC)
+
+        assert resolver.resolve(repository).get("polling_interval") == 600
+
+        repository.config_override = {"polling_interval": 900}
+        repository.updated_at = datetime(2024, 1, 2, tzinfo=UTC)
+
+        assert resolver.resolve(repository).get("polling_interval") == 900
+
+
+class TestOverrideInvalidation:
+    """Tests for invalidation from the repository layer."""
+
+    async def test_set_config_override_invalidates_global_resolver(self):
+        """
+        Why: Overrides set through the repository must apply immediately
+        What: Tests set_config_override invalidates the repository's entry
+        How: Sets an override with a mocked session and checks the invalidation
+        """
+        repository = Repository(url=REPO_URL, name="repo")
+        session = AsyncMock()
+        session.get = AsyncMock(return_value=repository)
+
+        with patch(
+            "src.repositories.repository.invalidate_repository_config"
+        ) as invalidate:
+            await RepositoryRepository(session).set_config_override(
+                uuid.uuid4(), "is_critical", True
+            )
+
+        invalidate.assert_called_once_with(REPO_URL)
+        assert repository.config_override == {"is_critical": True}
+
+    def test_global_resolver_follows_global_manager(self, manager, monkeypatch):
+        """
+        Why: Reinitializing the global manager must not leave a stale resolver
+        What: Tests the global resolver is rebuilt for a new global manager
+        How: Patches the global manager and compares resolver instances
+        """
+        monkeypatch.setattr("src.config.resolver._global_resolver", None)
+        with patch("src.config.resolver.get_config_manager", return_value=manager):
+            resolver = get_repository_config_resolver()
+            assert get_repository_config_resolver() is resolver
+            assert resolver.manager is manager
+
+        other = ConfigurationManager(create_minimal_config())
+        with patch("src.config.resolver.get_config_manager", return_value=other):
+            assert get_repository_config_resolver().manager is other
@@ -0,0 +1,168 @@
+"""Unit tests for compiled skip-pattern matching.
+
+This module tests glob translation, literal and wildcard matching, skip
+decisions on GitHub pull request and check run payloads, the batch filters,
+and caching of compiled filters.
+"""
+
+import re
+
+from src.config.manager import ConfigurationManager
+from src.config.resolver import RepositoryConfigResolver
+from src.config.skip_patterns import (
+    PatternSet,
+    compile_skip_patterns,
+    glob_to_regex,
+)
+from src.config.utils import create_minimal_config
+
+
+def pull_request(number, author="octocat", labels=(), title="Fix bug"):
+    """Build a pull request payload as returned by the GitHub API."""
+    return {
+        "number": number,
+        "title": title,
+        "user": {"login": author},
+        "labels": [{"name": label} for label in labels],
+    }
+
+
+class TestPatternSet:
+    """Tests for compiled pattern sets."""
+
+    def test_glob_wildcards_only(self):
+        """
+        Why: Logins like "dependabot[bot]" contain glob metacharacters
+        What: Tests only "*" and "?" are wildcards and brackets are literal
+        How: Translates patterns and matches them with fullmatch
+        """
+        assert re.fullmatch(glob_to_regex("codecov/*"), "codecov/patch")
+        assert re.fullmatch(glob_to_regex("v?"), "v2")
+        assert re.fullmatch(glob_to_regex("dependabot[bot]"), "dependabot[bot]")
+        assert not re.fullmatch(glob_to_regex("dependabot[bot]"), "dependabotb")
+
+    def test_literals_and_globs_ignore_case(self):
+        """
+        Why: GitHub labels and logins are case-insensitive
+        What: Tests literal and wildcard patterns match regardless of case
+        How: Compiles mixed patterns and matches differently cased values
+        """
+        patterns = PatternSet.compile(["WIP", "codecov/*"])
+
+        assert patterns.literals == frozenset({"wip"})
+        assert patterns.matches("wip")
+        assert patterns.matches("Codecov/Project")
+        assert not patterns.matches("wip-2")
+        assert not patterns.matches("ci/codecov/patch")
+
+    def test_empty_set_is_false(self):
+        """
+        Why: Categories without patterns should be skipped entirely
+        What: Tests an empty pattern set is falsy and matches nothing
+        How: Compiles no patterns
+        """
+        patterns = PatternSet.compile([])
+
+        assert not patterns
+        assert not patterns.matches("anything")
+
+
+class TestSkipFilter:
+    """Tests for skip decisions on GitHub payloads."""
+
+    def test_pull_request_skip_reasons(self):
+        """
+        Why: Skipped pull requests should be traceable to a pattern category
+        What: Tests author, label and title patterns and their reasons
+        How: Evaluates payloads matching each category and one matching none
+        """
+        skip = compile_skip_patterns(
+            {
+                "authors": ["dependabot[bot]"],
+                "pr_labels": ["wip"],
+                "pr_titles": ["[skip]*"],
+            }
+        )
+
+        reason = skip.pull_request_skip_reason
+
+        assert reason(pull_request(1, author="dependabot[bot]")) == "authors"
+        assert reason(pull_request(2, labels=["WIP"])) == "pr_labels"
+        assert reason(pull_request(3, title="[skip] Update docs")) == "pr_titles"
+        assert reason(pull_request(4)) is None
+
+    def test_filter_pages(self):
+        """
+        Why: The monitor filters whole API pages per poll
+        What: Tests the batch filters keep unmatched payloads in order
+        How: Filters pages of pull requests and check runs
+        """
+        skip = compile_skip_patterns(
+            {"pr_labels": ["draft"], "check_names": ["codecov/*", "license/cla"]}
+        )
+        pulls = [pull_request(1), pull_request(2, labels=["draft"]), pull_request(3)]
+        checks = [
+            {"name": "tests"},
+            {"name": "codecov/patch"},
+            {"name": "License/CLA"},
+            {"name": "lint"},
+        ]
+
+        assert [pr["number"] for pr in skip.filter_pull_requests(pulls)] == [1, 3]
+        assert [c["name"] for c in skip.filter_check_runs(checks)] == [
+            "tests",
+            "lint",
+        ]
+        assert skip.skips_check_run({"name": "codecov/project"})
+        assert not skip.skips_check_run({"name": "tests"})
+
+    def test_no_patterns_keep_everything(self):
+        """
+        Why: Repositories with skip_patterns set to null skip nothing
+        What: Tests a filter compiled from None keeps every payload
+        How: Filters payloads that would match the default patterns
+        """
+        skip = compile_skip_patterns(None)
+
+        assert skip.filter_pull_requests([pull_request(1, labels=["wip"])])
+        assert skip.filter_check_runs([{"name": "codecov/patch"}])
+
+
+class TestCompiledFilterCache:
+    """Tests for sharing compiled filters."""
+
+    def test_same_patterns_share_filter(self):
+        """
+        Why: Compiling per repository and snapshot would repeat identical work
+        What: Tests equal patterns in any order return the same filter
+        How: Compiles reordered patterns and compares identities
+        """
+        first = compile_skip_patterns({"authors": ["a", "b"], "unknown": ["x"]})
+        second = compile_skip_patterns({"authors": ["b", "a"]})
+
+        assert first is second
+
+    def test_resolved_settings_carry_filter(self):
+        """
+        Why: Per-PR decisions read the filter from memoized repository settings
+        What: Tests resolved settings expose the repository's compiled filter
+        How: Resolves the minimal config's repository with a label override
+        """
+        manager = ConfigurationManager(create_minimal_config())
+        resolver = RepositoryConfigResolver(manager)
+
+        settings = resolver.resolve_url(
+            "https://github.com/example/repo",
+            {"skip_patterns.pr_labels": ["blocked"]},
+        )
+
+        assert settings.skip_filter.skips_pull_request(
+            pull_request(1, labels=["blocked"])
+        )
+        assert settings.skip_filter.skips_pull_request(
+            pull_request(2, author="dependabot[bot]")
+        )
+        assert not settings.skip_filter.skips_pull_request(
+            pull_request(3, labels=["wip"])
+        )
+        resolver.close()
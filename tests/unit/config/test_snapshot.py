@@ -0,0 +1,191 @@
+"""Unit tests for configuration snapshots and accessors.
+
+This module tests flattening configuration into immutable snapshots, atomic
+publication on reload and override changes, pre-resolved accessors, and
+sampled access metrics in the configuration manager.
+"""
+
+import threading
+
+import pytest
+
+from src.config.exceptions import ConfigurationError
+from src.config.manager import ConfigurationManager
+from src.config.snapshot import ConfigSnapshot, flatten_config
+from src.config.utils import create_minimal_config
+
+
+class TestConfigSnapshot:
+    """Tests for snapshot construction and lookups."""
+
+    def test_flatten_config_includes_nested_and_intermediate_keys(self):
+        """
+        Why: Reads must be a single mapping lookup for any dotted key
+        What: Tests leaf fields, sections and dict entries are all flattened
+        How: Flattens the minimal config and checks representative keys
+        """
+        config = create_minimal_config()
+
+        flat = flatten_config(config)
+
+        assert flat["database.url"] == config.database.url
+        assert flat["system.worker_timeout"] == config.system.worker_timeout
+        assert flat["database"] is config.database
+        assert flat["llm.anthropic.model"] == config.llm["anthropic"].model
+        assert flat["repositories"] is config.repositories
+
+    def test_snapshot_is_read_only_and_applies_overrides(self):
+        """
+        Why: Readers share snapshots across threads, so they must not change
+        What: Tests overrides take precedence and values cannot be mutated
+        How: Builds a snapshot with an override and attempts to assign a key
+        """
+        config = create_minimal_config()
+
+        snapshot = ConfigSnapshot.build(
+            config, version=1, overrides={"system.debug_mode": True}
+        )
+
+        assert snapshot.get("system.debug_mode") is True
+        assert snapshot.get("missing.key", "fallback") == "fallback"
+        with pytest.raises(TypeError):
+            snapshot.values["database.url"] = "changed"  # type: ignore[index]
+
+    def test_overrides_apply_to_ancestor_sections(self):
+        """
+        Why: Reading a section must agree with reading one of its keys
+        What: Tests an override shows in the key, its section and get_section
+        How: Overrides database.pool_size and reads it every way, then reverts
+        """
+        config = create_minimal_config()
+        manager = ConfigurationManager(config)
+        manager.get_database_config()
+
+        manager.set_override("database.pool_size", 7)
+
+        assert manager.get("database.pool_size") == 7
+        assert manager.get("database").pool_size == 7
+        assert manager.get_database_config()["pool_size"] == 7
+        assert config.database.pool_size == 10
+
+        manager.remove_override("database.pool_size")
+
+        assert manager.get("database").pool_size == 10
+        assert manager.get_database_config()["pool_size"] == 10
+
+    def test_section_override_replaces_descendant_keys(self):
+        """
+        Why: Replacing a whole section must not leave its old keys readable
+        What: Tests keys below an overridden section come from the new value
+        How: Builds a snapshot overriding database with a copied model
+        """
+        config = create_minimal_config()
+        database = config.database.model_copy(update={"pool_size": 3})
+
+        snapshot = ConfigSnapshot.build(
+            config, version=1, overrides={"database": database}
+        )
+
+        assert snapshot.get("database.pool_size") == 3
+        assert snapshot.get("database") is database
+
+
+class TestConfigAccessor:
+    """Tests for pre-resolved accessors on the manager."""
+
+    def test_accessor_follows_overrides(self):
+        """
+        Why: Accessors are resolved once but must see later changes
+        What: Tests the value changes inside an override context and reverts
+        How: Reads an accessor before, during and after override_context
+        """
+        config = create_minimal_config()
+        manager = ConfigurationManager(config)
+        timeout = manager.accessor("system.worker_timeout")
+
+        with manager.override_context({"system.worker_timeout": 5}):
+            assert timeout.get() == 5
+            assert manager.get("system.worker_timeout") == 5
+
+        assert timeout.get() == config.system.worker_timeout
+
+    def test_accessor_rereads_only_on_new_snapshot(self):
+        """
+        Why: Repeated reads on hot paths should not repeat the lookup
+        What: Tests the accessor keeps its resolved version until a publish
+        How: Compares accessor versions before and after an override change
+        """
+        manager = ConfigurationManager(create_minimal_config())
+        accessor = manager.accessor("database.url")
+        version = accessor.version
+
+        accessor.get()
+        assert accessor.version == version
+
+        manager.set_override("system.debug_mode", True)
+        accessor.get()
+        assert accessor.version == manager.snapshot.version > version
+
+    def test_accessor_rejects_unknown_keys(self):
+        """
+        Why: Typos in hot-path keys should fail at startup, not return None
+        What: Tests unknown keys raise unless a default is given
+        How: Resolves accessors for a missing key with and without default
+        """
+        manager = ConfigurationManager(create_minimal_config())
+
+        with pytest.raises(ConfigurationError, match="Unknown configuration key"):
+            manager.accessor("system.no_such_setting")
+        assert manager.accessor("system.no_such_setting", 30).get() == 30
+
+    def test_reads_during_reloads_see_complete_snapshots(self):
+        """
+        Why: Readers no longer lock, so publication must be atomic
+        What: Tests concurrent readers always see values from one snapshot
+        How: Flips two overrides together while threads read both keys
+        """
+        manager = ConfigurationManager(create_minimal_config())
+        manager.set_override("feature.a", 0)
+        manager.set_override("feature.b", 0)
+        torn: list[tuple[int, int]] = []
+        stop = threading.Event()
+
+        def read() -> None:
+            while not stop.is_set():
+                snapshot = manager.snapshot
+                pair = (snapshot.get("feature.a"), snapshot.get("feature.b"))
+                if pair[0] != pair[1]:
+                    torn.append(pair)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for value in range(1, 200):
+            with manager.override_context({"feature.a": value, "feature.b": value}):
+                pass
+        stop.set()
+        for reader in readers:
+            reader.join()
+
+        assert torn == []
+
+
+class TestSampledAccessMetrics:
+    """Tests for sampled access pattern recording."""
+
+    def test_reads_are_sampled_and_weighted(self):
+        """
+        Why: Recording every read adds lock contention to the hot path
+        What: Tests one in access_sample_rate reads is recorded, weighted so
+              the count still estimates the total
+        How: Performs 100 reads with a sample rate of 10
+        """
+        manager = ConfigurationManager(create_minimal_config(), access_sample_rate=10)
+        assert manager._metrics is not None
+
+        for _ in range(100):
+            manager.get("database.url")
+
+        pattern = manager._metrics._access_patterns["database.url"]
+        assert pattern["count"] == 100
+        assert manager._metrics._counters["access_read"] == 100
@@ -0,0 +1,268 @@
+"""Unit tests for configuration hot reload.
+
+This module tests diff-based configuration updates, selective cache
+invalidation, section subscribers, and the file watcher's change detection,
+debouncing and handling of invalid files.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+from src.config.cache import ConfigurationCache
+from src.config.exceptions import ConfigurationError
+from src.config.manager import ConfigurationManager
+from src.config.utils import create_minimal_config
+from src.config.watcher import ConfigChange, ConfigWatcher, config_section
+
+
+def write_config(path: Path, **changes: dict[str, Any]) -> None:
+    """Write the minimal config to path with per-section field changes."""
+    data = create_minimal_config().model_dump(mode="json")
+    for section, values in changes.items():
+        data[section].update(values)
+    path.write_text(yaml.safe_dump(data))
+    # Make the change visible to stat even within the same timestamp tick
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def config_file(tmp_path: Path) -> Path:
+    """Create a valid configuration file."""
+    path = tmp_path / "config.yaml"
+    write_config(path)
+    return path
+
+
+@pytest.fixture
+def manager(config_file: Path) -> ConfigurationManager:
+    """Create a manager loaded from the configuration file."""
+    manager = ConfigurationManager()
+    manager.load_configuration(str(config_file))
+    return manager
+
+
+def wait_for(condition: Any, timeout: float = 5.0) -> bool:
+    """Poll condition until it is true or timeout passes."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestApplyConfiguration:
+    """Tests for incremental configuration updates."""
+
+    def test_notifies_only_subscribers_of_changed_sections(
+        self, manager: ConfigurationManager
+    ):
+        """
+        Why: A webhook change must not make the database layer rebuild pools
+        What: Tests only subscribers of changed sections are called
+        How: Changes a notification field with database and notification
+             subscribers registered
+        """
+        database_changes: list[ConfigChange] = []
+        notification_changes: list[ConfigChange] = []
+        manager.subscribe(database_changes.append, sections=["database"])
+        manager.subscribe(notification_changes.append, sections=["notification"])
+        config = manager.config.model_copy(deep=True)
+        config.notification.escalation_delay = 600
+
+        change = manager.apply_configuration(config)
+
+        assert change.paths == ["notification.escalation_delay"]
+        assert change.sections == {"notification"}
+        assert database_changes == []
+        assert notification_changes == [change]
+        assert manager.get("notification.escalation_delay") == 600
+
+    def test_unchanged_configuration_is_a_no_op(self, manager: ConfigurationManager):
+        """
+        Why: Touching the file without edits should not disturb anything
+        What: Tests an equal configuration notifies nobody and keeps snapshots
+        How: Applies a copy of the current configuration
+        """
+        calls: list[ConfigChange] = []
+        manager.subscribe(calls.append)
+        version = manager.snapshot.version
+
+        change = manager.apply_configuration(manager.config.model_copy(deep=True))
+
+        assert change.diffs == []
+        assert calls == []
+        assert manager.snapshot.version == version
+
+    def test_unsubscribe_and_failing_subscribers(self, manager: ConfigurationManager):
+        """
+        Why: One broken subscriber must not block others or the reload
+        What: Tests failures are recorded and unsubscribed callbacks not called
+        How: Registers a raising, a removed and a recording subscriber
+        """
+
+        def broken(change: ConfigChange) -> None:
+            raise RuntimeError("subscriber failed")
+
+        removed: list[ConfigChange] = []
+        received: list[ConfigChange] = []
+        manager.subscribe(broken)
+        manager.subscribe(removed.append)()
+        manager.subscribe(received.append)
+        config = manager.config.model_copy(deep=True)
+        config.system.worker_timeout = 60
+
+        manager.apply_configuration(config)
+
+        assert removed == []
+        assert len(received) == 1
+        assert manager._metrics is not None
+        errors = manager._metrics.get_metrics_summary()["error_summary"]
+        assert errors["error_types"]["config_subscriber_error"] == 1
+
+
+class TestSelectiveInvalidation:
+    """Tests for diff-based cache invalidation."""
+
+    def test_update_config_keeps_unrelated_entries(self):
+        """
+        Why: Invalidating the whole cache on every reload causes miss storms
+        What: Tests only keys at, above or below changed paths are dropped
+        How: Warms several keys and sections, then updates one path
+        """
+        config = create_minimal_config()
+        cache = ConfigurationCache(config)
+        cache.get("database.url")
+        cache.get("queue.url")
+        cache.get_section("database")
+        cache.get_section("queue")
+        updated = config.model_copy(deep=True)
+        updated.database.url = "sqlite:///./other.db"
+
+        removed = cache.update_config(updated, ["database.url"])
+
+        assert removed == 2
+        assert "queue.url" in cache._cache
+        assert "section:queue" in cache._cache
+        assert "database.url" not in cache._cache
+        assert cache.get("database.url") == "sqlite:///./other.db"
+
+    def test_config_section_handles_list_paths(self):
+        """
+        Why: Diff paths for list items use index notation
+        What: Tests the section is taken before dots or brackets
+        How: Extracts sections from dotted and indexed paths
+        """
+        assert config_section("database.pool_size") == "database"
+        assert config_section("repositories[0].url") == "repositories"
+        assert config_section("default_llm_provider") == "default_llm_provider"
+
+
+class TestConfigWatcher:
+    """Tests for file change detection and reloads."""
+
+    def test_poll_detects_file_changes(
+        self, manager: ConfigurationManager, config_file: Path
+    ):
+        """
+        Why: The polling backend must notice edits without inotify
+        What: Tests poll reports a change once per modification
+        How: Polls before and after rewriting the file
+        """
+        watcher = ConfigWatcher(manager, config_file, backend="polling")
+
+        assert watcher.poll() is False
+        write_config(config_file, system={"worker_timeout": 42})
+        assert watcher.poll() is True
+        assert watcher.poll() is False
+
+    def test_invalid_file_keeps_current_configuration(
+        self, manager: ConfigurationManager, config_file: Path
+    ):
+        """
+        Why: A half-written or broken file must never replace a good config
+        What: Tests reload reports failure and leaves the config untouched
+        How: Writes invalid YAML and reloads
+        """
+        watcher = ConfigWatcher(manager, config_file, backend="polling")
+        config = manager.config
+        config_file.write_text("database: [unclosed")
+
+        assert watcher.reload() is None
+
+        assert manager.config is config
+        assert watcher.failures == 1
+        assert watcher.last_error
+
+    def test_environment_refresh_after_reload_keeps_file_changes(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Why: An environment refresh must substitute the live document, not
+             the one loaded at startup
+        What: Tests a hot-reloaded value survives a later environment refresh
+        How: Reloads an edited file, changes a referenced variable, refreshes
+        """
+        monkeypatch.setenv("TEST_WATCH_DB_URL", "sqlite:///./one.db")
+        config_file = tmp_path / "config.yaml"
+        url = "${TEST_WATCH_DB_URL}"
+        write_config(config_file, database={"url": url, "pool_size": 5})
+        manager = ConfigurationManager()
+        manager.load_configuration(str(config_file))
+        watcher = ConfigWatcher(manager, config_file, backend="polling")
+
+        write_config(config_file, database={"url": url, "pool_size": 17})
+        assert watcher.reload() is not None
+        assert manager.get("database.pool_size") == 17
+
+        monkeypatch.setenv("TEST_WATCH_DB_URL", "sqlite:///./two.db")
+        change = manager.refresh_environment()
+
+        assert change is not None
+        assert change.paths == ["database.url"]
+        assert manager.get("database.pool_size") == 17
+        assert manager.get("database.url") == "sqlite:///./two.db"
+
+    def test_debounced_background_reload(
+        self, manager: ConfigurationManager, config_file: Path
+    ):
+        """
+        Why: Editors write files in bursts that should cause one reload
+        What: Tests the running watcher applies the final content once
+        How: Rewrites the file three times in quick succession while watching
+        """
+        changes: list[ConfigChange] = []
+        manager.subscribe(changes.append, sections=["system"])
+        watcher = manager.start_watching(
+            backend="polling", poll_interval=0.01, debounce=0.2
+        )
+        try:
+            for timeout in (60, 90, 120):
+                write_config(config_file, system={"worker_timeout": timeout})
+                time.sleep(0.02)
+
+            assert wait_for(lambda: watcher.reloads >= 1)
+            time.sleep(0.3)
+        finally:
+            manager.stop_watching()
+
+        assert watcher.reloads == 1
+        assert [change.paths for change in changes] == [["system.worker_timeout"]]
+        assert manager.get("system.worker_timeout") == 120
+
+    def test_start_watching_requires_file(self):
+        """
+        Why: Configurations built in code have no file to follow
+        What: Tests a clear error instead of a watcher on nothing
+        How: Starts watching on a manager created from a config object
+        """
+        manager = ConfigurationManager(create_minimal_config())
+
+        with pytest.raises(ConfigurationError, match="No configuration file"):
+            manager.start_watching()
@@ -0,0 +1,150 @@
+"""Unit tests for binary configuration snapshots.
+
+This module tests round-tripping validated configuration through snapshot
+files, rejection of snapshots for another schema or a changed configuration
+file, and the manager's export and snapshot loading with full-load fallback.
+"""
+
+import pytest
+import yaml
+
+from src.config import worker_snapshot
+from src.config.exceptions import ConfigurationError
+from src.config.manager import ConfigurationManager
+from src.config.models import Config, FixCategory, LogLevel
+from src.config.utils import create_minimal_config
+from src.config.worker_snapshot import read_config_snapshot, write_config_snapshot
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a minimal configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.safe_dump(create_minimal_config().model_dump(mode="json")))
+    return path
+
+
+class TestSnapshotFile:
+    """Tests for writing and reading snapshot files."""
+
+    def test_round_trip_restores_models_and_enums(self, tmp_path):
+        """
+        Why: Workers must see exactly the configuration the parent validated
+        What: Tests the loaded configuration equals the written one
+        How: Writes a snapshot and compares values and nested types
+        """
+        config = create_minimal_config()
+        config.system.log_level = LogLevel.DEBUG
+        path = write_config_snapshot(config, tmp_path / "config.snapshot")
+
+        loaded = read_config_snapshot(path)
+
+        assert loaded == config
+        assert loaded is not None
+        assert loaded.system.log_level is LogLevel.DEBUG
+        assert FixCategory.LINT in loaded.repositories[0].fix_categories
+        assert loaded.model_fields_set == config.model_fields_set
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_loading_skips_validation(self, tmp_path, monkeypatch):
+        """
+        Why: Re-validating in every worker is the cost snapshots remove
+        What: Tests no model validation runs while reading a snapshot
+        How: Makes Config validation fail and reads a snapshot
+        """
+        path = write_config_snapshot(create_minimal_config(), tmp_path / "s")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("validated")
+
+        monkeypatch.setattr(Config, "model_validate", fail)
+        monkeypatch.setattr(Config, "__init__", fail)
+
+        assert read_config_snapshot(path) is not None
+
+    def test_schema_mismatch_is_rejected(self, tmp_path, monkeypatch):
+        """
+        Why: A snapshot written by another version may not fit the models
+        What: Tests a snapshot with a different schema hash is not loaded
+        How: Writes a snapshot, then changes the expected schema hash
+        """
+        path = write_config_snapshot(create_minimal_config(), tmp_path / "s")
+        monkeypatch.setattr(worker_snapshot, "schema_hash", lambda: "other")
+
+        assert read_config_snapshot(path) is None
+
+    def test_changed_source_file_is_rejected(self, tmp_path, config_file):
+        """
+        Why: A snapshot must not outlive the file it was loaded from
+        What: Tests editing the source file invalidates the snapshot
+        How: Writes a snapshot tied to a file, then appends to the file
+        """
+        path = write_config_snapshot(
+            create_minimal_config(), tmp_path / "s", source=config_file
+        )
+        assert read_config_snapshot(path) is not None
+
+        with config_file.open("a") as f:
+            f.write("\n# edited\n")
+
+        assert read_config_snapshot(path) is None
+
+    def test_corrupt_or_missing_snapshot_is_rejected(self, tmp_path):
+        """
+        Why: Workers must fall back instead of crashing on a bad snapshot
+        What: Tests missing, empty and garbage files are not loaded
+        How: Reads each kind of file
+        """
+        empty = tmp_path / "empty"
+        empty.write_bytes(b"")
+        garbage = tmp_path / "garbage"
+        garbage.write_bytes(b"\x00not a snapshot")
+
+        assert read_config_snapshot(tmp_path / "missing") is None
+        assert read_config_snapshot(empty) is None
+        assert read_config_snapshot(garbage) is None
+
+
+class TestManagerSnapshots:
+    """Tests for exporting and loading snapshots through the manager."""
+
+    def test_export_and_load(self, tmp_path, config_file):
+        """
+        Why: Workers start from the configuration the parent loaded
+        What: Tests a worker manager loads the exported configuration
+        How: Loads lazily in a parent, exports, and loads in a new manager
+        """
+        parent = ConfigurationManager()
+        parent.load_configuration(str(config_file), lazy=True)
+        path = parent.export_snapshot(tmp_path / "config.snapshot")
+
+        worker = ConfigurationManager()
+        config = worker.load_snapshot(path, auto_discover=False)
+
+        assert type(config) is Config
+        assert config.model_dump() == parent.config.model_dump()
+        assert worker.get("database.url") == parent.get("database.url")
+
+    def test_falls_back_to_full_load(self, tmp_path, config_file):
+        """
+        Why: A stale or missing snapshot must not prevent startup
+        What: Tests load_snapshot loads the configuration file instead
+        How: Loads from a snapshot path that does not exist
+        """
+        manager = ConfigurationManager()
+
+        config = manager.load_snapshot(
+            tmp_path / "missing", config_path=str(config_file)
+        )
+
+        assert config.repositories[0].url == "https://github.com/example/repo"
+        assert manager.is_loaded
+
+    def test_export_requires_loaded_configuration(self, tmp_path):
+        """
+        Why: There is nothing to hand to workers before loading
+        What: Tests exporting without configuration raises
+        How: Exports from a fresh manager
+        """
+        with pytest.raises(ConfigurationError):
+            ConfigurationManager().export_snapshot(tmp_path / "s")
@@ -0,0 +1,477 @@
+"""
+Unit tests for monthly partition management.
+
+Why: Ensure retention for check_runs and pr_state_history removes whole
+     partitions (or falls back to a single set-based DELETE) and that
+     archives and partition bounds are derived correctly
+What: Tests partition name parsing, provisioning, expiry selection, retention
+      statement flow, JSONL archival, and repository cleanup delegation
+How: Uses AsyncMock sessions that record executed SQL and return canned
+     results, without requiring a PostgreSQL instance
+"""
+
+import asyncio
+import gzip
+import json
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.database.partitioning import (
+    PartitionError,
+    PartitionInfo,
+    PartitionMaintainer,
+    PartitionManager,
+    RetentionResult,
+    parse_partition_name,
+)
+from src.repositories.check_run import CheckRunRepository
+from src.repositories.state_history import PRStateHistoryRepository
+
+
+def _result(scalar: Any = None, rows: list[tuple] | None = None) -> MagicMock:
+    """Build a mocked execute() result."""
+    result = MagicMock()
+    result.scalar_one.return_value = scalar
+    result.all.return_value = rows or []
+    result.rowcount = scalar
+    return result
+
+
+def _executed_sql(session: AsyncMock) -> list[str]:
+    """Return the SQL text of every statement passed to session.execute."""
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+class TestPartitionNames:
+    """Test partition naming helpers."""
+
+    def test_parse_partition_name(self) -> None:
+        """
+        Why: Partition ranges are derived from names for retention decisions
+        What: Tests a monthly partition name maps to its month range
+        How: Parses a December partition and checks the year rollover
+        """
+        info = parse_partition_name("check_runs", "check_runs_p2025_12")
+
+        assert info is not None
+        assert info.range_start == datetime(2025, 12, 1, tzinfo=UTC)
+        assert info.range_end == datetime(2026, 1, 1, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "name", ["check_runs_default", "pr_state_history_p2025_01", "check_runs_x"]
+    )
+    def test_parse_partition_name_ignores_other_tables(self, name: str) -> None:
+        """
+        Why: Default partitions and other tables must never be treated as expired
+        What: Tests non-monthly or foreign names are ignored
+        How: Parses names that should not match check_runs partitions
+        """
+        assert parse_partition_name("check_runs", name) is None
+
+
+class TestPartitionManager:
+    """Test PartitionManager behavior."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        """
+        Why: Provide a mock AsyncSession recording executed statements
+        What: Creates AsyncMock session with execute and stream methods
+        How: Sets up execute as an AsyncMock that tests configure per call
+        """
+        session = AsyncMock()
+        session.execute = AsyncMock()
+        return session
+
+    async def test_rejects_unknown_tables(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Table names are interpolated into DDL and must be whitelisted
+        What: Tests unknown tables raise PartitionError before any SQL runs
+        How: Calls ensure_partitions with an arbitrary table name
+        """
+        manager = PartitionManager(mock_session)
+
+        with pytest.raises(PartitionError):
+            await manager.ensure_partitions("users; DROP TABLE x")
+
+        mock_session.execute.assert_not_called()
+
+    async def test_ensure_partitions(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Future partitions must exist before rows for that month arrive
+        What: Tests ensure_partitions calls the provisioning function
+        How: Mocks the function result and checks parameters and return value
+        """
+        mock_session.execute.return_value = _result(scalar=2)
+        manager = PartitionManager(mock_session)
+
+        created = await manager.ensure_partitions("check_runs", months_ahead=2)
+
+        assert created == 2
+        statement, params = mock_session.execute.call_args.args
+        assert "ensure_monthly_partitions" in str(statement)
+        assert params["table"] == "check_runs"
+        assert params["ahead"] == 2
+
+    async def test_get_expired_partitions(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Only partitions entirely before the cutoff may be removed
+        What: Tests partially expired and default partitions are excluded
+        How: Lists three partitions and a default with a mid-month cutoff
+        """
+        mock_session.execute.return_value = _result(
+            rows=[
+                ("check_runs_p2025_03",),
+                ("check_runs_default",),
+                ("check_runs_p2025_01",),
+                ("check_runs_p2025_02",),
+            ]
+        )
+        manager = PartitionManager(mock_session)
+
+        expired = await manager.get_expired_partitions(
+            "check_runs", datetime(2025, 3, 15, tzinfo=UTC)
+        )
+
+        assert [info.name for info in expired] == [
+            "check_runs_p2025_01",
+            "check_runs_p2025_02",
+        ]
+
+    async def test_retention_falls_back_to_delete(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Unpartitioned schemas (create_all) still need working retention
+        What: Tests a single ranked DELETE is issued when not partitioned
+        How: Reports the table as unpartitioned and inspects the DELETE
+        """
+        mock_session.execute.side_effect = [_result(scalar=False), _result(scalar=7)]
+        manager = PartitionManager(mock_session)
+
+        outcome = await manager.apply_retention(
+            "pr_state_history", datetime(2025, 1, 1, tzinfo=UTC), keep_latest_per_pr=5
+        )
+
+        assert outcome.rows_removed == 7
+        assert outcome.used_partitions is False
+        delete_sql = _executed_sql(mock_session)[-1]
+        assert delete_sql.startswith("DELETE FROM pr_state_history")
+        assert "row_number()" in delete_sql
+        assert mock_session.execute.call_args.args[1]["keep"] == 5
+
+    async def test_retention_detaches_and_drops_partitions(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Retention must drop whole partitions rather than delete rows
+        What: Tests expired partitions are detached then dropped, and orphaned
+              analysis results are removed for check runs
+        How: Stubs is_partitioned and expiry, then checks the statement order
+        """
+        info = PartitionInfo(
+            name="check_runs_p2025_01",
+            table_name="check_runs",
+            range_start=datetime(2025, 1, 1, tzinfo=UTC),
+            range_end=datetime(2025, 2, 1, tzinfo=UTC),
+        )
+        mock_session.execute.return_value = _result(scalar=40)
+        manager = PartitionManager(mock_session)
+
+        with (
+            patch.object(manager, "is_partitioned", AsyncMock(return_value=True)),
+            patch.object(
+                manager, "get_expired_partitions", AsyncMock(return_value=[info])
+            ),
+        ):
+            outcome = await manager.apply_retention(
+                "check_runs", datetime(2025, 3, 1, tzinfo=UTC)
+            )
+
+        assert outcome.rows_removed == 40
+        assert outcome.partitions_removed == ["check_runs_p2025_01"]
+        statements = _executed_sql(mock_session)
+        assert statements[0] == "SELECT count(*) FROM check_runs_p2025_01"
+        assert statements[1].startswith("DELETE FROM analysis_results")
+        assert statements[2] == (
+            "ALTER TABLE check_runs DETACH PARTITION check_runs_p2025_01"
+        )
+        assert statements[3] == "DROP TABLE check_runs_p2025_01"
+
+    async def test_retention_keeps_latest_rows(self, mock_session: AsyncMock) -> None:
+        """
+        Why: The latest N rows per PR must survive partition removal without
+             piling up in the default partition
+        What: Tests survivors are stashed before detach and moved into a
+              rebuilt partition for the same month before the old one is dropped
+        How: Returns 3 survivors and checks rows_removed and the statement order
+        """
+        info = PartitionInfo(
+            name="pr_state_history_p2025_01",
+            table_name="pr_state_history",
+            range_start=datetime(2025, 1, 1, tzinfo=UTC),
+            range_end=datetime(2025, 2, 1, tzinfo=UTC),
+        )
+        mock_session.execute.side_effect = [
+            _result(scalar=10),  # partition row count
+            _result(),  # create survivors table
+            _result(scalar=3),  # survivors count
+            *[_result() for _ in range(7)],  # detach, rebuild and drops
+        ]
+        manager = PartitionManager(mock_session)
+
+        with (
+            patch.object(manager, "is_partitioned", AsyncMock(return_value=True)),
+            patch.object(
+                manager, "get_expired_partitions", AsyncMock(return_value=[info])
+            ),
+        ):
+            outcome = await manager.apply_retention(
+                "pr_state_history",
+                datetime(2025, 3, 1, tzinfo=UTC),
+                keep_latest_per_pr=2,
+            )
+
+        assert outcome.rows_removed == 7
+        assert outcome.rows_kept == 3
+        assert outcome.partitions_rebuilt == ["pr_state_history_p2025_01"]
+        assert outcome.partitions_removed == []
+        statements = _executed_sql(mock_session)[3:]
+        assert statements == [
+            "ALTER TABLE pr_state_history DETACH PARTITION pr_state_history_p2025_01",
+            "ALTER TABLE pr_state_history_p2025_01 "
+            "RENAME TO pr_state_history_p2025_01_retired",
+            "CREATE TABLE pr_state_history_p2025_01 (LIKE pr_state_history "
+            "INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+            "INSERT INTO pr_state_history_p2025_01 SELECT * FROM _retention_survivors",
+            "ALTER TABLE pr_state_history ATTACH PARTITION pr_state_history_p2025_01 "
+            "FOR VALUES FROM ('2025-01-01T00:00:00+00:00') "
+            "TO ('2025-02-01T00:00:00+00:00')",
+            "DROP TABLE _retention_survivors",
+            "DROP TABLE pr_state_history_p2025_01_retired",
+        ]
+
+    async def test_retention_without_drop_reports_detached_tables(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Partitions that are only detached have not been removed
+        What: Tests drop=False reports the detached table, not a removal
+        How: Applies retention with drop=False to one expired partition
+        """
+        info = PartitionInfo(
+            name="check_runs_p2025_01",
+            table_name="check_runs",
+            range_start=datetime(2025, 1, 1, tzinfo=UTC),
+            range_end=datetime(2025, 2, 1, tzinfo=UTC),
+        )
+        mock_session.execute.return_value = _result(scalar=40)
+        manager = PartitionManager(mock_session)
+
+        with (
+            patch.object(manager, "is_partitioned", AsyncMock(return_value=True)),
+            patch.object(
+                manager, "get_expired_partitions", AsyncMock(return_value=[info])
+            ),
+        ):
+            outcome = await manager.apply_retention(
+                "check_runs", datetime(2025, 3, 1, tzinfo=UTC), drop=False
+            )
+
+        assert outcome.partitions_removed == []
+        assert outcome.detached_tables == ["check_runs_p2025_01"]
+        assert not any("DROP TABLE" in sql for sql in _executed_sql(mock_session))
+
+    async def test_retention_skips_partitions_fully_kept(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: A rebuilt partition holding only survivors must not be rebuilt on
+             every retention run
+        What: Tests a partition whose rows are all kept is left attached
+        How: Reports every row as a survivor and checks nothing is detached
+        """
+        info = PartitionInfo(
+            name="pr_state_history_p2025_01",
+            table_name="pr_state_history",
+            range_start=datetime(2025, 1, 1, tzinfo=UTC),
+            range_end=datetime(2025, 2, 1, tzinfo=UTC),
+        )
+        mock_session.execute.side_effect = [
+            _result(scalar=3),  # partition row count
+            _result(),  # create survivors table
+            _result(scalar=3),  # survivors count
+            _result(),  # drop survivors table
+        ]
+        manager = PartitionManager(mock_session)
+
+        with (
+            patch.object(manager, "is_partitioned", AsyncMock(return_value=True)),
+            patch.object(
+                manager, "get_expired_partitions", AsyncMock(return_value=[info])
+            ),
+        ):
+            outcome = await manager.apply_retention(
+                "pr_state_history",
+                datetime(2025, 3, 1, tzinfo=UTC),
+                keep_latest_per_pr=2,
+            )
+
+        assert outcome.rows_removed == 0
+        assert outcome.partitions_removed == []
+        assert not any("DETACH" in sql for sql in _executed_sql(mock_session))
+
+    async def test_rejects_unknown_archive_format(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Typos in archive format should fail before any data is removed
+        What: Tests unsupported formats raise PartitionError
+        How: Calls apply_retention with an invalid format
+        """
+        manager = PartitionManager(mock_session)
+
+        with pytest.raises(PartitionError):
+            await manager.apply_retention(
+                "check_runs", datetime.now(UTC), archive_format="csv"
+            )
+
+        mock_session.execute.assert_not_called()
+
+    async def test_archive_partition_jsonl(
+        self, mock_session: AsyncMock, tmp_path: Path
+    ) -> None:
+        """
+        Why: Archived partitions must be readable after the table is dropped
+        What: Tests rows are written as gzip JSON lines with primitive values
+        How: Mocks a streamed result and reads the archive back
+        """
+        row_id = uuid.uuid4()
+        created = datetime(2025, 1, 5, tzinfo=UTC)
+
+        class _Stream:
+            def mappings(self) -> "_Stream":
+                return self
+
+            async def partitions(self, size: int) -> Any:
+                yield [{"id": row_id, "created_at": created, "metadata": {"a": 1}}]
+
+        mock_session.stream = AsyncMock(return_value=_Stream())
+        manager = PartitionManager(mock_session)
+        info = PartitionInfo(
+            name="check_runs_p2025_01",
+            table_name="check_runs",
+            range_start=datetime(2025, 1, 1, tzinfo=UTC),
+            range_end=datetime(2025, 2, 1, tzinfo=UTC),
+        )
+
+        path = await manager.archive_partition(info, tmp_path)
+
+        assert path == tmp_path / "check_runs_p2025_01.jsonl.gz"
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            records = [json.loads(line) for line in archive]
+        assert records == [
+            {
+                "id": str(row_id),
+                "created_at": created.isoformat(),
+                "metadata": '{"a": 1}',
+            }
+        ]
+
+
+class TestPartitionMaintainer:
+    """Test scheduled partition provisioning."""
+
+    async def test_run_once_provisions_partitioned_tables(self) -> None:
+        """
+        Why: Partitions must be provisioned by the app, not only the migration,
+             or new months' rows land in the default partition
+        What: Tests each partitioned table is provisioned in its own transaction
+        How: Uses a mocked session factory and patches PartitionManager
+        """
+        session = AsyncMock()
+        session.begin = MagicMock(return_value=AsyncMock())
+        factory = MagicMock(return_value=session)
+        session.__aenter__.return_value = session
+        maintainer = PartitionMaintainer(factory, interval=60, months_ahead=2)
+
+        with (
+            patch.object(
+                PartitionManager, "is_partitioned", AsyncMock(return_value=True)
+            ),
+            patch.object(
+                PartitionManager, "ensure_partitions", AsyncMock(return_value=1)
+            ) as ensure,
+        ):
+            created = await maintainer.run_once()
+
+        assert created == 2
+        assert [call.args for call in ensure.await_args_list] == [
+            ("check_runs",),
+            ("pr_state_history",),
+        ]
+        assert all(
+            call.kwargs == {"months_ahead": 2} for call in ensure.await_args_list
+        )
+        assert session.begin.call_count == 2
+
+    async def test_start_runs_at_startup_and_stop_cancels(self) -> None:
+        """
+        Why: Provisioning must happen on startup, not only after an interval
+        What: Tests start() runs a pass immediately and stop() ends the task
+        How: Starts with a long interval and waits for the first pass
+        """
+        maintainer = PartitionMaintainer(MagicMock(), interval=3600)
+        ran = AsyncMock(return_value=0)
+
+        with patch.object(maintainer, "run_once", ran):
+            maintainer.start()
+            await asyncio.sleep(0)
+            await maintainer.stop()
+
+        ran.assert_awaited_once()
+        assert maintainer._task is None
+
+
+class TestRepositoryCleanup:
+    """Test repository cleanup methods delegate to partition retention."""
+
+    @pytest.mark.parametrize(
+        ("repository_class", "method", "table", "keep"),
+        [
+            (CheckRunRepository, "cleanup_old_checks", "check_runs", 10),
+            (PRStateHistoryRepository, "cleanup_old_history", "pr_state_history", 50),
+        ],
+    )
+    async def test_cleanup_uses_partition_retention(
+        self, repository_class: type, method: str, table: str, keep: int
+    ) -> None:
+        """
+        Why: Cleanup must no longer be a placeholder returning 0
+        What: Tests cleanup delegates to PartitionManager.apply_retention
+        How: Patches apply_retention and checks arguments and return value
+        """
+        repository = repository_class(AsyncMock())
+        cutoff = datetime(2025, 1, 1, tzinfo=UTC)
+        retention = AsyncMock(
+            return_value=RetentionResult(table_name=table, rows_removed=12)
+        )
+
+        with patch(
+            "src.database.partitioning.PartitionManager.apply_retention", retention
+        ):
+            removed = await getattr(repository, method)(cutoff)
+
+        assert removed == 12
+        retention.assert_awaited_once_with(
+            table,
+            cutoff,
+            keep_latest_per_pr=keep,
+            archive_dir=None,
+            archive_format="jsonl",
+        )
@@ -0,0 +1,296 @@
+"""
+Unit tests for read-replica routing.
+
+Why: Ensure read-only work is offloaded to replicas only when that is safe:
+     the replica is healthy, fresh enough, and cannot hide the caller's own
+     writes
+What: Tests RoutingSession bind selection, read-your-writes stickiness,
+      lag and health eligibility, health check accounting, fallback to the
+      primary, and replica configuration parsing
+How: Builds routers over unconnected asyncpg engines so routing decisions
+     are observed without a database, and mocks connections for health checks
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import column, literal, select, table, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.database.config import DatabaseConfig
+from src.database.replicas import (
+    ROUTER_INFO_KEY,
+    ReplicaRouter,
+    ReplicaState,
+    RoutingSession,
+    consistency_scope,
+    read_only,
+    read_only_scope,
+)
+
+PULL_REQUESTS = table("pull_requests", column("id"), column("title"))
+
+
+def make_engine(host: str) -> AsyncEngine:
+    """Create an engine that never connects during routing tests."""
+    return create_async_engine(f"postgresql+asyncpg://user:secret@{host}/db")
+
+
+@pytest.fixture
+def router() -> ReplicaRouter:
+    """Create a router with one primary and two healthy, fresh replicas."""
+    router = ReplicaRouter(
+        make_engine("primary"), [make_engine("replica1"), make_engine("replica2")]
+    )
+    for replica in router.replicas:
+        replica.healthy = True
+        replica.lag_seconds = 0.0
+    return router
+
+
+def make_session(router: ReplicaRouter) -> RoutingSession:
+    """Create a routing session bound to router."""
+    return RoutingSession(info={ROUTER_INFO_KEY: router})
+
+
+def replica_engines(router: ReplicaRouter) -> list[object]:
+    """Get the sync engines of the router's replicas."""
+    return [replica.engine.sync_engine for replica in router.replicas]
+
+
+class TestRoutingSession:
+    """Test statement routing decisions."""
+
+    def test_reads_outside_read_only_use_primary(self, router: ReplicaRouter) -> None:
+        """
+        Why: Only methods known to be read-only may tolerate replica lag
+        What: Tests selects outside a read_only scope go to the primary
+        How: Resolves the bind for a select without entering a scope
+        """
+        session = make_session(router)
+
+        bind = session.get_bind(clause=select(PULL_REQUESTS))
+
+        assert bind is router.primary.sync_engine
+        assert router.counters["primary_reads"] == 1
+
+    def test_read_only_selects_round_robin_replicas(
+        self, router: ReplicaRouter
+    ) -> None:
+        """
+        Why: Read load should spread over all eligible replicas
+        What: Tests selects inside read_only_scope alternate between replicas
+        How: Resolves the bind for four selects in a scope
+        """
+        session = make_session(router)
+
+        with read_only_scope():
+            binds = [session.get_bind(clause=select(literal(1))) for _ in range(4)]
+
+        assert binds == replica_engines(router) * 2
+        assert router.counters["replica_reads"] == 4
+
+    def test_writes_make_session_sticky_to_primary(self, router: ReplicaRouter) -> None:
+        """
+        Why: A session must see its own writes, which replicas may not have yet
+        What: Tests DML goes to the primary and later reads follow it there
+        How: Resolves an update then a select inside read_only_scope
+        """
+        session = make_session(router)
+
+        with read_only_scope():
+            write = session.get_bind(
+                clause=update(PULL_REQUESTS).values(title="renamed")
+            )
+            read = session.get_bind(clause=select(PULL_REQUESTS))
+
+        assert write is read is router.primary.sync_engine
+        assert router.counters["writes"] == 1
+        assert router.counters["replica_reads"] == 0
+
+    def test_locking_and_textual_statements_use_primary(
+        self, router: ReplicaRouter
+    ) -> None:
+        """
+        Why: Row locks only exist on the primary, and raw SQL may write
+        What: Tests SELECT FOR UPDATE and text() never reach a replica
+        How: Resolves both inside read_only_scope
+        """
+        session = make_session(router)
+
+        with read_only_scope():
+            text_bind = session.get_bind(clause=text("SELECT 1"))
+            lock_bind = session.get_bind(clause=select(PULL_REQUESTS).with_for_update())
+
+        assert text_bind is lock_bind is router.primary.sync_engine
+
+    def test_falls_back_to_primary_without_eligible_replica(
+        self, router: ReplicaRouter
+    ) -> None:
+        """
+        Why: Reads must keep working while every replica is down or lagging
+        What: Tests the primary serves reads when no replica qualifies
+        How: Marks one replica unhealthy and the other beyond max_lag
+        """
+        router.replicas[0].healthy = False
+        router.replicas[1].lag_seconds = router.max_lag + 1
+        session = make_session(router)
+
+        with read_only_scope():
+            bind = session.get_bind(clause=select(PULL_REQUESTS))
+
+        assert bind is router.primary.sync_engine
+
+    async def test_read_only_decorator_scopes_method(
+        self, router: ReplicaRouter
+    ) -> None:
+        """
+        Why: Repository methods opt into replica reads with the decorator
+        What: Tests the scope applies during the call and ends with it
+        How: Resolves binds inside and after a decorated coroutine
+        """
+        session = make_session(router)
+
+        @read_only
+        async def get_statistics() -> object:
+            return session.get_bind(clause=select(PULL_REQUESTS))
+
+        assert await get_statistics() in replica_engines(router)
+        assert session.get_bind(clause=select(PULL_REQUESTS)) is (
+            router.primary.sync_engine
+        )
+
+
+class TestReadYourWrites:
+    """Test lag-aware consistency across sessions."""
+
+    def test_consistency_scope_skips_replicas_behind_last_write(
+        self, router: ReplicaRouter
+    ) -> None:
+        """
+        Why: A write in one session must be visible to reads in the next one
+             within the same unit of work
+        What: Tests replicas lagging more than the time since the write are
+              skipped while fresher ones are used
+        How: Writes in one session and reads in another with lagging replicas
+        """
+        router.replicas[0].lag_seconds = 3.0
+        router.replicas[1].lag_seconds = 0.0
+
+        with consistency_scope(), read_only_scope():
+            make_session(router).get_bind(clause=update(PULL_REQUESTS))
+            reader = make_session(router)
+            binds = {reader.get_bind(clause=select(PULL_REQUESTS)) for _ in range(3)}
+
+        assert binds == {router.replicas[1].engine.sync_engine}
+
+    def test_choose_replica_respects_time_since_write(
+        self, router: ReplicaRouter
+    ) -> None:
+        """
+        Why: A replica whose lag exceeds the time since the write may not
+             have replayed it yet
+        What: Tests eligibility flips once enough time has passed
+        How: Calls choose_replica with elapsed times around the lag
+        """
+        for replica in router.replicas:
+            replica.lag_seconds = 2.0
+
+        assert router.choose_replica(since_write=1.0) is None
+        assert router.choose_replica(since_write=2.5) is not None
+
+
+class TestHealthChecks:
+    """Test replica lag measurement and health transitions."""
+
+    @pytest.fixture
+    def replica(self, router: ReplicaRouter) -> ReplicaState:
+        """Replace the router's replicas with one on a mocked engine."""
+        state = ReplicaState(name="replica", engine=MagicMock())
+        router.replicas = [state]
+        return state
+
+    def set_lag(self, replica: ReplicaState, lag: float) -> None:
+        """Make the replica's lag query return lag."""
+        conn = AsyncMock()
+        conn.execute.return_value = MagicMock(scalar=MagicMock(return_value=lag))
+        replica.engine.connect.return_value.__aenter__.return_value = conn
+
+    async def test_successful_check_records_lag(
+        self, router: ReplicaRouter, replica: ReplicaState
+    ) -> None:
+        """
+        Why: Replicas start out of rotation until their lag is known
+        What: Tests a successful check marks the replica healthy with its lag
+        How: Returns a lag of 1.5 seconds from the mocked connection
+        """
+        self.set_lag(replica, 1.5)
+
+        await router.check_replicas()
+
+        assert replica.healthy
+        assert replica.lag_seconds == 1.5
+        assert router.get_metrics()["replicas"][0]["lag_seconds"] == 1.5
+
+    async def test_failures_mark_unhealthy_after_threshold(
+        self, router: ReplicaRouter, replica: ReplicaState
+    ) -> None:
+        """
+        Why: One transient failure should not flap a replica out of rotation
+        What: Tests the replica stays healthy until failure_threshold failures
+        How: Makes connect raise after a successful check
+        """
+        self.set_lag(replica, 0.0)
+        await router.check_replicas()
+        replica.engine.connect.side_effect = OSError("connection refused")
+
+        await router.check_replicas()
+        assert replica.healthy
+
+        await router.check_replicas()
+        assert not replica.healthy
+        assert replica.consecutive_failures == 2
+        assert replica.last_error == "connection refused"
+
+    def test_replica_names_hide_passwords(self, router: ReplicaRouter) -> None:
+        """
+        Why: Replica names are exported in health details and logs
+        What: Tests credentials are masked
+        How: Checks the name built from a URL with a password
+        """
+        assert "secret" not in router.replicas[0].name
+        assert "replica1" in router.replicas[0].name
+
+
+class TestReplicaConfig:
+    """Test replica settings in DatabaseConfig."""
+
+    def test_parses_comma_separated_urls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Why: Replica URLs are usually provided as a single environment value
+        What: Tests DATABASE_REPLICA_URLS is split into a list
+        How: Sets the variable with two URLs and surrounding whitespace
+        """
+        monkeypatch.setenv(
+            "DATABASE_REPLICA_URLS",
+            "postgresql+asyncpg://u:p@replica1/db, postgresql+asyncpg://u:p@replica2/db",
+        )
+        monkeypatch.setenv("DATABASE_REPLICA_MAX_LAG", "2.5")
+
+        config = DatabaseConfig(password="secret")
+
+        assert config.replica_urls == [
+            "postgresql+asyncpg://u:p@replica1/db",
+            "postgresql+asyncpg://u:p@replica2/db",
+        ]
+        assert config.replica_max_lag == 2.5
+
+    def test_rejects_invalid_replica_url(self) -> None:
+        """
+        Why: A malformed replica URL should fail at startup, not on first read
+        What: Tests validation errors for URLs without a host
+        How: Creates a config with an invalid replica URL
+        """
+        with pytest.raises(ValidationError, match="Invalid replica URL"):
+            DatabaseConfig(password="secret", replica_urls=["not-a-url"])
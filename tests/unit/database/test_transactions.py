@@ -0,0 +1,467 @@
+"""
+Unit tests for batched UnitOfWork commits and retryable transactions.
+
+Why: Ensure a unit of work applies its operations with a few set-based
+     statements in foreign key order instead of one round trip per entity,
+     and that contention only re-runs the work that hit it
+What: Tests operation grouping and dependency ordering, merge avoidance for
+      tracked and detached entities, bulk UPDATE/DELETE statements, ORM
+      cascade fallback and per-commit statement counts, plus SQLSTATE
+      classification, jittered backoff and savepoint-scoped batch retries
+How: Uses real mapped models with an AsyncMock session that records calls,
+     backed by an in-memory SQLite connection for statement counting, and
+     raises DBAPIErrors carrying PostgreSQL SQLSTATEs
+"""
+
+import uuid
+from collections.abc import Iterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.database.transactions import (
+    DEADLOCK_DETECTED,
+    SERIALIZATION_FAILURE,
+    RetryableTransaction,
+    TransactionError,
+    UnitOfWork,
+    classify_transient_error,
+)
+from src.models.check_run import CheckRun
+from src.models.pull_request import PullRequest
+from src.models.repository import Repository
+from src.models.state_history import PRStateHistory
+
+
+def detached[T](entity: T) -> T:
+    """Give entity an id and identity key as if it had been loaded before."""
+    entity.id = uuid.uuid4()  # type: ignore[attr-defined]
+    entity.created_at = datetime.now(UTC)  # type: ignore[attr-defined]
+    make_transient_to_detached(entity)
+    return entity
+
+
+@pytest.fixture
+def session() -> Iterator[AsyncMock]:
+    """Create a session mock tracking nothing and inside a transaction."""
+    connection = create_engine("sqlite://").connect()
+    session = AsyncMock()
+    session.connection.return_value = MagicMock(sync_connection=connection)
+    session.in_transaction = MagicMock(return_value=True)
+    session.add_all = MagicMock()
+    session.expunge = MagicMock()
+    session.identity_map = set()
+    session.__contains__.return_value = False
+    yield session
+    connection.close()
+
+
+def executed_sql(session: AsyncMock) -> list[str]:
+    """Return the SQL text of every statement passed to session.execute."""
+    return [str(call.args[0]) for call in session.execute.call_args_list]
+
+
+class TestGrouping:
+    """Test operation grouping and ordering."""
+
+    def test_orders_writes_by_foreign_keys(self, session: AsyncMock) -> None:
+        """
+        Why: Child rows can only be inserted after the rows they reference
+             and must be deleted before them
+        What: Tests creates run parents first and deletes children first
+        How: Adds operations in reverse dependency order and groups them
+        """
+        uow = UnitOfWork(session)
+        for entity in (CheckRun(), PullRequest(), Repository()):
+            uow.add_operation("create", entity)
+            uow.add_operation("delete", entity)
+
+        groups = uow._group_operations()
+
+        creates = [mapper.class_ for mapper in groups["create"]]
+        deletes = [mapper.class_ for mapper in groups["delete"]]
+        assert creates == [Repository, PullRequest, CheckRun]
+        assert deletes == [CheckRun, PullRequest, Repository]
+
+    async def test_rejects_unknown_operation(self, session: AsyncMock) -> None:
+        """
+        Why: Typos in operation names must not be silently ignored
+        What: Tests commit raises before touching the session
+        How: Adds an 'upsert' operation and commits
+        """
+        uow = UnitOfWork(session)
+        uow.add_operation("upsert", Repository())
+
+        with pytest.raises(ValueError, match="Unknown operation type: upsert"):
+            await uow.commit()
+        session.add_all.assert_not_called()
+
+
+class TestCommit:
+    """Test batched application of operations."""
+
+    async def test_creates_are_added_in_one_batch_per_type(
+        self, session: AsyncMock
+    ) -> None:
+        """
+        Why: The flush batches same-type inserts into executemany statements
+        What: Tests creates are added per type and flushed together
+        How: Commits three new state history rows
+        """
+        rows = [PRStateHistory() for _ in range(3)]
+        uow = UnitOfWork(session)
+        for row in rows:
+            uow.add_operation("create", row)
+
+        stats = await uow.commit()
+
+        session.add_all.assert_called_once_with(rows)
+        session.flush.assert_awaited_once()
+        assert stats.inserted == 3
+
+    async def test_updates_skip_merge_round_trips(self, session: AsyncMock) -> None:
+        """
+        Why: session.merge issues a SELECT per entity it does not know
+        What: Tests tracked entities are left to the flush and detached ones
+              become one bulk UPDATE by primary key of their changed columns
+        How: Updates one tracked and two detached repositories
+        """
+        tracked = Repository(url="https://github.com/org/tracked")
+        first = detached(Repository(url="https://github.com/org/a", name="a"))
+        second = detached(Repository(url="https://github.com/org/b", name="b"))
+        first.name = "renamed"
+        first.updated_at = datetime.now(UTC)
+        second.failure_count = 3
+        session.__contains__.side_effect = lambda entity: entity is tracked
+        uow = UnitOfWork(session)
+        for entity in (tracked, first, second):
+            uow.add_operation("update", entity)
+
+        stats = await uow.commit()
+
+        session.merge.assert_not_awaited()
+        (call,) = session.execute.await_args_list
+        statement, rows = call.args
+        assert str(statement).startswith("UPDATE repositories")
+        assert rows == [
+            {"id": first.id, "name": "renamed"},
+            {"id": second.id, "failure_count": 3},
+        ]
+        assert stats.updated == 3
+
+    async def test_unchanged_detached_updates_write_nothing(
+        self, session: AsyncMock
+    ) -> None:
+        """
+        Why: Rewriting unchanged columns would undo other writers' changes
+        What: Tests a detached entity without changes issues no UPDATE
+        How: Updates a detached repository that was not modified
+        """
+        uow = UnitOfWork(session)
+        uow.add_operation("update", detached(Repository(url="u", name="a")))
+
+        await uow.commit()
+
+        session.execute.assert_not_awaited()
+        session.merge.assert_not_awaited()
+
+    async def test_detached_relationship_changes_are_merged(
+        self, session: AsyncMock
+    ) -> None:
+        """
+        Why: A bulk UPDATE skips the ORM cascades of changed relationships
+        What: Tests a detached entity with a changed relationship is merged
+        How: Moves a detached pull request to another repository
+        """
+        pull_request = detached(PullRequest())
+        pull_request.repository = detached(Repository(url="u", name="a"))
+        uow = UnitOfWork(session)
+        uow.add_operation("update", pull_request)
+
+        await uow.commit()
+
+        session.merge.assert_awaited_once_with(pull_request)
+        session.execute.assert_not_awaited()
+
+    async def test_transient_updates_keep_merge_semantics(
+        self, session: AsyncMock
+    ) -> None:
+        """
+        Why: An entity never loaded may not exist yet, and merge inserts it
+        What: Tests transient entities are still merged
+        How: Updates a new repository object
+        """
+        entity = Repository(url="https://github.com/org/new")
+        uow = UnitOfWork(session)
+        uow.add_operation("update", entity)
+
+        await uow.commit()
+
+        session.merge.assert_awaited_once_with(entity)
+
+    async def test_deletes_use_single_statement_without_cascades(
+        self, session: AsyncMock
+    ) -> None:
+        """
+        Why: Leaf rows can be deleted set-based, but ORM cascades must still
+             remove children of cascading types
+        What: Tests leaf types use one DELETE ... IN and cascading types use
+              session.delete
+        How: Deletes two state history rows and one pull request
+        """
+        history = [detached(PRStateHistory()) for _ in range(2)]
+        pr = detached(PullRequest())
+        uow = UnitOfWork(session)
+        for entity in (pr, *history):
+            uow.add_operation("delete", entity)
+
+        stats = await uow.commit()
+
+        (sql,) = executed_sql(session)
+        assert sql.startswith("DELETE FROM pr_state_history")
+        assert "(pr_state_history.id, pr_state_history.created_at) IN" in sql
+        session.delete.assert_awaited_once_with(pr)
+        assert stats.deleted == 3
+
+    async def test_counts_statements_per_commit(self, session: AsyncMock) -> None:
+        """
+        Why: Batching is only verifiable if statement counts are reported
+        What: Tests cursor executions during commit are counted, and only those
+        How: Runs two statements on the connection from flush, one after commit
+        """
+        connection = session.connection.return_value.sync_connection
+        session.flush.side_effect = lambda: [
+            connection.exec_driver_sql("SELECT 1") for _ in range(2)
+        ]
+        uow = UnitOfWork(session)
+        uow.add_operation("create", Repository())
+
+        stats = await uow.commit()
+        connection.exec_driver_sql("SELECT 1")
+
+        assert stats.statements == 2
+        assert uow.last_stats is stats
+
+    async def test_cannot_commit_twice(self, session: AsyncMock) -> None:
+        """
+        Why: Re-applying operations would duplicate inserts
+        What: Tests a second commit raises TransactionError
+        How: Commits an empty unit of work twice
+        """
+        uow = UnitOfWork(session)
+        await uow.commit()
+
+        with pytest.raises(TransactionError, match="already committed"):
+            await uow.commit()
+
+
+class PgError(Exception):
+    """Driver exception exposing a SQLSTATE like asyncpg's."""
+
+    def __init__(self, sqlstate: str):
+        super().__init__(f"SQLSTATE {sqlstate}")
+        self.sqlstate = sqlstate
+
+
+def db_error(sqlstate: str) -> DBAPIError:
+    """Create a wrapped driver error with the given SQLSTATE."""
+    return DBAPIError("UPDATE ...", None, PgError(sqlstate))
+
+
+@pytest.fixture
+def retry_session() -> AsyncMock:
+    """Create a session mock whose savepoints record their outcome."""
+    session = AsyncMock()
+    session.in_transaction = MagicMock(return_value=False)
+    session.savepoints = []
+
+    @asynccontextmanager
+    async def begin_nested():  # type: ignore[no-untyped-def]
+        try:
+            yield
+        except BaseException:
+            session.savepoints.append("rollback")
+            raise
+        session.savepoints.append("release")
+
+    session.begin_nested = begin_nested
+    return session
+
+
+@pytest.fixture
+def no_sleep() -> Iterator[AsyncMock]:
+    """Skip backoff sleeps in retry tests."""
+    with patch(
+        "src.database.transactions.asyncio.sleep", new_callable=AsyncMock
+    ) as sleep:
+        yield sleep
+
+
+class TestErrorClassification:
+    """Test SQLSTATE classification of transient errors."""
+
+    def test_classifies_deadlock_and_serialization_failure(self) -> None:
+        """
+        Why: Deadlocks and serialization failures need different retry scopes
+        What: Tests both SQLSTATEs are recognized and others are not
+        How: Classifies wrapped driver errors and a plain exception
+        """
+        assert classify_transient_error(db_error(DEADLOCK_DETECTED)) == "deadlock"
+        assert (
+            classify_transient_error(db_error(SERIALIZATION_FAILURE))
+            == "serialization_failure"
+        )
+        assert classify_transient_error(db_error("23505")) is None
+        assert classify_transient_error(ValueError("boom")) is None
+
+    def test_follows_exception_cause(self) -> None:
+        """
+        Why: Errors are often re-raised wrapped in application exceptions
+        What: Tests the SQLSTATE is found through __cause__
+        How: Classifies a TransactionError raised from a deadlock
+        """
+        try:
+            try:
+                raise db_error(DEADLOCK_DETECTED)
+            except DBAPIError as e:
+                raise TransactionError("failed") from e
+        except TransactionError as wrapped:
+            assert classify_transient_error(wrapped) == "deadlock"
+
+
+@pytest.mark.usefixtures("no_sleep")
+class TestRetryableTransaction:
+    """Test jittered retries and savepoint-scoped batches."""
+
+    def test_backoff_is_jittered_and_capped(self, retry_session: AsyncMock) -> None:
+        """
+        Why: Workers retrying in lockstep collide again on the same rows
+        What: Tests delays vary within [0, min(max_delay, exponential)]
+        How: Samples many delays for an early and a late attempt
+        """
+        retry = RetryableTransaction(retry_session, base_delay=0.1, max_delay=1.0)
+
+        early = [retry.backoff_delay(1) for _ in range(200)]
+        late = [retry.backoff_delay(10) for _ in range(200)]
+
+        assert all(0 <= delay <= 0.2 for delay in early)
+        assert len(set(early)) > 1
+        assert all(0 <= delay <= 1.0 for delay in late)
+
+    async def test_deadlock_retries_only_failing_chunk(
+        self, retry_session: AsyncMock
+    ) -> None:
+        """
+        Why: Re-running committed chunks wastes work and raises contention
+        What: Tests a deadlock rolls back one savepoint and re-runs only its
+              items with a smaller batch, inside a single transaction
+        How: Deadlocks the second chunk once while processing ten items
+        """
+        calls: list[list[int]] = []
+
+        async def operation(session: AsyncMock, chunk: Sequence[int]) -> None:
+            calls.append(list(chunk))
+            if len(calls) == 2:
+                raise db_error(DEADLOCK_DETECTED)
+
+        retry = RetryableTransaction(retry_session)
+        stats = await retry.execute_batches(
+            list(range(10)), operation, batch_size=4, grow_after=10
+        )
+
+        assert calls == [[0, 1, 2, 3], [4, 5, 6, 7], [4, 5], [6, 7], [8, 9]]
+        assert retry_session.savepoints.count("rollback") == 1
+        assert stats.deadlocks == stats.retries == 1
+        assert stats.batches == 4
+        assert stats.final_batch_size == 2
+        retry_session.commit.assert_awaited_once()
+
+    async def test_batch_size_grows_back_after_successes(
+        self, retry_session: AsyncMock
+    ) -> None:
+        """
+        Why: Small batches after a contention spike cost extra round trips
+        What: Tests the batch size shrinks on deadlocks and doubles after
+              grow_after consecutive successes, up to the initial size
+        How: Deadlocks the first two attempts and records chunk sizes
+        """
+        sizes: list[int] = []
+
+        async def operation(session: AsyncMock, chunk: Sequence[int]) -> None:
+            sizes.append(len(chunk))
+            if len(sizes) <= 2:
+                raise db_error(DEADLOCK_DETECTED)
+
+        retry = RetryableTransaction(retry_session)
+        stats = await retry.execute_batches(
+            list(range(40)), operation, batch_size=8, grow_after=2
+        )
+
+        assert sizes == [8, 4, 2, 2, 4, 4, 8, 8, 8, 4]
+        assert stats.final_batch_size == 8
+
+    async def test_repeated_deadlocks_exhaust_chunk_retries(
+        self, retry_session: AsyncMock
+    ) -> None:
+        """
+        Why: A chunk that never gets its locks must fail instead of spinning
+        What: Tests TransactionError after max_retries chunk retries
+        How: Deadlocks every attempt with max_retries=2
+        """
+        operation = AsyncMock(side_effect=db_error(DEADLOCK_DETECTED))
+        retry = RetryableTransaction(retry_session, max_retries=2)
+
+        with pytest.raises(TransactionError, match="deadlocked 3 times"):
+            await retry.execute_batches([1, 2], operation, batch_size=2)
+
+        assert operation.await_count == 3
+        retry_session.commit.assert_not_awaited()
+
+    async def test_serialization_failure_restarts_transaction(
+        self, retry_session: AsyncMock, no_sleep: AsyncMock
+    ) -> None:
+        """
+        Why: A serialization failure invalidates the transaction's snapshot,
+             so retrying a savepoint cannot succeed
+        What: Tests the whole transaction is rolled back and run again
+        How: Fails the second chunk once with SQLSTATE 40001
+        """
+        calls: list[list[int]] = []
+
+        async def operation(session: AsyncMock, chunk: Sequence[int]) -> None:
+            calls.append(list(chunk))
+            if len(calls) == 2:
+                raise db_error(SERIALIZATION_FAILURE)
+
+        retry = RetryableTransaction(retry_session)
+        stats = await retry.execute_batches([1, 2, 3, 4], operation, batch_size=2)
+
+        assert calls == [[1, 2], [3, 4], [1, 2], [3, 4]]
+        retry_session.rollback.assert_awaited_once()
+        retry_session.commit.assert_awaited_once()
+        no_sleep.assert_awaited_once()
+        assert stats.deadlocks == 0
+
+    async def test_other_errors_are_not_retried_per_chunk(
+        self, retry_session: AsyncMock
+    ) -> None:
+        """
+        Why: Constraint violations fail the same way on every retry
+        What: Tests an integrity error propagates without a chunk retry
+        How: Raises IntegrityError from the first chunk with max_retries=0
+        """
+        operation = AsyncMock(
+            side_effect=IntegrityError("INSERT ...", None, PgError("23505"))
+        )
+        retry = RetryableTransaction(retry_session, max_retries=0)
+
+        with pytest.raises(TransactionError, match="after 1 attempts"):
+            await retry.execute_batches([1, 2], operation)
+
+        operation.assert_awaited_once()
+        assert retry_session.savepoints == ["rollback"]
@@ -8,7 +8,7 @@ How: Creates model instances and tests their behavior in isolation
 """
 
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 import pytest
@@ -304,6 +304,23 @@ class TestBusinessLogic:
         assert repo.last_polled_at is None
         assert repo.needs_polling is True
 
+    def test_repository_update_last_polled_schedules_next_poll(self) -> None:
+        """
+        Why: The poll scheduler selects due repositories by next_poll_at
+        What: Tests update_last_polled() moves next_poll_at one interval ahead
+        How: Polls a repo and compares next_poll_at with last_polled_at
+        """
+        repo = Repository(
+            url="https://github.com/test/repo",
+            name="repo",
+            polling_interval_minutes=15,
+        )
+
+        repo.update_last_polled()
+
+        assert repo.last_polled_at is not None
+        assert repo.next_poll_at == repo.last_polled_at + timedelta(minutes=15)
+
     def test_pull_request_state_transitions(self) -> None:
         """
         Why: Verify PR state transition validation works
@@ -424,6 +441,38 @@ class TestBusinessLogic:
         assert reopen_history.is_reopening is True
 
 
+class TestPartitionedTables:
+    """Test models of tables partitioned by month on created_at."""
+
+    @pytest.mark.parametrize("model", [CheckRun, PRStateHistory])
+    def test_primary_key_includes_partition_key(self, model: type) -> None:
+        """
+        Why: PostgreSQL requires the partition key in every unique constraint,
+             so the models must match the partitioned schema
+        What: Tests the primary key is (id, created_at)
+        How: Inspects the mapped table's primary key columns
+        """
+        assert model.__table__.primary_key.columns.keys() == ["id", "created_at"]
+
+    def test_check_run_has_no_unique_external_id_or_foreign_keys_to_it(
+        self,
+    ) -> None:
+        """
+        Why: The partitioned table cannot enforce external_id uniqueness alone
+             or be the target of a foreign key
+        What: Tests no unique external_id and no foreign key to check_runs
+        How: Inspects table constraints and analysis_results foreign keys
+        """
+        external_id = CheckRun.__table__.c.external_id
+        assert not external_id.unique
+        assert not any(
+            getattr(constraint, "columns", None) is not None
+            and list(constraint.columns) == [external_id]
+            for constraint in CheckRun.__table__.constraints
+        )
+        assert not AnalysisResult.__table__.foreign_keys
+
+
 class TestFieldConstraints:
     """Test field constraints and validation."""
 
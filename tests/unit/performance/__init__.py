@@ -0,0 +1 @@
+"""Unit tests for performance monitoring utilities."""
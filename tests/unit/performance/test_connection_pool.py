@@ -0,0 +1,297 @@
+"""
+Unit tests for adaptive connection pool concurrency control.
+
+Why: Ensure session concurrency in front of the pool adapts to measured
+     contention without oscillating or leaving its configured bounds
+What: Tests AdaptiveConcurrencyLimiter slot accounting and
+      AdaptivePoolController decisions, hysteresis, cooldown and metrics
+How: Drives the limiter with real asyncio tasks and feeds the controller
+     synthetic PoolSample values over a mocked engine pool
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.database.connection import DatabaseConnectionManager
+from src.performance.connection_pool import (
+    AdaptiveConcurrencyLimiter,
+    AdaptivePoolController,
+    PoolSample,
+)
+
+
+def make_optimizer(pool_size: int = 5, max_overflow: int = 5) -> MagicMock:
+    """Build an optimizer double whose pool reports the given capacity."""
+    optimizer = MagicMock()
+    pool = optimizer.engine.pool
+    pool.size.return_value = pool_size
+    pool._max_overflow = max_overflow
+    pool.checkedout.return_value = 0
+    pool.overflow.return_value = -pool_size
+    optimizer._stats = {"checkout_times": [], "total_checkins": 0}
+    return optimizer
+
+
+def make_sample(
+    utilization: float = 0.5,
+    wait_p95: float = 0.0,
+    avg_checkout_time: float = 0.01,
+    timeouts: int = 0,
+) -> PoolSample:
+    """Build a sample for a pool of capacity 10."""
+    return PoolSample(
+        capacity=10,
+        checked_out=int(utilization * 10),
+        overflow=0,
+        utilization=utilization,
+        wait_p95=wait_p95,
+        waiting=0,
+        timeouts=timeouts,
+        avg_checkout_time=avg_checkout_time,
+    )
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test the resizable semaphore."""
+
+    async def test_limits_concurrent_holders(self) -> None:
+        """
+        Why: The limiter is what actually bounds open sessions
+        What: Tests waiters block at the limit and are served in order
+        How: Holds both slots of a limit-2 limiter and releases one
+        """
+        limiter = AdaptiveConcurrencyLimiter(2)
+        await limiter.acquire()
+        await limiter.acquire()
+
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+        assert not waiter.done()
+
+        limiter.release()
+        await waiter
+        assert limiter.in_use == 2
+        assert limiter.waiting == 0
+
+    async def test_raising_limit_wakes_waiters(self) -> None:
+        """
+        Why: An increase must take effect for tasks already queued
+        What: Tests set_limit hands new slots to waiters immediately
+        How: Queues two waiters on a full limiter and raises its limit
+        """
+        limiter = AdaptiveConcurrencyLimiter(1)
+        await limiter.acquire()
+        waiters = [asyncio.create_task(limiter.acquire()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        limiter.set_limit(3)
+        await asyncio.gather(*waiters)
+
+        assert limiter.in_use == 3
+
+    async def test_lowering_limit_drains_without_interrupting(self) -> None:
+        """
+        Why: Shrinking must not cancel sessions that are already open
+        What: Tests holders keep their slots while new acquires wait
+        How: Lowers the limit below current usage and releases one slot
+        """
+        limiter = AdaptiveConcurrencyLimiter(3)
+        for _ in range(3):
+            await limiter.acquire()
+
+        limiter.set_limit(1)
+        waiter = asyncio.create_task(limiter.acquire())
+        limiter.release()
+        await asyncio.sleep(0)
+
+        assert limiter.in_use == 2
+        assert not waiter.done()
+        waiter.cancel()
+
+    async def test_timeout_counts_and_frees_waiter(self) -> None:
+        """
+        Why: Callers must not wait forever, and timeouts feed the controller
+        What: Tests TimeoutError is raised, counted and the waiter removed
+        How: Acquires a full limiter with a short timeout
+        """
+        limiter = AdaptiveConcurrencyLimiter(1)
+        await limiter.acquire()
+
+        with pytest.raises(TimeoutError):
+            await limiter.acquire(timeout=0.01)
+
+        assert limiter.timeouts == 1
+        assert limiter.waiting == 0
+        assert limiter.drain_wait_times().count == 2
+
+
+class TestAdaptivePoolController:
+    """Test control decisions."""
+
+    @pytest.fixture
+    def controller(self) -> AdaptivePoolController:
+        """Create a controller over a pool of capacity 10."""
+        controller = AdaptivePoolController(
+            make_optimizer(),
+            min_limit=2,
+            stable_intervals=2,
+            cooldown_intervals=1,
+        )
+        controller.limiter.set_limit(6)
+        return controller
+
+    def test_defaults_max_limit_to_pool_capacity(self) -> None:
+        """
+        Why: More sessions than pool_size + max_overflow can only time out
+        What: Tests max_limit and the initial limit match the pool capacity
+        How: Creates a controller over a 5 + 5 pool
+        """
+        controller = AdaptivePoolController(make_optimizer())
+
+        assert controller.max_limit == 10
+        assert controller.limiter.limit == 10
+
+    def test_increases_after_sustained_waits(
+        self, controller: AdaptivePoolController
+    ) -> None:
+        """
+        Why: Slot waits with normal database latency mean the limit is the
+             bottleneck
+        What: Tests one sample only arms the change and the second applies it
+        How: Feeds two samples with p95 waits above target
+        """
+        slow = make_sample(wait_p95=0.2)
+
+        assert controller.evaluate(slow).action == "hold"
+        decision = controller.evaluate(slow)
+
+        assert decision.action == "increase"
+        assert decision.limit == 7
+        assert controller.counters == {"increase": 1, "decrease": 0, "hold": 1}
+
+    def test_decreases_when_database_saturated(
+        self, controller: AdaptivePoolController
+    ) -> None:
+        """
+        Why: When hold times inflate at high utilization, more concurrency
+             only queues inside the database
+        What: Tests the limit shrinks multiplicatively, not below min_limit
+        How: Establishes a baseline hold time then feeds saturated samples
+        """
+        controller.evaluate(make_sample(avg_checkout_time=0.01))
+        saturated = make_sample(utilization=0.95, avg_checkout_time=0.05)
+
+        controller.evaluate(saturated)
+        decision = controller.evaluate(saturated)
+
+        assert decision.action == "decrease"
+        assert decision.limit == 4
+        assert "5.0x baseline" in decision.reason
+
+    def test_holds_during_cooldown_and_on_mixed_signals(
+        self, controller: AdaptivePoolController
+    ) -> None:
+        """
+        Why: Hysteresis prevents oscillation around a threshold
+        What: Tests no change happens in cooldown or when signals alternate
+        How: Applies an increase, then alternates waits with calm samples
+        """
+        slow = make_sample(wait_p95=0.2)
+        controller.evaluate(slow)
+        controller.evaluate(slow)
+
+        assert controller.evaluate(slow).reason.endswith("(cooling down)")
+        for sample in (make_sample(), slow, make_sample(), slow):
+            assert controller.evaluate(sample).action == "hold"
+        assert controller.limiter.limit == 7
+
+    def test_respects_max_limit(self, controller: AdaptivePoolController) -> None:
+        """
+        Why: The limit must stay within configured bounds
+        What: Tests repeated increase signals stop at max_limit
+        How: Feeds many timeout samples
+        """
+        for _ in range(20):
+            controller.evaluate(make_sample(timeouts=1))
+
+        assert controller.limiter.limit == 10
+
+    def test_sample_reads_pool_and_limiter(self) -> None:
+        """
+        Why: Decisions are only as good as the signals sampled
+        What: Tests utilization, overflow and hold time come from the pool
+        How: Sets pool counters and optimizer checkout times on the doubles
+        """
+        optimizer = make_optimizer()
+        optimizer.engine.pool.checkedout.return_value = 7
+        optimizer.engine.pool.overflow.return_value = 2
+        controller = AdaptivePoolController(optimizer)
+        optimizer._stats["checkout_times"] = [0.02, 0.04]
+        optimizer._stats["total_checkins"] = 2
+
+        sample = controller.sample()
+
+        assert sample.utilization == 0.7
+        assert sample.overflow == 2
+        assert sample.avg_checkout_time == pytest.approx(0.03)
+
+    def test_sample_only_uses_checkins_of_the_interval(self) -> None:
+        """
+        Why: Under low traffic old hold times must not keep driving decisions
+        What: Tests each sample averages only the checkins since the last one
+        How: Samples after old checkins, after new ones, then after none
+        """
+        optimizer = make_optimizer()
+        optimizer._stats["checkout_times"] = [1.0, 1.0]
+        optimizer._stats["total_checkins"] = 2
+        controller = AdaptivePoolController(optimizer)
+
+        optimizer._stats["checkout_times"] += [0.01, 0.03]
+        optimizer._stats["total_checkins"] = 4
+        assert controller.sample().avg_checkout_time == pytest.approx(0.02)
+
+        assert controller.sample().avg_checkout_time == 0.0
+
+    async def test_metrics_export_decisions(
+        self, controller: AdaptivePoolController
+    ) -> None:
+        """
+        Why: Decisions must be observable to replace hand tuning
+        What: Tests gauges and counters reflect the last decision
+        How: Holds a slot and takes one controller step
+        """
+        async with controller.slot():
+            controller.step()
+            metrics = controller.get_metrics()
+        await controller.stop()
+
+        assert metrics["limit"] == 6
+        assert metrics["in_use"] == 1
+        assert metrics["decisions_total"]["hold"] == 1
+        assert metrics["last_decision"]["reason"] == "within targets"
+
+
+class TestConnectionManagerIntegration:
+    """Test the controller in front of get_session."""
+
+    async def test_session_holds_slot(self, mock_database_config: MagicMock) -> None:
+        """
+        Why: Every session must count against the adaptive limit
+        What: Tests a slot is held while a session is open and then released
+        How: Replaces the engine and session factory with doubles
+        """
+        mock_database_config.pool.adaptive_concurrency = True
+        manager = DatabaseConnectionManager(mock_database_config)
+        controller = AdaptivePoolController(make_optimizer())
+        manager._engine = MagicMock(dispose=AsyncMock())
+        manager._pool_controller = controller
+        manager._session_factory = MagicMock(return_value=AsyncMock())
+
+        async with manager.get_session():
+            assert controller.limiter.in_use == 1
+        await manager.close()
+
+        assert controller.limiter.in_use == 0
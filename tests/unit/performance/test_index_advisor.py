@@ -0,0 +1,442 @@
+"""
+Unit tests for the workload-driven index advisor.
+
+Why: Ensure index recommendations come from the statements that dominate
+     load, are validated by planner costs and can be shipped as migrations
+What: Tests statement parsing, candidate generation, cost-based selection,
+      Alembic migration rendering and composite selectivity estimation
+How: Parses representative ORM statements and patches plan costing so
+     selection runs without a PostgreSQL server
+"""
+
+import re
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from src.performance.index_advisor import (
+    IndexCandidate,
+    IndexRecommendation,
+    WorkloadIndexAdvisor,
+    WorkloadStatement,
+    generate_candidates,
+    parse_statement,
+    render_alembic_migration,
+    write_alembic_migration,
+)
+from src.performance.indexes import IndexOptimizer
+
+PR_LIST = (
+    "SELECT pull_requests.id, pull_requests.title FROM pull_requests "
+    "WHERE pull_requests.repository_id = $1 AND pull_requests.state = $2 "
+    "ORDER BY pull_requests.updated_at DESC LIMIT $3"
+)
+DUE_REPOSITORIES = (
+    "SELECT r.url FROM repositories r "
+    "WHERE r.status = 'active' AND r.next_poll_at <= now()"
+)
+
+
+def statement(query: str, total_exec_time: float = 1000.0) -> WorkloadStatement:
+    """Build a workload statement with the given cumulative time."""
+    return WorkloadStatement(
+        query=query, calls=100, total_exec_time=total_exec_time, mean_exec_time=10.0
+    )
+
+
+class TestParseStatement:
+    """Test predicate and sort key extraction."""
+
+    def test_extracts_equality_sort_and_selected_columns(self) -> None:
+        """
+        Why: Composite keys are built from equality filters then sort keys
+        What: Tests a typical repository list query is split into its parts
+        How: Parses a normalized pg_stat_statements query
+        """
+        (pattern,) = parse_statement(PR_LIST)
+
+        assert pattern.table == "pull_requests"
+        assert pattern.equality == ["repository_id", "state"]
+        assert pattern.order_by == ["updated_at DESC"]
+        assert pattern.selected == ["id", "title"]
+
+    def test_resolves_aliases_and_joins(self) -> None:
+        """
+        Why: Predicates must be attributed to the right table across joins
+        What: Tests aliased columns, join keys and NULL tests per table
+        How: Parses a join between check_runs and an aliased pull_requests
+        """
+        patterns = parse_statement(
+            "SELECT check_runs.id FROM check_runs "
+            "JOIN pull_requests AS pr ON pr.id = check_runs.pr_id "
+            "WHERE pr.repository_id = $1 AND check_runs.completed_at IS NULL"
+        )
+        by_table = {pattern.table: pattern for pattern in patterns}
+
+        assert by_table["check_runs"].equality == ["pr_id"]
+        assert by_table["check_runs"].null_tests == {"completed_at": False}
+        assert by_table["pull_requests"].equality == ["repository_id", "id"]
+
+    def test_ignores_statements_without_predicates(self) -> None:
+        """
+        Why: Full scans without filters or sorts cannot use a new index
+        What: Tests no pattern is produced for them
+        How: Parses an unfiltered count
+        """
+        assert parse_statement("SELECT count(*) FROM pull_requests") == []
+
+
+class TestGenerateCandidates:
+    """Test candidate index generation."""
+
+    def test_composite_and_covering_candidates(self) -> None:
+        """
+        Why: Both the plain composite and an index-only-scan variant should
+             be evaluated against the planner
+        What: Tests equality columns lead, then the sort key, plus INCLUDE
+        How: Generates candidates for the PR list query
+        """
+        candidates = generate_candidates(parse_statement(PR_LIST))
+
+        key = ("repository_id", "state", "updated_at DESC")
+        assert candidates == [
+            IndexCandidate("pull_requests", key),
+            IndexCandidate("pull_requests", key, include=("id", "title")),
+        ]
+        assert candidates[0].create_sql() == (
+            "CREATE INDEX idx_pull_requests_repository_id_state_updated_at_desc "
+            "ON pull_requests (repository_id, state, updated_at DESC)"
+        )
+
+    def test_constant_filters_become_partial_predicate(self) -> None:
+        """
+        Why: Constant filters on low-cardinality columns make small partial
+             indexes that only contain the rows queried
+        What: Tests the constant moves into WHERE and the range column is keyed
+        How: Generates candidates for the due repositories query
+        """
+        candidates = generate_candidates(parse_statement(DUE_REPOSITORIES))
+
+        assert (
+            IndexCandidate("repositories", ("next_poll_at",), where="status = 'active'")
+            in candidates
+        )
+        assert IndexCandidate("repositories", ("next_poll_at",)) in candidates
+
+    def test_long_names_are_truncated_deterministically(self) -> None:
+        """
+        Why: PostgreSQL truncates identifiers over 63 bytes, which could make
+             two different indexes collide
+        What: Tests long names are shortened with a stable digest
+        How: Builds the name of a wide index twice
+        """
+        columns = tuple(f"column_number_{i}" for i in range(6))
+        name = IndexCandidate("pull_requests", columns).name
+
+        assert len(name) == 63
+        assert name == IndexCandidate("pull_requests", columns).name
+
+
+class _RecordingConnection:
+    """AsyncConnection stand-in that enforces SQLAlchemy's autobegin rule.
+
+    Executing a statement outside a transaction begins one implicitly, after
+    which begin() raises like the real connection does.
+    """
+
+    def __init__(self) -> None:
+        self.events: list[str] = []
+        self.in_transaction = False
+
+    async def begin(self) -> SimpleNamespace:
+        if self.in_transaction:
+            raise InvalidRequestError("a transaction is already begun")
+        self.in_transaction = True
+        self.events.append("begin")
+        return SimpleNamespace(rollback=self._rollback)
+
+    async def begin_nested(self) -> SimpleNamespace:
+        self.events.append("savepoint")
+        return SimpleNamespace(rollback=self._rollback_savepoint)
+
+    async def execute(self, statement: Any, params: Any = None) -> list[Any]:
+        self.in_transaction = True
+        sql = str(statement)
+        self.events.append(sql.split("(")[0].split()[-1] if "hypopg" in sql else sql)
+        if "pg_extension" in sql:
+            return [
+                SimpleNamespace(extname=name)
+                for name in ("pg_stat_statements", "hypopg")
+            ]
+        if "pg_stat_statements" in sql:
+            return [
+                SimpleNamespace(
+                    query=PR_LIST,
+                    calls=100,
+                    total_exec_time=1000.0,
+                    mean_exec_time=10.0,
+                    rows=10,
+                )
+            ]
+        return []
+
+    async def _rollback(self) -> None:
+        self.in_transaction = False
+        self.events.append("rollback")
+
+    async def _rollback_savepoint(self) -> None:
+        self.events.append("rollback to savepoint")
+
+
+class TestWorkloadIndexAdvisor:
+    """Test cost-based validation and winner selection."""
+
+    @pytest.fixture
+    def advisor(self) -> WorkloadIndexAdvisor:
+        """Create an advisor with a mocked engine."""
+        return WorkloadIndexAdvisor(MagicMock(), min_improvement=0.3)
+
+    async def test_keeps_candidates_that_lower_cost(
+        self, advisor: WorkloadIndexAdvisor
+    ) -> None:
+        """
+        Why: Only indexes the planner would actually use are worth creating
+        What: Tests the best candidate wins and the one it covers is dropped
+        How: Patches plan costs so the covering index is cheapest
+        """
+
+        async def costs_with_index(conn, candidate, queries, use_hypopg):
+            return [20.0 if candidate.include else 40.0 for _ in queries]
+
+        with (
+            patch.object(advisor, "_plan_cost", AsyncMock(return_value=100.0)),
+            patch.object(advisor, "_costs_with_index", side_effect=costs_with_index),
+        ):
+            recommendations = await advisor.evaluate(
+                AsyncMock(), [statement(PR_LIST)], use_hypopg=True
+            )
+
+        assert len(recommendations) == 1
+        (winner,) = recommendations
+        assert winner.candidate.include == ("id", "title")
+        assert winner.improvement == pytest.approx(0.8)
+        assert winner.saved_time_ms == pytest.approx(800.0)
+        assert winner.to_suggestion().estimated_benefit == "high"
+
+    async def test_rejects_small_improvements_and_existing_indexes(
+        self, advisor: WorkloadIndexAdvisor
+    ) -> None:
+        """
+        Why: Marginal or already existing indexes only add write overhead
+        What: Tests candidates below min_improvement or covered are dropped
+        How: Patches a 10% cost reduction and passes an existing index
+        """
+        existing = [
+            IndexCandidate("repositories", ("next_poll_at",), where="status = 'active'")
+        ]
+        costs = AsyncMock(side_effect=lambda conn, c, queries, h: [90.0] * len(queries))
+
+        with (
+            patch.object(advisor, "_plan_cost", AsyncMock(return_value=100.0)),
+            patch.object(advisor, "_costs_with_index", costs),
+        ):
+            recommendations = await advisor.evaluate(
+                AsyncMock(),
+                [statement(PR_LIST), statement(DUE_REPOSITORIES)],
+                existing,
+            )
+
+        assert recommendations == []
+        evaluated = {call.args[1] for call in costs.await_args_list}
+        assert existing[0] not in evaluated
+
+    async def test_recommend_requires_pg_stat_statements(
+        self, advisor: WorkloadIndexAdvisor
+    ) -> None:
+        """
+        Why: Without recorded statements there is no workload to analyze
+        What: Tests recommend returns nothing when the extension is missing
+        How: Patches the extension lookup to return an empty set
+        """
+        conn = AsyncMock()
+        advisor.engine.connect.return_value.__aenter__.return_value = conn
+
+        with patch.object(
+            advisor, "_installed_extensions", AsyncMock(return_value=set())
+        ):
+            assert await advisor.recommend() == []
+
+    async def test_real_index_builds_require_opt_in(self) -> None:
+        """
+        Why: Building a real index blocks writes to a production table for
+             the whole build, which lock_timeout does not bound
+        What: Tests candidates are skipped without HypoPG by default, and
+              only built inside a rolled back savepoint when opted in
+        How: Evaluates candidates on a recording connection with and
+             without build_real_indexes
+        """
+        conn = _RecordingConnection()
+        advisor = WorkloadIndexAdvisor(MagicMock())
+        candidate = IndexCandidate("pull_requests", ("repository_id",))
+
+        with patch.object(advisor, "_plan_cost", AsyncMock(return_value=100.0)):
+            assert (
+                await advisor._costs_with_index(conn, candidate, [PR_LIST], False)
+                is None
+            )
+            assert conn.events == []
+
+            conn.exec_driver_sql = AsyncMock()  # type: ignore[attr-defined]
+            advisor.build_real_indexes = True
+            costs = await advisor._costs_with_index(conn, candidate, [PR_LIST], False)
+
+        assert costs == [100.0]
+        executed = [call.args[0] for call in conn.exec_driver_sql.await_args_list]
+        assert executed[-1] == candidate.create_sql()
+        assert conn.events == ["savepoint", "rollback to savepoint"]
+
+    async def test_recommend_without_hypopg_builds_nothing(self) -> None:
+        """
+        Why: The default must be safe to run against production
+        What: Tests recommend returns nothing without HypoPG or an opt-in
+        How: Runs recommend with only pg_stat_statements installed
+        """
+        conn = _RecordingConnection()
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = conn
+        advisor = WorkloadIndexAdvisor(engine)
+
+        with patch.object(
+            advisor,
+            "_installed_extensions",
+            AsyncMock(return_value={"pg_stat_statements"}),
+        ):
+            assert await advisor.recommend() == []
+
+        assert conn.events == ["begin", "rollback"]
+
+    async def test_recommend_runs_in_one_rolled_back_transaction(self) -> None:
+        """
+        Why: Executing the catalog reads first autobegins a transaction, after
+             which an explicit begin() raises and recommend always failed
+        What: Tests the transaction is begun before any statement, HypoPG
+              what-ifs run inside savepoints, and everything is rolled back
+        How: Runs recommend and recommend_from_workload on a connection that
+             raises on begin() after autobegin, with plan costs patched
+        """
+        conn = _RecordingConnection()
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = conn
+        advisor = WorkloadIndexAdvisor(engine)
+
+        async def plan_cost(conn: Any, query: str) -> float:
+            return 40.0 if "hypopg_create_index" in conn.events[-1:] else 100.0
+
+        with patch.object(advisor, "_plan_cost", side_effect=plan_cost):
+            recommendations = await advisor.recommend()
+
+        assert recommendations
+        assert conn.events[0] == "begin"
+        assert conn.events[-1] == "rollback"
+        assert conn.events.count("begin") == 1
+        created = conn.events.index("hypopg_create_index")
+        assert conn.events[created - 1] == "savepoint"
+        assert conn.events[created + 1 : created + 3] == [
+            "rollback to savepoint",
+            "hypopg_reset",
+        ]
+
+        conn.events.clear()
+        with patch(
+            "src.performance.index_advisor.WorkloadIndexAdvisor._plan_cost",
+            AsyncMock(return_value=100.0),
+        ):
+            assert await IndexOptimizer(engine).recommend_from_workload() == []
+        assert conn.events[0] == "begin"
+        assert conn.events[-1] == "rollback"
+
+
+class TestAlembicMigration:
+    """Test migration rendering for recommended indexes."""
+
+    @pytest.fixture
+    def recommendation(self) -> IndexRecommendation:
+        """Build a partial covering index recommendation."""
+        return IndexRecommendation(
+            IndexCandidate(
+                "repositories",
+                ("next_poll_at",),
+                include=("url",),
+                where="status = 'active'",
+            ),
+            [statement(DUE_REPOSITORIES)],
+            cost_before=100.0,
+            cost_after=10.0,
+            saved_time_ms=900.0,
+        )
+
+    def test_renders_valid_migration(self, recommendation: IndexRecommendation) -> None:
+        """
+        Why: Winners should ship through the normal migration workflow
+        What: Tests the module compiles and creates and drops the index
+        How: Renders a migration and executes it with a mocked op
+        """
+        source = render_alembic_migration(
+            [recommendation], "abc123def456", "dd4eae59bb8d"
+        )
+        module: dict[str, object] = {}
+        op = MagicMock()
+        with patch.dict("sys.modules", {"alembic": MagicMock(op=op)}):
+            exec(compile(source, "migration.py", "exec"), module)
+        module["upgrade"]()  # type: ignore[operator]
+        module["downgrade"]()  # type: ignore[operator]
+
+        assert module["down_revision"] == "dd4eae59bb8d"
+        name = "idx_repositories_next_poll_at_partial_covering"
+        args, kwargs = op.create_index.call_args
+        assert args == (name, "repositories", ["next_poll_at"])
+        assert kwargs["postgresql_include"] == ["url"]
+        assert str(kwargs["postgresql_where"]) == "status = 'active'"
+        op.drop_index.assert_called_once_with(name, table_name="repositories")
+
+    def test_writes_file_with_repo_template(
+        self, recommendation: IndexRecommendation, tmp_path: Path
+    ) -> None:
+        """
+        Why: Alembic discovers revisions by the configured file template
+        What: Tests the file name follows YYYYMMDD_HHMM_<rev>_<slug>.py
+        How: Writes the migration into a temporary versions directory
+        """
+        path = write_alembic_migration([recommendation], tmp_path, "dd4eae59bb8d")
+
+        assert re.fullmatch(
+            r"\d{8}_\d{4}_[0-9a-f]{12}_add_workload_indexes\.py", path.name
+        )
+        assert "Revises: dd4eae59bb8d" in path.read_text()
+
+
+class TestCompositeSelectivity:
+    """Test IndexOptimizer selectivity estimation."""
+
+    async def test_counts_distinct_column_combinations(self) -> None:
+        """
+        Why: Sampling only the first column overstates composite selectivity
+        What: Tests all columns are counted together as a row value
+        How: Captures the SQL sent to a mocked session
+        """
+        session = AsyncMock()
+        session.execute.return_value.fetchone = MagicMock(
+            return_value=MagicMock(distinct_count=50, total_count=100)
+        )
+
+        selectivity = await IndexOptimizer(MagicMock())._estimate_column_selectivity(
+            session, "check_runs", ["pr_id", "check_name"]
+        )
+
+        assert selectivity == 0.5
+        sql = str(session.execute.await_args.args[0])
+        assert "COUNT(DISTINCT (pr_id, check_name))" in sql
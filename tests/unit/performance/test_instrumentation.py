@@ -0,0 +1,177 @@
+"""
+Unit tests for automatic SQL instrumentation.
+
+Why: Ensure every statement is measured under a stable fingerprint and
+     attributed to the repository method that issued it
+What: Tests fingerprint_statement normalization, QueryInstrumentation hooks
+      and repository method attribution through the contextvar
+How: Normalizes sample SQL and runs real statements on an in-memory SQLite
+     engine with the hooks attached
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import bindparam, column, create_engine, select, table, text
+from sqlalchemy.exc import OperationalError
+
+from src.models.repository import Repository
+from src.performance.instrumentation import (
+    QueryInstrumentation,
+    fingerprint_statement,
+    get_query_origin,
+    query_origin,
+)
+from src.performance.monitoring import PerformanceMonitor
+from src.repositories.repository import RepositoryRepository
+
+
+class TestFingerprintStatement:
+    """Test SQL fingerprint normalization."""
+
+    @pytest.mark.parametrize(
+        ("statement", "expected"),
+        [
+            (
+                "SELECT * FROM prs WHERE id = 42 AND title = 'it''s'",
+                "SELECT * FROM prs WHERE id = ? AND title = ?",
+            ),
+            (
+                "SELECT * FROM prs WHERE id IN ($1, $2, $3)",
+                "SELECT * FROM prs WHERE id IN (...)",
+            ),
+            (
+                "SELECT * FROM prs WHERE id IN (%(id_1)s, %(id_2)s)",
+                "SELECT * FROM prs WHERE id IN (...)",
+            ),
+            (
+                "SELECT *\n  FROM check_runs_p2026_01 LIMIT :param_1::INTEGER",
+                "SELECT * FROM check_runs_p2026_01 LIMIT ?::INTEGER",
+            ),
+            (
+                "INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?)",
+                "INSERT INTO t (a, b) VALUES (?, ?), ...",
+            ),
+        ],
+    )
+    def test_normalizes_literals_and_lists(self, statement: str, expected: str) -> None:
+        """
+        Why: Executions differing only in values must aggregate together
+        What: Tests literals, bind styles, IN lists and VALUES rows normalize
+        How: Compares fingerprints of sample statements with expected output
+        """
+        assert fingerprint_statement(statement) == expected
+
+
+class TestQueryInstrumentation:
+    """Test cursor execution hooks."""
+
+    @pytest.fixture
+    def monitor(self) -> PerformanceMonitor:
+        """
+        Why: Isolate recorded metrics per test
+        What: Provides a fresh PerformanceMonitor
+        How: Instantiates a monitor with logging disabled
+        """
+        return PerformanceMonitor(enable_logging=False)
+
+    def test_records_latency_rows_and_origin(self, monitor: PerformanceMonitor) -> None:
+        """
+        Why: Every statement should be measured without manual decoration
+        What: Tests executions are recorded under origin-prefixed fingerprints
+        How: Runs parameterized statements on an instrumented SQLite engine
+        """
+        engine = create_engine("sqlite://")
+        QueryInstrumentation(monitor).attach(engine)
+
+        with engine.connect() as conn, query_origin("PRRepository.search"):
+            for value in range(3):
+                conn.execute(text("SELECT :value"), {"value": value})
+
+        patterns = {
+            key: stats
+            for key, stats in monitor._iter_pattern_stats(None)
+            if key.startswith("PRRepository.search")
+        }
+        assert list(patterns) == ["PRRepository.search | SELECT ?"]
+        assert patterns["PRRepository.search | SELECT ?"].histogram.count == 3
+
+    def test_records_errors(self, monitor: PerformanceMonitor) -> None:
+        """
+        Why: Failing statements matter as much as slow ones
+        What: Tests failed executions are recorded with success=False
+        How: Executes SQL against a missing table and checks error counts
+        """
+        engine = create_engine("sqlite://")
+        QueryInstrumentation(monitor).attach(engine)
+
+        with engine.connect() as conn, pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing WHERE id = 7"))
+
+        stats = dict(monitor._iter_pattern_stats(None))
+        assert stats["SELECT * FROM missing WHERE id = ?"].error_count == 1
+
+    def test_detach_stops_recording(self, monitor: PerformanceMonitor) -> None:
+        """
+        Why: Instrumentation must be removable, e.g. for benchmarks
+        What: Tests no statements are recorded after detach()
+        How: Attaches, detaches and executes a statement
+        """
+        engine = create_engine("sqlite://")
+        instrumentation = QueryInstrumentation(monitor)
+        instrumentation.attach(engine)
+        instrumentation.detach(engine)
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        assert list(monitor._iter_pattern_stats(None)) == []
+
+    def test_counts_compiled_cache_hits(self, monitor: PerformanceMonitor) -> None:
+        """
+        Why: Cached statements only pay off if executions hit the compiled
+             cache, so the hit ratio must be observable
+        What: Tests the first execution misses, repeats hit, and outcomes are
+              also kept per origin
+        How: Executes one prebuilt bindparam statement five times
+        """
+        engine = create_engine("sqlite://")
+        instrumentation = QueryInstrumentation(monitor)
+        instrumentation.attach(engine)
+        statement = select(column("id")).select_from(table("repositories"))
+        statement = statement.where(column("id") == bindparam("id"))
+
+        with engine.connect() as conn:
+            conn.execute(text("CREATE TABLE repositories (id INTEGER)"))
+            with query_origin("RepositoryRepository.get"):
+                for value in range(5):
+                    conn.execute(statement, {"id": value})
+
+        stats = instrumentation.compile_cache_stats()
+        assert stats["by_origin"]["RepositoryRepository.get"] == {
+            "hits": 4,
+            "misses": 1,
+            "uncached": 0,
+            "hit_ratio": 0.8,
+        }
+        assert stats["hits"] == 4
+
+
+class TestRepositoryAttribution:
+    """Test repository methods set the query origin."""
+
+    async def test_public_methods_set_origin(self) -> None:
+        """
+        Why: Metrics should name the repository method that issued the SQL
+        What: Tests inherited and own methods report the concrete class
+        How: Captures get_query_origin() from inside a mocked session call
+        """
+        origins: list[str | None] = []
+        session = AsyncMock()
+        session.get.side_effect = lambda *_: origins.append(get_query_origin())
+        repository = RepositoryRepository(session)
+
+        await repository.get_by_id(Repository().id)
+
+        assert origins == ["RepositoryRepository.get_by_id"]
+        assert get_query_origin() is None
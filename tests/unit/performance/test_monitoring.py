@@ -0,0 +1,166 @@
+"""
+Unit tests for streaming performance monitoring.
+
+Why: Ensure latency percentiles stay accurate while memory stays bounded,
+     since the monitor sits on every database call
+What: Tests StreamingHistogram accuracy, bounds and merging, and
+      PerformanceMonitor aggregation by pattern and time bucket
+How: Feeds known latency distributions and compares reported percentiles
+     with exact values within the configured relative accuracy
+"""
+
+import random
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from src.performance.histogram import StreamingHistogram
+from src.performance.monitoring import PerformanceMonitor
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    """Return the exact nearest-rank quantile of values."""
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestStreamingHistogram:
+    """Test StreamingHistogram behavior."""
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """
+        Why: Percentiles are only useful if their error is bounded
+        What: Tests p50/p95/p99/p999 are within 1% of the exact values
+        How: Adds 20k log-normal latencies and compares with sorted values
+        """
+        rng = random.Random(42)
+        values = [rng.lognormvariate(-4, 1) for _ in range(20_000)]
+        histogram = StreamingHistogram(relative_accuracy=0.01)
+        for value in values:
+            histogram.add(value)
+
+        qs = [0.5, 0.95, 0.99, 0.999]
+        for q, estimate in zip(qs, histogram.quantiles(qs), strict=True):
+            exact = _exact_quantile(values, q)
+            assert abs(estimate - exact) <= 0.011 * exact
+        assert histogram.count == len(values)
+        assert histogram.mean == pytest.approx(sum(values) / len(values))
+
+    def test_bucket_count_is_bounded(self) -> None:
+        """
+        Why: Memory must not grow with the number or spread of values
+        What: Tests populated buckets never exceed max_buckets
+        How: Adds values spanning many orders of magnitude with a small cap
+        """
+        histogram = StreamingHistogram(relative_accuracy=0.01, max_buckets=64)
+        for exponent in range(-5, 4):
+            for step in range(1, 100):
+                histogram.add(step * 10.0**exponent)
+
+        assert len(histogram._buckets) <= 64
+        assert histogram.quantile(1.0) == histogram.max
+
+    def test_merge_matches_single_histogram(self) -> None:
+        """
+        Why: Stats across time buckets are computed by merging histograms
+        What: Tests merging two halves equals one histogram of all values
+        How: Splits values across two histograms and compares quantiles
+        """
+        values = [i / 1000 for i in range(1, 1001)]
+        combined = StreamingHistogram()
+        first, second = StreamingHistogram(), StreamingHistogram()
+        for index, value in enumerate(values):
+            combined.add(value)
+            (first if index % 2 else second).add(value)
+
+        first.merge(second)
+
+        qs = [0.5, 0.99]
+        assert first.quantiles(qs) == combined.quantiles(qs)
+        assert first.count == combined.count
+
+    def test_empty_and_invalid(self) -> None:
+        """
+        Why: Callers query stats before any traffic has been recorded
+        What: Tests empty histograms report zero and bad quantiles raise
+        How: Queries an empty histogram and an out-of-range quantile
+        """
+        histogram = StreamingHistogram()
+
+        assert histogram.quantile(0.99) == 0.0
+        with pytest.raises(ValueError):
+            histogram.quantile(1.5)
+
+
+class TestPerformanceMonitor:
+    """Test PerformanceMonitor aggregation."""
+
+    async def test_get_stats_reports_percentiles(self) -> None:
+        """
+        Why: Average latency hides tail latency problems
+        What: Tests get_stats() reports counts, rates and percentiles
+        How: Records 1000 queries with one error and a slow outlier
+        """
+        monitor = PerformanceMonitor(slow_query_threshold=1.0, enable_logging=False)
+        for index in range(1, 1000):
+            await monitor.record_query("select_prs", index / 10_000, cache_hit=True)
+        await monitor.record_query("select_prs", 2.0, success=False)
+
+        stats = await monitor.get_stats()
+
+        assert stats.total_queries == 1000
+        assert stats.error_count == 1
+        assert stats.slow_query_count == 1
+        assert stats.success_rate == pytest.approx(0.999)
+        assert stats.cache_hit_rate == pytest.approx(0.999)
+        assert stats.p50_time == pytest.approx(0.05, rel=0.02)
+        assert stats.p99_time == pytest.approx(0.099, rel=0.02)
+        assert stats.max_time == 2.0
+        assert [m.execution_time for m in await monitor.get_slow_queries()] == [2.0]
+
+    async def test_stats_filter_by_pattern_and_time_bucket(self) -> None:
+        """
+        Why: Reports look at specific query patterns over recent windows
+        What: Tests query_pattern and since select the right buckets
+        How: Records into two time buckets by patching the clock
+        """
+        monitor = PerformanceMonitor(enable_logging=False)
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+
+        with patch("src.performance.monitoring.time.time") as clock:
+            clock.return_value = start.timestamp()
+            monitor.record("select_prs", 0.1)
+            monitor.record("update_repo", 0.2)
+            clock.return_value = (start + timedelta(minutes=5)).timestamp()
+            monitor.record("select_prs", 0.3)
+
+        recent = await monitor.get_stats(since=start + timedelta(minutes=2))
+        prs = await monitor.get_stats(query_pattern="select_prs")
+        patterns = await monitor.get_query_patterns()
+
+        assert recent.total_queries == 1
+        assert prs.total_queries == 2
+        assert patterns["update_repo"]["count"] == 1
+        assert "p99_time" in patterns["select_prs"]
+
+    async def test_clear_stats_drops_old_buckets(self) -> None:
+        """
+        Why: Clearing must free memory held by old time buckets
+        What: Tests clear_stats(older_than) drops only buckets that ended
+        How: Records into two buckets and clears between them
+        """
+        monitor = PerformanceMonitor(enable_logging=False)
+        start = datetime(2026, 1, 1, tzinfo=UTC)
+
+        with patch("src.performance.monitoring.time.time") as clock:
+            clock.return_value = start.timestamp()
+            monitor.record("q", 0.1)
+            monitor.record("q", 0.1)
+            clock.return_value = (start + timedelta(minutes=5)).timestamp()
+            monitor.record("q", 0.1)
+
+        removed = await monitor.clear_stats(older_than=start + timedelta(minutes=2))
+
+        assert removed == 2
+        assert (await monitor.get_stats()).total_queries == 1
@@ -0,0 +1,166 @@
+"""
+Unit tests for N+1 query detection.
+
+Why: Ensure repeated per-row lazy loads and repeated statements are reported
+     with the responsible relationship, and that strict mode fails fast
+What: Tests NPlusOneDetector scopes, findings, summaries and strict mode
+How: Runs ORM workloads against a small in-memory SQLite schema
+"""
+
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy import ForeignKey, create_engine, select, text
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    Session,
+    mapped_column,
+    relationship,
+    selectinload,
+)
+
+from src.performance.instrumentation import query_origin
+from src.performance.n_plus_one import NPlusOneDetector, NPlusOneError
+
+
+class _Base(DeclarativeBase):
+    pass
+
+
+class _Parent(_Base):
+    __tablename__ = "parent"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["_Child"]] = relationship(back_populates="parent")
+
+
+class _Child(_Base):
+    __tablename__ = "child"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"))
+    parent: Mapped[_Parent] = relationship(back_populates="children")
+
+
+class TestNPlusOneDetector:
+    """Test N+1 detection scopes."""
+
+    @pytest.fixture
+    def session(self) -> Generator[Session, None, None]:
+        """
+        Why: Provide a populated schema with a one-to-many relationship
+        What: Creates six parents with two children each in SQLite
+        How: Builds the schema on an in-memory engine and commits rows
+        """
+        engine = create_engine("sqlite://")
+        _Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add_all(
+                _Parent(id=i, children=[_Child(id=i * 10 + j) for j in range(2)])
+                for i in range(6)
+            )
+            session.commit()
+            session.expunge_all()
+            yield session
+
+    def test_reports_lazy_loads_by_relationship(self, session: Session) -> None:
+        """
+        Why: Per-row lazy loads are the classic N+1 pattern
+        What: Tests the responsible relationship and origin are reported
+        How: Touches a lazy collection on every parent inside a scope
+        """
+        detector = NPlusOneDetector(threshold=5)
+
+        with detector.scope("job") as report, query_origin("ParentRepo.list"):
+            for parent in session.scalars(select(_Parent)):
+                _ = parent.children
+
+        assert len(report.findings) == 1
+        finding = report.findings[0]
+        assert finding.kind == "lazy_load"
+        assert finding.target == "_Parent.children"
+        assert finding.count == 6
+        assert finding.origin == "ParentRepo.list"
+        assert "6 lazy loads of _Parent.children" in report.summary()
+
+    def test_eager_loading_is_clean(self, session: Session) -> None:
+        """
+        Why: Properly eager-loaded paths must not produce false positives
+        What: Tests selectinload results in no findings
+        How: Loads parents with selectinload and touches every collection
+        """
+        with NPlusOneDetector(threshold=5).scope("job") as report:
+            parents = session.scalars(
+                select(_Parent).options(selectinload(_Parent.children))
+            ).all()
+            assert sum(len(parent.children) for parent in parents) == 12
+
+        assert report.findings == []
+        assert report.statement_count == 2
+
+    def test_reports_repeated_statements(self, session: Session) -> None:
+        """
+        Why: Repository calls in a loop are N+1 patterns without lazy loads
+        What: Tests a statement repeated past threshold is reported once
+        How: Executes one parameterized statement per row
+        """
+        with NPlusOneDetector(threshold=3).scope("job") as report:
+            for parent_id in range(4):
+                session.execute(
+                    text("SELECT * FROM child WHERE parent_id = :id"),
+                    {"id": parent_id},
+                )
+
+        assert [(f.kind, f.count) for f in report.findings] == [("repeated_query", 4)]
+        assert report.findings[0].target == "SELECT * FROM child WHERE parent_id = ?"
+
+    def test_repeated_writes_are_not_findings(self, session: Session) -> None:
+        """
+        Why: Batched writes in a loop repeat by design and are not N+1 reads
+        What: Tests repeated INSERT, UPDATE, DELETE and savepoints are ignored
+        How: Writes one row at a time past threshold inside a savepoint
+        """
+        with NPlusOneDetector(threshold=3, strict=True).scope("job") as report:
+            with session.begin_nested():
+                for i in range(4):
+                    session.add(_Child(id=100 + i, parent_id=0))
+                    session.flush()
+            for i in range(4):
+                session.execute(
+                    text("UPDATE child SET parent_id = 1 WHERE id = :id"),
+                    {"id": 100 + i},
+                )
+                session.execute(text("DELETE FROM child WHERE id = :id"), {"id": i})
+
+        assert report.findings == []
+        assert report.statement_count == 0
+
+    def test_strict_mode_raises_on_lazy_load(self, session: Session) -> None:
+        """
+        Why: Tests should fail on any lazy load that would emit SQL
+        What: Tests strict scopes apply raiseload to ORM selects
+        How: Touches a lazy collection and expects InvalidRequestError
+        """
+        parent = None
+        with (
+            pytest.raises(InvalidRequestError, match="raise_on_sql"),
+            NPlusOneDetector(strict=True).scope("test"),
+        ):
+            parent = session.scalars(select(_Parent)).first()
+            assert parent is not None
+            _ = parent.children
+
+    def test_strict_mode_raises_on_findings(self, session: Session) -> None:
+        """
+        Why: Repeated statements should also fail strict test runs
+        What: Tests NPlusOneError is raised when the scope exits
+        How: Repeats a statement past threshold in a strict scope
+        """
+        with (
+            pytest.raises(NPlusOneError, match="3 executions"),
+            NPlusOneDetector(threshold=3, strict=True).scope("test"),
+        ):
+            for _ in range(3):
+                session.execute(text("SELECT 1"))
@@ -0,0 +1,299 @@
+"""
+Unit tests for slow query plan capture.
+
+Why: Ensure slow statements get their plans sampled without flooding the
+     database, and that plan regressions raise actionable alerts
+What: Tests plan bottleneck/shape parsing, regression detection in
+      record_plan, and the sampling and rate limits applied in submit
+How: Feeds sample EXPLAIN JSON plans and patches the capture coroutine
+"""
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.performance.optimizations import QueryPlanAnalyzer
+from src.performance.plan_capture import (
+    PlanChangeAlert,
+    SlowQueryPlanCapture,
+    is_safe_to_analyze,
+)
+
+FINGERPRINT = "SELECT * FROM pull_requests WHERE repository_id = ?"
+
+
+def index_plan(total_cost: float = 8.3) -> dict[str, Any]:
+    """Build an analyzed plan that uses an index scan under a sort."""
+    return {
+        "Plan": {
+            "Node Type": "Sort",
+            "Total Cost": total_cost,
+            "Actual Total Time": 1.5,
+            "Actual Loops": 1,
+            "Plans": [
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": "pull_requests",
+                    "Index Name": "idx_pull_requests_repository_id",
+                    "Total Cost": total_cost - 0.5,
+                    "Actual Total Time": 1.2,
+                    "Actual Loops": 1,
+                    "Actual Rows": 12,
+                    "Plan Rows": 10,
+                }
+            ],
+        },
+        "Planning Time": 0.1,
+        "Execution Time": 1.6,
+    }
+
+
+def seq_plan(total_cost: float = 8.3) -> dict[str, Any]:
+    """Build an analyzed plan that falls back to a sequential scan."""
+    plan = index_plan(total_cost)
+    scan = plan["Plan"]["Plans"][0]
+    scan["Node Type"] = "Seq Scan"
+    del scan["Index Name"]
+    return plan
+
+
+def partitioned_plan(*partitions: str) -> dict[str, Any]:
+    """Build a plan scanning the given check_runs partitions under an Append."""
+    return {
+        "Plan": {
+            "Node Type": "Append",
+            "Total Cost": 20.0,
+            "Plans": [
+                {
+                    "Node Type": "Index Scan",
+                    "Relation Name": partition,
+                    "Index Name": f"{partition}_pr_id_idx",
+                    "Total Cost": 10.0,
+                }
+                for partition in partitions
+            ],
+        }
+    }
+
+
+@pytest.fixture
+def capture() -> SlowQueryPlanCapture:
+    """Create a plan capture with a mocked engine."""
+    return SlowQueryPlanCapture(MagicMock(), min_interval=60, max_per_minute=2)
+
+
+class TestPlanParsing:
+    """Test bottleneck and shape extraction from EXPLAIN JSON."""
+
+    def test_finds_node_with_largest_exclusive_time(self) -> None:
+        """
+        Why: The bottleneck is the node that spends the most time itself, not
+             the root whose time includes all of its children
+        What: Tests the index scan is reported over the enclosing sort
+        How: Parses an analyzed plan and checks the bottleneck fields
+        """
+        parsed = QueryPlanAnalyzer._parse_execution_plan(index_plan())
+
+        bottleneck = parsed["bottleneck"]
+        assert bottleneck["node_type"] == "Index Scan"
+        assert bottleneck["index"] == "idx_pull_requests_repository_id"
+        assert bottleneck["exclusive_time"] == pytest.approx(1.2)
+        assert bottleneck["actual_rows"] == 12
+
+    def test_plan_shape_normalizes_partitions(self) -> None:
+        """
+        Why: Scanning a new monthly partition is not a plan change
+        What: Tests partition suffixes are stripped and siblings deduplicated
+        How: Compares shapes of plans over different partition sets
+        """
+        january = QueryPlanAnalyzer._plan_shape(
+            partitioned_plan("check_runs_p2026_01")["Plan"]
+        )
+        two_months = QueryPlanAnalyzer._plan_shape(
+            partitioned_plan("check_runs_p2026_01", "check_runs_p2026_02")["Plan"]
+        )
+
+        assert january == two_months == "Append(Index Scan[check_runs_pr_id_idx])"
+
+
+class TestRecordPlan:
+    """Test plan regression detection."""
+
+    def test_first_plan_has_no_alert(self, capture: SlowQueryPlanCapture) -> None:
+        """
+        Why: A regression needs a previous plan to compare against
+        What: Tests the first capture is stored without an alert
+        How: Records one plan and checks the stored snapshot
+        """
+        assert capture.record_plan(FINGERPRINT, index_plan()) is None
+
+        snapshot = capture.get_plan(FINGERPRINT)
+        assert snapshot is not None
+        assert snapshot.execution_time == 1.6
+        assert snapshot.bottleneck["node_type"] == "Index Scan"
+
+    def test_index_to_seq_scan_alerts(self, capture: SlowQueryPlanCapture) -> None:
+        """
+        Why: An index scan turning into a sequential scan is the classic
+             plan regression after stats drift or a dropped index
+        What: Tests the alert names the removed and added scans
+        How: Records an index plan then a seq scan plan with a subscriber
+        """
+        received: list[PlanChangeAlert] = []
+        capture.subscribe(received.append)
+
+        capture.record_plan(FINGERPRINT, index_plan())
+        alert = capture.record_plan(FINGERPRINT, seq_plan())
+
+        assert alert is not None
+        assert received == [alert]
+        assert alert.reasons == [
+            "scans changed from "
+            "[Index Scan on idx_pull_requests_repository_id] "
+            "to [Seq Scan on pull_requests]"
+        ]
+
+    def test_cost_jump_alerts(self, capture: SlowQueryPlanCapture) -> None:
+        """
+        Why: The same plan shape can still get much more expensive
+        What: Tests a cost growth beyond cost_jump_ratio is reported
+        How: Records the same shape at 10 and then 25 total cost
+        """
+        capture.record_plan(FINGERPRINT, index_plan(total_cost=10.0))
+
+        alert = capture.record_plan(FINGERPRINT, index_plan(total_cost=25.0))
+        assert alert is not None
+        assert alert.reasons == ["cost jumped 10.0 -> 25.0 (2.5x)"]
+
+        assert capture.record_plan(FINGERPRINT, index_plan(total_cost=30.0)) is None
+
+    def test_retains_bounded_fingerprints(self) -> None:
+        """
+        Why: Plan storage must stay bounded with many distinct statements
+        What: Tests the least recently captured fingerprint is evicted
+        How: Records three fingerprints with max_fingerprints=2
+        """
+        capture = SlowQueryPlanCapture(MagicMock(), max_fingerprints=2)
+        for fingerprint in ("a", "b", "c"):
+            capture.record_plan(fingerprint, index_plan())
+
+        assert capture.get_plan("a") is None
+        assert capture.get_plan("c") is not None
+
+
+class TestSubmit:
+    """Test sampling and rate limiting of captures."""
+
+    async def test_rate_limits_per_fingerprint_and_globally(
+        self, capture: SlowQueryPlanCapture
+    ) -> None:
+        """
+        Why: EXPLAIN ANALYZE re-runs slow queries, so captures must be rare
+        What: Tests per-fingerprint interval and global per-minute limits
+        How: Submits repeatedly with the capture coroutine patched out
+        """
+        with patch.object(capture, "_capture", side_effect=lambda *_: _noop()) as run:
+            assert capture.submit("a", "SELECT 1", (), False)
+            await capture.wait_idle()
+            assert not capture.submit("a", "SELECT 1", (), False)
+            assert capture.submit("b", "SELECT 2", (), False)
+            await capture.wait_idle()
+            assert not capture.submit("c", "SELECT 3", (), False)
+
+        assert run.call_count == 2
+
+    def test_skips_executemany_and_explain(self, capture: SlowQueryPlanCapture) -> None:
+        """
+        Why: Batched writes and our own EXPLAIN statements cannot be explained
+        What: Tests both are rejected before consuming rate limit tokens
+        How: Submits them outside an event loop and checks the token count
+        """
+        assert not capture.submit("a", "INSERT INTO t VALUES (?)", [(1,)], True)
+        assert not capture.submit("b", "EXPLAIN SELECT 1", (), False)
+        assert capture._tokens == 2
+
+    def test_requires_running_loop(self, capture: SlowQueryPlanCapture) -> None:
+        """
+        Why: Captures run as background tasks on the application's loop
+        What: Tests submit is a no-op without a running event loop
+        How: Submits from synchronous test code
+        """
+        assert not capture.submit("a", "SELECT 1", (), False)
+        assert capture._tokens == 2
+
+
+class TestExplainOptions:
+    """Test which statements are re-executed under EXPLAIN ANALYZE."""
+
+    @staticmethod
+    def _engine(plan: dict[str, Any]) -> tuple[MagicMock, AsyncMock]:
+        """Build an engine whose connection returns plan for any EXPLAIN."""
+        conn = AsyncMock()
+        conn.exec_driver_sql.return_value = MagicMock(
+            scalar=MagicMock(return_value=[plan])
+        )
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = conn
+        return engine, conn
+
+    @pytest.mark.parametrize(
+        ("statement", "safe"),
+        [
+            ("SELECT * FROM pull_requests WHERE id = $1", True),
+            ("WITH x AS (SELECT 1) SELECT * FROM x", True),
+            ("SELECT nextval('pull_requests_id_seq')", False),
+            ("SELECT pg_advisory_xact_lock(42)", False),
+            ("SELECT pg_try_advisory_lock(1)", False),
+            ("SELECT pg_notify('channel', 'payload')", False),
+            ("SELECT * INTO copy FROM pull_requests", False),
+            ("SELECT * FROM check_runs FOR KEY SHARE", False),
+            ("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d", False),
+            ("UPDATE repositories SET name = $1", False),
+        ],
+    )
+    def test_is_safe_to_analyze(self, statement: str, safe: bool) -> None:
+        """
+        Why: EXPLAIN ANALYZE executes the statement, so sequences, locks and
+             notifications would fire again even inside a rolled-back
+             transaction
+        What: Tests only plain reads are considered safe
+        How: Checks reads, writes, locks and side-effecting function calls
+        """
+        assert is_safe_to_analyze(statement) is safe
+
+    async def test_only_plans_by_default(self) -> None:
+        """
+        Why: Re-running slow statements must be opt-in
+        What: Tests a plain read gets EXPLAIN without ANALYZE by default
+        How: Captures a read with a mocked engine and inspects the statement
+        """
+        engine, conn = self._engine(index_plan())
+        capture = SlowQueryPlanCapture(engine)
+
+        await capture._capture(FINGERPRINT, "SELECT 1", ())
+
+        explain = conn.exec_driver_sql.await_args_list[-1].args[0]
+        assert explain == "EXPLAIN (FORMAT JSON) SELECT 1"
+        assert capture.get_plan(FINGERPRINT) is not None
+
+    async def test_analyze_skips_side_effects(self) -> None:
+        """
+        Why: With analyze enabled, side-effecting reads must still only be
+             planned
+        What: Tests ANALYZE is used for a plain read but not for nextval()
+        How: Captures both statements with analyze=True
+        """
+        engine, conn = self._engine(index_plan())
+        capture = SlowQueryPlanCapture(engine, analyze=True)
+
+        await capture._capture("a", "SELECT 1", ())
+        await capture._capture("b", "SELECT nextval('s')", ())
+
+        statements = [call.args[0] for call in conn.exec_driver_sql.await_args_list]
+        assert "EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) SELECT 1" in statements
+        assert "EXPLAIN (FORMAT JSON) SELECT nextval('s')" in statements
+
+
+async def _noop() -> None:
+    """Stand in for a capture that finishes immediately."""
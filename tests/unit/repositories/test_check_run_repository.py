@@ -0,0 +1,175 @@
+"""
+Unit tests for CheckRunRepository latest-run queries.
+
+Why: Ensure latest-check-run lookups use a single DISTINCT ON query, work in
+     batch over many PRs, and filter failures in SQL rather than Python
+What: Tests get_latest_for_pr, get_latest_for_prs and get_failed_checks_for_pr
+How: Uses AsyncMock sessions and inspects the compiled PostgreSQL statements
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models.check_run import CheckRun
+from src.models.enums import CheckStatus
+from src.repositories.check_run import CheckRunRepository
+
+
+def _compiled_sql(session: AsyncMock) -> str:
+    """Compile the statement passed to session.execute for PostgreSQL."""
+    statement = session.execute.call_args[0][0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestCheckRunLatestQueries:
+    """Test latest check run queries."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        """
+        Why: Provide a mock AsyncSession for repository queries
+        What: Creates AsyncMock session returning configurable scalars
+        How: Sets execute to return a result whose scalars().all() is empty
+        """
+        session = AsyncMock()
+        session.execute = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute.return_value = result
+        return session
+
+    def _set_checks(self, session: AsyncMock, checks: list[CheckRun]) -> None:
+        """Configure the mocked session to return the given check runs."""
+        session.execute.return_value.scalars.return_value.all.return_value = checks
+
+    async def test_get_latest_for_pr_uses_distinct_on(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: The GROUP BY join-back could return duplicates on timestamp ties
+        What: Tests the query uses DISTINCT ON with a deterministic tie-break
+        How: Compiles the executed statement and checks its clauses
+        """
+        repository = CheckRunRepository(mock_session)
+
+        await repository.get_latest_for_pr(uuid.uuid4())
+
+        sql = _compiled_sql(mock_session)
+        assert "DISTINCT ON (check_runs.pr_id, check_runs.check_name)" in sql
+        assert "check_runs.created_at DESC, check_runs.id DESC" in sql
+        assert "GROUP BY" not in sql
+
+    async def test_hot_lookups_reuse_prebuilt_statements(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Rebuilding select() constructs on every call costs CPU on hot paths
+        What: Tests repeated calls execute the same statement object with the
+              values passed as bound parameters
+        How: Calls get_latest_for_pr and get_by_external_id twice each
+        """
+        repository = CheckRunRepository(mock_session)
+        pr_id = uuid.uuid4()
+
+        for _ in range(2):
+            await repository.get_latest_for_pr(pr_id)
+            await repository.get_by_external_id("123")
+
+        calls = mock_session.execute.call_args_list
+        assert calls[0].args[0] is calls[2].args[0]
+        assert calls[1].args[0] is calls[3].args[0]
+        assert calls[0].args[1] == {"pr_id": pr_id}
+        assert calls[1].args[1] == {"external_id": "123"}
+
+    async def test_external_id_lookup_returns_newest_row(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: external_id is only unique together with created_at on the
+             partitioned table, so a re-ingested run may have two rows
+        What: Tests the lookup orders by created_at and returns one row
+        How: Compiles the executed statement and checks ORDER BY and LIMIT
+        """
+        repository = CheckRunRepository(mock_session)
+
+        await repository.get_by_external_id("123")
+
+        sql = _compiled_sql(mock_session)
+        assert "ORDER BY check_runs.created_at DESC" in sql
+        assert "LIMIT" in sql
+
+    async def test_get_by_id_queries_by_id_column(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: session.get() needs the full (id, created_at) primary key
+        What: Tests get_by_id filters on id instead of calling session.get
+        How: Calls get_by_id and inspects the executed statement
+        """
+        repository = CheckRunRepository(mock_session)
+
+        await repository.get_by_id(uuid.uuid4())
+
+        mock_session.get.assert_not_called()
+        assert "WHERE check_runs.id = " in _compiled_sql(mock_session)
+
+    async def test_get_latest_for_prs_groups_by_pr(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Triaging all open PRs must not issue one query per PR
+        What: Tests one query returns a mapping with an entry for every PR
+        How: Returns checks for one of two PRs and checks the mapping
+        """
+        pr_with_checks = uuid.uuid4()
+        pr_without_checks = uuid.uuid4()
+        checks = [
+            CheckRun(pr_id=pr_with_checks, check_name="lint", external_id="1"),
+            CheckRun(pr_id=pr_with_checks, check_name="test", external_id="2"),
+        ]
+        self._set_checks(mock_session, checks)
+        repository = CheckRunRepository(mock_session)
+
+        latest = await repository.get_latest_for_prs(
+            [pr_with_checks, pr_without_checks]
+        )
+
+        assert latest == {pr_with_checks: checks, pr_without_checks: []}
+        mock_session.execute.assert_called_once()
+        assert "check_runs.pr_id IN" in _compiled_sql(mock_session)
+
+    async def test_get_latest_for_prs_empty(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Avoid a pointless round trip when there are no PRs to evaluate
+        What: Tests an empty input returns an empty mapping without querying
+        How: Calls with an empty list and asserts execute was not called
+        """
+        repository = CheckRunRepository(mock_session)
+
+        assert await repository.get_latest_for_prs([]) == {}
+        mock_session.execute.assert_not_called()
+
+    async def test_get_failed_checks_filters_in_sql(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Failure filtering should not load every latest check into Python
+        What: Tests status and conclusion filters are applied to latest runs
+        How: Compiles the statement and checks the filter and subquery
+        """
+        failed = CheckRun(
+            pr_id=uuid.uuid4(), check_name="test", status=CheckStatus.COMPLETED
+        )
+        self._set_checks(mock_session, [failed])
+        repository = CheckRunRepository(mock_session)
+
+        result = await repository.get_failed_checks_for_pr(failed.pr_id)
+
+        assert result == [failed]
+        sql = _compiled_sql(mock_session)
+        assert "check_runs.id IN (SELECT DISTINCT ON" in sql
+        assert "check_runs.status = " in sql
+        assert "check_runs.conclusion = " in sql
@@ -0,0 +1,251 @@
+"""
+Unit tests for repository read-model projections.
+
+Why: Ensure projection variants of hot read paths fetch only the columns they
+     need and return immutable, slotted rows instead of ORM entities
+What: Tests projection dataclasses and the *_rows repository methods for pull
+      requests, check runs and repositories
+How: Uses AsyncMock sessions returning plain result tuples and inspects the
+     compiled SQL to verify selected columns and absent eager loads
+"""
+
+import dataclasses
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models.enums import CheckConclusion, CheckStatus, PRState
+from src.repositories.check_run import CheckRunRepository
+from src.repositories.projections import (
+    CheckRunStatusRow,
+    PullRequestPollRow,
+    PullRequestSummaryRow,
+    RepositoryPollRow,
+)
+from src.repositories.pull_request import PullRequestRepository
+from src.repositories.repository import RepositoryRepository
+
+
+def _compiled_sql(session: AsyncMock) -> str:
+    """Compile the statement passed to session.execute for PostgreSQL."""
+    statement = session.execute.call_args[0][0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def mock_session() -> AsyncMock:
+    """
+    Why: Provide a mock AsyncSession for projection queries
+    What: Creates AsyncMock session with a mocked execute method
+    How: Sets up execute as an AsyncMock returning a configurable result
+    """
+    session = AsyncMock()
+    session.execute = AsyncMock()
+    return session
+
+
+def _set_rows(session: AsyncMock, rows: list[tuple]) -> None:
+    """Configure the mocked session to return the given result rows."""
+    mock_result = MagicMock()
+    mock_result.all.return_value = rows
+    session.execute.return_value = mock_result
+
+
+class TestProjectionRows:
+    """Test projection dataclass behavior."""
+
+    def test_rows_are_frozen_and_slotted(self) -> None:
+        """
+        Why: Projection rows must be cheap and safe to share between tasks
+        What: Tests rows reject mutation and carry no per-instance __dict__
+        How: Builds a row, attempts assignment, and checks for __slots__
+        """
+        row = PullRequestPollRow(
+            id=uuid.uuid4(),
+            repository_id=uuid.uuid4(),
+            pr_number=1,
+            state=PRState.OPENED,
+            draft=False,
+            head_sha="a" * 40,
+            last_checked_at=None,
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            row.pr_number = 2  # type: ignore[misc]
+
+        assert hasattr(PullRequestPollRow, "__slots__")
+        assert not hasattr(row, "__dict__")
+
+    @pytest.mark.parametrize(
+        "row_type",
+        [
+            PullRequestPollRow,
+            PullRequestSummaryRow,
+            CheckRunStatusRow,
+            RepositoryPollRow,
+        ],
+    )
+    def test_columns_match_fields(self, row_type: type) -> None:
+        """
+        Why: Rows are built positionally, so column order must follow field order
+        What: Tests each projection's columns() lines up with its dataclass fields
+        How: Compares column keys with dataclass field names
+        """
+        field_names = [field.name for field in dataclasses.fields(row_type)]
+        column_names = [column.key for column in row_type.columns()]
+
+        assert column_names == field_names
+
+    def test_check_run_status_row_is_failed(self) -> None:
+        """
+        Why: Callers filter projected check runs by failure without the entity
+        What: Tests is_failed mirrors CheckRun.is_failed semantics
+        How: Builds failed and successful rows and checks the property
+        """
+        base = {
+            "id": uuid.uuid4(),
+            "pr_id": uuid.uuid4(),
+            "external_id": "1",
+            "check_name": "lint",
+            "status": CheckStatus.COMPLETED,
+            "created_at": datetime.now(UTC),
+        }
+
+        failed = CheckRunStatusRow(conclusion=CheckConclusion.FAILURE, **base)
+        passed = CheckRunStatusRow(conclusion=CheckConclusion.SUCCESS, **base)
+
+        assert failed.is_failed
+        assert not passed.is_failed
+
+
+class TestRepositoryProjectionMethods:
+    """Test *_rows projection variants on repositories."""
+
+    async def test_get_prs_needing_check_rows(self, mock_session: AsyncMock) -> None:
+        """
+        Why: The PR poll loop should not load bodies, metadata or relationships
+        What: Tests get_prs_needing_check_rows() maps rows and selects few columns
+        How: Mocks result tuples, then inspects returned rows and compiled SQL
+        """
+        pr_id = uuid.uuid4()
+        repo_id = uuid.uuid4()
+        _set_rows(
+            mock_session,
+            [(pr_id, repo_id, 7, PRState.OPENED, False, "b" * 40, None)],
+        )
+        repository = PullRequestRepository(mock_session)
+
+        rows = await repository.get_prs_needing_check_rows(datetime.now(UTC), limit=10)
+
+        assert rows == [
+            PullRequestPollRow(
+                id=pr_id,
+                repository_id=repo_id,
+                pr_number=7,
+                state=PRState.OPENED,
+                draft=False,
+                head_sha="b" * 40,
+                last_checked_at=None,
+            )
+        ]
+        sql = _compiled_sql(mock_session)
+        assert "pull_requests.body" not in sql
+        assert "pull_requests.metadata" not in sql
+        assert "NULLS FIRST" in sql
+        assert "LIMIT" in sql
+
+    async def test_get_active_prs_for_repo_rows(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Listing active PRs only needs display fields
+        What: Tests get_active_prs_for_repo_rows() returns summary rows
+        How: Mocks result tuples and checks mapping and draft filtering
+        """
+        repo_id = uuid.uuid4()
+        created = datetime.now(UTC)
+        _set_rows(
+            mock_session,
+            [
+                (
+                    uuid.uuid4(),
+                    repo_id,
+                    3,
+                    "Fix bug",
+                    "dev",
+                    PRState.OPENED,
+                    False,
+                    "c" * 40,
+                    created,
+                )
+            ],
+        )
+        repository = PullRequestRepository(mock_session)
+
+        rows = await repository.get_active_prs_for_repo_rows(repo_id)
+
+        assert len(rows) == 1
+        assert isinstance(rows[0], PullRequestSummaryRow)
+        assert rows[0].title == "Fix bug"
+        assert "pull_requests.draft" in _compiled_sql(mock_session)
+
+    async def test_get_latest_rows_for_pr(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Status checks over latest runs should skip output text and logs
+        What: Tests get_latest_rows_for_pr() returns status rows
+        How: Mocks result tuples and checks output columns are not selected
+        """
+        pr_id = uuid.uuid4()
+        _set_rows(
+            mock_session,
+            [
+                (
+                    uuid.uuid4(),
+                    pr_id,
+                    "42",
+                    "tests",
+                    CheckStatus.COMPLETED,
+                    CheckConclusion.FAILURE,
+                    datetime.now(UTC),
+                )
+            ],
+        )
+        repository = CheckRunRepository(mock_session)
+
+        rows = await repository.get_latest_rows_for_pr(pr_id)
+
+        assert [row.check_name for row in rows] == ["tests"]
+        assert rows[0].is_failed
+        sql = _compiled_sql(mock_session)
+        assert "check_runs.output_text" not in sql
+        assert "check_runs.metadata" not in sql
+
+    async def test_get_repositories_needing_poll_rows(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: The repository poller only needs scheduling fields
+        What: Tests get_repositories_needing_poll_rows() returns poll rows
+        How: Mocks result tuples and checks config_override is not selected
+        """
+        repo_id = uuid.uuid4()
+        _set_rows(
+            mock_session,
+            [(repo_id, "https://github.com/o/r", "o/r", 15, None, 0)],
+        )
+        repository = RepositoryRepository(mock_session)
+
+        rows = await repository.get_repositories_needing_poll_rows()
+
+        assert rows == [
+            RepositoryPollRow(
+                id=repo_id,
+                url="https://github.com/o/r",
+                full_name="o/r",
+                polling_interval_minutes=15,
+                last_polled_at=None,
+                failure_count=0,
+            )
+        ]
+        assert "repositories.config_override" not in _compiled_sql(mock_session)
@@ -0,0 +1,126 @@
+"""
+Unit tests for RepositoryRepository poll scheduling.
+
+Why: Ensure due repositories are found through next_poll_at and leased to
+     workers without overlap, so polling scales across workers
+What: Tests get_repositories_needing_poll, claim_repositories_for_poll and
+      the next_poll_at maintenance in polling interval updates
+How: Uses AsyncMock sessions and inspects the compiled PostgreSQL statements
+"""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.models.repository import Repository
+from src.repositories.repository import RepositoryRepository
+
+
+def _compiled_sql(session: AsyncMock) -> str:
+    """Compile the statement passed to session.execute for PostgreSQL."""
+    statement = session.execute.call_args[0][0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestRepositoryPollScheduling:
+    """Test repository poll scheduling queries."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        """
+        Why: Provide a mock AsyncSession for repository queries
+        What: Creates AsyncMock session with an empty execute result
+        How: Sets execute to return a result whose scalars().all() is empty
+        """
+        session = AsyncMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        result.rowcount = 0
+        session.execute = AsyncMock(return_value=result)
+        session.get = AsyncMock()
+        return session
+
+    async def test_needing_poll_filters_on_next_poll_at(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Per-row epoch arithmetic cannot use an index
+        What: Tests due repositories are selected by next_poll_at <= now()
+        How: Compiles the executed statement and checks the filter
+        """
+        repository = RepositoryRepository(mock_session)
+
+        await repository.get_repositories_needing_poll()
+
+        sql = _compiled_sql(mock_session)
+        assert "repositories.next_poll_at <= now()" in sql
+        assert "extract" not in sql.lower()
+
+    async def test_claim_uses_skip_locked_lease(self, mock_session: AsyncMock) -> None:
+        """
+        Why: Concurrent workers must not claim the same due repository
+        What: Tests the claim locks due rows with SKIP LOCKED and leases them
+        How: Compiles the UPDATE ... RETURNING and returns the claimed repo
+        """
+        claimed = Repository(url="https://github.com/o/r", name="r")
+        mock_session.execute.return_value.scalars.return_value.all.return_value = [
+            claimed
+        ]
+        repository = RepositoryRepository(mock_session)
+
+        result = await repository.claim_repositories_for_poll(10, lease_seconds=60)
+
+        assert result == [claimed]
+        sql = _compiled_sql(mock_session)
+        assert sql.startswith("UPDATE repositories SET next_poll_at=(now() + ")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "LIMIT" in sql
+        assert "RETURNING" in sql
+
+    async def test_claim_with_no_capacity(self, mock_session: AsyncMock) -> None:
+        """
+        Why: A worker with no free slots should not touch the database
+        What: Tests a non-positive limit returns nothing without querying
+        How: Claims with limit 0 and asserts execute was not called
+        """
+        repository = RepositoryRepository(mock_session)
+
+        assert await repository.claim_repositories_for_poll(0) == []
+        mock_session.execute.assert_not_called()
+
+    async def test_update_last_polled_reschedules(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: A successful poll must end the lease and set the next due time
+        What: Tests update_last_polled() sets next_poll_at from the poll time
+        How: Polls a mocked entity at a fixed timestamp
+        """
+        repo = Repository(
+            url="https://github.com/o/r", name="r", polling_interval_minutes=5
+        )
+        mock_session.get.return_value = repo
+        repository = RepositoryRepository(mock_session)
+        polled_at = datetime(2026, 1, 1, tzinfo=UTC)
+
+        await repository.update_last_polled(uuid.uuid4(), polled_at)
+
+        assert repo.next_poll_at == polled_at + timedelta(minutes=5)
+
+    async def test_bulk_interval_update_reschedules(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Changing the interval must move already scheduled polls
+        What: Tests the bulk UPDATE recomputes next_poll_at in SQL
+        How: Compiles the executed UPDATE statement
+        """
+        repository = RepositoryRepository(mock_session)
+
+        await repository.bulk_update_polling_interval([uuid.uuid4()], 30)
+
+        sql = _compiled_sql(mock_session)
+        assert "next_poll_at=(coalesce(repositories.last_polled_at, now())" in sql
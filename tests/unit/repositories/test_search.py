@@ -0,0 +1,168 @@
+"""
+Unit tests for PR and repository search queries.
+
+Why: Ensure text search uses the full-text and trigram indexes on PostgreSQL
+     while keeping the ILIKE fallback for other dialects
+What: Tests search_prs, search_prs_ranked and search_repositories
+How: Uses AsyncMock sessions with a configurable bind dialect and inspects
+     the compiled PostgreSQL statements
+"""
+
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.models import PullRequest, Repository
+from src.models.base import Base
+from src.models.enums import PRState
+from src.repositories.projections import PullRequestSearchHit
+from src.repositories.pull_request import PullRequestRepository
+from src.repositories.repository import RepositoryRepository
+
+
+def _compiled_sql(session: AsyncMock) -> str:
+    """Compile the statement passed to session.execute for PostgreSQL."""
+    statement = session.execute.call_args[0][0]
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+class TestSearchQueries:
+    """Test dialect-aware search queries."""
+
+    @pytest.fixture
+    def mock_session(self) -> AsyncMock:
+        """
+        Why: Provide a mock AsyncSession bound to a PostgreSQL engine
+        What: Creates AsyncMock session whose bind reports the postgresql dialect
+        How: Sets bind.dialect.name and an empty execute result
+        """
+        session = AsyncMock()
+        session.bind = MagicMock()
+        session.bind.dialect.name = "postgresql"
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        result.all.return_value = []
+        session.execute = AsyncMock(return_value=result)
+        return session
+
+    async def test_search_prs_uses_full_text_on_postgresql(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Leading-wildcard ILIKE on title and body cannot use an index
+        What: Tests query_text is matched against search_vector and ranked
+        How: Compiles the executed statement and checks the FTS clauses
+        """
+        repository = PullRequestRepository(mock_session)
+
+        await repository.search_prs(query_text="flaky test", author="dev")
+
+        sql = _compiled_sql(mock_session)
+        assert "pull_requests.search_vector @@ websearch_to_tsquery(" in sql
+        assert "ORDER BY ts_rank_cd(pull_requests.search_vector" in sql
+        assert "pull_requests.title ILIKE" not in sql
+        assert "pull_requests.author ILIKE" in sql
+
+    async def test_search_prs_falls_back_to_ilike(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: SQLite and other dialects have no tsvector support
+        What: Tests the ILIKE filters are used when not on PostgreSQL
+        How: Switches the bind dialect to sqlite and inspects the statement
+        """
+        mock_session.bind.dialect.name = "sqlite"
+        repository = PullRequestRepository(mock_session)
+
+        await repository.search_prs(query_text="flaky test")
+
+        sql = _compiled_sql(mock_session)
+        assert "pull_requests.title ILIKE" in sql
+        assert "search_vector" not in sql
+
+    async def test_search_prs_ranked_returns_highlighted_hits(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Search UIs need relevance and matched-term snippets in one query
+        What: Tests ranked search selects ts_headline and maps projection rows
+        How: Returns one raw row from the mock and checks the mapped hit
+        """
+        row = (
+            uuid.uuid4(),
+            uuid.uuid4(),
+            7,
+            "Fix flaky test",
+            "dev",
+            PRState.OPENED,
+            datetime.now(UTC),
+            0.42,
+            "Fix <b>flaky</b> test",
+            None,
+        )
+        mock_session.execute.return_value.all.return_value = [row]
+        repository = PullRequestRepository(mock_session)
+
+        hits = await repository.search_prs_ranked("flaky", limit=5)
+
+        assert hits == [PullRequestSearchHit(*row)]
+        sql = _compiled_sql(mock_session)
+        assert sql.count("ts_headline(") == 2
+        assert "LIMIT" in sql
+
+    async def test_search_repositories_orders_by_similarity(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """
+        Why: Trigram indexes make substring matches fast; similarity makes
+             them useful by putting the closest names first
+        What: Tests query_text results are ordered by trigram similarity
+        How: Compiles the executed statement and checks the ORDER BY clause
+        """
+        repository = RepositoryRepository(mock_session)
+
+        await repository.search_repositories(query_text="agentic")
+
+        sql = _compiled_sql(mock_session)
+        assert "ORDER BY greatest(similarity(repositories.name" in sql
+        assert "repositories.name ILIKE" in sql
+
+
+class TestSearchSchema:
+    """Test the search columns outside PostgreSQL."""
+
+    def test_sqlite_create_all_and_insert(self) -> None:
+        """
+        Why: Tests and development create the schema on SQLite, which has no
+             tsvector type or text search functions
+        What: Tests create_all succeeds and search_vector is a plain column
+        How: Creates all tables in an in-memory SQLite database and inserts a PR
+        """
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+
+        with Session(engine) as session:
+            repository = Repository(url="https://github.com/org/repo", name="repo")
+            session.add(repository)
+            session.flush()
+            pr = PullRequest(
+                repository_id=repository.id,
+                pr_number=1,
+                title="Fix search",
+                author="dev",
+                state=PRState.OPENED,
+                base_branch="main",
+                head_branch="fix",
+                base_sha="a" * 40,
+                head_sha="b" * 40,
+                url="https://github.com/org/repo/pull/1",
+            )
+            session.add(pr)
+            session.flush()
+
+            assert pr.search_vector is None